@@ -0,0 +1,28 @@
+"""
+django-allauth adapters for accounts.
+"""
+
+from allauth.account.adapter import DefaultAccountAdapter
+from allauth.core import context as allauth_context
+from django.contrib.sites.shortcuts import get_current_site
+from django.utils.html import strip_tags
+
+from core.tasks import send_email
+
+
+class AccountAdapter(DefaultAccountAdapter):
+    """Send allauth's emails (e.g. password resets) from the task worker."""
+
+    def send_mail(self, template_prefix: str, email: str, context: dict) -> None:
+        request = allauth_context.request
+        ctx = {"request": request, "email": email, "current_site": get_current_site(request)}
+        ctx.update(context)
+        # Rendered here, where the request is available; only SMTP is deferred
+        message = self.render_mail(template_prefix, email, ctx)
+        body, html_body = message.body, None
+        if message.content_subtype == "html":
+            body, html_body = strip_tags(message.body), message.body
+        for content, mimetype in getattr(message, "alternatives", []):
+            if mimetype == "text/html":
+                html_body = content
+        send_email.enqueue(message.subject, body, message.from_email, message.to, html_body)
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-19 12:20
+# Existing rows are converted to 16-byte values by events 0008_binary_uuid_pk
+
+import uuid6
+from django.db import migrations
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+    ]
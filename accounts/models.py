@@ -4,17 +4,19 @@ Accounts models.
 
 import uuid6
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+
+from core.fields import BinaryUUIDField
 
 
 class User(AbstractUser):
     """
     Custom user model inheriting from AbstractUser.
 
-    Uses UUID v6 as primary key for security and sortability (time-ordered).
+    Uses UUID v6 as primary key for security and sortability (time-ordered),
+    stored compactly as a BinaryUUIDField like core.models.BaseModel.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid6.uuid6, editable=False)
+    id = BinaryUUIDField(primary_key=True, default=uuid6.uuid6, editable=False)
 
     class Meta:
         """Meta options for User model."""
@@ -0,0 +1,153 @@
+"""
+Local thumbnails of users' social avatars.
+
+Pages link avatars through avatar_url(), a local address keyed by the user and
+a hash of the provider's avatar URL, instead of the provider's (often
+full-size) image: a page of topic cards costs no third-party fetch. The avatar
+view fetches the provider's image once through AVATAR_FETCHER, stores an
+AVATAR_SIZE px square thumbnail (WebP, or PNG when Pillow lacks WebP support)
+in AVATAR_DIR and serves it as immutable, since a new provider URL means a new
+address.
+
+When a social account is saved with an avatar that isn't stored yet (e.g. the
+user changed their picture and logged in again), the refresh_avatar task
+(accounts.tasks) stores the new thumbnail in the background and removes the
+user's older ones.
+"""
+
+import hashlib
+from collections.abc import Callable
+from io import BytesIO
+from pathlib import Path
+from uuid import UUID
+
+import requests
+from allauth.socialaccount.models import SocialAccount
+from django.conf import settings
+from django.urls import reverse
+from django.utils.module_loading import import_string
+from PIL import Image, ImageOps, features
+
+from core.utils import write_atomic
+
+if features.check("webp"):
+    THUMBNAIL_FORMAT, THUMBNAIL_CONTENT_TYPE, THUMBNAIL_SUFFIX = "WEBP", "image/webp", ".webp"
+else:
+    THUMBNAIL_FORMAT, THUMBNAIL_CONTENT_TYPE, THUMBNAIL_SUFFIX = "PNG", "image/png", ".png"
+
+
+class AvatarError(Exception):
+    """The avatar couldn't be fetched, or isn't an image Pillow can read."""
+
+
+def fetch_avatar(url: str) -> bytes:
+    """
+    Default AVATAR_FETCHER: download `url`, up to AVATAR_MAX_BYTES.
+
+    Raises:
+        AvatarError: If the download fails or the image is too large
+    """
+    try:
+        with requests.get(url, stream=True, timeout=settings.AVATAR_FETCH_TIMEOUT) as response:
+            response.raise_for_status()
+            data = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                data += chunk
+                if len(data) > settings.AVATAR_MAX_BYTES:
+                    raise AvatarError(
+                        f"Avatar larger than {settings.AVATAR_MAX_BYTES} bytes: {url}"
+                    )
+    except requests.RequestException as e:
+        raise AvatarError(f"Couldn't fetch avatar {url}: {e}") from e
+    return bytes(data)
+
+
+def get_fetcher() -> Callable[[str], bytes]:
+    """The AVATAR_FETCHER callable (tests replace it with a local stub)."""
+    return import_string(settings.AVATAR_FETCHER)
+
+
+def get_social_avatar_source(account: SocialAccount) -> str | None:
+    """The provider's avatar URL of a social account, if it has one."""
+    try:
+        return account.get_avatar_url() or None
+    except Exception:
+        # Provider not configured, or unexpected extra_data
+        return None
+
+
+def get_avatar_source(user_id: UUID) -> str | None:
+    """The provider's avatar URL of the user's (first) social account."""
+    account = SocialAccount.objects.filter(user_id=user_id).order_by("pk").first()
+    return get_social_avatar_source(account) if account else None
+
+
+def avatar_version(source_url: str) -> str:
+    """Short hash of a provider avatar URL: part of the local address of its thumbnail."""
+    return hashlib.sha256(source_url.encode()).hexdigest()[:16]
+
+
+def avatar_url(user_id: UUID, source_url: str) -> str:
+    """Local address of the thumbnail of `source_url`, the user's provider avatar."""
+    return reverse(
+        "accounts:avatar", kwargs={"user_id": user_id, "version": avatar_version(source_url)}
+    )
+
+
+def thumbnail_path(user_id: UUID, version: str) -> Path:
+    return Path(settings.AVATAR_DIR) / f"{user_id.hex}-{version}{THUMBNAIL_SUFFIX}"
+
+
+def make_thumbnail(data: bytes) -> bytes:
+    """
+    Crop an image to a centered square and shrink it to AVATAR_SIZE px.
+
+    Raises:
+        AvatarError: If the data isn't an image Pillow can read
+    """
+    size = (settings.AVATAR_SIZE, settings.AVATAR_SIZE)
+    try:
+        with Image.open(BytesIO(data)) as image:
+            # JPEGs are decoded straight at a reduced scale
+            image.draft(None, size)
+            image = ImageOps.exif_transpose(image)
+            thumbnail = ImageOps.fit(image.convert("RGBA"), size, Image.Resampling.LANCZOS)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise AvatarError(f"Unreadable avatar image: {e}") from e
+    output = BytesIO()
+    thumbnail.save(output, THUMBNAIL_FORMAT)
+    return output.getvalue()
+
+
+def store_avatar(user_id: UUID, source_url: str) -> Path:
+    """
+    Fetch the provider avatar and store its thumbnail, replacing the user's older ones.
+
+    Raises:
+        AvatarError: If the avatar can't be fetched or read
+
+    Returns:
+        Path of the stored thumbnail
+    """
+    path = thumbnail_path(user_id, avatar_version(source_url))
+    data = make_thumbnail(get_fetcher()(source_url))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, data)
+    for old in path.parent.glob(f"{user_id.hex}-*"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return path
+
+
+def refresh_avatar(user_id: UUID) -> bool:
+    """
+    Store the thumbnail of the user's current provider avatar, unless it is stored already.
+
+    Returns:
+        Whether a thumbnail was fetched
+    """
+    source = get_avatar_source(user_id)
+    if source is None or thumbnail_path(user_id, avatar_version(source)).exists():
+        return False
+    store_avatar(user_id, source)
+    return True
@@ -0,0 +1,26 @@
+"""
+Signal receivers of the accounts app (connected in AccountsConfig.ready).
+"""
+
+from allauth.socialaccount.models import SocialAccount
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+
+from accounts.services.avatar_service import (
+    avatar_version,
+    get_social_avatar_source,
+    thumbnail_path,
+)
+from accounts.tasks import refresh_avatar
+
+# Sent with `user_id` when a user's avatar address changes (pages showing it are stale)
+avatar_changed = Signal()
+
+
+@receiver(post_save, sender=SocialAccount)
+def refresh_changed_avatar(instance: SocialAccount, **_kwargs: object) -> None:
+    """Fetch the account's avatar in the background when it isn't stored yet."""
+    source = get_social_avatar_source(instance)
+    if source and not thumbnail_path(instance.user_id, avatar_version(source)).exists():
+        avatar_changed.send(sender=SocialAccount, user_id=instance.user_id)
+        refresh_avatar.enqueue(str(instance.user_id))
@@ -0,0 +1,15 @@
+"""
+Background tasks of the accounts app (run by `manage.py run_worker`, see core.task_queue).
+"""
+
+from uuid import UUID
+
+from django.tasks import task
+
+from accounts.services import avatar_service
+
+
+@task
+def refresh_avatar(user_id: str) -> bool:
+    """Store the thumbnail of the user's current social avatar."""
+    return avatar_service.refresh_avatar(UUID(user_id))
@@ -1,7 +1,11 @@
 """URL configuration for accounts app."""
 
+from django.urls import path
+
+from accounts import views
+
 app_name = "accounts"
 
 urlpatterns = [
-    # URLs will be added in Phase 2 (SSO) and Phase 5 (readonly)
+    path("avatars/<uuid:user_id>/<slug:version>/", views.avatar, name="avatar"),
 ]
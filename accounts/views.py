@@ -1 +1,68 @@
-# Create your views here.
+"""
+Views for accounts app.
+"""
+
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from django.http import FileResponse, Http404, HttpRequest, HttpResponse
+from django.shortcuts import redirect
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.views.decorators.http import require_GET
+
+from accounts.services.avatar_service import (
+    THUMBNAIL_CONTENT_TYPE,
+    AvatarError,
+    avatar_version,
+    get_avatar_source,
+    store_avatar,
+    thumbnail_path,
+)
+
+logger = logging.getLogger(__name__)
+
+# The address changes with the avatar, so browsers may keep a thumbnail for good
+AVATAR_MAX_AGE = timedelta(days=365)
+
+
+@require_GET
+def avatar(_request: HttpRequest, user_id: UUID, version: str) -> HttpResponse:
+    """
+    Serve the thumbnail of a user's social avatar (see avatar_service).
+
+    A stored thumbnail is served without a query. Otherwise it is fetched from
+    the provider first, if `version` is the user's current avatar; when the
+    provider fails, the browser is sent to the provider's image instead.
+
+    Args:
+        _request: HTTP request object
+        user_id: User ID
+        version: avatar_version() of the provider avatar URL
+
+    Returns:
+        The thumbnail, or a redirect to the provider's image
+    """
+    try:
+        thumbnail = thumbnail_path(user_id, version).open("rb")
+    except FileNotFoundError:
+        # Not stored yet, or just removed: store_avatar drops the user's other versions
+        source = get_avatar_source(user_id)
+        if source is None or avatar_version(source) != version:
+            raise Http404("Avatar não encontrado.") from None
+        try:
+            thumbnail = store_avatar(user_id, source).open("rb")
+        except AvatarError:
+            logger.warning("Serving avatar of user %s from its provider", user_id, exc_info=True)
+            response = redirect(source)
+            add_never_cache_headers(response)
+            return response
+        except FileNotFoundError:
+            # Replaced by a newer avatar as soon as it was stored
+            raise Http404("Avatar não encontrado.") from None
+
+    response = FileResponse(thumbnail, content_type=THUMBNAIL_CONTENT_TYPE)
+    patch_cache_control(
+        response, public=True, max_age=int(AVATAR_MAX_AGE.total_seconds()), immutable=True
+    )
+    return response
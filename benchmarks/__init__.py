@@ -0,0 +1,5 @@
+"""
+Standalone benchmarks for FloripaTalks storage and query decisions.
+
+Run with `uv run python -m benchmarks.<name>`; results are printed, not asserted.
+"""
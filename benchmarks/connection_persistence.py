@@ -0,0 +1,113 @@
+"""
+Benchmark: request latency with and without persistent database connections.
+
+Serves the home page, an event page and its load-more fragment through Django's
+WSGI handler against a temporary SQLite file configured by sqlite_databases()
+(WAL, pragmas, read-only alias), first with CONN_MAX_AGE=0 (connect and run the
+connection setup on every request) and then with persistent connections.
+
+Usage:
+    uv run python -m benchmarks.connection_persistence [--requests 500] [--topics 60]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from wsgiref.util import setup_testing_defaults
+
+import django
+from django.conf import settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "floripatalks.settings.test")
+
+
+def setup(path: Path) -> None:
+    from floripatalks.settings.base import sqlite_databases
+
+    settings.DATABASES = sqlite_databases(path)
+    settings.ALLOWED_HOSTS = ["*"]
+    django.setup()
+
+    from django.core.management import call_command
+
+    # Test settings disable migrations; syncdb builds the same tables
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def seed(topics: int) -> None:
+    from accounts.models import User
+    from events.models import Event, Topic, Vote
+
+    users = User.objects.bulk_create(
+        User(username=f"user{i}", email=f"user{i}@example.com") for i in range(50)
+    )
+    event = Event.objects.create(name="Benchmark", slug="benchmark")
+    created = Topic.objects.bulk_create(
+        Topic(event=event, creator=users[i % len(users)], title=f"Topic {i}", slug=f"topic-{i}")
+        for i in range(topics)
+    )
+    Vote.objects.bulk_create(
+        Vote(topic=topic, user=user) for i, topic in enumerate(created) for user in users[: i % 20]
+    )
+
+
+def request(handler: object, path: str, headers: dict[str, str]) -> float:
+    environ = {"PATH_INFO": path, "wsgi.input": io.BytesIO(), **headers}
+    setup_testing_defaults(environ)
+    started = time.perf_counter()
+    response = handler(environ, lambda _status, _headers: None)
+    body = b"".join(response)
+    response.close()  # Fires request_finished: closes obsolete connections
+    elapsed = time.perf_counter() - started
+    assert body, path
+    return elapsed
+
+
+def run(conn_max_age: int, requests: int) -> dict[str, list[float]]:
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db import connections
+
+    connections.close_all()
+    for alias in connections:
+        connections[alias].settings_dict["CONN_MAX_AGE"] = conn_max_age
+        connections[alias].settings_dict["CONN_HEALTH_CHECKS"] = conn_max_age != 0
+
+    handler = WSGIHandler()
+    pages = {
+        "home": ("/", {}),
+        "event page": ("/events/benchmark/", {}),
+        "load more": ("/events/benchmark/topics/load-more/", {"HTTP_HX_REQUEST": "true"}),
+    }
+    timings: dict[str, list[float]] = {name: [] for name in pages}
+    for name, (path, headers) in pages.items():
+        request(handler, path, headers)  # Warm up templates and URL resolver
+        for _ in range(requests):
+            timings[name].append(request(handler, path, headers))
+    connections.close_all()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--topics", type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup(Path(tmp) / "db.sqlite3")
+        seed(args.topics)
+        print(f"{args.requests:,} requests per page, {args.topics} topics")
+        for label, conn_max_age in (("CONN_MAX_AGE=0", 0), ("persistent", 600)):
+            for page, samples in run(conn_max_age, args.requests).items():
+                samples_ms = sorted(sample * 1000 for sample in samples)
+                p50 = statistics.median(samples_ms)
+                p95 = samples_ms[int(len(samples_ms) * 0.95)]
+                print(f"{label:>15} {page:>10}: p50 {p50:6.2f} ms  p95 {p95:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: time to first byte and total time of the event page, streamed or not.
+
+Seeds a temporary SQLite file (configured by sqlite_databases()) with
+seed_load(), one event holding every topic, runs ANALYZE, and requests the
+event page through the test client (the full middleware stack) as an anonymous
+visitor, with EVENT_PAGE_STREAMING off and on. Rendered in one piece, the
+first byte comes with the last; streamed, it comes once the page around the
+topic list is rendered.
+
+Usage:
+    uv run python -m benchmarks.event_page_streaming [--topics 1000] [--votes 100000] [--runs 50]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "floripatalks.settings.test")
+
+
+def setup(path: Path) -> None:
+    from floripatalks.settings.base import sqlite_databases
+
+    settings.DATABASES = sqlite_databases(path)
+    # The test client's host (pytest-django adds it when running tests)
+    settings.ALLOWED_HOSTS = ["testserver"]
+    django.setup()
+
+    from django.core.management import call_command
+
+    # Test settings disable migrations; syncdb builds the same tables
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def seed(topics: int, votes: int) -> None:
+    from django.db import connection
+
+    from events.services.seed_service import SeedConfig, seed_load
+
+    result = seed_load(SeedConfig(users=2_000, events=1, topics=topics, votes=votes))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    print(
+        f"Seeded {result.topics:,} topics, {result.votes:,} votes "
+        f"and {result.users:,} users in {result.seconds:.1f} s"
+    )
+
+
+def request_page(url: str) -> tuple[float, float]:
+    """Request the page once: milliseconds to its first byte and to its last."""
+    from django.test import Client
+
+    started = time.perf_counter()
+    response = Client().get(url)
+    assert response.status_code == 200, response.status_code
+    if not response.streaming:
+        response.content  # noqa: B018
+        total = (time.perf_counter() - started) * 1000
+        return total, total
+    chunks = iter(response.streaming_content)
+    next(chunks)
+    first_byte = (time.perf_counter() - started) * 1000
+    for _ in chunks:
+        pass
+    response.close()
+    return first_byte, (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--topics", type=int, default=1000)
+    parser.add_argument("--votes", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup(Path(tmp) / "db.sqlite3")
+        seed(args.topics, args.votes)
+
+        from django.urls import reverse
+
+        from events.models import Event
+
+        url = reverse("events:event_detail", kwargs={"slug": Event.objects.get().slug})
+
+        print(f"p50 over {args.runs} runs")
+        for streaming in (False, True):
+            settings.EVENT_PAGE_STREAMING = streaming
+            request_page(url)  # Warm up the page cache, statement cache and templates
+            samples = [request_page(url) for _ in range(args.runs)]
+            first_byte = statistics.median(sample[0] for sample in samples)
+            total = statistics.median(sample[1] for sample in samples)
+            name = "streamed" if streaming else "rendered"
+            print(f"{name:>8}: first byte {first_byte:7.2f} ms  last byte {total:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: throughput of the database task backend and its worker.
+
+Enqueues tasks on core.task_queue.DatabaseBackend in a temporary SQLite file
+configured by sqlite_databases(), then runs them with run_tasks() at several
+batch sizes (tasks claimed per UPDATE). A second pass enqueues every task
+twice, to show identical waiting tasks being batched into one.
+
+Usage:
+    uv run python -m benchmarks.task_worker [--tasks 2000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "floripatalks.settings.test")
+
+
+def setup(path: Path) -> None:
+    from floripatalks.settings.base import sqlite_databases
+
+    settings.DATABASES = sqlite_databases(path)
+    settings.TASKS = {"default": {"BACKEND": "core.task_queue.DatabaseBackend"}}
+    django.setup()
+
+    from django.core.management import call_command
+
+    # Test settings disable migrations; syncdb builds the same tables
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def touch(n: int) -> int:
+    return n
+
+
+def enqueue(tasks: int, copies: int) -> float:
+    started = time.perf_counter()
+    for n in range(tasks):
+        for _ in range(copies):
+            touch.enqueue(n)
+    return time.perf_counter() - started
+
+
+def drain(batch_size: int) -> tuple[int, float]:
+    from core.task_queue import run_tasks
+
+    ran = 0
+    started = time.perf_counter()
+    while batch := run_tasks("default", batch_size, "benchmark").tasks:
+        ran += batch
+    return ran, time.perf_counter() - started
+
+
+def main() -> None:
+    global touch
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup(Path(tmp) / "db.sqlite3")
+        from django.tasks import task
+
+        # @task needs the tasks framework configured, so it is applied after setup()
+        touch = task(touch)
+
+        for batch_size in (1, 20, 100):
+            enqueue_seconds = enqueue(args.tasks, copies=1)
+            ran, run_seconds = drain(batch_size)
+            print(
+                f"batch size {batch_size:>3}: enqueued {args.tasks / enqueue_seconds:8,.0f}/s"
+                f"  ran {ran:,} at {ran / run_seconds:8,.0f}/s"
+            )
+
+        enqueue_seconds = enqueue(args.tasks, copies=2)
+        ran, run_seconds = drain(20)
+        print(
+            f"enqueued {2 * args.tasks:,} ({args.tasks:,} distinct) in {enqueue_seconds:.2f} s,"
+            f" ran {ran:,} in {run_seconds:.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
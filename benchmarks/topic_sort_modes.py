@@ -0,0 +1,118 @@
+"""
+Benchmark: latency of each topic listing mode at 1000 topics and 1M votes.
+
+Seeds a temporary SQLite file (configured by sqlite_databases()) with
+seed_load(), one event holding every topic, runs ANALYZE, and times
+get_topics_page() for each TopicSort mode: the first page, and a deep page
+reached by following next_cursor, next to the same deep page fetched by offset
+with get_topics_for_event().
+
+Usage:
+    uv run python -m benchmarks.topic_sort_modes [--topics 1000] [--votes 1000000] [--runs 50]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import django
+from django.conf import settings
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "floripatalks.settings.test")
+
+
+def setup(path: Path) -> None:
+    from floripatalks.settings.base import sqlite_databases
+
+    settings.DATABASES = sqlite_databases(path)
+    django.setup()
+
+    from django.core.management import call_command
+
+    # Test settings disable migrations; syncdb builds the same tables
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def seed(topics: int, votes: int) -> None:
+    from django.db import connection
+
+    from events.services.seed_service import SeedConfig, seed_load
+
+    result = seed_load(SeedConfig(users=20_000, events=1, topics=topics, votes=votes))
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+    print(
+        f"Seeded {result.topics:,} topics, {result.votes:,} votes "
+        f"and {result.users:,} users in {result.seconds:.1f} s"
+    )
+
+
+def timed(call: Callable[[], object], runs: int) -> tuple[float, float]:
+    call()  # Warm up the page cache and statement cache
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.95)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--topics", type=int, default=1000)
+    parser.add_argument("--votes", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=10, help="Page number of the deep page.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup(Path(tmp) / "db.sqlite3")
+        seed(args.topics, args.votes)
+
+        from django.db.models import Count
+
+        from accounts.models import User
+        from events.models import Event
+        from events.services.topic_service import (
+            TOPICS_PAGE_SIZE,
+            TopicSort,
+            get_topics_for_event,
+            get_topics_page,
+        )
+
+        slug = Event.objects.get().slug
+        # The user with the most topics: the longest "mine" listing
+        user = User.objects.annotate(count=Count("created_topics")).order_by("-count").first()
+
+        print(f"p50 / p95 over {args.runs} runs, page {args.depth} of {TOPICS_PAGE_SIZE} topics")
+        for sort in TopicSort:
+            if sort == TopicSort.RANKING:
+                continue  # Closed events only; the seeded event is open
+            cursor = None
+            for _ in range(args.depth - 1):
+                cursor = get_topics_page(slug, sort, cursor=cursor, user=user).next_cursor
+                if cursor is None:
+                    break
+            cases = {
+                "first page": lambda sort=sort: get_topics_page(slug, sort, user=user),
+                "cursor page": lambda sort=sort, cursor=cursor: get_topics_page(
+                    slug, sort, cursor=cursor, user=user
+                ),
+                "offset page": lambda sort=sort: get_topics_for_event(
+                    slug, offset=(args.depth - 1) * TOPICS_PAGE_SIZE, user=user, sort=sort
+                ),
+            }
+            for name, call in cases.items():
+                if name == "cursor page" and cursor is None:
+                    continue  # Fewer pages than --depth in this mode
+                p50, p95 = timed(call, args.runs)
+                print(f"{sort.value:>9} {name:>12}: p50 {p50:7.2f} ms  p95 {p95:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: UUID keys as char(32) hex text vs 16-byte BLOB on SQLite.
+
+Builds two databases with the same events_vote-shaped table (UUID primary key,
+topic/user foreign keys, the unique (topic, user) index and the topic index),
+fills them with identical data and compares file size and the per-vote lookup
+done by vote_service / the has_voted subquery.
+
+Usage:
+    uv run python -m benchmarks.uuid_storage [--votes 1000000] [--topics 1000] [--users 20000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+import uuid6
+
+SCHEMA = """
+CREATE TABLE events_vote (
+    id {type} NOT NULL PRIMARY KEY,
+    created_at datetime NOT NULL,
+    topic_id {type} NOT NULL,
+    user_id {type} NOT NULL
+);
+CREATE UNIQUE INDEX events_vote_topic_user_uniq ON events_vote (topic_id, user_id);
+CREATE INDEX events_vote_topic_idx ON events_vote (topic_id);
+"""
+
+
+def build(path: Path, column_type: str, encode: Callable[[uuid.UUID], object], rows: list) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA.format(type=column_type))
+    conn.executemany(
+        "INSERT INTO events_vote VALUES (?, ?, ?, ?)",
+        ((encode(v), created, encode(t), encode(u)) for v, created, t, u in rows),
+    )
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+
+def time_lookups(path: Path, encode: Callable[[uuid.UUID], object], probes: list) -> float:
+    conn = sqlite3.connect(path)
+    query = "SELECT 1 FROM events_vote WHERE topic_id = ? AND user_id = ? LIMIT 1"
+    started = time.perf_counter()
+    for topic_id, user_id in probes:
+        conn.execute(query, (encode(topic_id), encode(user_id))).fetchone()
+    elapsed = time.perf_counter() - started
+    conn.close()
+    return elapsed / len(probes) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--votes", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=1_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--probes", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    topics = [uuid6.uuid6() for _ in range(args.topics)]
+    users = [uuid6.uuid6() for _ in range(args.users)]
+    pairs = set()
+    while len(pairs) < min(args.votes, args.topics * args.users):
+        pairs.add((rng.randrange(args.topics), rng.randrange(args.users)))
+    rows = [(uuid6.uuid6(), "2025-12-10 12:00:00", topics[t], users[u]) for t, u in pairs]
+    probes = [
+        (topics[rng.randrange(args.topics)], users[rng.randrange(args.users)])
+        for _ in range(args.probes)
+    ]
+
+    variants = {
+        "char(32) hex text": ("char(32)", lambda value: value.hex),
+        "16-byte blob": ("blob", lambda value: value.bytes),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{len(rows):,} votes, {args.topics:,} topics, {args.users:,} users")
+        for label, (column_type, encode) in variants.items():
+            path = Path(tmp) / f"{column_type.replace('(', '').replace(')', '')}.sqlite3"
+            build(path, column_type, encode, rows)
+            size_mb = path.stat().st_size / 1024 / 1024
+            lookup_us = time_lookups(path, encode, probes)
+            print(f"{label:>18}: {size_mb:8.1f} MB  {lookup_us:6.2f} µs/lookup")
+
+
+if __name__ == "__main__":
+    main()
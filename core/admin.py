@@ -1 +1,25 @@
-# Register your models here.
+"""
+Django admin configuration for core app.
+"""
+
+from django.contrib import admin
+from django.http import HttpRequest
+
+from core.models import QueuedTask
+
+
+@admin.register(QueuedTask)
+class QueuedTaskAdmin(admin.ModelAdmin):
+    """Read-only view of background tasks and their results (core.task_queue)."""
+
+    list_display = ["task_path", "status", "queue_name", "created_at", "finished_at"]
+    list_filter = ["status", "queue_name", "task_path"]
+    search_fields = ["task_path"]
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        """Tasks are only created by enqueueing them."""
+        return False
+
+    def has_change_permission(self, _request: HttpRequest, _obj: object = None) -> bool:
+        """Tasks are only changed by the worker running them."""
+        return False
@@ -1,5 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
     name = "core"
+
+    def ready(self) -> None:
+        if settings.NPLUSONE_DETECTION:
+            from core import nplusone
+
+            nplusone.install()
@@ -0,0 +1,212 @@
+"""
+Online backup and restore of the SQLite database.
+
+Backups use SQLite's backup API (sqlite3.Connection.backup) on the live
+`default` connection, copying a few pages per step and sleeping in between, so
+the app keeps serving (and writing) while a snapshot is taken. Each snapshot is
+checked with `PRAGMA integrity_check` before it is kept, optionally gzipped, and
+only the newest BACKUP_KEEP snapshots in BACKUP_DIR are retained.
+
+Restores also go through the backup API, into the open database, so gunicorn's
+persistent connections (CONN_MAX_AGE) see the restored data instead of holding
+on to a replaced file. Every worker's caches are then invalidated, and
+`database_restored` is sent for apps to retire what clients may have cached
+(e.g. version numbers the restored rows would reuse).
+"""
+
+import gzip
+import shutil
+import sqlite3
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.dispatch import Signal
+
+from core.invalidation import get_bus
+
+SNAPSHOT_PREFIX = "floripatalks-"
+SNAPSHOT_SUFFIXES = (".sqlite3", ".sqlite3.gz")
+
+# Sent with `snapshot` once a snapshot's contents replaced the database's
+database_restored = Signal()
+
+
+class BackupError(Exception):
+    """A snapshot couldn't be taken, verified or restored."""
+
+
+@dataclass
+class BackupResult:
+    """Summary of a backup run."""
+
+    path: Path
+    size: int = 0
+    steps: int = 0
+    seconds: float = 0.0
+    removed: list[Path] = field(default_factory=list)
+
+
+def _raw_connection() -> sqlite3.Connection:
+    connection = connections[DEFAULT_DB_ALIAS]
+    connection.ensure_connection()
+    return connection.connection
+
+
+def list_snapshots(directory: Path | str | None = None) -> list[Path]:
+    """Snapshots in `directory` (default BACKUP_DIR), newest first."""
+    directory = Path(directory or settings.BACKUP_DIR)
+    if not directory.is_dir():
+        return []
+    snapshots = [
+        path
+        for path in directory.glob(f"{SNAPSHOT_PREFIX}*")
+        if path.name.endswith(SNAPSHOT_SUFFIXES)
+    ]
+    # Names embed a UTC timestamp, so name order is age order
+    return sorted(snapshots, reverse=True)
+
+
+def check_integrity(path: Path) -> None:
+    """
+    Run `PRAGMA integrity_check` on an uncompressed database file.
+
+    Raises:
+        BackupError: If the file isn't a healthy SQLite database
+    """
+    try:
+        with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+            rows = [row[0] for row in conn.execute("PRAGMA integrity_check")]
+    except sqlite3.DatabaseError as e:
+        raise BackupError(f"{path.name} is not a valid SQLite database: {e}") from e
+    if rows != ["ok"]:
+        raise BackupError(f"{path.name} failed the integrity check: {'; '.join(rows[:5])}")
+
+
+@contextmanager
+def _uncompressed(snapshot: Path) -> Iterator[Path]:
+    """Yield a path to the snapshot's database file, gunzipping it if needed."""
+    if snapshot.suffix != ".gz":
+        yield snapshot
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / snapshot.stem
+        with gzip.open(snapshot, "rb") as source, path.open("wb") as target:
+            shutil.copyfileobj(source, target)
+        yield path
+
+
+def verify_snapshot(snapshot: Path) -> None:
+    """
+    Check a (possibly gzipped) snapshot's integrity.
+
+    Raises:
+        BackupError: If the snapshot can't be read or is corrupt
+    """
+    try:
+        with _uncompressed(snapshot) as path:
+            check_integrity(path)
+    except (OSError, EOFError) as e:
+        raise BackupError(f"Can't read {snapshot.name}: {e}") from e
+
+
+def rotate_snapshots(directory: Path, keep: int) -> list[Path]:
+    """Delete all but the newest `keep` snapshots; return the deleted paths."""
+    removed = list_snapshots(directory)[keep:]
+    for path in removed:
+        path.unlink(missing_ok=True)
+    return removed
+
+
+def backup_database(
+    directory: Path | str | None = None,
+    pages: int = 256,
+    sleep: float = 0.01,
+    compress: bool = False,
+    keep: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> BackupResult:
+    """
+    Take a verified snapshot of the live database.
+
+    The copy runs `pages` pages per step and sleeps `sleep` seconds between
+    steps; SQLite only holds a read lock during each step, so writers aren't
+    blocked for longer than one step. If another connection writes mid-backup,
+    SQLite restarts the copy, so the result is always a consistent snapshot.
+
+    Args:
+        directory: Where to store the snapshot (default BACKUP_DIR)
+        pages: Pages copied per step (-1 copies everything in one step)
+        sleep: Seconds to sleep between steps
+        compress: Gzip the snapshot
+        keep: Snapshots to keep after this one is added (default BACKUP_KEEP)
+        progress: Called after each step with (remaining pages, total pages)
+
+    Returns:
+        BackupResult with the snapshot path, size, steps and removed snapshots
+
+    Raises:
+        BackupError: If the copy fails its integrity check (nothing is kept)
+    """
+    started = time.monotonic()
+    directory = Path(directory or settings.BACKUP_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{SNAPSHOT_PREFIX}{datetime.now(UTC):%Y%m%dT%H%M%S%fZ}.sqlite3"
+    final = directory / (f"{name}.gz" if compress else name)
+    partial = directory / f".{name}.partial"
+    result = BackupResult(path=final)
+
+    def on_step(_status: int, remaining: int, total: int) -> None:
+        result.steps += 1
+        if progress:
+            progress(remaining, total)
+
+    try:
+        with closing(sqlite3.connect(partial)) as target:
+            _raw_connection().backup(target, pages=pages, progress=on_step, sleep=sleep)
+            # The copy inherits WAL mode; a rollback-journal file is self-contained
+            target.execute("PRAGMA journal_mode = DELETE")
+        check_integrity(partial)
+        if compress:
+            compressed = partial.with_suffix(".gz.partial")
+            with partial.open("rb") as source, gzip.open(compressed, "wb") as target:
+                shutil.copyfileobj(source, target)
+            compressed.replace(final)
+        else:
+            partial.replace(final)
+    finally:
+        # Only complete, verified snapshots ever get a snapshot name
+        partial.unlink(missing_ok=True)
+        partial.with_suffix(".gz.partial").unlink(missing_ok=True)
+
+    result.size = final.stat().st_size
+    result.removed = rotate_snapshots(directory, keep if keep is not None else settings.BACKUP_KEEP)
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def restore_database(snapshot: Path) -> None:
+    """
+    Replace the live database's contents with a snapshot.
+
+    The snapshot is verified first. The copy runs in a single backup step, so
+    other connections see either the old or the restored database, never a mix.
+    Afterwards every worker's caches are invalidated and `database_restored` is sent.
+
+    Raises:
+        BackupError: If the snapshot is corrupt or the copy fails
+    """
+    verify_snapshot(snapshot)
+    with _uncompressed(snapshot) as path, closing(sqlite3.connect(path)) as source:
+        try:
+            source.backup(_raw_connection(), pages=-1)
+        except sqlite3.Error as e:
+            raise BackupError(f"Restore from {snapshot.name} failed: {e}") from e
+    get_bus().publish_all()
+    database_restored.send(sender=restore_database, snapshot=snapshot)
@@ -0,0 +1,52 @@
+"""
+Custom model fields for FloripaTalks.
+"""
+
+import uuid
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import UUIDField
+
+
+class BinaryUUIDField(UUIDField):
+    """
+    UUIDField stored as a 16-byte BLOB on SQLite.
+
+    Django's UUIDField falls back to char(32) hex text on databases without a
+    native uuid type, so on SQLite every primary key, foreign key and index entry
+    is twice the needed size. This field stores the raw 16 bytes there instead and
+    behaves exactly like UUIDField (native uuid column) on other databases.
+
+    Foreign keys pointing at a BinaryUUIDField inherit its column type and
+    conversions, so only the primary key needs to declare it.
+    """
+
+    def get_internal_type(self) -> str:
+        # Not "UUIDField": SQLite's backend converter would try to parse the
+        # returned bytes as hex text. Conversion is handled by from_db_value.
+        return "BinaryUUIDField"
+
+    def db_type(self, connection: BaseDatabaseWrapper) -> str:
+        if connection.vendor == "sqlite":
+            return "blob"
+        return connection.data_types["UUIDField"]
+
+    def get_db_prep_value(
+        self, value: object, connection: BaseDatabaseWrapper, prepared: bool = False
+    ) -> object:
+        if connection.vendor != "sqlite":
+            return super().get_db_prep_value(value, connection, prepared)
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = self.to_python(value)
+        return value.bytes
+
+    def from_db_value(
+        self, value: object, _expression: object, _connection: BaseDatabaseWrapper
+    ) -> uuid.UUID | None:
+        if isinstance(value, bytes | memoryview):
+            return uuid.UUID(bytes=bytes(value))
+        # Native uuid columns return UUID; hex text still comes back from rows
+        # written before the binary migration and from backends without uuid.
+        return self.to_python(value)
@@ -0,0 +1,191 @@
+"""
+Redundant index audit for the SQLite schema.
+
+Reads the indexes SQLite actually has (PRAGMA index_list / index_xinfo and the
+partial-index WHERE clause from sqlite_master) and reports the ones another
+index on the same table already makes useless:
+
+- duplicates: same key columns (order, direction, collation) and same WHERE;
+- prefixes: a non-unique index whose key is the leading part of another index
+  with the same WHERE, e.g. Index(topic) next to unique_together (topic, user).
+
+Unique indexes are never reported as prefixes (they enforce a constraint), and
+a partial index is only compared with indexes that have the same condition.
+Each finding names the model declaration that created the index, so it can be
+removed from the model and a migration generated.
+"""
+
+import re
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+@dataclass(frozen=True)
+class IndexInfo:
+    """One index as SQLite sees it."""
+
+    table: str
+    name: str
+    # (column, descending, collation) per key column, in key order
+    key: tuple[tuple[str, bool, str], ...]
+    unique: bool
+    # Normalized WHERE clause of a partial index ("" for full indexes)
+    condition: str = ""
+    source: str = ""
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return tuple(column for column, _desc, _collation in self.key)
+
+
+@dataclass(frozen=True)
+class RedundantIndex:
+    """An index made redundant by another one on the same table."""
+
+    index: IndexInfo
+    covered_by: IndexInfo
+    reason: str
+
+    def describe(self) -> str:
+        return (
+            f"{self.index.table}.{self.index.name} ({', '.join(self.index.columns)}) "
+            f"[{self.index.source}] {self.reason} "
+            f"{self.covered_by.name} ({', '.join(self.covered_by.columns)}) "
+            f"[{self.covered_by.source}]"
+        )
+
+
+def _normalize_condition(sql: str | None) -> str:
+    if not sql:
+        return ""
+    match = re.search(r"\sWHERE\s(.+)$", sql, re.IGNORECASE | re.DOTALL)
+    if not match:
+        return ""
+    return re.sub(r"\s+", " ", match.group(1).replace('"', "")).strip().lower()
+
+
+def _index_sources(connection: object, table: str) -> dict[str, str]:
+    """Map index names Django would create for `table` to the declaration behind them."""
+    # Only used for its name generation; entering it would toggle foreign keys
+    editor = connection.SchemaEditorClass(connection, collect_sql=True)
+    sources: dict[str, str] = {}
+    for model in apps.get_models():
+        meta = model._meta
+        if meta.db_table != table:
+            continue
+        label = meta.object_name
+        for index in meta.indexes:
+            sources[index.name] = f"{label}.Meta.indexes"
+        for constraint in meta.constraints:
+            sources[constraint.name] = f"{label}.Meta.constraints"
+        for fields in meta.unique_together:
+            columns = [meta.get_field(name).column for name in fields]
+            name = editor._create_index_name(table, columns, suffix="_uniq")
+            sources[name] = f"{label}.Meta.unique_together"
+        for field in meta.local_fields:
+            if field.db_index and not field.unique:
+                name = editor._create_index_name(table, [field.column], suffix="")
+                kind = "ForeignKey" if field.is_relation else "db_index"
+                sources[name] = f"{label}.{field.name} ({kind})"
+    return sources
+
+
+def table_indexes(table: str, using: str = DEFAULT_DB_ALIAS) -> list[IndexInfo]:
+    """
+    The indexes of `table`, including SQLite's automatic ones for PRIMARY KEY/UNIQUE.
+
+    Expression indexes are skipped: their keys can't be compared column by column.
+    """
+    connection = connections[using]
+    sources = _index_sources(connection, table)
+    quote = connection.ops.quote_name
+    indexes = []
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA index_list({quote(table)})")
+        listed = cursor.fetchall()
+        for _seq, name, unique, origin, _partial in listed:
+            cursor.execute(f"PRAGMA index_xinfo({quote(name)})")
+            key_rows = [row for row in cursor.fetchall() if row[5]]
+            if any(row[1] < 0 for row in key_rows):
+                continue
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = %s", [name]
+            )
+            definition = cursor.fetchone()
+            if origin == "pk":
+                source = "primary key"
+            elif origin == "u":
+                source = sources.get(name, "unique field")
+            else:
+                source = sources.get(name, "not declared by a model")
+            indexes.append(
+                IndexInfo(
+                    table=table,
+                    name=name,
+                    key=tuple((row[2], bool(row[3]), row[4].upper()) for row in key_rows),
+                    unique=bool(unique),
+                    condition=_normalize_condition(definition[0] if definition else None),
+                    source=source,
+                )
+            )
+    return sorted(indexes, key=lambda index: index.name)
+
+
+def _redundancy(index: IndexInfo, other: IndexInfo) -> str | None:
+    """Why `other` makes `index` redundant, or None if it doesn't."""
+    if index.condition != other.condition:
+        return None
+    if index.key == other.key:
+        # Keep the one that enforces something; among equals, the first by name
+        if index.unique and not other.unique:
+            return None
+        if index.unique == other.unique and index.name < other.name:
+            return None
+        return "duplicates"
+    if not index.unique and other.key[: len(index.key)] == index.key:
+        return "is a prefix of"
+    return None
+
+
+def find_redundant_indexes(
+    app_labels: list[str] | None = None, using: str = DEFAULT_DB_ALIAS
+) -> list[RedundantIndex]:
+    """
+    Report redundant indexes on the tables of the given apps' models.
+
+    Args:
+        app_labels: Apps to audit (default: every installed app)
+        using: Database alias
+
+    Returns:
+        One RedundantIndex per redundant index, naming an index that covers it
+
+    Raises:
+        LookupError: If an app label isn't installed
+    """
+    connection = connections[using]
+    if app_labels is None:
+        models = apps.get_models()
+    else:
+        models = [
+            model for label in app_labels for model in apps.get_app_config(label).get_models()
+        ]
+    existing = set(connection.introspection.table_names())
+    tables = sorted({model._meta.db_table for model in models} & existing)
+
+    findings = []
+    for table in tables:
+        indexes = table_indexes(table, using=using)
+        # Point each finding at the strongest cover: unique first, then the widest key
+        covers = sorted(indexes, key=lambda index: (not index.unique, -len(index.key), index.name))
+        for index in indexes:
+            for other in covers:
+                if other is index:
+                    continue
+                reason = _redundancy(index, other)
+                if reason:
+                    findings.append(RedundantIndex(index=index, covered_by=other, reason=reason))
+                    break
+    return findings
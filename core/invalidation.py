@@ -0,0 +1,160 @@
+"""
+Invalidation of in-process caches across gunicorn workers.
+
+Each worker has its own memory, so a value cached in one worker goes stale
+when another worker writes. The bus is a memory-mapped file of INVALIDATION_BUS_SLOTS
+64-bit version counters, shared by every worker on the host: writers publish
+a key (its counter is incremented, under an exclusive flock), and caches
+remember the counter they were filled at. Checking a key is a read from
+shared memory, with no system call or query, so caches can check on every
+lookup and a write in one worker is seen by the next request of any other.
+
+Keys are hashed to slots, so unrelated keys may share a counter; that only
+causes extra invalidations. Counters only move forward while the workers
+run: the file must not be deleted or truncated under them.
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import weakref
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+
+_COUNTER = struct.Struct("<Q")
+
+
+class InvalidationBus:
+    """Version counters in a memory-mapped file, shared between processes."""
+
+    def __init__(self, path: str | Path, slots: int) -> None:
+        self.path = Path(path)
+        self.slots = slots
+        # flock is held per open file, which forked workers would share
+        self.pid = os.getpid()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        size = slots * _COUNTER.size
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        # Growing (never shrinking) keeps the counters other processes have mapped
+        with self._locked():
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _offset(self, key: str) -> int:
+        return (zlib.crc32(key.encode()) % self.slots) * _COUNTER.size
+
+    def version(self, key: str) -> int:
+        """The current counter of a key."""
+        return _COUNTER.unpack_from(self._map, self._offset(key))[0]
+
+    def publish(self, *keys: str) -> None:
+        """Invalidate what every process cached for these keys."""
+        offsets = sorted({self._offset(key) for key in keys})
+        with self._locked():
+            for offset in offsets:
+                (value,) = _COUNTER.unpack_from(self._map, offset)
+                _COUNTER.pack_into(self._map, offset, value + 1)
+
+    def publish_all(self) -> None:
+        """Invalidate everything every process cached (e.g. after a restore)."""
+        with self._locked():
+            for offset in range(0, self.slots * _COUNTER.size, _COUNTER.size):
+                (value,) = _COUNTER.unpack_from(self._map, offset)
+                _COUNTER.pack_into(self._map, offset, value + 1)
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+_bus: InvalidationBus | None = None
+_bus_lock = threading.Lock()
+
+
+def get_bus() -> InvalidationBus:
+    """This process's handle on the bus file at INVALIDATION_BUS_PATH."""
+    global _bus
+    path = Path(settings.INVALIDATION_BUS_PATH)
+    if _bus is None or _bus.path != path or _bus.pid != os.getpid():
+        with _bus_lock:
+            if _bus is None or _bus.path != path or _bus.pid != os.getpid():
+                _bus = InvalidationBus(path, settings.INVALIDATION_BUS_SLOTS)
+    return _bus
+
+
+def publish(*keys: str) -> None:
+    """
+    Invalidate cached values of `keys` in every worker.
+
+    Inside a transaction the keys are published right away (so later reads of
+    this transaction aren't served from the cache) and again once it commits:
+    until then other workers still read the old rows, and may cache them again.
+    """
+    bus = get_bus()
+    bus.publish(*keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: bus.publish(*keys))
+
+
+_caches: "weakref.WeakSet[InvalidatedCache]" = weakref.WeakSet()
+
+
+class InvalidatedCache:
+    """
+    A per-process LRU cache whose entries are dropped when their bus key is published.
+
+    Each entry stores the bus counter read before its value was computed, so a
+    value computed while a write was committing is never kept past the
+    write's publish.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[int, object]] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get_or_set(self, key: Hashable, bus_key: str, compute: Callable[[], object]) -> object:
+        """
+        The cached value of `key`, or `compute()` if `bus_key` was published since.
+        """
+        version = get_bus().version(bus_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                return entry[1]
+        value = compute()
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def clear_caches() -> None:
+    """Empty every InvalidatedCache of this process (e.g. between tests)."""
+    for cache in list(_caches):
+        cache.clear()
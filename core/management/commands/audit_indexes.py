@@ -0,0 +1,66 @@
+"""
+Management command to list redundant indexes in the database schema.
+
+`python manage.py audit_indexes` audits the project's own apps;
+`--all` includes third-party and contrib apps. With `--check` the command
+fails when anything is found, so CI can keep redundant indexes out.
+"""
+
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.index_audit import find_redundant_indexes
+
+
+def _project_app_labels() -> list[str]:
+    base_dir = Path(settings.BASE_DIR).resolve()
+    labels = []
+    for config in apps.get_app_configs():
+        path = Path(config.path).resolve()
+        # A project-local virtualenv (.venv) is under BASE_DIR too
+        if path.is_relative_to(base_dir) and "site-packages" not in path.parts:
+            labels.append(config.label)
+    return labels
+
+
+class Command(BaseCommand):
+    help = (
+        "List indexes made redundant by another index on the same table (exact duplicates "
+        "and non-unique prefixes), with the model declaration that created each one."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "app_labels",
+            nargs="*",
+            help="Apps to audit (default: the project's own apps).",
+        )
+        parser.add_argument(
+            "--all", action="store_true", help="Audit every installed app, including third-party."
+        )
+        parser.add_argument(
+            "--database", default="default", help="Database alias to audit (default: default)."
+        )
+        parser.add_argument(
+            "--check", action="store_true", help="Exit with an error if any index is redundant."
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        app_labels = None if options["all"] else options["app_labels"] or _project_app_labels()
+        try:
+            findings = find_redundant_indexes(app_labels, using=options["database"])
+        except LookupError as e:
+            raise CommandError(str(e)) from e
+
+        if not findings:
+            self.stdout.write(self.style.SUCCESS("No redundant indexes"))
+            return
+        for finding in findings:
+            self.stdout.write(finding.describe())
+        message = f"{len(findings)} redundant index(es)"
+        if options["check"]:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(message))
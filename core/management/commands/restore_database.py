@@ -0,0 +1,75 @@
+"""
+Management command to restore the SQLite database from a backup_database snapshot.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from core.backup import BackupError, backup_database, list_snapshots, restore_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace the database's contents with a verified snapshot. "
+        "The current database is snapshotted first."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "snapshot",
+            nargs="?",
+            type=Path,
+            help="Snapshot file to restore (default: the newest snapshot in --dir).",
+        )
+        parser.add_argument(
+            "--dir",
+            type=Path,
+            default=settings.BACKUP_DIR,
+            help="Snapshot directory used to find the newest snapshot (default: BACKUP_DIR).",
+        )
+        parser.add_argument(
+            "--no-safety-backup",
+            action="store_false",
+            dest="safety_backup",
+            help="Don't snapshot the current database before restoring.",
+        )
+        parser.add_argument(
+            "--noinput",
+            "--no-input",
+            action="store_false",
+            dest="interactive",
+            help="Don't ask for confirmation.",
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        snapshot = options["snapshot"]
+        if snapshot is None:
+            snapshots = list_snapshots(options["dir"])
+            if not snapshots:
+                raise CommandError(f"No snapshots in {options['dir']}")
+            snapshot = snapshots[0]
+        if not snapshot.is_file():
+            raise CommandError(f"{snapshot} does not exist")
+
+        if options["interactive"]:
+            answer = input(
+                f"This will replace ALL data in the database with {snapshot.name}.\n"
+                "Type 'yes' to continue, or 'no' to cancel: "
+            )
+            if answer != "yes":
+                self.stdout.write("Restore cancelled.")
+                return
+
+        try:
+            if options["safety_backup"]:
+                # Kept out of the rotation: it must survive until the restore is checked
+                current = backup_database(
+                    options["dir"], keep=len(list_snapshots(options["dir"])) + 1
+                )
+                self.stdout.write(f"Current database saved to {current.path}")
+            restore_database(snapshot)
+        except BackupError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(f"Restored {snapshot.name}"))
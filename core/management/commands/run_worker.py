@@ -0,0 +1,89 @@
+"""
+Management command running the tasks of core.task_queue.DatabaseBackend.
+
+`python manage.py run_worker` runs next to gunicorn (see startup.sh), polling
+for due tasks until it gets SIGTERM/SIGINT; the task being run is finished
+first, and the rest of its claimed batch is released for the next worker. `--burst` runs the due tasks and exits (e.g. from cron or tests).
+"""
+
+import os
+import signal
+import socket
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.tasks import DEFAULT_TASK_BACKEND_ALIAS, task_backends
+from django.tasks.exceptions import InvalidTaskBackend
+
+from core.task_queue import DatabaseBackend, prune_task_results, run_tasks
+
+
+class Command(BaseCommand):
+    help = "Run tasks enqueued on the database task backend."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--backend",
+            default=DEFAULT_TASK_BACKEND_ALIAS,
+            help="TASKS alias of a DatabaseBackend (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=20,
+            help="Tasks claimed per query (default: %(default)s).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when no task is due (default: %(default)s).",
+        )
+        parser.add_argument("--burst", action="store_true", help="Exit once no task is due.")
+
+    def handle(self, *_args: object, **options: object) -> None:
+        try:
+            backend = task_backends[options["backend"]]
+        except InvalidTaskBackend as e:
+            raise CommandError(str(e)) from e
+        if not isinstance(backend, DatabaseBackend):
+            raise CommandError(f"Task backend {options['backend']!r} isn't a DatabaseBackend")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+
+        worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        retention = timedelta(days=settings.TASK_RESULT_RETENTION_DAYS)
+        pruned_at = 0.0
+
+        self.stdout.write(f"Worker {worker_id} running queues {', '.join(sorted(backend.queues))}")
+        total = 0
+        while not self.stopping:
+            batch = run_tasks(
+                options["backend"],
+                options["batch_size"],
+                worker_id,
+                stopping=lambda: self.stopping,
+            )
+            total += batch.tasks
+            if batch.tasks and options["verbosity"] > 1:
+                self.stdout.write(
+                    f"{batch.succeeded} succeeded, {batch.retried} to retry, {batch.failed} failed"
+                )
+            if batch.tasks:
+                continue
+            if options["burst"]:
+                break
+            if time.monotonic() - pruned_at > 3600:
+                prune_task_results(retention)
+                pruned_at = time.monotonic()
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(f"Ran {total} tasks"))
+
+    def _stop(self, _signum: int, _frame: object) -> None:
+        self.stopping = True
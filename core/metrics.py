@@ -0,0 +1,234 @@
+"""
+Prometheus-style metrics shared across gunicorn workers.
+
+Each worker process keeps its metric values in memory and, at most once per
+METRICS_FLUSH_INTERVAL seconds, writes them to its own JSON file in METRICS_DIR
+(atomic rename, no locking between workers). Updates held back by that throttle
+are written by a timer once the interval has passed, and at exit, so an idle
+worker's last values still reach the file. The /metrics endpoint merges every
+file in the directory and renders the text exposition format.
+
+Counters are cumulative for the lifetime of the directory, so it should be
+emptied when the server starts (see startup.sh), like prometheus_client's
+multiprocess mode.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True)
+class MetricDefinition:
+    """Type, help text and (for histograms) buckets of a metric."""
+
+    type: str
+    help: str
+    buckets: tuple[float, ...] = ()
+
+
+METRICS: dict[str, MetricDefinition] = {
+    "floripatalks_http_requests_total": MetricDefinition(
+        "counter", "HTTP requests by URL name, method and status."
+    ),
+    "floripatalks_http_request_duration_seconds": MetricDefinition(
+        "histogram", "HTTP request latency by URL name.", LATENCY_BUCKETS
+    ),
+    "floripatalks_http_response_size_bytes": MetricDefinition(
+        "histogram", "HTTP response body size by URL name.", SIZE_BUCKETS
+    ),
+    "floripatalks_db_queries_per_request": MetricDefinition(
+        "histogram", "SQL queries run per request by URL name.", QUERY_COUNT_BUCKETS
+    ),
+    "floripatalks_db_query_duration_seconds_total": MetricDefinition(
+        "counter", "Time spent in SQL queries by URL name."
+    ),
+    "floripatalks_votes_created_total": MetricDefinition("counter", "Votes created."),
+    "floripatalks_topics_created_total": MetricDefinition("counter", "Topics created."),
+}
+
+
+def _labels(labels: dict[str, str] | None) -> Labels:
+    return tuple(sorted((labels or {}).items()))
+
+
+class MetricsStore:
+    """
+    Metric values of one worker process, flushed to a file shared via METRICS_DIR.
+    """
+
+    def __init__(self, directory: Path, flush_interval: float) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self.pid = os.getpid()
+        # pid alone could be reused by a later worker and overwrite a dead
+        # worker's (still valid) counters
+        self.path = self.directory / f"{self.pid}-{uuid.uuid4().hex}.json"
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        # (name, labels) -> [bucket counts..., sum, count]
+        self._histograms: dict[tuple[str, Labels], list[float]] = {}
+        self._last_flush: float | None = None
+        self._dirty = False
+        # Pending flush of the updates a throttled flush held back
+        self._timer: threading.Timer | None = None
+
+    def inc(self, name: str, labels: dict[str, str] | None = None, amount: float = 1) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+            self._dirty = True
+        self.flush()
+
+    def observe(self, name: str, value: float, labels: dict[str, str] | None = None) -> None:
+        buckets = METRICS[name].buckets
+        key = (name, _labels(labels))
+        with self._lock:
+            values = self._histograms.setdefault(key, [0.0] * (len(buckets) + 2))
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    values[i] += 1
+            values[-2] += value
+            values[-1] += 1
+            self._dirty = True
+        self.flush()
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Write this worker's values to its file, at most once per flush interval.
+
+        A throttled flush schedules another for the end of the interval.
+        """
+        now = time.monotonic()
+        throttled = self._last_flush is not None and now - self._last_flush < self.flush_interval
+        if not self._dirty:
+            return
+        if throttled and not force:
+            self._schedule_flush(self._last_flush + self.flush_interval - now)
+            return
+        with self._lock:
+            data = {
+                "counters": [
+                    [name, list(labels), value] for (name, labels), value in self._counters.items()
+                ],
+                "histograms": [
+                    [name, list(labels), values]
+                    for (name, labels), values in self._histograms.items()
+                ],
+            }
+            self._dirty = False
+            self._last_flush = now
+            # Written under the lock: threads of one worker share the temp file
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data))
+            os.replace(tmp_path, self.path)
+
+    def _schedule_flush(self, delay: float) -> None:
+        with self._lock:
+            if self._timer is not None and self._timer.is_alive():
+                return
+            self._timer = threading.Timer(delay, self.flush, kwargs={"force": True})
+            # Never keeps the process alive: the exit flush (see get_store) covers it
+            self._timer.daemon = True
+            self._timer.start()
+
+    def collect(
+        self,
+    ) -> tuple[dict[tuple[str, Labels], float], dict[tuple[str, Labels], list[float]]]:
+        """Merge the values flushed by every worker (including this one)."""
+        self.flush(force=True)
+        counters: dict[tuple[str, Labels], float] = {}
+        histograms: dict[tuple[str, Labels], list[float]] = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # Worker file removed or replaced mid-read
+            for name, labels, value in data["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, values in data["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.setdefault(key, [0.0] * len(values))
+                for i, value in enumerate(values):
+                    merged[i] += value
+        return counters, histograms
+
+
+_store: MetricsStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> MetricsStore:
+    """Return this process's store, creating a new one after a fork (e.g. gunicorn --preload)."""
+    global _store
+    if _store is None or _store.pid != os.getpid():
+        with _store_lock:
+            if _store is None or _store.pid != os.getpid():
+                _store = MetricsStore(settings.METRICS_DIR, settings.METRICS_FLUSH_INTERVAL)
+                atexit.register(_store.flush, force=True)
+    return _store
+
+
+def inc(name: str, labels: dict[str, str] | None = None, amount: float = 1) -> None:
+    """Increment a counter."""
+    get_store().inc(name, labels, amount)
+
+
+def observe(name: str, value: float, labels: dict[str, str] | None = None) -> None:
+    """Record a histogram observation."""
+    get_store().observe(name, value, labels)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render_exposition() -> str:
+    """Render all workers' metrics in the Prometheus text exposition format (0.0.4)."""
+    counters, histograms = get_store().collect()
+    lines: list[str] = []
+    for name, definition in METRICS.items():
+        lines.append(f"# HELP {name} {definition.help}")
+        lines.append(f"# TYPE {name} {definition.type}")
+        if definition.type == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            continue
+        for (metric, labels), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            for bound, count in zip(definition.buckets, values, strict=False):
+                le = (("le", _format_value(bound)),)
+                lines.append(f"{name}_bucket{_format_labels(labels, le)} {_format_value(count)}")
+            inf = (("le", "+Inf"),)
+            lines.append(f"{name}_bucket{_format_labels(labels, inf)} {_format_value(values[-1])}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-2])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(values[-1])}")
+    return "\n".join(lines) + "\n"
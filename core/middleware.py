@@ -0,0 +1,326 @@
+"""
+Middleware for core utilities.
+
+Each runs in the handler's mode (sync under WSGI, async under ASGI), so Django
+never adapts the chain around it: under ASGI, an async view such as the event
+page's long poll waits without holding a thread.
+"""
+
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from core import metrics
+from core.nplusone import track_lazy_loads
+from core.profiling import (
+    RequestProfiler,
+    new_report,
+    release_profiler,
+    save_report,
+    try_acquire_profiler,
+)
+from core.routers import read_only_queries
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper counting queries and the time spent in them.
+
+    Installed with connection.execute_wrapper(), Django's supported hook for
+    instrumenting every query of a connection.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(
+        self,
+        execute: Callable[..., object],
+        sql: str,
+        params: object,
+        many: bool,
+        context: dict[str, object],
+    ) -> object:
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - started
+
+
+@contextmanager
+def _recording_queries(queries: QueryRecorder) -> Iterator[None]:
+    """Record the queries of every database connection made in this context."""
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(queries))
+        yield
+
+
+class HybridMiddleware:
+    """
+    Base of middleware that is both sync and async capable.
+
+    Subclasses implement handle() for the sync chain and ahandle() for the
+    async one; __call__ picks the one matching get_response.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if self.async_mode:
+            return self.ahandle(request)
+        return self.handle(request)
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        raise NotImplementedError
+
+
+class MetricsMiddleware(HybridMiddleware):
+    """
+    Record latency, SQL count/time, response size and status per resolved URL name.
+
+    Must be first in MIDDLEWARE so the latency covers the whole middleware stack.
+    Requests that don't resolve to a URL pattern are labeled "unresolved" to keep
+    label cardinality bounded. Streaming responses are recorded once their
+    content has been sent, so the queries and time spent streaming are included.
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        queries = QueryRecorder()
+        started = time.perf_counter()
+        with _recording_queries(queries):
+            response = self.get_response(request)
+        return self._recorded(request, response, queries, started)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        queries = QueryRecorder()
+        started = time.perf_counter()
+        with _recording_queries(queries):
+            response = await self.get_response(request)
+        return self._recorded(request, response, queries, started)
+
+    def _recorded(
+        self, request: HttpRequest, response: HttpResponse, queries: QueryRecorder, started: float
+    ) -> HttpResponse:
+        match = getattr(request, "resolver_match", None)
+        view = {"view": match.view_name if match else "unresolved"}
+        metrics.inc(
+            "floripatalks_http_requests_total",
+            {**view, "method": request.method or "", "status": str(response.status_code)},
+        )
+        if response.streaming:
+            streamed = self._astreamed if response.is_async else self._streamed
+            response.streaming_content = streamed(
+                response.streaming_content, view, queries, started
+            )
+        else:
+            self._record(view, queries, started, len(response.content))
+        return response
+
+    def _streamed(
+        self, content: Iterable[bytes], view: dict[str, str], queries: QueryRecorder, started: float
+    ) -> Iterator[bytes]:
+        size = 0
+        chunks = iter(content)
+        while True:
+            # One chunk at a time: the server may send each chunk from another thread
+            with _recording_queries(queries):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
+            size += len(chunk)
+            yield chunk
+        self._record(view, queries, started, size)
+
+    async def _astreamed(
+        self,
+        content: AsyncIterable[bytes],
+        view: dict[str, str],
+        queries: QueryRecorder,
+        started: float,
+    ) -> AsyncIterator[bytes]:
+        size = 0
+        chunks = aiter(content)
+        while True:
+            with _recording_queries(queries):
+                chunk = await anext(chunks, None)
+            if chunk is None:
+                break
+            size += len(chunk)
+            yield chunk
+        self._record(view, queries, started, size)
+
+    @staticmethod
+    def _record(view: dict[str, str], queries: QueryRecorder, started: float, size: int) -> None:
+        metrics.observe(
+            "floripatalks_http_request_duration_seconds", time.perf_counter() - started, view
+        )
+        metrics.observe("floripatalks_db_queries_per_request", queries.count, view)
+        metrics.inc("floripatalks_db_query_duration_seconds_total", view, queries.seconds)
+        metrics.observe("floripatalks_http_response_size_bytes", size, view)
+
+
+async def _read_chunks(content: AsyncIterable[bytes]) -> list[bytes]:
+    return [chunk async for chunk in content]
+
+
+class ProfilingMiddleware(HybridMiddleware):
+    """
+    Profile a request on demand for staff users (see core.profiling).
+
+    Activated with the `_profile` query parameter or an `X-Profile` header. The
+    report is stored and its admin URL returned in the `X-Profile-Report` header;
+    with `_profile=report` the client is redirected to the report page instead.
+    Streaming responses are read to the end under the profiler (and sent
+    unstreamed), so the work done while streaming is in the report. Must come
+    after AuthenticationMiddleware.
+
+    Under ASGI a profiled request runs in one thread, which the sync views and
+    middleware below are brought back to, since the profiler only sees the
+    thread it was enabled in.
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        requested = request.GET.get("_profile") or request.headers.get("x-profile")
+        if not requested or not request.user.is_staff or not try_acquire_profiler():
+            return self.get_response(request)
+        return self._profiled(request, requested, self.get_response)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        requested = request.GET.get("_profile") or request.headers.get("x-profile")
+        if not requested or not (await request.auser()).is_staff or not try_acquire_profiler():
+            return await self.get_response(request)
+        return await sync_to_async(self._profiled)(
+            request, requested, async_to_sync(self.get_response)
+        )
+
+    def _profiled(
+        self,
+        request: HttpRequest,
+        requested: str,
+        get_response: Callable[[HttpRequest], HttpResponse],
+    ) -> HttpResponse:
+        """Run the request under the profiler acquired by the caller and store its report."""
+        try:
+            report = new_report(
+                request.method or "", request.get_full_path(), request.user.username
+            )
+            queries = QueryRecorder()
+            with _recording_queries(queries), RequestProfiler(report):
+                response = get_response(request)
+                if response.streaming and response.is_async:
+                    response.streaming_content = async_to_sync(_read_chunks)(
+                        response.streaming_content
+                    )
+                elif response.streaming:
+                    response.streaming_content = list(response.streaming_content)
+        finally:
+            release_profiler()
+
+        match = getattr(request, "resolver_match", None)
+        report.view_name = match.view_name if match else ""
+        report.status = response.status_code
+        report.sql_count = queries.count
+        report.sql_seconds = queries.seconds
+        save_report(report)
+
+        report_url = reverse("profile_report_detail", kwargs={"report_id": report.id})
+        if requested == "report":
+            return HttpResponseRedirect(report_url)
+        response["X-Profile-Report"] = report_url
+        return response
+
+
+class ReadOnlyDatabaseMiddleware(HybridMiddleware):
+    """
+    Run the reads of safe-method requests on the read-only database alias.
+
+    GET/HEAD/OPTIONS requests (event page, home, load-more fragments) are wrapped
+    in core.routers.read_only_queries(), so their reads go to the read-only
+    SQLite connection and keep flowing while another request holds a write
+    transaction. Writes are always routed to `default`. Place it before
+    SessionMiddleware so session and user lookups are covered too.
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in SAFE_METHODS:
+            return self.get_response(request)
+        with read_only_queries():
+            return self.get_response(request)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        if request.method not in SAFE_METHODS:
+            return await self.get_response(request)
+        # A context variable: the ORM's sync_to_async threads see it too
+        with read_only_queries():
+            return await self.get_response(request)
+
+
+class NPlusOneMiddleware(HybridMiddleware):
+    """
+    Track lazy related-object loads per request (see core.nplusone).
+
+    Only listed in development and test settings, where NPLUSONE_DETECTION
+    makes repeated lazy loads of a relation warn or raise.
+    """
+
+    def handle(self, request: HttpRequest) -> HttpResponse:
+        with track_lazy_loads():
+            return self.get_response(request)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        with track_lazy_loads():
+            return await self.get_response(request)
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise's static file serving, also in the async chain.
+
+    WhiteNoiseMiddleware is sync only, so under ASGI Django would run everything
+    after it (views included) through a thread. Static files are looked up the
+    same way, and their responses (which open the file) built in a thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        super().__init__(get_response)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.ahandle(request)
+        return super().__call__(request)
+
+    async def ahandle(self, request: HttpRequest) -> HttpResponse:
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,105 @@
+# Generated by Django 6.0 on 2026-10-19 19:05
+
+import django.utils.timezone
+import uuid6
+from django.db import migrations, models
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("core", "0003_delete_concretebasemodel_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedTask",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("task_path", models.CharField(max_length=255, verbose_name="Tarefa")),
+                ("backend", models.CharField(max_length=32, verbose_name="Backend")),
+                ("queue_name", models.CharField(max_length=32, verbose_name="Fila")),
+                ("priority", models.SmallIntegerField(default=0, verbose_name="Prioridade")),
+                ("args", models.JSONField(default=list, verbose_name="Argumentos")),
+                ("kwargs", models.JSONField(default=dict, verbose_name="Argumentos nomeados")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("READY", "Ready"),
+                            ("RUNNING", "Running"),
+                            ("FAILED", "Failed"),
+                            ("SUCCESSFUL", "Successful"),
+                        ],
+                        default="READY",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "run_after",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="Executar após"
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Iniciada em"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Finalizada em"),
+                ),
+                (
+                    "last_attempted_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Última tentativa"),
+                ),
+                ("return_value", models.JSONField(blank=True, null=True, verbose_name="Retorno")),
+                ("errors", models.JSONField(default=list, verbose_name="Erros")),
+                ("worker_ids", models.JSONField(default=list, verbose_name="Workers")),
+                ("dedupe_key", models.CharField(editable=False, max_length=64)),
+                ("claim", models.CharField(blank=True, editable=False, max_length=32, null=True)),
+            ],
+            options={
+                "verbose_name": "Tarefa",
+                "verbose_name_plural": "Tarefas",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        models.F("queue_name"),
+                        models.OrderBy(models.F("priority"), descending=True),
+                        models.F("run_after"),
+                        condition=models.Q(("status", "READY")),
+                        name="core_task_ready_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("status", "RUNNING")),
+                        fields=["claim"],
+                        name="core_task_claim_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("status__in", ["FAILED", "SUCCESSFUL"])),
+                        fields=["finished_at"],
+                        name="core_task_finished_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("status", "READY")),
+                        fields=("dedupe_key",),
+                        name="core_task_unique_ready",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -7,18 +7,23 @@ consistency across the application.
 
 import uuid6
 from django.db import models
+from django.tasks import TaskResultStatus
 from django.utils import timezone
 
+from core.fields import BinaryUUIDField
+
 
 class BaseModel(models.Model):
     """
     Abstract base model providing UUID v6 primary key and timestamps.
 
+    The primary key is a BinaryUUIDField: 16-byte BLOB on SQLite, native uuid elsewhere.
+
     All models should inherit from this class (or SoftDeleteModel) to ensure
     consistency across the application.
     """
 
-    id = models.UUIDField(primary_key=True, default=uuid6.uuid6, editable=False)
+    id = BinaryUUIDField(primary_key=True, default=uuid6.uuid6, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -47,7 +52,10 @@ class SoftDeleteModel(BaseModel):
     should inherit from this class.
     """
 
-    is_deleted = models.BooleanField(default=False, db_index=True)
+    # Not indexed on its own: a boolean column is too unselective to be useful.
+    # Concrete models declare partial indexes with condition=Q(is_deleted=False)
+    # matching their real access paths instead (see events.Topic).
+    is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
     # Custom manager that filters is_deleted=False by default
@@ -69,3 +77,78 @@ class SoftDeleteModel(BaseModel):
         self.is_deleted = False
         self.deleted_at = None
         self.save(update_fields=["is_deleted", "deleted_at"])
+
+
+class QueuedTask(BaseModel):
+    """
+    A task enqueued on core.task_queue.DatabaseBackend, and its result.
+
+    created_at is when it was enqueued. Identical tasks (same function, queue
+    and arguments) share one READY row: enqueueing a task that is already
+    waiting returns the waiting one, so a burst of writes asking for the same
+    maintenance runs it once.
+    """
+
+    task_path = models.CharField("Tarefa", max_length=255)
+    backend = models.CharField("Backend", max_length=32)
+    queue_name = models.CharField("Fila", max_length=32)
+    priority = models.SmallIntegerField("Prioridade", default=0)
+    args = models.JSONField("Argumentos", default=list)
+    kwargs = models.JSONField("Argumentos nomeados", default=dict)
+    status = models.CharField(
+        "Status",
+        max_length=10,
+        choices=TaskResultStatus.choices,
+        default=TaskResultStatus.READY,
+    )
+    # The earliest the task may run: its run_after, or when a retry is due
+    run_after = models.DateTimeField("Executar após", default=timezone.now)
+    started_at = models.DateTimeField("Iniciada em", null=True, blank=True)
+    finished_at = models.DateTimeField("Finalizada em", null=True, blank=True)
+    last_attempted_at = models.DateTimeField("Última tentativa", null=True, blank=True)
+    return_value = models.JSONField("Retorno", null=True, blank=True)
+    # [{"exception_class_path": ..., "traceback": ...}], one per failed attempt
+    errors = models.JSONField("Erros", default=list)
+    worker_ids = models.JSONField("Workers", default=list)
+    # Hash of the task path, queue and arguments (see DatabaseBackend.enqueue)
+    dedupe_key = models.CharField(max_length=64, editable=False)
+    # Set by the worker that claimed the task, to read back its claimed batch
+    claim = models.CharField(max_length=32, null=True, blank=True, editable=False)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Tarefa"
+        verbose_name_plural = "Tarefas"
+        indexes = [
+            # The worker's claim query: ready tasks of a queue, highest priority first
+            models.Index(
+                "queue_name",
+                models.F("priority").desc(),
+                "run_after",
+                name="core_task_ready_idx",
+                condition=models.Q(status=TaskResultStatus.READY),
+            ),
+            models.Index(
+                fields=["claim"],
+                name="core_task_claim_idx",
+                condition=models.Q(status=TaskResultStatus.RUNNING),
+            ),
+            # Pruning of old results walks finished tasks by time
+            models.Index(
+                fields=["finished_at"],
+                name="core_task_finished_idx",
+                condition=models.Q(
+                    status__in=[TaskResultStatus.FAILED, TaskResultStatus.SUCCESSFUL]
+                ),
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dedupe_key"],
+                condition=models.Q(status=TaskResultStatus.READY),
+                name="core_task_unique_ready",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.task_path} ({self.status})"
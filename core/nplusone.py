@@ -0,0 +1,144 @@
+"""
+N+1 query detection for development and tests.
+
+A lazy related-object load is a query run by attribute access: `topic.creator`
+or `vote.user` on an instance that wasn't fetched with select_related() (or
+prefetch_related()). One such load is harmless; the same relation loaded lazily
+for several rows of a model in one request is the N+1 pattern the DTOs
+are meant to prevent, usually a loop or a template iterating over rows.
+
+install() wraps Django's forward (ForeignKey/OneToOneField) and reverse
+one-to-one descriptors so that each load that actually queries the database is
+counted in the active track_lazy_loads() scope: NPlusOneMiddleware opens one
+per request, and tests/conftest.py one per test. When a relation reaches
+NPLUSONE_THRESHOLD lazy loads in a scope, the NPLUSONE_DETECTION setting
+decides what happens: "raise" (tests) raises NPlusOneError at the offending
+access, "warn" (development) logs a warning. Outside a scope nothing is counted.
+
+Reverse foreign key and many-to-many managers (`topic.votes.all()`) aren't
+tracked: their queries can't be told apart from deliberate ones like
+`topic.votes.create()`.
+"""
+
+import logging
+import traceback
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import Model
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor,
+    ReverseOneToOneDescriptor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class NPlusOneError(Exception):
+    """The same relation was lazily loaded for several rows in one scope."""
+
+
+@dataclass
+class LazyLoadTracker:
+    """Rows lazily loaded from, per (model label, relation name), in one request or test."""
+
+    loads: defaultdict[tuple[str, str], set[object]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    allowed: bool = False
+
+
+_tracker: ContextVar[LazyLoadTracker | None] = ContextVar("lazy_load_tracker", default=None)
+
+
+@contextmanager
+def track_lazy_loads() -> Iterator[LazyLoadTracker]:
+    """Count lazy loads made in this context in a fresh tracker."""
+    tracker = LazyLoadTracker()
+    token = _tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _tracker.reset(token)
+
+
+@contextmanager
+def allow_lazy_loads() -> Iterator[None]:
+    """Don't count lazy loads made in this context (e.g. deliberate per-row loads)."""
+    tracker = _tracker.get()
+    if tracker is None:
+        yield
+        return
+    previous = tracker.allowed
+    tracker.allowed = True
+    try:
+        yield
+    finally:
+        tracker.allowed = previous
+
+
+def _caller() -> str:
+    """The innermost project frame outside this module, as "path:line"."""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename).resolve()
+        if (
+            path.is_relative_to(base_dir)
+            and "site-packages" not in path.parts
+            and path != Path(__file__).resolve()
+        ):
+            return f"{path.relative_to(base_dir)}:{frame.lineno}"
+    return "unknown location"
+
+
+def record_lazy_load(instance: Model, name: str) -> None:
+    """Count a lazy load of `instance.<name>`; report it when it looks like an N+1."""
+    tracker = _tracker.get()
+    if tracker is None or tracker.allowed:
+        return
+    key = (instance._meta.label, name)
+    # Distinct rows: reloading one row's relation on a fresh instance isn't an N+1
+    rows = tracker.loads[key]
+    rows.add(instance.pk)
+    # Report once per relation and scope
+    if len(rows) != settings.NPLUSONE_THRESHOLD:
+        return
+
+    message = (
+        f"Possible N+1 query: {key[0]}.{name} was lazily loaded for "
+        f"{len(rows)} rows ({_caller()}). "
+        "Fetch it with select_related() or prefetch_related()."
+    )
+    if settings.NPLUSONE_DETECTION == "raise":
+        raise NPlusOneError(message)
+    logger.warning(message)
+
+
+def install() -> None:
+    """Wrap the related-object descriptors to record lazy loads (idempotent)."""
+    if getattr(ForwardManyToOneDescriptor.get_object, "_records_lazy_loads", False):
+        return
+
+    forward_get_object = ForwardManyToOneDescriptor.get_object
+    reverse_get_queryset = ReverseOneToOneDescriptor.get_queryset
+
+    # Only called by __get__ on a cache miss (prefetching uses get_queryset)
+    def get_object(self: ForwardManyToOneDescriptor, instance: Model) -> Model:
+        record_lazy_load(instance, self.field.name)
+        return forward_get_object(self, instance)
+
+    # Called with the instance hint by __get__ on a cache miss, without it when prefetching
+    def get_queryset(self: ReverseOneToOneDescriptor, **hints: object) -> object:
+        instance = hints.get("instance")
+        if isinstance(instance, Model):
+            record_lazy_load(instance, self.related.accessor_name)
+        return reverse_get_queryset(self, **hints)
+
+    get_object._records_lazy_loads = True
+    ForwardManyToOneDescriptor.get_object = get_object
+    ReverseOneToOneDescriptor.get_queryset = get_queryset
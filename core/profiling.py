@@ -0,0 +1,168 @@
+"""
+On-demand request profiling for staff users.
+
+ProfilingMiddleware runs a request under cProfile when a staff user asks for it
+(`?_profile=1` or `X-Profile: 1`). The report attributes wall time to the app
+layers (events.views, events.use_cases, events.services), the ORM, SQL execution
+and template rendering, and is stored as JSON in PROFILING_DIR. Only the newest
+PROFILING_MAX_REPORTS are kept (a ring buffer on disk); they are browsed from
+the admin (core.views.profile_report_list).
+
+cProfile is deterministic and roughly doubles Python-side time, so compare
+layers against each other rather than against unprofiled latency.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.conf import settings
+
+# Layer name -> path fragments of the source files that belong to it
+LAYERS: dict[str, tuple[str, ...]] = {
+    "events.views": ("/events/views.py",),
+    "events.use_cases": ("/events/use_cases/",),
+    "events.services": ("/events/services/",),
+    "ORM (django.db)": ("/django/db/",),
+    "templates": ("/django/template/", "/django_cotton/"),
+}
+
+TOP_FUNCTIONS = 40
+
+# cProfile allows one active profiler per process (sys.monitoring tool slot), so
+# concurrent profiled requests in a threaded worker run unprofiled instead.
+_profiler_lock = threading.Lock()
+
+
+@dataclass
+class ProfileReport:
+    """One profiled request."""
+
+    id: str
+    created_at: str
+    method: str
+    path: str
+    view_name: str
+    username: str
+    status: int = 0
+    total_seconds: float = 0.0
+    sql_count: int = 0
+    sql_seconds: float = 0.0
+    layers: dict[str, float] = field(default_factory=dict)
+    top_functions: str = ""
+
+
+def _layer_of(filename: str) -> str | None:
+    normalized = filename.replace("\\", "/")
+    for layer, fragments in LAYERS.items():
+        if any(fragment in normalized for fragment in fragments):
+            return layer
+    return None
+
+
+def layer_times(stats: pstats.Stats) -> dict[str, float]:
+    """
+    Inclusive time per layer, without double counting nested or recursive calls.
+
+    A layer's time is the cumulative time of the calls *into* it from code outside
+    it (e.g. views -> use case), so a service calling another service, or the ORM
+    calling itself, is only counted once.
+    """
+    totals = dict.fromkeys(LAYERS, 0.0)
+    for func, (_cc, _nc, _tt, _ct, callers) in stats.stats.items():
+        layer = _layer_of(func[0])
+        if layer is None:
+            continue
+        for caller, (_c_cc, _c_nc, _c_tt, c_ct) in callers.items():
+            if _layer_of(caller[0]) != layer:
+                totals[layer] += c_ct
+    return totals
+
+
+class RequestProfiler:
+    """Profile one callable and build a ProfileReport from it."""
+
+    def __init__(self, report: ProfileReport) -> None:
+        self.report = report
+        self.profiler = cProfile.Profile()
+
+    def __enter__(self) -> "RequestProfiler":
+        self._started = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.profiler.disable()
+        self.report.total_seconds = time.perf_counter() - self._started
+
+        stats = pstats.Stats(self.profiler)
+        self.report.layers = layer_times(stats)
+        output = io.StringIO()
+        pstats.Stats(self.profiler, stream=output).sort_stats("cumulative").print_stats(
+            TOP_FUNCTIONS
+        )
+        self.report.top_functions = output.getvalue()
+
+
+def try_acquire_profiler() -> bool:
+    return _profiler_lock.acquire(blocking=False)
+
+
+def release_profiler() -> None:
+    _profiler_lock.release()
+
+
+def new_report(method: str, path: str, username: str) -> ProfileReport:
+    now = datetime.now(UTC)
+    # Sortable ids: the ring buffer drops the oldest by name
+    report_id = f"{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+    return ProfileReport(
+        id=report_id,
+        created_at=now.isoformat(),
+        method=method,
+        path=path,
+        view_name="",
+        username=username,
+    )
+
+
+def _directory() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def save_report(report: ProfileReport) -> None:
+    """Store a report and drop the oldest ones beyond PROFILING_MAX_REPORTS."""
+    directory = _directory()
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{report.id}.json").write_text(json.dumps(asdict(report)))
+
+    reports = sorted(directory.glob("*.json"))
+    for old in reports[: max(len(reports) - settings.PROFILING_MAX_REPORTS, 0)]:
+        old.unlink(missing_ok=True)
+
+
+def list_reports() -> list[ProfileReport]:
+    """Stored reports, newest first."""
+    reports = []
+    for path in sorted(_directory().glob("*.json"), reverse=True):
+        try:
+            reports.append(ProfileReport(**json.loads(path.read_text())))
+        except (OSError, ValueError, TypeError):
+            continue  # Dropped by the ring buffer mid-read, or an incompatible old report
+    return reports
+
+
+def load_report(report_id: str) -> ProfileReport | None:
+    """Load one report, or None if it doesn't exist (or was rotated out)."""
+    path = _directory() / f"{report_id}.json"
+    # Ids come from URLs: only accept names that are direct children of the directory
+    if path.parent != _directory() or not path.is_file():
+        return None
+    return ProfileReport(**json.loads(path.read_text()))
@@ -0,0 +1,74 @@
+"""
+EXPLAIN QUERY PLAN checks for the SQL a piece of code runs.
+
+capture_plans() runs a callable under CaptureQueriesContext and explains every
+SELECT/UPDATE/DELETE it issued. plan_problems() picks out the plan steps that
+usually mean a missing or unusable index:
+
+- `SCAN <table>`: a full table scan (scans of CTEs/subquery co-routines and
+  `CONSTANT ROW` are fine);
+- `USE TEMP B-TREE FOR ORDER BY|GROUP BY|DISTINCT`: rows sorted at query time
+  instead of read in index order.
+
+Captured SQL has its parameters inlined (that is how Django's SQLite backend
+reports executed queries), so it is explained as-is. Run the checks against a
+seeded, ANALYZEd database: on near-empty tables the planner picks scans because
+they are cheaper, which hides exactly the regressions this is meant to catch.
+"""
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+
+_NAMED_STEP = re.compile(r"^(?:CO-ROUTINE|MATERIALIZE)\s+(.+)$")
+_SCAN = re.compile(r"^SCAN\s+(\S+)")
+_TEMP_BTREE = re.compile(r"^USE TEMP B-TREE FOR (?:LAST TERM OF )?(?:ORDER BY|GROUP BY|DISTINCT)")
+
+
+@dataclass
+class QueryPlan:
+    """One captured statement and its EXPLAIN QUERY PLAN steps."""
+
+    sql: str
+    steps: list[str] = field(default_factory=list)
+
+    @property
+    def problems(self) -> list[str]:
+        return plan_problems(self.steps)
+
+
+def explain(sql: str, using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """The `detail` column of EXPLAIN QUERY PLAN for `sql`, in plan order."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return [row[3] for row in cursor.fetchall()]
+
+
+def plan_problems(steps: list[str]) -> list[str]:
+    """Steps of a plan that are full table scans or temporary sorts."""
+    # Subqueries and CTEs evaluated as co-routines are "scanned" by name
+    named = {match.group(1) for step in steps if (match := _NAMED_STEP.match(step))}
+    named.add("CONSTANT")  # SCAN CONSTANT ROW: a SELECT without FROM
+
+    def is_problem(step: str) -> bool:
+        scan = _SCAN.match(step)
+        return bool(scan and scan.group(1) not in named or _TEMP_BTREE.match(step))
+
+    return [step for step in steps if is_problem(step)]
+
+
+def capture_plans(call: Callable[[], object], using: str = DEFAULT_DB_ALIAS) -> list[QueryPlan]:
+    """Run `call` and explain every explainable statement it executed."""
+    connection = connections[using]
+    with CaptureQueriesContext(connection) as captured:
+        call()
+    return [
+        QueryPlan(sql=query["sql"], steps=explain(query["sql"], using=using))
+        for query in captured.captured_queries
+        if query["sql"].lstrip().upper().startswith(EXPLAINABLE)
+    ]
@@ -0,0 +1,58 @@
+"""
+Identifier of the deployed release, part of the validators of rendered pages.
+
+Validators built only from data (event versions) would keep answering 304
+after a deploy that changed the HTML around the data, e.g. templates or the
+hashed names of static files, leaving clients on pages that point at removed
+assets. get_release() combines RELEASE (set by the deployment, e.g. to the
+commit SHA) with a hash of the project's templates and the static files
+manifest, and dates the release by the newest of those files.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cache
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+
+# Written by collectstatic with ManifestStaticFilesStorage
+STATIC_MANIFEST = "staticfiles.json"
+
+
+@dataclass(frozen=True)
+class Release:
+    """The deployed release: a short identifier and when it was built."""
+
+    id: str
+    built_at: datetime
+
+
+def _release_files() -> list[Path]:
+    """The project's templates and the static files manifest, in a stable order."""
+    directories = [Path(path) for engine in settings.TEMPLATES for path in engine["DIRS"]]
+    base_dir = Path(settings.BASE_DIR).resolve()
+    for config in apps.get_app_configs():
+        path = Path(config.path).resolve()
+        # Third-party templates only change with a dependency upgrade (set RELEASE)
+        if path.is_relative_to(base_dir) and "site-packages" not in path.parts:
+            directories.append(path / "templates")
+    files = sorted(path for directory in directories for path in directory.rglob("*.html"))
+    manifest = Path(settings.STATIC_ROOT) / STATIC_MANIFEST
+    if manifest.is_file():
+        files.append(manifest)
+    return files
+
+
+@cache
+def get_release() -> Release:
+    """The deployed release (computed once per process)."""
+    digest = hashlib.sha256(settings.RELEASE.encode())
+    built_at = datetime.fromtimestamp(0, UTC)
+    for path in _release_files():
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+        built_at = max(built_at, datetime.fromtimestamp(path.stat().st_mtime, UTC))
+    return Release(id=digest.hexdigest()[:12], built_at=built_at.replace(microsecond=0))
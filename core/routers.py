@@ -0,0 +1,89 @@
+"""
+Database routing between the writer and the read-only SQLite connection.
+
+Settings may define a READ_ONLY_DATABASE alias opened on the same SQLite file
+in read-only URI mode (`mode=ro`) with `PRAGMA query_only`. Inside
+read_only_queries() (ReadOnlyDatabaseMiddleware wraps GET/HEAD/OPTIONS
+requests in it) reads go to that alias, so listing pages never take write
+locks, while every write still goes to `default`.
+
+Reads stay on `default` while it is inside a transaction, so code that writes
+and then reads in one atomic block sees its own uncommitted rows.
+
+Streamed responses read after the middleware returned: read_only_snapshot()
+routes their reads again, all in one transaction so every chunk sees the
+database as the first one did.
+"""
+
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Model
+
+READ_ONLY_DATABASE = "readonly"
+
+_read_only = ContextVar("read_only_queries", default=False)
+
+
+@contextmanager
+def read_only_queries() -> Iterator[None]:
+    """Route reads made in this context to the read-only alias, when configured."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def _read_alias() -> str | None:
+    """The alias reads are routed to here (None: default)."""
+    if (
+        _read_only.get()
+        and READ_ONLY_DATABASE in settings.DATABASES
+        and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+    ):
+        return READ_ONLY_DATABASE
+    return None
+
+
+def read_only_snapshot[T](items: Iterator[T]) -> Generator[T]:
+    """
+    Iterate `items` (e.g. the batches of a streamed response) as read_only_queries(),
+    with all their reads in one transaction: on SQLite in WAL mode, one snapshot.
+
+    Each step runs inside read_only_queries() on its own, so the routing never
+    leaks to the consumer between steps. Close the generator if it isn't
+    exhausted: the transaction stays open until then.
+    """
+    with read_only_queries():
+        alias = _read_alias() or DEFAULT_DB_ALIAS
+    with transaction.atomic(using=alias):
+        while True:
+            with read_only_queries():
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+            yield item
+
+
+class ReadOnlyRouter:
+    """Send reads to READ_ONLY_DATABASE inside read_only_queries(), writes to default."""
+
+    def db_for_read(self, _model: type[Model], **_hints: object) -> str | None:
+        return _read_alias()
+
+    def db_for_write(self, _model: type[Model], **_hints: object) -> str:
+        # Explicit: without it, saving an instance read from the read-only alias
+        # would go back to that alias (Django's instance-hint fallback)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, _obj1: Model, _obj2: Model, **_hints: object) -> bool:
+        # Both aliases are the same SQLite file
+        return True
+
+    def allow_migrate(self, db: str, _app_label: str, **_hints: object) -> bool | None:
+        return False if db == READ_ONLY_DATABASE else None
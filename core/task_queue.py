@@ -0,0 +1,350 @@
+"""
+A database-backed backend for Django's tasks framework, and its worker.
+
+DatabaseBackend stores enqueued tasks as core.QueuedTask rows in the default
+database, in the caller's transaction: a task enqueued by a write that rolls
+back is never run, and the worker (`manage.py run_worker`) only sees it once
+the write has committed.
+
+Identical tasks waiting to run are batched into one (see QueuedTask). Failed
+attempts are retried MAX_ATTEMPTS times in all, RETRY_DELAY seconds apart
+(doubling each time). A claimed task is leased to its worker for LEASE
+seconds from its claim, renewed when its attempt starts: tasks whose worker
+died (no outcome within the lease) are claimed again, the lost attempt counted
+as a failed one. Backend OPTIONS:
+
+    MAX_ATTEMPTS: Attempts per task, the first included (default 3)
+    RETRY_DELAY: Seconds before the first retry (default 10)
+    LEASE: Seconds a worker has to store a task's outcome, longer than any
+        task runs (default 600)
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from traceback import format_exception
+
+from django.db import IntegrityError, transaction
+from django.db.models import Subquery
+from django.tasks import Task, TaskContext, TaskResult, TaskResultStatus, task_backends
+from django.tasks.backends.base import BaseTaskBackend
+from django.tasks.base import TaskError
+from django.tasks.exceptions import InvalidTask, TaskResultDoesNotExist
+from django.tasks.signals import task_enqueued, task_finished, task_started
+from django.utils import timezone
+from django.utils.json import normalize_json
+from django.utils.module_loading import import_string
+
+from core.models import QueuedTask
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 10
+DEFAULT_LEASE = 600
+
+
+class TaskLeaseExpired(Exception):
+    """The worker running a task stopped before storing its outcome (recorded as its error)."""
+
+
+def _dedupe_key(task: Task, args: list, kwargs: dict) -> str:
+    payload = json.dumps(
+        [task.module_path, task.queue_name, task.priority, args, kwargs], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_task(task_path: str) -> Task:
+    """The Task a QueuedTask row refers to (the module attribute its @task made)."""
+    loaded = import_string(task_path)
+    if not isinstance(loaded, Task):
+        raise InvalidTask(f"{task_path!r} is not a task")
+    return loaded
+
+
+class DatabaseBackend(BaseTaskBackend):
+    """Tasks framework backend storing tasks in core.QueuedTask, run by `run_worker`."""
+
+    supports_defer = True
+    supports_get_result = True
+    supports_priority = True
+
+    def __init__(self, alias: str, params: dict) -> None:
+        super().__init__(alias, params)
+        self.max_attempts = self.options.get("MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)
+        self.retry_delay = self.options.get("RETRY_DELAY", DEFAULT_RETRY_DELAY)
+        self.lease = self.options.get("LEASE", DEFAULT_LEASE)
+
+    def enqueue(self, task: Task, args: tuple, kwargs: dict) -> TaskResult:
+        """Store the task, or return the identical one already waiting to run."""
+        self.validate_task(task)
+        args, kwargs = normalize_json(list(args)), normalize_json(kwargs)
+        key = _dedupe_key(task, args, kwargs)
+        waiting = QueuedTask.objects.filter(dedupe_key=key, status=TaskResultStatus.READY)
+
+        record = waiting.first()
+        if record is None:
+            try:
+                with transaction.atomic():
+                    record = QueuedTask.objects.create(
+                        task_path=task.module_path,
+                        backend=self.alias,
+                        queue_name=task.queue_name,
+                        priority=task.priority,
+                        args=args,
+                        kwargs=kwargs,
+                        run_after=task.run_after or timezone.now(),
+                        dedupe_key=key,
+                    )
+            except IntegrityError:
+                # Enqueued by a concurrent request between the lookup and the insert
+                record = waiting.get()
+            result = self.to_result(record, task)
+            task_enqueued.send(type(self), task_result=result)
+            return result
+        return self.to_result(record, task)
+
+    def get_result(self, result_id: str) -> TaskResult:
+        try:
+            record = QueuedTask.objects.get(pk=uuid.UUID(result_id))
+        except (ValueError, QueuedTask.DoesNotExist) as e:
+            raise TaskResultDoesNotExist(result_id) from e
+        return self.to_result(record, load_task(record.task_path))
+
+    def to_result(self, record: QueuedTask, task: Task) -> TaskResult:
+        """The TaskResult of a QueuedTask row."""
+        result = TaskResult(
+            task=task,
+            id=str(record.pk),
+            status=TaskResultStatus(record.status),
+            enqueued_at=record.created_at,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            last_attempted_at=record.last_attempted_at,
+            args=record.args,
+            kwargs=record.kwargs,
+            backend=self.alias,
+            errors=[TaskError(**error) for error in record.errors],
+            worker_ids=record.worker_ids,
+        )
+        object.__setattr__(result, "_return_value", record.return_value)
+        return result
+
+
+@dataclass
+class WorkerBatch:
+    """Outcome of one run_tasks() call."""
+
+    succeeded: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    @property
+    def tasks(self) -> int:
+        return self.succeeded + self.retried + self.failed
+
+
+def _error_entry(error: BaseException) -> dict[str, str]:
+    exception_type = type(error)
+    return {
+        "exception_class_path": f"{exception_type.__module__}.{exception_type.__qualname__}",
+        "traceback": "".join(format_exception(error)),
+    }
+
+
+def _retry_at(backend: DatabaseBackend, attempts: int) -> datetime:
+    return timezone.now() + timedelta(seconds=backend.retry_delay * 2 ** (attempts - 1))
+
+
+def recover_stale_tasks(backend: DatabaseBackend) -> int:
+    """
+    Put back the backend's RUNNING tasks whose lease expired: their worker died.
+
+    A lost attempt that had started counts as a failed attempt, so the task is
+    retried (or failed) like one that raised; tasks that were claimed but never
+    started are simply ready again.
+
+    Returns:
+        Number of tasks recovered
+    """
+    now = timezone.now()
+    stale = QueuedTask.objects.filter(
+        status=TaskResultStatus.RUNNING,
+        queue_name__in=backend.queues,
+        last_attempted_at__lt=now - timedelta(seconds=backend.lease),
+    )
+    recovered = 0
+    for record in stale:
+        # Each finished attempt stored its outcome: a started one that didn't is lost
+        attempts = len(record.worker_ids)
+        if attempts > len(record.errors):
+            lost = TaskLeaseExpired(
+                f"Worker {record.worker_ids[-1]} stored no outcome within {backend.lease}s"
+            )
+            record.errors.append(_error_entry(lost))
+        if attempts < backend.max_attempts:
+            changes = {
+                "status": TaskResultStatus.READY,
+                "run_after": _retry_at(backend, attempts) if attempts else now,
+            }
+        else:
+            changes = {"status": TaskResultStatus.FAILED, "finished_at": now}
+        # Unless its worker came back to it, or another worker recovered it first
+        still_stale = QueuedTask.objects.filter(
+            pk=record.pk,
+            status=TaskResultStatus.RUNNING,
+            claim=record.claim,
+            last_attempted_at=record.last_attempted_at,
+        )
+        try:
+            with transaction.atomic():
+                recovered += still_stale.update(errors=record.errors, **changes)
+        except IntegrityError:
+            # An identical task is waiting, and will do this one's work
+            recovered += still_stale.update(
+                errors=record.errors, status=TaskResultStatus.FAILED, finished_at=now
+            )
+    return recovered
+
+
+def claim_tasks(backend: DatabaseBackend, limit: int) -> list[QueuedTask]:
+    """
+    Mark up to `limit` due tasks of the backend's queues as RUNNING, and return them.
+
+    The claim is a single UPDATE (with the selection as its subquery), so two
+    workers never claim the same task.
+    """
+    now = timezone.now()
+    due = QueuedTask.objects.filter(
+        status=TaskResultStatus.READY,
+        queue_name__in=backend.queues,
+        run_after__lte=now,
+    ).order_by("-priority", "run_after")
+    claim = uuid.uuid4().hex
+    QueuedTask.objects.filter(pk__in=Subquery(due.values("pk")[:limit])).update(
+        status=TaskResultStatus.RUNNING, claim=claim, started_at=now, last_attempted_at=now
+    )
+    claimed = QueuedTask.objects.filter(status=TaskResultStatus.RUNNING, claim=claim)
+    return sorted(claimed, key=lambda record: (-record.priority, record.run_after))
+
+
+def _start_attempt(record: QueuedTask, worker_id: str) -> bool:
+    """
+    Record the worker's attempt and renew the task's lease, unless the lease
+    expired while the task waited in the claimed batch (it was recovered).
+    """
+    record.worker_ids.append(worker_id)
+    record.last_attempted_at = timezone.now()
+    return bool(
+        QueuedTask.objects.filter(
+            pk=record.pk, status=TaskResultStatus.RUNNING, claim=record.claim
+        ).update(last_attempted_at=record.last_attempted_at, worker_ids=record.worker_ids)
+    )
+
+
+def _release_claimed(records: list[QueuedTask]) -> None:
+    """Make claimed tasks that weren't started ready again (the worker is stopping)."""
+    for record in records:
+        claimed = QueuedTask.objects.filter(
+            pk=record.pk, status=TaskResultStatus.RUNNING, claim=record.claim
+        )
+        try:
+            with transaction.atomic():
+                claimed.update(status=TaskResultStatus.READY)
+        except IntegrityError:
+            # An identical task was enqueued meanwhile, and will do this one's work
+            claimed.update(status=TaskResultStatus.FAILED, finished_at=timezone.now())
+
+
+def _run_claimed(backend: DatabaseBackend, record: QueuedTask) -> str:
+    """Run a claimed, started task and store its outcome; returns its new status."""
+    try:
+        task = load_task(record.task_path)
+    except (ImportError, InvalidTask) as e:
+        task, error = None, e
+    else:
+        result = backend.to_result(record, task)
+        task_started.send(type(backend), task_result=result)
+        try:
+            if task.takes_context:
+                value = task.call(TaskContext(task_result=result), *record.args, **record.kwargs)
+            else:
+                value = task.call(*record.args, **record.kwargs)
+            record.return_value = normalize_json(value)
+            error = None
+        except KeyboardInterrupt:
+            raise
+        except BaseException as e:
+            error = e
+
+    if error is None:
+        record.status = TaskResultStatus.SUCCESSFUL
+    else:
+        record.errors.append(_error_entry(error))
+        attempts = len(record.worker_ids)
+        if task is not None and attempts < backend.max_attempts:
+            record.status = TaskResultStatus.READY
+            record.run_after = _retry_at(backend, attempts)
+        else:
+            record.status = TaskResultStatus.FAILED
+    if record.status != TaskResultStatus.READY:
+        record.finished_at = timezone.now()
+
+    fields = ["status", "run_after", "finished_at", "return_value", "errors", "worker_ids"]
+    try:
+        with transaction.atomic():
+            record.save(update_fields=fields)
+    except IntegrityError:
+        # An identical task was enqueued meanwhile; it will do this retry's work
+        record.status = TaskResultStatus.FAILED
+        record.finished_at = timezone.now()
+        record.save(update_fields=fields)
+
+    if task is not None and record.status != TaskResultStatus.READY:
+        task_finished.send(type(backend), task_result=backend.to_result(record, task))
+    return record.status
+
+
+def run_tasks(
+    backend_alias: str,
+    limit: int,
+    worker_id: str,
+    stopping: Callable[[], bool] = lambda: False,
+) -> WorkerBatch:
+    """
+    Recover stale tasks, then claim and run up to `limit` due tasks of a DatabaseBackend.
+
+    Once `stopping()` is true, the claimed tasks not started yet are released.
+
+    Returns:
+        WorkerBatch with the number of tasks that succeeded, will be retried and failed
+    """
+    backend = task_backends[backend_alias]
+    batch = WorkerBatch()
+    recover_stale_tasks(backend)
+    claimed = claim_tasks(backend, limit)
+    for i, record in enumerate(claimed):
+        if stopping():
+            _release_claimed(claimed[i:])
+            break
+        if not _start_attempt(record, worker_id):
+            continue
+        status = _run_claimed(backend, record)
+        if status == TaskResultStatus.SUCCESSFUL:
+            batch.succeeded += 1
+        elif status == TaskResultStatus.READY:
+            batch.retried += 1
+        else:
+            batch.failed += 1
+    return batch
+
+
+def prune_task_results(older_than: timedelta) -> int:
+    """Delete tasks that finished more than `older_than` ago; returns how many."""
+    deleted, _ = QueuedTask.objects.filter(
+        status__in=[TaskResultStatus.FAILED, TaskResultStatus.SUCCESSFUL],
+        finished_at__lt=timezone.now() - older_than,
+    ).delete()
+    return deleted
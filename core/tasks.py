@@ -0,0 +1,21 @@
+"""
+Tasks shared by the apps (see core.task_queue for the backend running them).
+"""
+
+from django.core.mail import EmailMultiAlternatives
+from django.tasks import task
+
+
+@task
+def send_email(
+    subject: str,
+    body: str,
+    from_email: str | None,
+    to: list[str],
+    html_body: str | None = None,
+) -> int:
+    """Send an email rendered in the request, so SMTP latency stays out of it."""
+    message = EmailMultiAlternatives(subject, body, from_email, to)
+    if html_body is not None:
+        message.attach_alternative(html_body, "text/html")
+    return message.send()
@@ -4,6 +4,10 @@ Shared utility functions for FloripaTalks.
 This module contains common utility functions used across the application.
 """
 
+import os
+import tempfile
+from pathlib import Path
+
 
 def format_number_pt_br(number: int | str) -> str:
     """
@@ -72,3 +76,11 @@ def format_comment_count(count: int) -> str:
     formatted = format_number_pt_br(count)
     plural = "comentários" if count != 1 else "comentário"
     return f"{formatted} {plural}"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write a file through a temporary file and a rename, so readers never see it partial."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -1 +1,75 @@
-# Create your views here.
+"""
+Views for core app.
+"""
+
+import hmac
+
+from django.conf import settings
+from django.contrib import admin
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseForbidden
+from django.shortcuts import render
+
+from core.metrics import render_exposition
+from core.profiling import list_reports, load_report
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """
+    Expose metrics of all workers in the Prometheus text format.
+
+    Allowed for staff users and for scrapers sending `Authorization: Bearer
+    <METRICS_TOKEN>` (token auth is disabled while METRICS_TOKEN is unset).
+
+    Args:
+        request: HTTP request object
+
+    Returns:
+        HTTP response with the text exposition, or 403
+    """
+    token = settings.METRICS_TOKEN
+    authorization = request.headers.get("authorization", "")
+    has_token = bool(token) and hmac.compare_digest(authorization, f"Bearer {token}")
+    if not has_token and not request.user.is_staff:
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        render_exposition(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def profile_report_list(request: HttpRequest) -> HttpResponse:
+    """
+    Admin page listing the stored request profiles, newest first.
+
+    Wrapped with admin.site.admin_view in the URLconf (staff only).
+    """
+    context = {
+        **admin.site.each_context(request),
+        "title": "Perfis de requisições",
+        "reports": list_reports(),
+        "max_reports": settings.PROFILING_MAX_REPORTS,
+    }
+    return render(request, "admin/profiling/report_list.html", context)
+
+
+def profile_report_detail(request: HttpRequest, report_id: str) -> HttpResponse:
+    """
+    Admin page showing one request profile.
+
+    Wrapped with admin.site.admin_view in the URLconf (staff only).
+    """
+    report = load_report(report_id)
+    if report is None:
+        raise Http404("Perfil não encontrado (pode ter sido descartado).")
+
+    layers = sorted(report.layers.items(), key=lambda item: item[1], reverse=True)
+    context = {
+        **admin.site.each_context(request),
+        "title": f"Perfil: {report.method} {report.path}",
+        "report": report,
+        "layers": [
+            (name, seconds, 100 * seconds / report.total_seconds if report.total_seconds else 0)
+            for name, seconds in layers
+        ],
+    }
+    return render(request, "admin/profiling/report_detail.html", context)
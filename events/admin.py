@@ -2,11 +2,26 @@
 Django admin configuration for events app.
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.db.models import Count, QuerySet
 from django.http import HttpRequest
 
-from events.models import Event, Topic, Vote
+from core.invalidation import publish
+from events.models import (
+    ArchivedTopic,
+    ArchivedVote,
+    Comment,
+    Event,
+    PresenterSuggestion,
+    Topic,
+    Vote,
+)
+from events.services.archive_service import restore_archived_topic
+from events.services.comment_service import restore_comment, soft_delete_comment
+from events.services.event_service import close_voting, reopen_voting
+from events.services.event_version_service import EVENTS_BUS_KEY, bump_event_version
+from events.services.snapshot_service import archive_event, unarchive_event
+from events.services.topic_similarity_service import index_topic_titles
 
 
 class TopicInline(admin.TabularInline):
@@ -36,17 +51,46 @@ class VoteInline(admin.TabularInline):
     verbose_name_plural = "Votos"
 
 
+class ArchivedVoteInline(admin.TabularInline):
+    """Read-only inline for ArchivedVote within ArchivedTopic admin."""
+
+    model = ArchivedVote
+    extra = 0
+    fields = ["user", "created_at"]
+    readonly_fields = ["user", "created_at"]
+    can_delete = False
+    max_num = 0
+    verbose_name = "Voto arquivado"
+    verbose_name_plural = "Votos arquivados"
+
+
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
     """Admin interface for Event model."""
 
-    list_display = ["name", "slug", "topic_count", "created_at", "updated_at"]
+    list_display = [
+        "name",
+        "slug",
+        "topic_count",
+        "status",
+        "archived_at",
+        "created_at",
+        "updated_at",
+    ]
     verbose_name = "Evento"
     verbose_name_plural = "Eventos"
-    list_filter = ["created_at", "updated_at"]
+    list_filter = ["status", "archived_at", "created_at", "updated_at"]
     search_fields = ["name", "slug", "description"]
-    readonly_fields = ["id", "created_at", "updated_at"]
+    readonly_fields = [
+        "id",
+        "status",
+        "voting_closed_at",
+        "archived_at",
+        "created_at",
+        "updated_at",
+    ]
     inlines = [TopicInline]
+    actions = ["close_events", "reopen_events", "archive_events", "unarchive_events"]
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Event]:
         """Annotate queryset with topic count."""
@@ -61,6 +105,61 @@ class EventAdmin(admin.ModelAdmin):
         """Display total topic count for the event."""
         return getattr(obj, "_topic_count", 0)
 
+    def save_model(self, request: HttpRequest, obj: Event, form: object, change: bool) -> None:
+        """Invalidate cached event pages (ETags) and validators after admin edits."""
+        super().save_model(request, obj, form, change)
+        bump_event_version(obj.pk)
+
+    def delete_model(self, request: HttpRequest, obj: Event) -> None:
+        """Drop the deleted event's cached validators in every worker."""
+        super().delete_model(request, obj)
+        publish(EVENTS_BUS_KEY)
+
+    def delete_queryset(self, request: HttpRequest, queryset: QuerySet[Event]) -> None:
+        """Drop the deleted events' cached validators in every worker."""
+        super().delete_queryset(request, queryset)
+        publish(EVENTS_BUS_KEY)
+
+    @admin.action(description="Encerrar votação dos eventos selecionados")
+    def close_events(self, request: HttpRequest, queryset: QuerySet[Event]) -> None:
+        """Close voting and freeze each selected event's final ranking."""
+        for event in queryset:
+            close_voting(event.slug)
+        self.message_user(
+            request, f"Votação encerrada em {len(queryset)} evento(s).", level=messages.SUCCESS
+        )
+
+    @admin.action(description="Reabrir votação dos eventos selecionados")
+    def reopen_events(self, request: HttpRequest, queryset: QuerySet[Event]) -> None:
+        """Reopen voting of the selected events (their final ranking is discarded)."""
+        for event in queryset:
+            reopen_voting(event.slug)
+        self.message_user(
+            request, f"Votação reaberta em {len(queryset)} evento(s).", level=messages.SUCCESS
+        )
+
+    @admin.action(description="Arquivar eventos selecionados (página estática)")
+    def archive_events(self, request: HttpRequest, queryset: QuerySet[Event]) -> None:
+        """Write (or refresh) the static snapshot each selected closed event is served from."""
+        archived = [archive_event(event.slug) for event in queryset if event.is_closed]
+        self.message_user(
+            request, f"{len(archived)} evento(s) arquivado(s).", level=messages.SUCCESS
+        )
+        if skipped := len(queryset) - len(archived):
+            self.message_user(
+                request,
+                f"{skipped} evento(s) com votação aberta não arquivado(s): encerre a votação antes.",
+                level=messages.WARNING,
+            )
+
+    @admin.action(description="Desarquivar eventos selecionados")
+    def unarchive_events(self, request: HttpRequest, queryset: QuerySet[Event]) -> None:
+        """Delete the snapshots, so the event pages are rendered live again."""
+        unarchived = [event for event in queryset if unarchive_event(event.slug)]
+        self.message_user(
+            request, f"{len(unarchived)} evento(s) desarquivado(s).", level=messages.SUCCESS
+        )
+
     fieldsets = (
         (
             "Informações Básicas",
@@ -68,10 +167,16 @@ class EventAdmin(admin.ModelAdmin):
                 "fields": ("name", "slug", "description"),
             },
         ),
+        (
+            "Votação",
+            {
+                "fields": ("status", "voting_closed_at"),
+            },
+        ),
         (
             "Metadados",
             {
-                "fields": ("id", "created_at", "updated_at"),
+                "fields": ("id", "archived_at", "created_at", "updated_at"),
                 "classes": ("collapse",),
             },
         ),
@@ -82,18 +187,35 @@ class EventAdmin(admin.ModelAdmin):
 class TopicAdmin(admin.ModelAdmin):
     """Admin interface for Topic model."""
 
-    list_display = ["title", "slug", "event", "creator", "vote_count", "is_deleted", "created_at"]
+    list_display = [
+        "title",
+        "slug",
+        "event",
+        "creator",
+        "vote_count",
+        "comment_count",
+        "is_deleted",
+        "created_at",
+    ]
     verbose_name = "Tópico"
     verbose_name_plural = "Tópicos"
     list_filter = ["is_deleted", "created_at", "event"]
     search_fields = ["title", "slug", "description", "event__name", "creator__username"]
-    readonly_fields = ["id", "created_at", "updated_at"]
+    readonly_fields = ["id", "vote_count", "comment_count", "created_at", "updated_at"]
     inlines = [VoteInline]
     fieldsets = (
         (
             "Informações Básicas",
             {
-                "fields": ("event", "title", "slug", "description", "creator"),
+                "fields": (
+                    "event",
+                    "title",
+                    "slug",
+                    "description",
+                    "creator",
+                    "vote_count",
+                    "comment_count",
+                ),
             },
         ),
         (
@@ -112,18 +234,161 @@ class TopicAdmin(admin.ModelAdmin):
     )
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Topic]:
-        """Use all_objects to access deleted records in admin and annotate vote count."""
+        """Use all_objects to access deleted records in admin."""
         qs = self.model.all_objects.get_queryset()
-        qs = qs.annotate(_vote_count=Count("votes", distinct=True))
         ordering = self.get_ordering(request)
         if ordering:
             qs = qs.order_by(*ordering)
         return qs
 
-    @admin.display(
-        description="Total de Votos",
-        ordering="_vote_count",
+    def save_model(self, request: HttpRequest, obj: Topic, form: object, change: bool) -> None:
+        """Reindex the title and invalidate cached event pages (ETags) after admin edits."""
+        super().save_model(request, obj, form, change)
+        index_topic_titles([obj])
+        bump_event_version(obj.event_id, obj.pk)
+
+    def save_related(
+        self, request: HttpRequest, form: object, formsets: object, change: bool
+    ) -> None:
+        """Recount vote_count after votes are deleted through the inline."""
+        super().save_related(request, form, formsets, change)
+        topic = form.instance
+        Topic.all_objects.filter(pk=topic.pk).update(vote_count=topic.votes.count())
+
+
+@admin.register(ArchivedTopic)
+class ArchivedTopicAdmin(admin.ModelAdmin):
+    """Admin interface for archived topics, with restore back to the live tables."""
+
+    list_display = ["title", "slug", "event", "creator", "deleted_at", "archived_at"]
+    list_filter = ["archived_at", "event"]
+    search_fields = ["title", "slug", "event__name", "creator__username"]
+    readonly_fields = [
+        "id",
+        "event",
+        "title",
+        "slug",
+        "description",
+        "creator",
+        "created_at",
+        "updated_at",
+        "deleted_at",
+        "archived_at",
+    ]
+    inlines = [ArchivedVoteInline]
+    actions = ["restore_topics"]
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        """Archived topics are only created by the archive_deleted_topics command."""
+        return False
+
+    @admin.action(description="Restaurar tópicos selecionados")
+    def restore_topics(self, request: HttpRequest, queryset: QuerySet[ArchivedTopic]) -> None:
+        """Move the selected topics and their votes back to the live tables, undeleted."""
+        restored = [restore_archived_topic(archived) for archived in queryset]
+        self.message_user(
+            request, f"{len(restored)} tópico(s) restaurado(s).", level=messages.SUCCESS
+        )
+
+
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    """
+    Admin interface for Comment model.
+
+    Deleting/restoring goes through comment_service actions (is_deleted is read-only)
+    so Topic.comment_count stays in sync.
+    """
+
+    list_display = ["__str__", "topic", "author", "is_deleted", "created_at"]
+    list_filter = ["is_deleted", "created_at"]
+    search_fields = ["content", "topic__title", "author__username"]
+    readonly_fields = [
+        "id",
+        "topic",
+        "author",
+        "is_deleted",
+        "deleted_at",
+        "created_at",
+        "updated_at",
+    ]
+    fields = readonly_fields[:3] + ["content"] + readonly_fields[3:]
+    actions = ["soft_delete_comments", "restore_comments"]
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[Comment]:
+        """Use all_objects to access deleted records in admin."""
+        qs = self.model.all_objects.select_related("topic", "author")
+        ordering = self.get_ordering(request)
+        if ordering:
+            qs = qs.order_by(*ordering)
+        return qs
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        """Comments are only created through the topic page (keeps comment_count in sync)."""
+        return False
+
+    def has_delete_permission(self, _request: HttpRequest, _obj: Comment | None = None) -> bool:
+        """Hard deletes would bypass comment_count; use the soft delete action instead."""
+        return False
+
+    @admin.action(description="Excluir comentários selecionados (exclusão lógica)")
+    def soft_delete_comments(self, request: HttpRequest, queryset: QuerySet[Comment]) -> None:
+        deleted = sum(soft_delete_comment(comment.pk) for comment in queryset)
+        self.message_user(request, f"{deleted} comentário(s) excluído(s).", level=messages.SUCCESS)
+
+    @admin.action(description="Restaurar comentários selecionados")
+    def restore_comments(self, request: HttpRequest, queryset: QuerySet[Comment]) -> None:
+        restored = sum(restore_comment(comment.pk) for comment in queryset)
+        self.message_user(
+            request, f"{restored} comentário(s) restaurado(s).", level=messages.SUCCESS
+        )
+
+
+@admin.register(PresenterSuggestion)
+class PresenterSuggestionAdmin(admin.ModelAdmin):
+    """Admin interface for PresenterSuggestion model."""
+
+    list_display = ["presenter_contact", "topic", "suggested_by", "is_deleted", "created_at"]
+    list_filter = ["is_deleted", "created_at"]
+    search_fields = ["presenter_contact", "topic__title", "suggested_by__username"]
+    readonly_fields = ["id", "topic", "suggested_by", "created_at", "updated_at"]
+    fieldsets = (
+        (
+            "Informações Básicas",
+            {
+                "fields": ("topic", "suggested_by", "presenter_contact"),
+            },
+        ),
+        (
+            "Exclusão Lógica",
+            {
+                "fields": ("is_deleted", "deleted_at"),
+            },
+        ),
+        (
+            "Metadados",
+            {
+                "fields": ("id", "created_at", "updated_at"),
+                "classes": ("collapse",),
+            },
+        ),
     )
-    def vote_count(self, obj: Topic) -> int:
-        """Display total vote count for the topic."""
-        return getattr(obj, "_vote_count", 0)
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet[PresenterSuggestion]:
+        """Use all_objects to access deleted records in admin."""
+        qs = self.model.all_objects.select_related("topic", "suggested_by")
+        ordering = self.get_ordering(request)
+        if ordering:
+            qs = qs.order_by(*ordering)
+        return qs
+
+    def has_add_permission(self, _request: HttpRequest) -> bool:
+        """Suggestions are only created through the topic page (enforces the limits)."""
+        return False
+
+    def save_model(
+        self, request: HttpRequest, obj: PresenterSuggestion, form: object, change: bool
+    ) -> None:
+        """Invalidate cached event pages (ETags) after admin edits."""
+        super().save_model(request, obj, form, change)
+        bump_event_version(obj.topic.event_id, obj.topic_id)
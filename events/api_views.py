@@ -0,0 +1,281 @@
+"""
+Read-only JSON API (version 1) of events and their topics.
+
+Lists are keyset-paginated: each response has a `next_cursor`, passed back as
+`?cursor=` for the following page (null on the last one), and `?fields=`
+trims the objects to the fields listed. Responses carry an ETag derived from
+the event's version (see event_version_service), so an unchanged list is
+answered with 304 before any topic is read. Topic lists are streamed one batch
+at a time: exporting a whole event (`?limit=1000`) never holds all its topics.
+Every batch of a response is read from one snapshot, so votes cast while it
+streams can't move topics across the batches' cursors.
+
+Everything is served as an anonymous visitor sees it, with no per-user data.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Generator
+from functools import wraps
+from http import HTTPStatus
+from itertools import chain
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition, require_safe
+
+from core.release import get_release
+from core.routers import read_only_snapshot
+from events.dto.event_dto import EventDTO
+from events.dto.topic_dto import TopicDTO, TopicPageDTO
+from events.models import Event
+from events.services.event_version_service import get_event_version, get_events_version
+from events.services.topic_service import TopicSort, trending_since
+from events.use_cases.get_event_topics import get_event_topics_by_slug, iter_event_topics_pages
+from events.use_cases.get_events import get_events_page
+
+# Fields of each object, in output order (the default for `?fields=`)
+EVENT_FIELDS = ("slug", "name", "description", "status", "created_at", "voting_closed_at")
+TOPIC_FIELDS = (
+    "id",
+    "slug",
+    "title",
+    "description",
+    "vote_count",
+    "comment_count",
+    "presenter_suggestion_count",
+    "creator_username",
+    "creator_display_name",
+    "creator_avatar_url",
+    "event_slug",
+    "created_at",
+)
+
+# Listing modes of the API; the personal ones need a signed-in user. Closed
+# events are listed by their final ranking whatever the mode.
+TOPIC_SORTS = (TopicSort.TOP, TopicSort.TRENDING, TopicSort.NEWEST, TopicSort.OLDEST)
+
+EVENTS_LIMIT, EVENTS_MAX_LIMIT = 20, 100
+TOPICS_LIMIT, TOPICS_MAX_LIMIT = 100, 1_000
+# Topics read (and serialized) per query while a topic list is streamed
+TOPICS_BATCH_SIZE = 100
+
+
+class _QueryError(ValueError):
+    """A query string parameter is invalid (answered with 400)."""
+
+
+def _error(status: HTTPStatus, message: str) -> JsonResponse:
+    return JsonResponse({"error": message}, status=status)
+
+
+def _fields(request: HttpRequest, available: tuple[str, ...]) -> tuple[str, ...]:
+    """The fields asked for with `?fields=a,b`, in the order asked (all by default)."""
+    raw = request.GET.get("fields")
+    if not raw:
+        return available
+    fields = tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+    unknown = [name for name in fields if name not in available]
+    if unknown or not fields:
+        raise _QueryError(f"Campos desconhecidos: {', '.join(unknown) or raw}.")
+    return fields
+
+
+def _limit(request: HttpRequest, default: int, maximum: int) -> int:
+    """The page size from `?limit=`, between 1 and `maximum`."""
+    try:
+        limit = int(request.GET.get("limit", default))
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= maximum:
+        raise _QueryError(f"O limite deve ser um número entre 1 e {maximum}.")
+    return limit
+
+
+def _topic_sort(request: HttpRequest) -> TopicSort:
+    """The listing mode from `?sort=` (most voted by default)."""
+    value = request.GET.get("sort", TopicSort.TOP)
+    if value not in TOPIC_SORTS:
+        raise _QueryError(f"Ordenação desconhecida: {value}.")
+    return TopicSort(value)
+
+
+def _event_json(event: EventDTO, fields: tuple[str, ...]) -> dict[str, Any]:
+    return {name: getattr(event, name) for name in fields}
+
+
+def _topic_json(request: HttpRequest, topic: TopicDTO, fields: tuple[str, ...]) -> dict[str, Any]:
+    data = {name: getattr(topic, name) for name in fields}
+    if data.get("creator_avatar_url"):
+        data["creator_avatar_url"] = request.build_absolute_uri(data["creator_avatar_url"])
+    return data
+
+
+def _stream_topics(
+    request: HttpRequest, pages: Generator[TopicPageDTO], fields: tuple[str, ...]
+) -> Generator[str]:
+    """
+    The JSON of a topic list, one chunk per page of topics read.
+
+    The first next() only reads the first page (and yields nothing), so a bad
+    event or cursor raises before the response starts; from then on, closing
+    the stream closes `pages`, even if the response is never sent.
+    """
+    try:
+        first = next(pages)
+        yield ""
+        yield f'{{"sort": {json.dumps(first.sort)}, "data": ['
+        separator = ""
+        next_cursor = None
+        for page in chain([first], pages):
+            if page.topics:
+                yield separator + ", ".join(
+                    json.dumps(_topic_json(request, topic, fields), cls=DjangoJSONEncoder)
+                    for topic in page.topics
+                )
+                separator = ", "
+            next_cursor = page.next_cursor
+        yield f'], "next_cursor": {json.dumps(next_cursor)}}}'
+    finally:
+        # Ends the pages' read transaction, even if the client went away mid-list
+        pages.close()
+
+
+def _events_etag(request: HttpRequest) -> str:
+    """ETag of the event list: changes whenever any event does, or one is added or removed."""
+    count, updated_at = get_events_version()
+    changed = updated_at.isoformat() if updated_at else ""
+    raw = f"{count}:{changed}:{get_release().id}:{request.get_full_path()}"
+    return f"e{count}-{hashlib.sha256(raw.encode()).hexdigest()[:24]}"
+
+
+def _event_etag(request: HttpRequest, slug: str, **_kwargs: str) -> str | None:
+    """ETag of an event's topics: changes with the event's version (and the trending window)."""
+    event = get_event_version(slug)
+    if event is None:
+        return None
+
+    raw = f"{event.id}:{event.version}:{get_release().id}:{request.get_full_path()}"
+    if request.GET.get("sort") == TopicSort.TRENDING:
+        raw += f":since:{trending_since().isoformat()}"
+    return f"v{event.version}-{hashlib.sha256(raw.encode()).hexdigest()[:24]}"
+
+
+def _api_cache_control(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """
+    Cache policy of the API (including its 304s): public, since responses have
+    no per-user data, and revalidated every time, except for closed events,
+    which clients keep for EVENT_CLOSED_MAX_AGE.
+    """
+
+    @wraps(view_func)
+    def wrapper(request: HttpRequest, *args: object, **kwargs: str) -> HttpResponse:
+        response = view_func(request, *args, **kwargs)
+        event = get_event_version(kwargs["slug"]) if "slug" in kwargs else None
+        if event is not None and event.is_closed and response.status_code < 400:
+            patch_cache_control(response, public=True, max_age=settings.EVENT_CLOSED_MAX_AGE)
+        else:
+            patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+    return wrapper
+
+
+@require_safe
+@_api_cache_control
+@condition(etag_func=_events_etag)
+def event_list(request: HttpRequest) -> HttpResponse:
+    """
+    List the events by slug.
+
+    Args:
+        request: HTTP request object, with optional `cursor`, `limit` and `fields`
+
+    Returns:
+        JSON response with the page of events and the next page cursor
+    """
+    try:
+        fields = _fields(request, EVENT_FIELDS)
+        limit = _limit(request, EVENTS_LIMIT, EVENTS_MAX_LIMIT)
+        page = get_events_page(cursor=request.GET.get("cursor"), limit=limit)
+    except _QueryError as e:
+        return _error(HTTPStatus.BAD_REQUEST, str(e))
+    except ValueError:
+        return _error(HTTPStatus.BAD_REQUEST, "Cursor inválido.")
+
+    return JsonResponse(
+        {
+            "data": [_event_json(event, fields) for event in page.events],
+            "next_cursor": page.next_cursor,
+        }
+    )
+
+
+@require_safe
+@_api_cache_control
+@condition(etag_func=_event_etag)
+def topic_list(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    List an event's topics with their vote counts, streamed.
+
+    Args:
+        request: HTTP request object, with optional `sort` (see TOPIC_SORTS),
+            `cursor`, `limit` and `fields`
+        slug: Event slug
+
+    Returns:
+        Streamed JSON response with the listing mode, the topics and the next page cursor
+    """
+    try:
+        fields = _fields(request, TOPIC_FIELDS)
+        pages = read_only_snapshot(
+            iter_event_topics_pages(
+                slug,
+                sort=_topic_sort(request),
+                cursor=request.GET.get("cursor"),
+                limit=_limit(request, TOPICS_LIMIT, TOPICS_MAX_LIMIT),
+                batch_size=TOPICS_BATCH_SIZE,
+            )
+        )
+        stream = _stream_topics(request, pages, fields)
+        # Read before the response starts, so a bad event or cursor isn't a 200
+        next(stream)
+    except _QueryError as e:
+        return _error(HTTPStatus.BAD_REQUEST, str(e))
+    except ValueError:
+        return _error(HTTPStatus.BAD_REQUEST, "Cursor inválido.")
+    except Event.DoesNotExist:
+        return _error(HTTPStatus.NOT_FOUND, "Evento não encontrado.")
+
+    return StreamingHttpResponse(stream, content_type="application/json")
+
+
+@require_safe
+@_api_cache_control
+@condition(etag_func=_event_etag)
+def topic_detail(request: HttpRequest, slug: str, topic_slug: str) -> HttpResponse:
+    """
+    Show one of an event's topics.
+
+    Args:
+        request: HTTP request object, with optional `fields`
+        slug: Event slug
+        topic_slug: Topic slug
+
+    Returns:
+        JSON response with the topic
+    """
+    try:
+        fields = _fields(request, TOPIC_FIELDS)
+        topics = get_event_topics_by_slug(slug, [topic_slug])
+    except _QueryError as e:
+        return _error(HTTPStatus.BAD_REQUEST, str(e))
+    except Event.DoesNotExist:
+        topics = []
+    if not topics:
+        return _error(HTTPStatus.NOT_FOUND, "Tópico não encontrado.")
+
+    return JsonResponse({"data": _topic_json(request, topics[0], fields)})
@@ -0,0 +1,36 @@
+"""
+Comment DTOs for transferring comment data to templates.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class CommentDTO:
+    """
+    Data Transfer Object for Comment model.
+
+    Carries author data resolved upfront so comment templates never touch the ORM.
+    """
+
+    id: UUID
+    topic_slug: str
+    content: str
+    author_username: str
+    author_display_name: str
+    author_avatar_url: str | None
+    created_at: datetime
+
+
+@dataclass
+class CommentPageDTO:
+    """
+    One keyset-paginated page of a topic's comments.
+
+    `next_cursor` is an opaque token for the following page, or None on the last page.
+    """
+
+    comments: list[CommentDTO] = field(default_factory=list)
+    next_cursor: str | None = None
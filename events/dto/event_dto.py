@@ -0,0 +1,30 @@
+"""
+Event DTOs for transferring event data to the JSON API.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass
+class EventDTO:
+    """Data Transfer Object for Event model."""
+
+    slug: str
+    name: str
+    description: str | None
+    status: str
+    created_at: datetime
+    voting_closed_at: datetime | None = None
+
+
+@dataclass
+class EventPageDTO:
+    """
+    One keyset-paginated page of the events, by slug.
+
+    `next_cursor` is an opaque token for the following page, or None on the last page.
+    """
+
+    events: list[EventDTO] = field(default_factory=list)
+    next_cursor: str | None = None
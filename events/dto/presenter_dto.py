@@ -0,0 +1,23 @@
+"""
+Presenter suggestion DTO for transferring suggestion data to templates.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class PresenterDTO:
+    """
+    Data Transfer Object for PresenterSuggestion model.
+
+    Carries the suggester's data resolved upfront so templates never touch the ORM.
+    """
+
+    id: UUID
+    topic_slug: str
+    presenter_contact: str
+    suggested_by_username: str
+    suggested_by_display_name: str
+    created_at: datetime
@@ -2,10 +2,12 @@
 Topic DTO for transferring topic data to templates.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
+from events.dto.presenter_dto import PresenterDTO
+
 
 @dataclass
 class TopicDTO:
@@ -28,3 +30,33 @@ class TopicDTO:
     event_slug: str
     event_name: str
     created_at: datetime
+    comment_count: int = 0
+    # Total live suggestions, and only the first few of them (see
+    # topic_service.presenter_suggestions_prefetch); the rest load on demand.
+    presenter_suggestion_count: int = 0
+    presenter_suggestions: list[PresenterDTO] = field(default_factory=list)
+
+
+@dataclass
+class TopicPageDTO:
+    """
+    One keyset-paginated page of an event's topics in a listing mode.
+
+    `next_cursor` is an opaque token for the following page (of the same `sort`),
+    or None on the last page.
+    """
+
+    topics: list[TopicDTO] = field(default_factory=list)
+    next_cursor: str | None = None
+    sort: str = "top"
+
+
+@dataclass
+class SimilarTopicDTO:
+    """A live topic whose title resembles one being typed (see topic_similarity_service)."""
+
+    slug: str
+    title: str
+    vote_count: int
+    # Jaccard similarity of the titles' trigram sets, 0 to 1
+    similarity: float
@@ -0,0 +1,55 @@
+"""
+Vote trend DTOs for transferring hourly vote rollups to the admin chart.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class VoteTrendPointDTO:
+    """Votes cast and removed in one hour."""
+
+    hour: datetime
+    votes_cast: int
+    votes_removed: int
+
+    @property
+    def net_votes(self) -> int:
+        return self.votes_cast - self.votes_removed
+
+
+@dataclass
+class TopicVoteTrendDTO:
+    """A topic's vote totals over a period."""
+
+    topic_id: UUID
+    title: str
+    votes_cast: int
+    votes_removed: int
+
+    @property
+    def net_votes(self) -> int:
+        return self.votes_cast - self.votes_removed
+
+
+@dataclass
+class EventVoteTrendDTO:
+    """An event's hourly vote series over a period, with its most voted topics."""
+
+    event_slug: str
+    event_name: str
+    since: datetime
+    until: datetime
+    # Every hour of the period, including hours without votes
+    points: list[VoteTrendPointDTO] = field(default_factory=list)
+    top_topics: list[TopicVoteTrendDTO] = field(default_factory=list)
+
+    @property
+    def votes_cast(self) -> int:
+        return sum(point.votes_cast for point in self.points)
+
+    @property
+    def votes_removed(self) -> int:
+        return sum(point.votes_removed for point in self.points)
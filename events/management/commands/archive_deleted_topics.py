@@ -0,0 +1,55 @@
+"""
+Management command to move long soft-deleted topics into the archive tables.
+
+Meant to be scheduled (e.g. a daily cron/WebJob running
+`python manage.py archive_deleted_topics`); it is idempotent and safe to rerun.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from events.services.archive_service import archive_deleted_topics
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive topics soft-deleted longer than the retention period, "
+        "with their votes and comments."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TOPIC_ARCHIVE_RETENTION_DAYS,
+            help="Retention in days since soft delete (default: TOPIC_ARCHIVE_RETENTION_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Topics moved per transaction (default: 500).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many rows would be archived.",
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        result = archive_deleted_topics(
+            retention=timedelta(days=options["days"]),
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        verb = "Would archive" if options["dry_run"] else "Archived"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.topics} topics, {result.votes} votes, "
+                f"{result.comments} comments and "
+                f"{result.presenter_suggestions} presenter suggestions "
+                f"in {result.batches} batches ({result.seconds:.2f}s)"
+            )
+        )
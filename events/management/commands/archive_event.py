@@ -0,0 +1,44 @@
+"""
+Management command to archive events as static HTML snapshots (or unarchive them).
+
+Run `python manage.py archive_event <slug>` once an event's voting is closed; rerun it to
+refresh the snapshot, e.g. after a deploy that changes static files.
+"""
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from events.models import Event
+from events.services.snapshot_service import archive_event, unarchive_event
+
+
+class Command(BaseCommand):
+    help = "Serve events from a static snapshot of their topic list, or stop doing so."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("slugs", nargs="+", metavar="slug", help="Slugs of the events.")
+        parser.add_argument(
+            "--unarchive",
+            action="store_true",
+            help="Delete the snapshots and render the event pages live again.",
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        for slug in options["slugs"]:
+            if options["unarchive"]:
+                if unarchive_event(slug):
+                    self.stdout.write(self.style.SUCCESS(f"Unarchived {slug}"))
+                else:
+                    self.stdout.write(f"{slug} was not archived")
+                continue
+            try:
+                result = archive_event(slug)
+            except Event.DoesNotExist as e:
+                raise CommandError(f"Event {slug!r} does not exist") from e
+            except ValueError as e:
+                raise CommandError(f"{slug}: {e}") from e
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Archived {slug}: {result.topics} topics, "
+                    f"{result.size // 1024} KiB in {result.path.name}"
+                )
+            )
@@ -0,0 +1,51 @@
+"""
+Management command to trim the vote log down to its retention period.
+
+Meant to be scheduled (e.g. a daily cron/WebJob running
+`python manage.py compact_vote_log`); the removed entries are already counted
+in the hourly rollups, and it is idempotent and safe to rerun.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+from events.services.vote_analytics_service import compact_vote_log
+
+
+class Command(BaseCommand):
+    help = "Delete vote log entries older than the retention period (rollups keep their counts)."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.VOTE_LOG_RETENTION_DAYS,
+            help="Retention in days (default: VOTE_LOG_RETENTION_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Entries deleted per transaction (default: 5000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many entries would be deleted.",
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        result = compact_vote_log(
+            retention=timedelta(days=options["days"]),
+            batch_size=options["batch_size"],
+            dry_run=options["dry_run"],
+        )
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {result.entries} vote log entries "
+                f"in {result.batches} batches ({result.seconds:.2f}s)"
+            )
+        )
@@ -0,0 +1,96 @@
+"""
+Management command to fill the database with a synthetic load dataset.
+
+For local benchmarking and query-plan work, e.g. a 1M-vote database:
+`python manage.py seed_load --votes 1000000`.
+"""
+
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from events.services.seed_service import SeedConfig, seed_load
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-generate users, events, topics and Zipf-distributed votes "
+        "(deterministic for a given --seed)."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        defaults = SeedConfig()
+        parser.add_argument("--users", type=int, default=defaults.users)
+        parser.add_argument("--events", type=int, default=defaults.events)
+        parser.add_argument("--topics", type=int, default=defaults.topics)
+        parser.add_argument("--votes", type=int, default=defaults.votes)
+        parser.add_argument(
+            "--zipf",
+            type=float,
+            default=defaults.zipf,
+            help=f"Vote skew exponent over topics (default: {defaults.zipf}).",
+        )
+        parser.add_argument(
+            "--duplicate-ratio",
+            type=float,
+            default=defaults.duplicate_ratio,
+            help="Share of topics reusing an earlier title (slug suffixes).",
+        )
+        parser.add_argument(
+            "--deleted-ratio",
+            type=float,
+            default=defaults.deleted_ratio,
+            help="Share of topics that are soft-deleted.",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=defaults.days,
+            help="Timestamps are spread over this many days up to --until.",
+        )
+        parser.add_argument(
+            "--until",
+            type=datetime.fromisoformat,
+            help="Latest timestamp, ISO format (default: today at 00:00).",
+        )
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Allow running with DEBUG off (never against production data).",
+        )
+
+    def handle(self, *_args: object, **options: object) -> None:
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError("Refusing to seed with DEBUG off; pass --force if this is intended.")
+        if options["events"] < 1 and options["topics"] > 0:
+            raise CommandError("Topics need at least one event")
+        if options["topics"] < 1 and options["votes"] > 0:
+            raise CommandError("Votes need at least one topic")
+
+        config = SeedConfig(
+            users=options["users"],
+            events=options["events"],
+            topics=options["topics"],
+            votes=options["votes"],
+            zipf=options["zipf"],
+            duplicate_ratio=options["duplicate_ratio"],
+            deleted_ratio=options["deleted_ratio"],
+            days=options["days"],
+            until=options["until"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+        )
+        try:
+            result = seed_load(config)
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {result.users} users, {result.events} events, "
+                f"{result.topics} topics ({result.deleted_topics} soft-deleted) and "
+                f"{result.votes} votes ({result.seconds:.1f}s)"
+            )
+        )
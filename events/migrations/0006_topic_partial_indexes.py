@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-19 10:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0005_vote"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="topic",
+            name="events_topi_event_i_366812_idx",
+        ),
+        migrations.AlterField(
+            model_name="topic",
+            name="is_deleted",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["event", "created_at"],
+                name="events_topic_live_event_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 6.0 on 2026-10-19 11:05
+
+import django.db.models.deletion
+import uuid6
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0006_topic_partial_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedTopic",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Arquivado em"),
+                ),
+                ("slug", models.SlugField(max_length=200, verbose_name="Slug")),
+                ("title", models.CharField(max_length=200, verbose_name="Título")),
+                (
+                    "description",
+                    models.TextField(
+                        blank=True, max_length=2000, null=True, verbose_name="Descrição"
+                    ),
+                ),
+                (
+                    "creator",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_topics",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Criador",
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_topics",
+                        to="events.event",
+                        verbose_name="Evento",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Tópico arquivado",
+                "verbose_name_plural": "Tópicos arquivados",
+                "ordering": ["-archived_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedVote",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="votes",
+                        to="events.archivedtopic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_votes",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Voto arquivado",
+                "verbose_name_plural": "Votos arquivados",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,117 @@
+# Generated by Django 6.0 on 2026-10-19 12:20
+"""
+Switch primary keys to BinaryUUIDField and convert existing SQLite rows.
+
+AlterField only changes the declared column type: SQLite copies the existing
+char(32) hex values into the rebuilt tables unchanged. The RunPython step then
+rewrites every converted primary key, and every foreign key column (in any app,
+found via PRAGMA foreign_key_list) that points at one, from hex text to 16 bytes.
+No-op on databases with a native uuid type.
+"""
+
+import uuid6
+from django.db import migrations
+
+import core.fields
+
+# Tables whose "id" primary key is a BinaryUUIDField after this migration
+BINARY_UUID_TABLES = [
+    "auth_user",
+    "events_event",
+    "events_topic",
+    "events_vote",
+    "events_archivedtopic",
+    "events_archivedvote",
+]
+
+
+def _uuid_columns(cursor) -> list[tuple[str, str]]:
+    """Return (table, column) pairs holding ids of BINARY_UUID_TABLES."""
+    columns = [(table, "id") for table in BINARY_UUID_TABLES]
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    for (table,) in cursor.fetchall():
+        cursor.execute(f'PRAGMA foreign_key_list("{table}")')
+        for row in cursor.fetchall():
+            referenced_table, from_column, to_column = row[2], row[3], row[4]
+            if referenced_table in BINARY_UUID_TABLES and to_column in ("id", None):
+                columns.append((table, from_column))
+    return columns
+
+
+def _hex_to_bytes(value: object) -> object:
+    if isinstance(value, str) and len(value) == 32:
+        return bytes.fromhex(value)
+    return value
+
+
+def _bytes_to_hex(value: object) -> object:
+    if isinstance(value, bytes) and len(value) == 16:
+        return value.hex()
+    return value
+
+
+def _convert(schema_editor, function) -> None:
+    connection = schema_editor.connection
+    if connection.vendor != "sqlite":
+        return
+    # Registered as a SQL function so each column converts in a single UPDATE
+    # (and without relying on unhex(), which needs SQLite 3.41+).
+    connection.ensure_connection()
+    connection.connection.create_function("convert_uuid", 1, function, deterministic=True)
+    with connection.cursor() as cursor:
+        for table, column in _uuid_columns(cursor):
+            cursor.execute(f'UPDATE "{table}" SET "{column}" = convert_uuid("{column}")')
+
+
+def hex_to_blob(apps, schema_editor) -> None:
+    _convert(schema_editor, _hex_to_bytes)
+
+
+def blob_to_hex(apps, schema_editor) -> None:
+    _convert(schema_editor, _bytes_to_hex)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0007_archived_topic_archived_vote"),
+        ("accounts", "0002_binary_uuid_pk"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedtopic",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="archivedvote",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="event",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="topic",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.AlterField(
+            model_name="vote",
+            name="id",
+            field=core.fields.BinaryUUIDField(
+                default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+            ),
+        ),
+        migrations.RunPython(hex_to_blob, blob_to_hex),
+    ]
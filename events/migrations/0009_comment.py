@@ -0,0 +1,110 @@
+# Generated by Django 6.0 on 2026-10-19 14:02
+
+import django.db.models.deletion
+import uuid6
+from django.conf import settings
+from django.db import migrations, models
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0008_binary_uuid_pk"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="topic",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Comentários"
+            ),
+        ),
+        migrations.CreateModel(
+            name="ArchivedComment",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                ("content", models.TextField(max_length=1000, verbose_name="Conteúdo")),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_comments",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Autor",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to="events.archivedtopic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Comentário arquivado",
+                "verbose_name_plural": "Comentários arquivados",
+                "ordering": ["created_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="Comment",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                ("content", models.TextField(max_length=1000, verbose_name="Conteúdo")),
+                (
+                    "author",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Autor",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Comentário",
+                "verbose_name_plural": "Comentários",
+                "ordering": ["created_at", "id"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("is_deleted", False)),
+                        fields=["topic", "created_at", "id"],
+                        name="events_comment_live_topic_idx",
+                    )
+                ],
+            },
+        ),
+    ]
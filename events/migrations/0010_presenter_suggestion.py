@@ -0,0 +1,67 @@
+# Generated by Django 6.0 on 2026-10-19 15:10
+
+import django.db.models.deletion
+import uuid6
+from django.conf import settings
+from django.db import migrations, models
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0009_comment"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PresenterSuggestion",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "presenter_contact",
+                    models.CharField(max_length=500, verbose_name="Contato do palestrante"),
+                ),
+                (
+                    "suggested_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="presenter_suggestions",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Sugerido por",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="presenter_suggestions",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sugestão de palestrante",
+                "verbose_name_plural": "Sugestões de palestrantes",
+                "ordering": ["created_at", "id"],
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("is_deleted", False)),
+                        fields=["topic", "created_at", "id"],
+                        name="events_presenter_live_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0010_presenter_suggestion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="version",
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name="Versão"),
+        ),
+    ]
@@ -0,0 +1,101 @@
+# Generated by Django 6.0 on 2026-10-19 15:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vote_count(apps: object, schema_editor: object) -> None:
+    """Count existing votes into Topic.vote_count (one UPDATE over all topics)."""
+    Topic = apps.get_model("events", "Topic")
+    Vote = apps.get_model("events", "Vote")
+    counts = (
+        Vote.objects.filter(topic=OuterRef("pk"))
+        .order_by()
+        .values("topic")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Topic.objects.update(vote_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0011_event_version"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="topic",
+            name="events_topic_live_event_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="vote",
+            name="events_vote_topic_i_1b35a6_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="vote",
+            name="events_vote_topic_i_c1a53f_idx",
+        ),
+        migrations.AddField(
+            model_name="topic",
+            name="vote_count",
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name="Votos"),
+        ),
+        migrations.RunPython(backfill_vote_count, migrations.RunPython.noop),
+        # Only drop the FK index: altering the field would make SQLite rebuild events_vote
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="vote",
+                    name="topic",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="votes",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunSQL(
+                    'DROP INDEX IF EXISTS "events_vote_topic_id_598d83f2"',
+                    reverse_sql=(
+                        'CREATE INDEX "events_vote_topic_id_598d83f2" ON "events_vote" ("topic_id")'
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["event", "created_at", "id"],
+                name="events_topic_live_event_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["event", "-vote_count", "created_at", "id"],
+                name="events_topic_live_top_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["creator", "event", "created_at", "id"],
+                name="events_topic_live_creator_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(fields=["topic", "created_at"], name="events_vote_topic_recent_idx"),
+        ),
+    ]
@@ -0,0 +1,155 @@
+# Generated by Django 6.0 on 2026-10-19 16:40
+
+from datetime import UTC
+
+import django.db.models.deletion
+import uuid6
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncHour
+
+import core.fields
+
+
+def backfill_rollups(apps: object, schema_editor: object) -> None:
+    """Count existing votes into the hourly rollups (removals before the log are unknown)."""
+    Vote = apps.get_model("events", "Vote")
+    VoteHourlyRollup = apps.get_model("events", "VoteHourlyRollup")
+    buckets = (
+        Vote.objects.order_by()
+        .annotate(hour=TruncHour("created_at", tzinfo=UTC))
+        .values("topic_id", "topic__event_id", "hour")
+        .annotate(count=Count("pk"))
+    )
+    VoteHourlyRollup.objects.bulk_create(
+        (
+            VoteHourlyRollup(
+                event_id=bucket["topic__event_id"],
+                topic_id=bucket["topic_id"],
+                hour=bucket["hour"],
+                votes_cast=bucket["count"],
+            )
+            for bucket in buckets.iterator(chunk_size=10_000)
+        ),
+        batch_size=10_000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0012_topic_vote_count_listing_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VoteHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("hour", models.DateTimeField(verbose_name="Hora")),
+                ("votes_cast", models.PositiveIntegerField(default=0, verbose_name="Votos")),
+                (
+                    "votes_removed",
+                    models.PositiveIntegerField(default=0, verbose_name="Votos removidos"),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vote_rollups",
+                        to="events.event",
+                        verbose_name="Evento",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="vote_rollups",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Votos por hora",
+                "verbose_name_plural": "Votos por hora",
+                "ordering": ["hour"],
+                "indexes": [
+                    models.Index(fields=["event", "hour"], name="events_rollup_event_hour_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("topic", "hour"), name="events_rollup_topic_hour_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="VoteLogEntry",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "delta",
+                    models.SmallIntegerField(
+                        choices=[(1, "Voto"), (-1, "Voto removido")], verbose_name="Variação"
+                    ),
+                ),
+                (
+                    "event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="vote_log",
+                        to="events.event",
+                        verbose_name="Evento",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Registro de voto",
+                "verbose_name_plural": "Registro de votos",
+                "ordering": ["-created_at"],
+                "indexes": [models.Index(fields=["created_at"], name="events_votelog_created_idx")],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-19 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0013_vote_log_hourly_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="archived_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="Arquivado em"
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 17:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0014_event_archived_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="status",
+            field=models.CharField(
+                choices=[("open", "Votação aberta"), ("closed", "Votação encerrada")],
+                default="open",
+                editable=False,
+                max_length=10,
+                verbose_name="Situação",
+            ),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="voting_closed_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="Votação encerrada em"
+            ),
+        ),
+        migrations.AddField(
+            model_name="topic",
+            name="final_rank",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="Posição final"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["event", "final_rank", "id"],
+                name="events_topic_live_rank_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0 on 2026-10-19 18:20
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0015_event_voting_status"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="topic",
+            name="changed_in_version",
+            field=models.PositiveBigIntegerField(
+                default=0, editable=False, verbose_name="Alterado na versão"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="topic",
+            name="event",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="topics",
+                to="events.event",
+                verbose_name="Evento",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="topic",
+            index=models.Index(
+                fields=["event", "changed_in_version"], name="events_topic_changed_idx"
+            ),
+        ),
+    ]
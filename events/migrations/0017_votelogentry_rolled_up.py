@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-19 19:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0016_topic_changed_in_version"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Entries logged so far were counted into the rollups as they were written
+        migrations.AddField(
+            model_name="votelogentry",
+            name="rolled_up",
+            field=models.BooleanField(default=True, editable=False, verbose_name="Consolidado"),
+        ),
+        migrations.AlterField(
+            model_name="votelogentry",
+            name="rolled_up",
+            field=models.BooleanField(default=False, editable=False, verbose_name="Consolidado"),
+        ),
+        migrations.AddIndex(
+            model_name="votelogentry",
+            index=models.Index(
+                condition=models.Q(("rolled_up", False)),
+                fields=["created_at"],
+                name="events_votelog_pending_idx",
+            ),
+        ),
+    ]
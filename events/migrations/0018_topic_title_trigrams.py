@@ -0,0 +1,80 @@
+# Generated by Django 6.0 on 2026-10-19 20:10
+
+import django.db.models.deletion
+import uuid6
+from django.db import migrations, models
+
+import core.fields
+from events.services.topic_similarity_service import title_trigrams
+
+
+def index_live_topics(apps: object, schema_editor: object) -> None:
+    """Index the titles of the topics already suggested."""
+    Topic = apps.get_model("events", "Topic")
+    TopicTitleTrigram = apps.get_model("events", "TopicTitleTrigram")
+    TopicTitleTrigram.objects.bulk_create(
+        (
+            TopicTitleTrigram(event_id=topic.event_id, topic_id=topic.id, trigram=trigram)
+            for topic in Topic.objects.filter(is_deleted=False).iterator(chunk_size=1_000)
+            for trigram in title_trigrams(topic.title)
+        ),
+        batch_size=1_000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0017_votelogentry_rolled_up"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TopicTitleTrigram",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("trigram", models.CharField(max_length=3, verbose_name="Trigrama")),
+                (
+                    "event",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="events.event",
+                        verbose_name="Evento",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="title_trigrams",
+                        to="events.topic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Trigrama de título",
+                "verbose_name_plural": "Trigramas de títulos",
+                "indexes": [
+                    models.Index(
+                        fields=["event", "trigram", "topic"], name="events_title_trigram_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("topic", "trigram"), name="events_title_trigram_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(index_live_topics, migrations.RunPython.noop),
+    ]
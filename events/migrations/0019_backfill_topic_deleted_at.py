@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 21:30
+
+from django.db import migrations
+from django.db.models import F
+
+
+def backfill_deleted_at(apps: object, schema_editor: object) -> None:
+    """
+    Topics soft-deleted before soft_delete_topic set deleted_at were saved
+    (bumping updated_at) when deleted: date them by that last save.
+    """
+    Topic = apps.get_model("events", "Topic")
+    Topic._base_manager.filter(is_deleted=True, deleted_at__isnull=True).update(
+        deleted_at=F("updated_at")
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0018_topic_title_trigrams"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_deleted_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 6.0 on 2026-10-19 22:05
+
+import django.db.models.deletion
+import uuid6
+from django.conf import settings
+from django.db import migrations, models
+
+import core.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0019_backfill_topic_deleted_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedPresenterSuggestion",
+            fields=[
+                (
+                    "id",
+                    core.fields.BinaryUUIDField(
+                        default=uuid6.uuid6, editable=False, primary_key=True, serialize=False
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("is_deleted", models.BooleanField(default=False)),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "presenter_contact",
+                    models.CharField(max_length=500, verbose_name="Contato do palestrante"),
+                ),
+                (
+                    "suggested_by",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="archived_presenter_suggestions",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Sugerido por",
+                    ),
+                ),
+                (
+                    "topic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="presenter_suggestions",
+                        to="events.archivedtopic",
+                        verbose_name="Tópico",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sugestão de palestrante arquivada",
+                "verbose_name_plural": "Sugestões de palestrantes arquivadas",
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
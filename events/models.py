@@ -16,9 +16,27 @@ class Event(BaseModel):
     Inherits from BaseModel for UUID v6 primary key and timestamps.
     """
 
+    OPEN = "open"
+    CLOSED = "closed"
+    STATUS_CHOICES = [(OPEN, "Votação aberta"), (CLOSED, "Votação encerrada")]
+
     name = models.CharField("Nome", max_length=200)
     slug = models.SlugField("Slug", unique=True, max_length=100)
     description = models.TextField("Descrição", blank=True, null=True)
+    # Bumped (with updated_at) by the services whenever anything rendered on the
+    # event page changes; the event page's ETag/Last-Modified are derived from it.
+    version = models.PositiveBigIntegerField("Versão", default=0, editable=False)
+    # Set by snapshot_service.archive_event: the event page is then served from a
+    # static HTML snapshot instead of being rendered from the database.
+    archived_at = models.DateTimeField("Arquivado em", null=True, blank=True, editable=False)
+    # Changed only by event_service.close_voting/reopen_voting: closed events take
+    # no votes or topic changes, and list topics by their precomputed final_rank
+    status = models.CharField(
+        "Situação", max_length=10, choices=STATUS_CHOICES, default=OPEN, editable=False
+    )
+    voting_closed_at = models.DateTimeField(
+        "Votação encerrada em", null=True, blank=True, editable=False
+    )
 
     class Meta:
         ordering = ["-created_at"]
@@ -28,6 +46,10 @@ class Event(BaseModel):
     def __str__(self) -> str:
         return self.name
 
+    @property
+    def is_closed(self) -> bool:
+        return self.status == self.CLOSED
+
 
 class Topic(SoftDeleteModel):
     """
@@ -36,8 +58,13 @@ class Topic(SoftDeleteModel):
     Inherits from SoftDeleteModel for UUID v6 primary key, timestamps, and soft delete.
     """
 
+    # An index of its own would be a prefix of (event, changed_in_version)
     event = models.ForeignKey(
-        Event, on_delete=models.CASCADE, related_name="topics", verbose_name="Evento"
+        Event,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="topics",
+        verbose_name="Evento",
     )
     slug = models.SlugField("Slug", unique=True, max_length=200)
     title = models.CharField("Título", max_length=200)
@@ -48,13 +75,60 @@ class Topic(SoftDeleteModel):
         related_name="created_topics",
         verbose_name="Criador",
     )
+    # Denormalized count of live comments, maintained by comment_service in the
+    # same transaction as the comment write so listings never count comments.
+    comment_count = models.PositiveIntegerField("Comentários", default=0, editable=False)
+    # Denormalized count of votes, maintained by vote_service the same way, so the
+    # "most voted" listing can be read in index order instead of counted and sorted.
+    vote_count = models.PositiveIntegerField("Votos", default=0, editable=False)
+    # Position in the event's final ranking (1 = most voted), set when its voting
+    # is closed; closed events are listed in this order only.
+    final_rank = models.PositiveIntegerField("Posição final", null=True, blank=True, editable=False)
+    # The event version at which this topic's card last changed (see
+    # event_version_service), so clients can ask what changed since a version
+    changed_in_version = models.PositiveBigIntegerField(
+        "Alterado na versão", default=0, editable=False
+    )
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Tópico"
         verbose_name_plural = "Tópicos"
+        # Partial indexes over live rows only: SoftDeleteManager always adds
+        # is_deleted=False, so deleted topics never need to be in them. Each one
+        # serves a listing mode of topic_service.get_topics_page in its exact
+        # order, with `id` last so keyset cursors have a unique position.
+        # Slug lookups are already served by the unique index on slug.
         indexes = [
-            models.Index(fields=["event", "is_deleted", "created_at"]),
+            # Newest/oldest (SQLite walks it backwards for newest-first), trending
+            models.Index(
+                fields=["event", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_topic_live_event_idx",
+            ),
+            # Most voted, and "not voted by me"
+            models.Index(
+                fields=["event", "-vote_count", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_topic_live_top_idx",
+            ),
+            # "Mine", newest first
+            models.Index(
+                fields=["creator", "event", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_topic_live_creator_idx",
+            ),
+            # Final ranking of closed events
+            models.Index(
+                fields=["event", "final_rank", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_topic_live_rank_idx",
+            ),
+            # Topics changed since a version, deleted ones included
+            models.Index(
+                fields=["event", "changed_in_version"],
+                name="events_topic_changed_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -71,6 +145,48 @@ class Topic(SoftDeleteModel):
         super().save(*args, **kwargs)
 
 
+class TopicTitleTrigram(BaseModel):
+    """
+    One trigram of a live topic's normalized title, for finding similar titles.
+
+    Maintained by events.services.topic_similarity_service whenever topics are
+    created, edited, deleted or restored; deleted topics have no rows.
+    """
+
+    # Indexes of their own would be prefixes of (event, trigram, topic) and (topic, trigram)
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="+",
+        verbose_name="Evento",
+    )
+    topic = models.ForeignKey(
+        Topic,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="title_trigrams",
+        verbose_name="Tópico",
+    )
+    trigram = models.CharField("Trigrama", max_length=3)
+
+    class Meta:
+        verbose_name = "Trigrama de título"
+        verbose_name_plural = "Trigramas de títulos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["topic", "trigram"], name="events_title_trigram_unique"
+            ),
+        ]
+        indexes = [
+            # Topics sharing a title's trigrams, counted from the index alone
+            models.Index(fields=["event", "trigram", "topic"], name="events_title_trigram_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.trigram!r} in {self.topic_id}"
+
+
 class Vote(BaseModel):
     """
     Represents a user's vote on a topic.
@@ -79,8 +195,13 @@ class Vote(BaseModel):
     Votes are hard-deleted when users un-vote (no soft delete).
     """
 
+    # No index of its own: unique_together (topic, user) and (topic, created_at) lead with it
     topic = models.ForeignKey(
-        Topic, on_delete=models.CASCADE, related_name="votes", verbose_name="Tópico"
+        Topic,
+        on_delete=models.CASCADE,
+        related_name="votes",
+        verbose_name="Tópico",
+        db_index=False,
     )
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -93,11 +214,310 @@ class Vote(BaseModel):
         ordering = ["-created_at"]
         verbose_name = "Voto"
         verbose_name_plural = "Votos"
+        # Also serves "has this user voted" lookups
         unique_together = [["topic", "user"]]
         indexes = [
-            models.Index(fields=["topic", "user"]),
-            models.Index(fields=["topic"]),
+            # Recent votes per topic (trending), counted from the index alone
+            models.Index(fields=["topic", "created_at"], name="events_vote_topic_recent_idx"),
         ]
 
     def __str__(self) -> str:
         return f"{self.user.username} voted on {self.topic.title}"
+
+
+class VoteLogEntry(BaseModel):
+    """
+    Append-only log of votes cast and removed, written by events.services.vote_service.
+
+    Vote rows are hard-deleted on unvote; the log keeps both directions so vote
+    history survives. Entries are counted into VoteHourlyRollup shortly after
+    they are written, by the roll_up_vote_log task, and entries older than
+    VOTE_LOG_RETENTION_DAYS are removed by the `compact_vote_log` command.
+    """
+
+    CAST = 1
+    REMOVED = -1
+    DELTA_CHOICES = [(CAST, "Voto"), (REMOVED, "Voto removido")]
+
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="vote_log", verbose_name="Evento"
+    )
+    # No FK constraint (history outlives topics moved to the archive tables) and
+    # no index: the log is only read by time
+    topic = models.ForeignKey(
+        Topic,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+        verbose_name="Tópico",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+",
+        verbose_name="Usuário",
+    )
+    delta = models.SmallIntegerField("Variação", choices=DELTA_CHOICES)
+    # Whether the entry is counted in VoteHourlyRollup yet
+    rolled_up = models.BooleanField("Consolidado", default=False, editable=False)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Registro de voto"
+        verbose_name_plural = "Registro de votos"
+        indexes = [
+            # Compaction and rollup rebuilds walk the log by time
+            models.Index(fields=["created_at"], name="events_votelog_created_idx"),
+            # The entries roll_up_vote_log has yet to count
+            models.Index(
+                fields=["created_at"],
+                name="events_votelog_pending_idx",
+                condition=models.Q(rolled_up=False),
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_delta_display()} {self.topic_id} @ {self.created_at}"
+
+
+class VoteHourlyRollup(BaseModel):
+    """
+    Votes cast and removed per topic and hour, for trend analysis.
+
+    Maintained incrementally from the vote log by
+    events.services.vote_analytics_service, so analytics read this table
+    instead of events_vote. Per-event series are sums over the event's rows.
+    """
+
+    # Indexes of their own would be prefixes of (event, hour) and (topic, hour)
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name="vote_rollups",
+        verbose_name="Evento",
+    )
+    # No FK constraint: history outlives topics moved to the archive tables
+    topic = models.ForeignKey(
+        Topic,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="vote_rollups",
+        verbose_name="Tópico",
+    )
+    hour = models.DateTimeField("Hora")
+    votes_cast = models.PositiveIntegerField("Votos", default=0)
+    votes_removed = models.PositiveIntegerField("Votos removidos", default=0)
+
+    class Meta:
+        ordering = ["hour"]
+        verbose_name = "Votos por hora"
+        verbose_name_plural = "Votos por hora"
+        constraints = [
+            # Also serves per-topic series
+            models.UniqueConstraint(fields=["topic", "hour"], name="events_rollup_topic_hour_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["event", "hour"], name="events_rollup_event_hour_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.topic_id} @ {self.hour}: +{self.votes_cast} -{self.votes_removed}"
+
+    @property
+    def net_votes(self) -> int:
+        return self.votes_cast - self.votes_removed
+
+
+class Comment(SoftDeleteModel):
+    """
+    Represents a user's comment on a topic.
+
+    Inherits from SoftDeleteModel for UUID v6 primary key, timestamps, and soft delete.
+    Create and delete through events.services.comment_service so that
+    Topic.comment_count stays in sync.
+    """
+
+    topic = models.ForeignKey(
+        Topic, on_delete=models.CASCADE, related_name="comments", verbose_name="Tópico"
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="comments",
+        verbose_name="Autor",
+    )
+    content = models.TextField("Conteúdo", max_length=1000)
+
+    class Meta:
+        ordering = ["created_at", "id"]
+        verbose_name = "Comentário"
+        verbose_name_plural = "Comentários"
+        indexes = [
+            # Keyset pagination of a topic's live comments, oldest first
+            models.Index(
+                fields=["topic", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_comment_live_topic_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.content[:50]
+
+
+class PresenterSuggestion(SoftDeleteModel):
+    """
+    Represents a suggested presenter for a topic.
+
+    Inherits from SoftDeleteModel for UUID v6 primary key, timestamps, and soft delete.
+    Limited to 3 suggestions per user per topic and 10 per topic (see
+    events.services.presenter_service).
+    """
+
+    topic = models.ForeignKey(
+        Topic,
+        on_delete=models.CASCADE,
+        related_name="presenter_suggestions",
+        verbose_name="Tópico",
+    )
+    suggested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="presenter_suggestions",
+        verbose_name="Sugerido por",
+    )
+    # Free-form: email, name, LinkedIn URL, WhatsApp contact, etc.
+    presenter_contact = models.CharField("Contato do palestrante", max_length=500)
+
+    class Meta:
+        ordering = ["created_at", "id"]
+        verbose_name = "Sugestão de palestrante"
+        verbose_name_plural = "Sugestões de palestrantes"
+        indexes = [
+            # Per-topic listing (and the windowed preview prefetch), oldest first
+            models.Index(
+                fields=["topic", "created_at", "id"],
+                condition=models.Q(is_deleted=False),
+                name="events_presenter_live_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return self.presenter_contact[:50]
+
+
+class ArchivedTopic(BaseModel):
+    """
+    Cold storage for topics soft-deleted longer than the retention period.
+
+    Rows are moved here by the `archive_deleted_topics` command so the hot
+    `events_topic` table and its indexes only carry live (or recently deleted)
+    topics. Keeps the original id and timestamps so a topic can be restored as-is.
+    """
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField("Arquivado em", auto_now_add=True)
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, related_name="archived_topics", verbose_name="Evento"
+    )
+    slug = models.SlugField("Slug", max_length=200)
+    title = models.CharField("Título", max_length=200)
+    description = models.TextField("Descrição", max_length=2000, blank=True, null=True)
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_topics",
+        verbose_name="Criador",
+    )
+
+    class Meta:
+        ordering = ["-archived_at"]
+        verbose_name = "Tópico arquivado"
+        verbose_name_plural = "Tópicos arquivados"
+
+    def __str__(self) -> str:
+        return self.title
+
+
+class ArchivedVote(BaseModel):
+    """
+    Cold storage for the votes of an archived topic.
+    """
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    topic = models.ForeignKey(
+        ArchivedTopic, on_delete=models.CASCADE, related_name="votes", verbose_name="Tópico"
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_votes",
+        verbose_name="Usuário",
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Voto arquivado"
+        verbose_name_plural = "Votos arquivados"
+
+
+class ArchivedComment(BaseModel):
+    """
+    Cold storage for the comments (live or soft-deleted) of an archived topic.
+    """
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_deleted = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    topic = models.ForeignKey(
+        ArchivedTopic, on_delete=models.CASCADE, related_name="comments", verbose_name="Tópico"
+    )
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_comments",
+        verbose_name="Autor",
+    )
+    content = models.TextField("Conteúdo", max_length=1000)
+
+    class Meta:
+        ordering = ["created_at"]
+        verbose_name = "Comentário arquivado"
+        verbose_name_plural = "Comentários arquivados"
+
+
+class ArchivedPresenterSuggestion(BaseModel):
+    """
+    Cold storage for the presenter suggestions (live or soft-deleted) of an archived topic.
+    """
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_deleted = models.BooleanField(default=False)
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    topic = models.ForeignKey(
+        ArchivedTopic,
+        on_delete=models.CASCADE,
+        related_name="presenter_suggestions",
+        verbose_name="Tópico",
+    )
+    suggested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_presenter_suggestions",
+        verbose_name="Sugerido por",
+    )
+    presenter_contact = models.CharField("Contato do palestrante", max_length=500)
+
+    class Meta:
+        ordering = ["created_at"]
+        verbose_name = "Sugestão de palestrante arquivada"
+        verbose_name_plural = "Sugestões de palestrantes arquivadas"
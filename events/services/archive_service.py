@@ -0,0 +1,233 @@
+"""
+Archive service functions for moving long-deleted topics into cold tables.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from django.utils.text import slugify
+
+from events.models import (
+    ArchivedComment,
+    ArchivedPresenterSuggestion,
+    ArchivedTopic,
+    ArchivedVote,
+    Comment,
+    PresenterSuggestion,
+    Topic,
+    Vote,
+)
+from events.services.event_version_service import bump_event_version
+from events.services.topic_similarity_service import index_topic_titles
+
+
+@dataclass
+class ArchiveResult:
+    """Summary of an archival run."""
+
+    topics: int = 0
+    votes: int = 0
+    comments: int = 0
+    presenter_suggestions: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+def archive_deleted_topics(
+    retention: timedelta, batch_size: int = 500, dry_run: bool = False
+) -> ArchiveResult:
+    """
+    Move topics soft-deleted longer than `retention` (with their votes, comments
+    and presenter suggestions) to archive tables.
+
+    Each batch is copied and removed inside its own transaction, so a run can be
+    interrupted at any point without losing or duplicating rows, and writers are
+    only blocked for the duration of one batch.
+
+    Args:
+        retention: How long a topic must have been soft-deleted before archival
+        batch_size: Maximum number of topics moved per transaction
+        dry_run: Only count the candidates, don't move anything
+
+    Returns:
+        ArchiveResult with rows moved and time spent
+    """
+    started = time.monotonic()
+    result = ArchiveResult()
+    cutoff = timezone.now() - retention
+    candidates = Topic.all_objects.filter(is_deleted=True, deleted_at__lt=cutoff)
+
+    if dry_run:
+        result.topics = candidates.count()
+        result.votes = Vote.objects.filter(topic__in=candidates).count()
+        result.comments = Comment.all_objects.filter(topic__in=candidates).count()
+        result.presenter_suggestions = PresenterSuggestion.all_objects.filter(
+            topic__in=candidates
+        ).count()
+        result.seconds = time.monotonic() - started
+        return result
+
+    while True:
+        with transaction.atomic():
+            topics = list(candidates.order_by("deleted_at")[:batch_size])
+            if not topics:
+                break
+            topic_ids = [topic.id for topic in topics]
+            votes = list(Vote.objects.filter(topic_id__in=topic_ids))
+            comments = list(Comment.all_objects.filter(topic_id__in=topic_ids))
+            suggestions = list(PresenterSuggestion.all_objects.filter(topic_id__in=topic_ids))
+
+            ArchivedTopic.objects.bulk_create(
+                ArchivedTopic(
+                    id=topic.id,
+                    created_at=topic.created_at,
+                    updated_at=topic.updated_at,
+                    deleted_at=topic.deleted_at,
+                    event_id=topic.event_id,
+                    slug=topic.slug,
+                    title=topic.title,
+                    description=topic.description,
+                    creator_id=topic.creator_id,
+                )
+                for topic in topics
+            )
+            ArchivedVote.objects.bulk_create(
+                ArchivedVote(
+                    id=vote.id,
+                    created_at=vote.created_at,
+                    updated_at=vote.updated_at,
+                    topic_id=vote.topic_id,
+                    user_id=vote.user_id,
+                )
+                for vote in votes
+            )
+            ArchivedComment.objects.bulk_create(
+                ArchivedComment(
+                    id=comment.id,
+                    created_at=comment.created_at,
+                    updated_at=comment.updated_at,
+                    is_deleted=comment.is_deleted,
+                    deleted_at=comment.deleted_at,
+                    topic_id=comment.topic_id,
+                    author_id=comment.author_id,
+                    content=comment.content,
+                )
+                for comment in comments
+            )
+            ArchivedPresenterSuggestion.objects.bulk_create(
+                ArchivedPresenterSuggestion(
+                    id=suggestion.id,
+                    created_at=suggestion.created_at,
+                    updated_at=suggestion.updated_at,
+                    is_deleted=suggestion.is_deleted,
+                    deleted_at=suggestion.deleted_at,
+                    topic_id=suggestion.topic_id,
+                    suggested_by_id=suggestion.suggested_by_id,
+                    presenter_contact=suggestion.presenter_contact,
+                )
+                for suggestion in suggestions
+            )
+            Vote.objects.filter(topic_id__in=topic_ids).delete()
+            Comment.all_objects.filter(topic_id__in=topic_ids).delete()
+            PresenterSuggestion.all_objects.filter(topic_id__in=topic_ids).delete()
+            Topic.all_objects.filter(id__in=topic_ids).delete()
+
+        result.topics += len(topics)
+        result.votes += len(votes)
+        result.comments += len(comments)
+        result.presenter_suggestions += len(suggestions)
+        result.batches += 1
+
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def restore_archived_topic(archived: ArchivedTopic) -> Topic:
+    """
+    Move an archived topic, its votes, comments and presenter suggestions back
+    into the live tables.
+
+    The topic comes back undeleted (otherwise the next archival run would move it
+    out again). If its slug was reused while archived, a suffixed slug is generated.
+
+    Args:
+        archived: The archived topic to restore
+
+    Returns:
+        The restored Topic
+    """
+    with transaction.atomic():
+        base_slug = archived.slug or slugify(archived.title)
+        slug = base_slug
+        counter = 1
+        while Topic.all_objects.filter(slug=slug).exists():
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+
+        topic = Topic.all_objects.create(
+            id=archived.id,
+            event_id=archived.event_id,
+            creator_id=archived.creator_id,
+            slug=slug,
+            title=archived.title,
+            description=archived.description,
+            comment_count=archived.comments.filter(is_deleted=False).count(),
+            vote_count=archived.votes.count(),
+        )
+        Vote.objects.bulk_create(
+            Vote(id=vote.id, topic_id=topic.id, user_id=vote.user_id)
+            for vote in archived.votes.all()
+        )
+        Comment.all_objects.bulk_create(
+            Comment(
+                id=comment.id,
+                topic_id=topic.id,
+                author_id=comment.author_id,
+                content=comment.content,
+                is_deleted=comment.is_deleted,
+                deleted_at=comment.deleted_at,
+            )
+            for comment in archived.comments.all()
+        )
+        PresenterSuggestion.all_objects.bulk_create(
+            PresenterSuggestion(
+                id=suggestion.id,
+                topic_id=topic.id,
+                suggested_by_id=suggestion.suggested_by_id,
+                presenter_contact=suggestion.presenter_contact,
+                is_deleted=suggestion.is_deleted,
+                deleted_at=suggestion.deleted_at,
+            )
+            for suggestion in archived.presenter_suggestions.all()
+        )
+
+        # auto_now/auto_now_add stamp inserts with the current time; put the original
+        # timestamps back with UPDATEs, which bypass them.
+        Topic.all_objects.filter(id=topic.id).update(
+            created_at=archived.created_at, updated_at=archived.updated_at
+        )
+        archived_votes = ArchivedVote.objects.filter(id=OuterRef("id"))
+        Vote.objects.filter(topic_id=topic.id).update(
+            created_at=Subquery(archived_votes.values("created_at")[:1]),
+            updated_at=Subquery(archived_votes.values("updated_at")[:1]),
+        )
+        archived_comments = ArchivedComment.objects.filter(id=OuterRef("id"))
+        Comment.all_objects.filter(topic_id=topic.id).update(
+            created_at=Subquery(archived_comments.values("created_at")[:1]),
+            updated_at=Subquery(archived_comments.values("updated_at")[:1]),
+        )
+        archived_suggestions = ArchivedPresenterSuggestion.objects.filter(id=OuterRef("id"))
+        PresenterSuggestion.all_objects.filter(topic_id=topic.id).update(
+            created_at=Subquery(archived_suggestions.values("created_at")[:1]),
+            updated_at=Subquery(archived_suggestions.values("updated_at")[:1]),
+        )
+        archived.delete()
+        index_topic_titles([topic])
+        bump_event_version(topic.event_id, topic.id)
+
+    topic.refresh_from_db()
+    return topic
@@ -0,0 +1,160 @@
+"""
+Comment service functions for handling comment operations.
+"""
+
+import base64
+from datetime import datetime
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from events.dto.comment_dto import CommentDTO, CommentPageDTO
+from events.models import Comment, Topic
+from events.services.event_version_service import (
+    bump_event_version,
+    bump_event_version_for_topic,
+)
+from events.services.topic_service import get_user_avatar_url, get_user_display_name
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+COMMENTS_PAGE_SIZE = 10
+
+
+def encode_cursor(comment: Comment) -> str:
+    """Encode the (created_at, id) keyset position of a comment as an opaque token."""
+    raw = f"{comment.created_at.isoformat()}|{comment.id.hex}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, comment_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(hex=comment_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _to_dto(comment: Comment, topic_slug: str) -> CommentDTO:
+    return CommentDTO(
+        id=comment.id,
+        topic_slug=topic_slug,
+        content=comment.content,
+        author_username=comment.author.username,
+        author_display_name=get_user_display_name(comment.author),
+        author_avatar_url=get_user_avatar_url(comment.author),
+        created_at=comment.created_at,
+    )
+
+
+def get_comments_page(
+    topic_slug: str, cursor: str | None = None, limit: int = COMMENTS_PAGE_SIZE
+) -> CommentPageDTO:
+    """
+    Get one page of a topic's comments, oldest first, using keyset pagination.
+
+    Only `limit + 1` rows are read per call (the extra row tells whether there is a
+    next page), so cost is independent of how many comments the topic has.
+
+    Args:
+        topic_slug: The slug of the topic
+        cursor: Token from a previous page's next_cursor, or None for the first page
+        limit: Page size
+
+    Returns:
+        CommentPageDTO with the comments and the next page cursor
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+        ValueError: If the cursor is malformed
+    """
+    topic = Topic.objects.get(slug=topic_slug)
+    comments = (
+        Comment.objects.filter(topic=topic)
+        .select_related("author")
+        .prefetch_related("author__socialaccount_set")
+        .order_by("created_at", "id")
+    )
+    if cursor:
+        created_at, comment_id = decode_cursor(cursor)
+        comments = comments.filter(
+            Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=comment_id)
+        )
+
+    rows = list(comments[: limit + 1])
+    page = rows[:limit]
+    return CommentPageDTO(
+        comments=[_to_dto(comment, topic.slug) for comment in page],
+        next_cursor=encode_cursor(page[-1]) if len(rows) > limit else None,
+    )
+
+
+def create_comment(topic_slug: str, user: "User", content: str) -> CommentDTO:
+    """
+    Create a comment and increment the topic's denormalized comment_count.
+
+    Both writes happen in one transaction, and the count is incremented with an
+    F() expression so concurrent comments can't lose updates.
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+    """
+    topic = Topic.objects.get(slug=topic_slug)
+    with transaction.atomic():
+        comment = Comment.objects.create(topic=topic, author=user, content=content)
+        Topic.objects.filter(pk=topic.pk).update(comment_count=F("comment_count") + 1)
+        bump_event_version(topic.event_id, topic.id)
+    return _to_dto(comment, topic.slug)
+
+
+def soft_delete_comment(comment_id: UUID) -> bool:
+    """
+    Soft delete a comment and decrement the topic's comment_count.
+
+    The flag flip is a conditional UPDATE, so two concurrent deletes of the same
+    comment can only decrement the count once.
+
+    Returns:
+        True if the comment was deleted, False if it was already deleted
+    """
+    with transaction.atomic():
+        comment = Comment.all_objects.only("topic_id").get(pk=comment_id)
+        deleted = Comment.all_objects.filter(pk=comment_id, is_deleted=False).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        if deleted:
+            Topic.all_objects.filter(pk=comment.topic_id).update(
+                comment_count=F("comment_count") - 1
+            )
+            bump_event_version_for_topic(comment.topic_id)
+    return bool(deleted)
+
+
+def restore_comment(comment_id: UUID) -> bool:
+    """
+    Restore a soft-deleted comment and increment the topic's comment_count.
+
+    Returns:
+        True if the comment was restored, False if it wasn't deleted
+    """
+    with transaction.atomic():
+        comment = Comment.all_objects.only("topic_id").get(pk=comment_id)
+        restored = Comment.all_objects.filter(pk=comment_id, is_deleted=True).update(
+            is_deleted=False, deleted_at=None
+        )
+        if restored:
+            Topic.all_objects.filter(pk=comment.topic_id).update(
+                comment_count=F("comment_count") + 1
+            )
+            bump_event_version_for_topic(comment.topic_id)
+    return bool(restored)
@@ -0,0 +1,140 @@
+"""
+Event service functions for listing events and closing and reopening their voting.
+
+Closing freezes the event: its topics get their final_rank from the most voted
+order, once, and from then on the use cases reject votes and topic changes,
+listings read that ranking (no per-user has_voted) and the event page may be
+cached for EVENT_CLOSED_MAX_AGE.
+"""
+
+import base64
+
+from django.db import transaction
+from django.utils import timezone
+
+from events.dto.event_dto import EventDTO, EventPageDTO
+from events.models import Event, Topic
+from events.services.event_version_service import bump_event_version
+from events.services.snapshot_service import unarchive_event
+
+EVENT_CLOSED_MESSAGE = "Voting is closed for this event"
+
+EVENTS_PAGE_SIZE = 20
+
+
+def encode_event_cursor(event: Event) -> str:
+    """Encode an event's position in slug order as an opaque token."""
+    return base64.urlsafe_b64encode(event.slug.encode()).decode()
+
+
+def decode_event_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by encode_event_cursor.
+
+    Returns:
+        The slug to continue after
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        return base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def get_events_page(cursor: str | None = None, limit: int = EVENTS_PAGE_SIZE) -> EventPageDTO:
+    """
+    Get one page of the events by slug, using keyset pagination over the unique slug index.
+
+    Args:
+        cursor: Token from a previous page's next_cursor, or None for the first page
+        limit: Page size
+
+    Returns:
+        EventPageDTO with the events and the next page cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    events = Event.objects.order_by("slug")
+    if cursor:
+        events = events.filter(slug__gt=decode_event_cursor(cursor))
+
+    rows = list(events[: limit + 1])
+    page = rows[:limit]
+    return EventPageDTO(
+        events=[
+            EventDTO(
+                slug=event.slug,
+                name=event.name,
+                description=event.description,
+                status=event.status,
+                created_at=event.created_at,
+                voting_closed_at=event.voting_closed_at,
+            )
+            for event in page
+        ],
+        next_cursor=encode_event_cursor(page[-1]) if len(rows) > limit else None,
+    )
+
+
+def close_voting(event_slug: str) -> int:
+    """
+    Close an event's voting and precompute its final ranking.
+
+    Ranks follow the "most voted" listing (vote_count, then oldest first).
+    Closing a closed event recomputes the ranking.
+
+    Args:
+        event_slug: The slug of the event
+
+    Returns:
+        Number of ranked topics
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+    """
+    with transaction.atomic():
+        event = Event.objects.select_for_update().get(slug=event_slug)
+        topic_ids = list(
+            Topic.objects.filter(event=event)
+            .order_by("-vote_count", "created_at", "id")
+            .values_list("pk", flat=True)
+        )
+        # One primary key update per topic: with a large IN list (bulk_update)
+        # SQLite's planner picks a scan of every event's topics instead
+        for rank, topic_id in enumerate(topic_ids, start=1):
+            Topic.objects.filter(pk=topic_id).update(final_rank=rank)
+        Event.objects.filter(pk=event.pk).update(
+            status=Event.CLOSED, voting_closed_at=timezone.now()
+        )
+        bump_event_version(event.pk)
+    return len(topic_ids)
+
+
+def reopen_voting(event_slug: str) -> None:
+    """
+    Reopen a closed event's voting; its final ranking is discarded, and its
+    snapshot if it was archived.
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+    """
+    with transaction.atomic():
+        event = Event.objects.select_for_update().get(slug=event_slug)
+        Topic.all_objects.filter(event=event).update(final_rank=None)
+        Event.objects.filter(pk=event.pk).update(status=Event.OPEN, voting_closed_at=None)
+        bump_event_version(event.pk)
+    # Votes and topics are accepted again: the page must be rendered live
+    unarchive_event(event_slug)
+
+
+def is_voting_closed(event_slug: str) -> bool:
+    """Whether an event's voting is closed (False for unknown events)."""
+    return Event.objects.filter(slug=event_slug, status=Event.CLOSED).exists()
+
+
+def is_topic_voting_closed(topic_slug: str) -> bool:
+    """Whether the event a live topic belongs to has closed its voting."""
+    return Topic.objects.filter(slug=topic_slug, event__status=Event.CLOSED).exists()
@@ -0,0 +1,200 @@
+"""
+Event version service functions for conditional GET and change polling of event pages.
+
+Every service that changes something rendered on an event page (topics, votes,
+comments, presenter suggestions) calls bump_event_version in the same
+transaction as its write. Views derive ETag/Last-Modified from the version, so
+an unchanged page can be answered with 304 without running the topic query.
+
+When the change is to one topic's card, the topic is stamped with the new
+version (Topic.changed_in_version), and wait_for_event_change() can tell a
+client which cards changed after the version it has.
+
+Each worker caches the validators; a bump publishes EVENTS_BUS_KEY on the
+invalidation bus (core.invalidation), which drops them in every worker.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Subquery
+from django.utils import timezone
+
+from core.invalidation import InvalidatedCache, publish
+from events.models import Event, Topic
+
+# One bus key for every event: a per-event key would need the slug (the cache
+# key) at every write, and there are only a few events with live pages
+EVENTS_BUS_KEY = "events"
+# Added to every event's version by retire_event_versions()
+RETIRED_VERSIONS_OFFSET = 1_000_000
+
+_event_versions = InvalidatedCache()
+
+
+@dataclass(frozen=True)
+class EventVersion:
+    """Change validators of an event page."""
+
+    id: UUID
+    version: int
+    updated_at: datetime
+    status: str
+
+    @property
+    def is_closed(self) -> bool:
+        return self.status == Event.CLOSED
+
+
+@dataclass
+class EventChanges:
+    """An event's current version and the topics whose cards changed since a given one."""
+
+    version: int
+    # Empty when only event-wide things changed (e.g. its voting was closed)
+    topic_slugs: list[str] = field(default_factory=list)
+
+
+def bump_event_version(event_id: UUID, topic_id: UUID | None = None) -> None:
+    """
+    Mark everything rendered for an event as changed.
+
+    Args:
+        event_id: The event's id
+        topic_id: The topic whose card changed, if the change is to one topic
+    """
+    # update() bypasses auto_now, so updated_at is set explicitly
+    Event.objects.filter(pk=event_id).update(version=F("version") + 1, updated_at=timezone.now())
+    if topic_id is not None:
+        Topic.all_objects.filter(pk=topic_id).update(
+            changed_in_version=Subquery(Event.objects.filter(pk=event_id).values("version"))
+        )
+    publish(EVENTS_BUS_KEY)
+
+
+def bump_user_event_versions(user_id: UUID) -> int:
+    """
+    Mark the cards showing a user as changed, after their name or avatar changed.
+
+    Cards show their creator and the first presenter suggesters, so the topics
+    the user created or suggested a presenter for are stamped with their
+    event's new version, one bump per event.
+
+    Returns:
+        Number of events bumped
+    """
+    rows = (
+        Topic.all_objects.filter(
+            Q(creator_id=user_id) | Q(presenter_suggestions__suggested_by_id=user_id)
+        )
+        .values_list("event_id", "pk")
+        .distinct()
+    )
+    topics_by_event: dict[UUID, list[UUID]] = {}
+    for event_id, topic_id in rows:
+        topics_by_event.setdefault(event_id, []).append(topic_id)
+
+    with transaction.atomic():
+        for event_id, topic_ids in topics_by_event.items():
+            Event.objects.filter(pk=event_id).update(
+                version=F("version") + 1, updated_at=timezone.now()
+            )
+            Topic.all_objects.filter(pk__in=topic_ids).update(
+                changed_in_version=Subquery(Event.objects.filter(pk=event_id).values("version"))
+            )
+    if topics_by_event:
+        publish(EVENTS_BUS_KEY)
+    return len(topics_by_event)
+
+
+def retire_event_versions() -> None:
+    """
+    Move every event past the versions it had, after a restore brought back older rows.
+
+    The restored versions would be reached again by the next changes, so
+    validators (ETags, change polls) clients kept from before the restore
+    could match content that differs. Versions jump by RETIRED_VERSIONS_OFFSET,
+    more changes than an event gets between a snapshot and its restore.
+    """
+    Event.objects.update(version=F("version") + RETIRED_VERSIONS_OFFSET, updated_at=timezone.now())
+    publish(EVENTS_BUS_KEY)
+
+
+def bump_event_version_for_topic(topic_id: UUID) -> None:
+    """Bump the version of the event a topic (live or soft-deleted) belongs to."""
+    event_id = Topic.all_objects.values_list("event_id", flat=True).get(pk=topic_id)
+    bump_event_version(event_id, topic_id)
+
+
+def get_event_version(event_slug: str) -> EventVersion | None:
+    """
+    Read an event's validators, from this worker's cache while no event changed.
+
+    Returns:
+        EventVersion, or None if the event doesn't exist
+    """
+
+    def read() -> EventVersion | None:
+        row = (
+            Event.objects.filter(slug=event_slug)
+            .values("id", "version", "updated_at", "status")
+            .first()
+        )
+        return EventVersion(**row) if row else None
+
+    return _event_versions.get_or_set(event_slug, EVENTS_BUS_KEY, read)
+
+
+def get_events_version() -> tuple[int, datetime | None]:
+    """
+    Validators of the event listing: how many events there are and when one last changed.
+    """
+    row = Event.objects.aggregate(count=Count("id"), updated_at=Max("updated_at"))
+    return row["count"], row["updated_at"]
+
+
+async def wait_for_event_change(
+    event_slug: str, since_version: int, timeout: float, interval: float
+) -> EventChanges | None:
+    """
+    Wait until an event's version differs from `since_version`.
+
+    While waiting, only the event's version is read (one indexed events_event
+    lookup every `interval` seconds); the topic table is queried once, after
+    the version has changed.
+
+    Args:
+        event_slug: The slug of the event
+        since_version: The version the client has
+        timeout: Seconds to wait at most
+        interval: Seconds between version checks
+
+    Returns:
+        EventChanges, or None if nothing changed before the timeout
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        row = await Event.objects.filter(slug=event_slug).values("id", "version").afirst()
+        if row is None:
+            raise Event.DoesNotExist(f"Event {event_slug!r} does not exist")
+        if row["version"] != since_version:
+            slugs = [
+                slug
+                async for slug in Topic.all_objects.filter(
+                    event_id=row["id"], changed_in_version__gt=since_version
+                )
+                .order_by()
+                .values_list("slug", flat=True)
+            ]
+            return EventChanges(version=row["version"], topic_slugs=slugs)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(interval, remaining))
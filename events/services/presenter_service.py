@@ -0,0 +1,99 @@
+"""
+Presenter suggestion service functions for handling suggestion operations.
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from django.db import transaction
+from django.utils import timezone
+
+from events.dto.presenter_dto import PresenterDTO
+from events.models import PresenterSuggestion, Topic
+from events.services.event_version_service import (
+    bump_event_version,
+    bump_event_version_for_topic,
+)
+from events.services.topic_service import to_presenter_dto
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+MAX_SUGGESTIONS_PER_TOPIC = 10
+MAX_SUGGESTIONS_PER_USER = 3
+
+
+def get_suggestions_for_topic(topic_slug: str) -> list[PresenterDTO]:
+    """
+    Get all live presenter suggestions of a topic, oldest first.
+
+    The topic listing only carries a preview; this is the on-demand full list.
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+    """
+    topic = Topic.objects.get(slug=topic_slug)
+    suggestions = (
+        PresenterSuggestion.objects.filter(topic=topic)
+        .select_related("suggested_by")
+        .order_by("created_at", "id")
+    )
+    return [to_presenter_dto(suggestion, topic.slug) for suggestion in suggestions]
+
+
+def check_limits(topic: Topic, user: "User") -> None:
+    """
+    Verify a user may add one more suggestion to a topic.
+
+    Raises:
+        ValueError: If the topic or the user already reached their limit
+    """
+    suggestions = PresenterSuggestion.objects.filter(topic=topic)
+    if suggestions.count() >= MAX_SUGGESTIONS_PER_TOPIC:
+        raise ValueError(
+            f"Topic already has the maximum of {MAX_SUGGESTIONS_PER_TOPIC} presenter suggestions"
+        )
+    if suggestions.filter(suggested_by=user).count() >= MAX_SUGGESTIONS_PER_USER:
+        raise ValueError(f"You can suggest at most {MAX_SUGGESTIONS_PER_USER} presenters per topic")
+
+
+def suggest_presenter(topic_slug: str, user: "User", presenter_contact: str) -> PresenterDTO:
+    """
+    Create a presenter suggestion, enforcing the per-topic and per-user limits.
+
+    The limit check and the insert share one transaction, which takes the
+    database's write lock before the check (the writer's transactions are
+    IMMEDIATE, see sqlite_databases): concurrent suggestions wait for each
+    other and re-count, so they can't push a topic past its limit.
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+        ValueError: If a limit was reached
+    """
+    topic = Topic.objects.get(slug=topic_slug)
+    with transaction.atomic():
+        check_limits(topic, user)
+        suggestion = PresenterSuggestion.objects.create(
+            topic=topic, suggested_by=user, presenter_contact=presenter_contact
+        )
+        bump_event_version(topic.event_id, topic.id)
+    return to_presenter_dto(suggestion, topic.slug)
+
+
+def soft_delete_suggestion(suggestion_id: UUID) -> bool:
+    """
+    Soft delete a presenter suggestion.
+
+    Returns:
+        True if the suggestion was deleted, False if it was already deleted
+    """
+    with transaction.atomic():
+        deleted = PresenterSuggestion.all_objects.filter(pk=suggestion_id, is_deleted=False).update(
+            is_deleted=True, deleted_at=timezone.now()
+        )
+        if deleted:
+            topic_id = PresenterSuggestion.all_objects.values_list("topic_id", flat=True).get(
+                pk=suggestion_id
+            )
+            bump_event_version_for_topic(topic_id)
+    return bool(deleted)
@@ -0,0 +1,383 @@
+"""
+Synthetic load data generator for benchmarks and query-plan work.
+
+Builds users, events, topics and votes in large batches, with the skew real
+traffic has: votes follow a Zipf distribution over topics (a few topics get
+most votes), some topics reuse titles (so slugs need suffixes) and
+some are soft-deleted. The same seed always produces the same rows, including
+primary keys and timestamps (for a fixed `until`). Votes are also counted into
+the hourly vote rollups, so the analytics have the same history, and live topic
+titles are indexed for similar-title lookups.
+"""
+
+import itertools
+import random
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from accounts.models import User
+from events.models import Event, Topic, Vote
+from events.services.topic_similarity_service import index_topic_titles
+from events.services.vote_analytics_service import add_to_rollups, hour_start
+
+# 100 ns intervals between the UUID epoch (1582-10-15) and the Unix epoch
+UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+SUBJECTS = (
+    "Django",
+    "FastAPI",
+    "Pydantic",
+    "asyncio",
+    "pytest",
+    "Pandas",
+    "Polars",
+    "SQLAlchemy",
+    "HTMX",
+    "Type hints",
+    "Celery",
+    "NumPy",
+    "uv",
+    "Ruff",
+    "Docker",
+    "SQLite",
+    "Machine Learning",
+    "Web scraping",
+    "CPython",
+    "Rust e Python",
+)
+FORMATS = (
+    "Introdução a {}",
+    "{} na prática",
+    "{} em produção",
+    "Boas práticas com {}",
+    "{} avançado",
+    "Testando código com {}",
+    "Migrando para {}",
+    "O que há de novo em {}",
+)
+AUDIENCES = (
+    "",
+    " para iniciantes",
+    " para quem vem do Java",
+    " em times pequenos",
+    " em larga escala",
+    " sem dor de cabeça",
+    " no dia a dia",
+    " com exemplos reais",
+    " do zero",
+    " em 2026",
+)
+
+
+@dataclass
+class SeedConfig:
+    """What seed_load generates."""
+
+    users: int = 20_000
+    events: int = 10
+    topics: int = 5_000
+    votes: int = 1_000_000
+    # Vote skew: topic of popularity rank r gets votes proportional to 1 / r**zipf
+    zipf: float = 1.1
+    duplicate_ratio: float = 0.1
+    deleted_ratio: float = 0.05
+    days: int = 365
+    # Timestamps are spread over the `days` before this (default: today, 00:00)
+    until: datetime | None = None
+    seed: int = 42
+    batch_size: int = 10_000
+
+
+@dataclass
+class SeedResult:
+    """Rows created by a seed_load run."""
+
+    users: int = 0
+    events: int = 0
+    topics: int = 0
+    deleted_topics: int = 0
+    votes: int = 0
+    seconds: float = 0.0
+
+
+def _uuid6_at(moment: datetime, rng: random.Random) -> uuid.UUID:
+    """A UUIDv6 for `moment` with seeded random bits, so ids sort like created_at."""
+    timestamp = int(moment.timestamp() * 10_000_000) + UUID_EPOCH_OFFSET
+    value = (
+        (timestamp >> 12) << 80
+        | 0x6 << 76
+        | (timestamp & 0xFFF) << 64
+        | 0b10 << 62
+        | rng.getrandbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _title(index: int) -> str:
+    """The index-th distinct topic title (subject, then format, then audience)."""
+    subject = SUBJECTS[index % len(SUBJECTS)]
+    index //= len(SUBJECTS)
+    title_format = FORMATS[index % len(FORMATS)]
+    index //= len(FORMATS)
+    title = title_format.format(subject) + AUDIENCES[index % len(AUDIENCES)]
+    edition = index // len(AUDIENCES)
+    return f"{title} (parte {edition + 1})" if edition else title
+
+
+def _unique_slug(base: str, taken: set[str]) -> str:
+    """The slug Topic.save would pick: `base`, then `base-1`, `base-2`, ..."""
+    slug = base
+    counter = 1
+    while slug in taken:
+        slug = f"{base}-{counter}"
+        counter += 1
+    taken.add(slug)
+    return slug
+
+
+def zipf_allocation(total: int, capacities: list[int], exponent: float) -> list[int]:
+    """
+    Split `total` over ranked buckets with Zipf weights, respecting each bucket's capacity.
+
+    Bucket r (0-based) gets a share proportional to 1 / (r + 1) ** exponent; what a
+    full bucket can't take is spread over the remaining ones in rank order.
+    """
+    weights = [1 / (rank + 1) ** exponent for rank in range(len(capacities))]
+    scale = total / sum(weights) if weights else 0
+    counts = [
+        min(int(weight * scale), capacity)
+        for weight, capacity in zip(weights, capacities, strict=True)
+    ]
+    remaining = min(total, sum(capacities)) - sum(counts)
+    for rank, capacity in enumerate(capacities):
+        if remaining <= 0:
+            break
+        extra = min(capacity - counts[rank], remaining)
+        counts[rank] += extra
+        remaining -= extra
+    return counts
+
+
+def _insert_models(objs: list[models.Model], batch_size: int) -> None:
+    """
+    Insert model instances as they are, timestamps included, with executemany.
+
+    bulk_create runs the fields' pre_save, where auto_now/auto_now_add overwrite
+    the generated created_at/updated_at with the current time. Values are still
+    converted by the model fields.
+    """
+    if not objs:
+        return
+    meta = objs[0]._meta
+    fields = meta.concrete_fields
+    quote = connection.ops.quote_name
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} ({', '.join(quote(f.column) for f in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))})"
+    )
+    with connection.cursor() as cursor:
+        for batch in _batched(objs, batch_size):
+            cursor.executemany(
+                sql,
+                [
+                    tuple(
+                        field.get_db_prep_save(getattr(obj, field.attname), connection)
+                        for field in fields
+                    )
+                    for obj in batch
+                ],
+            )
+
+
+def _insert_votes(
+    votes: Iterable[tuple[uuid.UUID, uuid.UUID, datetime]], rng: random.Random, batch_size: int
+) -> int:
+    """
+    Insert (topic id, user id, voted at) rows into events_vote with executemany.
+
+    Votes are most of a load dataset, and bulk_create's per-object work (model
+    instances, per-field preparation) is about two thirds of its insert time, so
+    votes skip it. Values are still converted by the model fields themselves,
+    once per distinct topic/user id.
+    """
+    meta = Vote._meta
+    fields = [meta.get_field(name) for name in ("id", "created_at", "updated_at", "topic", "user")]
+    quote = connection.ops.quote_name
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} ({', '.join(quote(f.column) for f in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))})"
+    )
+    pk, created_at, _updated_at, topic, user = fields
+    topic_values: dict[uuid.UUID, object] = {}
+    user_values: dict[uuid.UUID, object] = {}
+
+    def rows() -> Iterator[tuple[object, ...]]:
+        for topic_id, user_id, voted in votes:
+            if topic_id not in topic_values:
+                topic_values[topic_id] = topic.get_db_prep_save(topic_id, connection)
+            if user_id not in user_values:
+                user_values[user_id] = user.get_db_prep_save(user_id, connection)
+            timestamp = created_at.get_db_prep_save(voted, connection)
+            yield (
+                pk.get_db_prep_save(_uuid6_at(voted, rng), connection),
+                timestamp,
+                timestamp,
+                topic_values[topic_id],
+                user_values[user_id],
+            )
+
+    inserted = 0
+    with connection.cursor() as cursor:
+        for batch in _batched(rows(), batch_size):
+            cursor.executemany(sql, batch)
+            inserted += len(batch)
+    return inserted
+
+
+def seed_load(config: SeedConfig) -> SeedResult:
+    """
+    Generate a load dataset in one transaction.
+
+    Usernames are prefixed with the seed, so a seed can only be loaded once per
+    database; different seeds can be stacked.
+
+    Args:
+        config: Row counts, skew and seed
+
+    Returns:
+        SeedResult with the rows created and time spent
+
+    Raises:
+        ValueError: If this seed was already loaded
+    """
+    started = time.monotonic()
+    rng = random.Random(config.seed)
+    prefix = f"seed{config.seed}"
+    if User.objects.filter(username__startswith=f"{prefix}-").exists():
+        raise ValueError(f"Seed {config.seed} was already loaded")
+
+    result = SeedResult()
+    end = config.until or timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    if timezone.is_naive(end):
+        end = timezone.make_aware(end)
+    start = end - timedelta(days=config.days)
+    span = (end - start).total_seconds()
+
+    def moment_after(after: datetime) -> datetime:
+        return after + timedelta(seconds=rng.random() * (end - after).total_seconds())
+
+    with transaction.atomic():
+        user_ids = []
+        users = []
+        for i in range(config.users):
+            joined = start + timedelta(seconds=rng.random() * span)
+            user_id = _uuid6_at(joined, rng)
+            user_ids.append(user_id)
+            users.append(
+                User(
+                    id=user_id,
+                    username=f"{prefix}-user{i}",
+                    email=f"{prefix}-user{i}@example.com",
+                    first_name=rng.choice(SUBJECTS).split()[0],
+                    password="!",  # Unusable; hashing 20k passwords would dominate the run
+                    date_joined=joined,
+                )
+            )
+        for batch in _batched(users, config.batch_size):
+            User.objects.bulk_create(batch)
+        result.users = len(users)
+
+        taken_event_slugs = set(Event.objects.values_list("slug", flat=True))
+        events = [
+            Event(
+                id=_uuid6_at(start, rng),
+                name=f"Python Floripa #{i + 1}",
+                slug=_unique_slug(slugify(f"{prefix}-python-floripa-{i + 1}"), taken_event_slugs),
+                created_at=start,
+                updated_at=end,
+            )
+            for i in range(config.events)
+        ]
+        _insert_models(events, config.batch_size)
+        result.events = len(events)
+
+        taken_topic_slugs = set(Topic.all_objects.values_list("slug", flat=True))
+        titles: list[str] = []
+        topics = []
+        # Popular events get more topics too
+        event_weights = [1 / (rank + 1) for rank in range(len(events))]
+        for _ in range(config.topics):
+            if titles and rng.random() < config.duplicate_ratio:
+                title = rng.choice(titles)
+            else:
+                title = _title(len(titles))
+                titles.append(title)
+            created = start + timedelta(seconds=rng.random() * span)
+            deleted = rng.random() < config.deleted_ratio
+            topics.append(
+                Topic(
+                    id=_uuid6_at(created, rng),
+                    event=rng.choices(events, event_weights)[0],
+                    creator_id=rng.choice(user_ids),
+                    title=title,
+                    slug=_unique_slug(slugify(title), taken_topic_slugs),
+                    description=f"Palestra sobre {title.lower()}.",
+                    is_deleted=deleted,
+                    deleted_at=moment_after(created) if deleted else None,
+                    created_at=created,
+                    updated_at=created,
+                )
+            )
+            result.deleted_topics += deleted
+
+        # Popularity rank is independent of age and event
+        ranked = topics[:]
+        rng.shuffle(ranked)
+        counts = zipf_allocation(config.votes, [len(user_ids)] * len(ranked), config.zipf)
+        for topic, count in zip(ranked, counts, strict=True):
+            topic.vote_count = count
+
+        _insert_models(topics, config.batch_size)
+        result.topics = len(topics)
+        index_topic_titles(topics, config.batch_size)
+
+        # Index-ordered inserts: topics by id, each topic's voters by id, so the
+        # (topic, user) indexes are appended to instead of split at random pages
+        by_topic = sorted(zip(ranked, counts, strict=True), key=lambda pair: pair[0].id.bytes)
+        user_ids.sort(key=lambda user_id: user_id.bytes)
+        # Counted into the hourly vote rollups as they are generated
+        rollups: Counter[tuple[uuid.UUID, datetime]] = Counter()
+
+        def votes() -> Iterator[tuple[uuid.UUID, uuid.UUID, datetime]]:
+            for topic, count in by_topic:
+                for user_index in sorted(rng.sample(range(len(user_ids)), count)):
+                    voted = moment_after(topic.created_at)
+                    rollups[topic.id, hour_start(voted)] += 1
+                    yield topic.id, user_ids[user_index], voted
+
+        result.votes = _insert_votes(votes(), rng, config.batch_size)
+        event_of = {topic.id: topic.event_id for topic in topics}
+        add_to_rollups(
+            {key: (event_of[key[0]], count) for key, count in rollups.items()}, config.batch_size
+        )
+
+    # Fresh planner statistics, as a long-running database would have
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    result.seconds = time.monotonic() - started
+    return result
@@ -0,0 +1,198 @@
+"""
+Static HTML snapshots of archived events.
+
+archive_event() renders an event's full topic list (every page, most voted
+first) once, as an anonymous visitor sees it, into a content-hashed file in
+EVENT_SNAPSHOT_DIR, precompressed with WhiteNoise's compressor (.gz, and .br
+when brotli is installed). manifest.json maps event slugs to their current
+snapshot file, and event_detail serves the file through WhiteNoise's responder
+(Accept-Encoding negotiation, ETag, 304) for as long as the event is listed
+there: an archived event's page costs no database query and no template work.
+
+Each worker re-reads the manifest whenever it is replaced, so archiving in one
+process (the command, the admin) is picked up by all of them. Snapshots embed
+hashed static asset URLs: re-archive after deploys that change static files.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.conf import settings
+from django.template.loader import render_to_string
+from django.utils import timezone
+from whitenoise.base import WhiteNoise
+from whitenoise.compress import Compressor
+from whitenoise.responders import MissingFileError, StaticFile
+
+from core.utils import write_atomic
+from events.models import Event
+from events.services.topic_service import TopicSort, get_topics_page
+
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class SnapshotResult:
+    """Summary of an archived event snapshot."""
+
+    path: Path
+    topics: int
+    size: int
+
+
+def _snapshot_dir() -> Path:
+    return Path(settings.EVENT_SNAPSHOT_DIR)
+
+
+def _read_manifest() -> dict[str, str]:
+    try:
+        return json.loads((_snapshot_dir() / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def _write_manifest(manifest: dict[str, str]) -> None:
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode()
+    write_atomic(_snapshot_dir() / MANIFEST_NAME, data)
+
+
+def _remove_snapshot_files(filename: str) -> None:
+    for suffix in ("", ".gz", ".br"):
+        (_snapshot_dir() / f"{filename}{suffix}").unlink(missing_ok=True)
+
+
+def render_event_snapshot(event: Event) -> tuple[str, int]:
+    """
+    Render the event page with every topic, without a request (so without a
+    user, CSRF token or listing controls).
+
+    Returns:
+        The HTML and the number of topics in it
+    """
+    topics = []
+    cursor = None
+    while True:
+        page = get_topics_page(event.slug, TopicSort.TOP, cursor=cursor, limit=500)
+        topics.extend(page.topics)
+        if (cursor := page.next_cursor) is None:
+            break
+
+    html = render_to_string(
+        "events/event_detail.html",
+        {"event": event, "topics": topics, "snapshot": True},
+    )
+    return html, len(topics)
+
+
+def archive_event(event_slug: str) -> SnapshotResult:
+    """
+    Archive a closed event: write a static snapshot of its page and serve it from now on.
+
+    Only closed events can be archived: the snapshot has no voting controls and
+    would hide later votes and topics. Re-archiving an archived event replaces
+    its snapshot; reopening its voting unarchives it (see event_service).
+
+    Args:
+        event_slug: The slug of the event
+
+    Returns:
+        SnapshotResult with the snapshot file
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+        ValueError: If the event's voting is open
+    """
+    event = Event.objects.get(slug=event_slug)
+    if not event.is_closed:
+        raise ValueError("Only closed events can be archived")
+    html, topic_count = render_event_snapshot(event)
+    data = html.encode()
+    filename = f"{event.slug}.{hashlib.sha256(data).hexdigest()[:12]}.html"
+
+    directory = _snapshot_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / filename
+    write_atomic(path, data)
+    Compressor(quiet=True).compress(str(path))
+
+    manifest = _read_manifest()
+    previous = manifest.get(event.slug)
+    manifest[event.slug] = filename
+    _write_manifest(manifest)
+    if previous and previous != filename:
+        _remove_snapshot_files(previous)
+
+    Event.objects.filter(pk=event.pk).update(archived_at=timezone.now())
+    return SnapshotResult(path=path, topics=topic_count, size=len(data))
+
+
+def unarchive_event(event_slug: str) -> bool:
+    """
+    Stop serving an event's snapshot and delete it; its page is rendered live again.
+
+    Returns:
+        True if the event had a snapshot
+    """
+    manifest = _read_manifest()
+    filename = manifest.pop(event_slug, None)
+    if filename:
+        _write_manifest(manifest)
+        _remove_snapshot_files(filename)
+    Event.objects.filter(slug=event_slug).update(archived_at=None)
+    return filename is not None
+
+
+class _SnapshotFiles:
+    """This worker's view of the manifest, as WhiteNoise StaticFiles by event slug."""
+
+    def __init__(self) -> None:
+        self.responder = WhiteNoise(
+            None,
+            max_age=settings.EVENT_SNAPSHOT_MAX_AGE,
+            allow_all_origins=False,
+            add_headers_function=self._add_etag,
+        )
+        # The manifest is replaced by a rename, so a new inode means a new manifest
+        self.key: tuple[Path, int, int] | None = None
+        self.files: dict[str, StaticFile] = {}
+
+    @staticmethod
+    def _add_etag(headers: object, path: str, _url: str) -> None:
+        # The content hash in the name is a stronger validator than mtime and size
+        headers["ETag"] = f'"{Path(path).name.rsplit(".", 2)[1]}"'
+
+    def get(self, event_slug: str) -> StaticFile | None:
+        directory = _snapshot_dir()
+        try:
+            stat = (directory / MANIFEST_NAME).stat()
+        except FileNotFoundError:
+            return None
+        key = (directory, stat.st_ino, stat.st_mtime_ns)
+        if key != self.key:
+            files = {}
+            for slug, filename in _read_manifest().items():
+                path = str(directory / filename)
+                try:
+                    files[slug] = self.responder.get_static_file(path, f"/{filename}")
+                except MissingFileError:
+                    continue  # Replaced or unarchived since the manifest was read
+            self.files, self.key = files, key
+        return self.files.get(event_slug)
+
+
+_snapshot_files: _SnapshotFiles | None = None
+
+
+def get_event_snapshot(event_slug: str) -> StaticFile | None:
+    """
+    The snapshot to serve for an event, without touching the database.
+
+    Returns:
+        A WhiteNoise StaticFile, or None if the event isn't archived
+    """
+    global _snapshot_files
+    if _snapshot_files is None:
+        _snapshot_files = _SnapshotFiles()
+    return _snapshot_files.get(event_slug)
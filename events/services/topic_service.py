@@ -1,11 +1,36 @@
-from typing import TYPE_CHECKING
-
-from django.core.exceptions import FieldError
-from django.db.models import Count, Exists, OuterRef
+import base64
+import json
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Window,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.utils.text import slugify
 
-from events.dto.topic_dto import TopicDTO
-from events.models import Event, Topic, Vote
+from accounts.services.avatar_service import avatar_url, get_social_avatar_source
+from core import metrics
+from events.dto.presenter_dto import PresenterDTO
+from events.dto.topic_dto import TopicDTO, TopicPageDTO
+from events.models import Event, PresenterSuggestion, Topic, Vote
+from events.services.event_version_service import bump_event_version
+from events.services.topic_similarity_service import index_topic_titles, unindex_topic
 
 if TYPE_CHECKING:
     from accounts.models import User
@@ -13,7 +38,7 @@ if TYPE_CHECKING:
 
 def get_user_avatar_url(user: "User | None") -> str | None:
     """
-    Get user's avatar URL from social account if available.
+    Get the local thumbnail URL of the user's social account avatar, if available.
 
     Returns None if no social account or avatar is available.
 
@@ -22,13 +47,10 @@ def get_user_avatar_url(user: "User | None") -> str | None:
     if not user or not hasattr(user, "socialaccount_set"):
         return None
 
-    try:
-        # Use all() to access prefetched data, then get first
-        social_accounts = user.socialaccount_set.all()
-        if social_accounts:
-            return social_accounts[0].get_avatar_url()
-    except Exception:
-        pass
+    # Use all() to access prefetched data, then get first
+    social_accounts = user.socialaccount_set.all()
+    if social_accounts and (source := get_social_avatar_source(social_accounts[0])):
+        return avatar_url(user.pk, source)
 
     return None
 
@@ -46,78 +68,329 @@ def get_user_display_name(user: "User | None") -> str:
     return user.username or ""
 
 
-def get_topics_for_event(
-    event_slug: str, offset: int = 0, limit: int = 20, user: "User | None" = None
-) -> list[TopicDTO]:
-    event = Event.objects.get(slug=event_slug)
+def recent_vote_count_subquery(since: datetime) -> Coalesce:
+    """
+    Build a correlated count of votes cast since `since`, for annotating Topic querysets.
+
+    Counted from the (topic, created_at) vote index alone, so the cost is the
+    number of recent votes rather than all of a topic's votes.
+    """
+    votes = (
+        Vote.objects.filter(topic=OuterRef("pk"), created_at__gte=since)
+        .order_by()
+        .values("topic")
+        .annotate(count=Count("topic"))
+        .values("count")
+    )
+    return Coalesce(Subquery(votes, output_field=IntegerField()), 0)
 
-    # Check if user has voted on each topic
-    # Only create subquery if user is authenticated (not AnonymousUser)
-    has_voted_subquery = None
-    if user is not None and user.is_authenticated:
-        # Filter votes by the specific user - this ensures we only check votes from this user
-        has_voted_subquery = Exists(Vote.objects.filter(topic=OuterRef("pk"), user=user))
 
+# How many presenter suggestions each topic card shows before "see all"
+PRESENTER_PREVIEW_SIZE = 3
+
+
+def presenter_suggestions_prefetch(size: int = PRESENTER_PREVIEW_SIZE) -> Prefetch:
+    """
+    Prefetch only the first `size` live presenter suggestions of each topic.
+
+    Slicing a Prefetch queryset makes Django filter on ROW_NUMBER() OVER
+    (PARTITION BY topic), so one query returns at most `size` rows per topic
+    instead of every suggestion of every listed topic. The per-topic total is
+    computed by a COUNT window over the same partition, before the slice is
+    applied, and attached to each row as `topic_suggestion_count`.
+
+    Results land in `topic.presenter_suggestions_preview`; read them with
+    presenter_preview().
+    """
+    suggestions = (
+        PresenterSuggestion.objects.select_related("suggested_by")
+        .annotate(topic_suggestion_count=Window(Count("id"), partition_by=F("topic_id")))
+        .order_by("created_at", "id")
+    )
+    return Prefetch(
+        "presenter_suggestions",
+        queryset=suggestions[:size],
+        to_attr="presenter_suggestions_preview",
+    )
+
+
+def to_presenter_dto(suggestion: PresenterSuggestion, topic_slug: str) -> PresenterDTO:
+    return PresenterDTO(
+        id=suggestion.id,
+        topic_slug=topic_slug,
+        presenter_contact=suggestion.presenter_contact,
+        suggested_by_username=suggestion.suggested_by.username,
+        suggested_by_display_name=get_user_display_name(suggestion.suggested_by),
+        created_at=suggestion.created_at,
+    )
+
+
+def presenter_preview(topic: Topic) -> tuple[int, list[PresenterDTO]]:
+    """
+    Read the (total count, preview DTOs) left on a topic by presenter_suggestions_prefetch.
+    """
+    preview = getattr(topic, "presenter_suggestions_preview", [])
+    count = preview[0].topic_suggestion_count if preview else 0
+    return count, [to_presenter_dto(suggestion, topic.slug) for suggestion in preview]
+
+
+class TopicSort(StrEnum):
+    """Listing modes of an event's topics."""
+
+    TOP = "top"
+    NEWEST = "newest"
+    OLDEST = "oldest"
+    MINE = "mine"
+    UNVOTED = "unvoted"
+    TRENDING = "trending"
+    # Final ranking: the only mode of closed events (see event_service)
+    RANKING = "ranking"
+
+
+# Modes that filter by the signed-in user
+PERSONAL_SORTS = frozenset({TopicSort.MINE, TopicSort.UNVOTED})
+
+TOPICS_PAGE_SIZE = 20
+
+# Votes cast within this window make a topic trending
+TRENDING_WINDOW = timedelta(days=7)
+
+# Sort key of each mode as (field or annotation, descending). Each ends with a
+# unique column, so a cursor is an exact position, and matches one of Topic's
+# partial indexes column for column, so pages are read in index order (trending
+# is the exception: its score is computed per query and sorted in memory).
+SORT_KEYS: dict[TopicSort, tuple[tuple[str, bool], ...]] = {
+    TopicSort.TOP: (("vote_count", True), ("created_at", False), ("id", False)),
+    TopicSort.NEWEST: (("created_at", True), ("id", True)),
+    TopicSort.OLDEST: (("created_at", False), ("id", False)),
+    TopicSort.MINE: (("created_at", True), ("id", True)),
+    TopicSort.UNVOTED: (("vote_count", True), ("created_at", False), ("id", False)),
+    TopicSort.TRENDING: (("recent_vote_count", True), ("created_at", False), ("id", False)),
+    TopicSort.RANKING: (("final_rank", False), ("id", False)),
+}
+
+# How each sort key column is stored in a cursor: (encode, decode)
+_CURSOR_VALUES: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "vote_count": (int, int),
+    "recent_vote_count": (int, int),
+    "final_rank": (int, int),
+    "created_at": (datetime.isoformat, datetime.fromisoformat),
+    "id": (lambda value: value.hex, lambda value: UUID(hex=value)),
+}
+
+
+def trending_since() -> datetime:
+    """Start of the trending window, on an hour boundary so it's stable within the hour."""
+    return timezone.now().replace(minute=0, second=0, microsecond=0) - TRENDING_WINDOW
+
+
+def encode_topic_cursor(topic: Topic, sort: TopicSort, since: datetime | None = None) -> str:
+    """Encode a topic's position in `sort` order (and the trending window) as an opaque token."""
+    raw = {
+        "sort": sort.value,
+        "after": [_CURSOR_VALUES[name][0](getattr(topic, name)) for name, _ in SORT_KEYS[sort]],
+        "since": since.isoformat() if since else None,
+    }
+    return base64.urlsafe_b64encode(json.dumps(raw).encode()).decode()
+
+
+def decode_topic_cursor(cursor: str, sort: TopicSort) -> tuple[list[Any], datetime | None]:
+    """
+    Decode a cursor produced by encode_topic_cursor for the same sort.
+
+    Returns:
+        The sort key values to continue after, and the trending window start
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort
+    """
     try:
-        topics_query = (
-            Topic.objects.filter(event=event)
-            .select_related("event", "creator")
-            .prefetch_related("creator__socialaccount_set")
-            .annotate(vote_count=Count("votes"))
-        )
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        keys = SORT_KEYS[sort]
+        if raw["sort"] != sort.value or len(raw["after"]) != len(keys):
+            raise ValueError("Cursor belongs to another sort")
+        after = [
+            _CURSOR_VALUES[name][1](value)
+            for (name, _), value in zip(keys, raw["after"], strict=True)
+        ]
+        since = datetime.fromisoformat(raw["since"]) if raw["since"] else None
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return after, since
+
+
+def _after(keys: tuple[tuple[str, bool], ...], values: list[Any]) -> Q:
+    """
+    Rows strictly after `values` in `keys` order (a keyset condition).
 
-        if has_voted_subquery:
-            topics_query = topics_query.annotate(has_voted=has_voted_subquery)
+    The leading column also gets an inclusive bound (e.g. vote_count <= 12), which
+    SQLite can use to start the index range at the cursor instead of filtering
+    from the first row.
+    """
+    condition = Q()
+    for (name, descending), value in reversed(list(zip(keys, values, strict=True))):
+        beyond = Q(**{f"{name}__{'lt' if descending else 'gt'}": value})
+        condition = beyond | (Q(**{name: value}) & condition) if condition else beyond
+    (first, descending), first_value = keys[0], values[0]
+    return Q(**{f"{first}__{'lte' if descending else 'gte'}": first_value}) & condition
 
-        topics = topics_query.order_by("-vote_count", "created_at")[offset : offset + limit]
-    except FieldError:
-        topics_query = (
-            Topic.objects.filter(event=event)
-            .select_related("event", "creator")
-            .prefetch_related("creator__socialaccount_set")
-        )
 
-        if has_voted_subquery:
-            topics_query = topics_query.annotate(has_voted=has_voted_subquery)
-
-        topics = topics_query.order_by("created_at")[offset : offset + limit]
-        for topic in topics:
-            topic.vote_count = 0
-
-    # Ensure we always return a list, even if topics is empty or None
-    if not topics:
-        return []
-
-    result = []
-    for topic in topics:
-        # Determine has_voted status
-        # Exists annotation returns a boolean directly from the database
-        if has_voted_subquery is not None and hasattr(topic, "has_voted"):
-            # has_voted was annotated - Exists returns True/False directly
-            # The Exists subquery checks: "Does a Vote exist for this topic AND this user?"
-            # So topic.has_voted is True only if THIS user voted on THIS topic
-            has_voted_bool = bool(topic.has_voted)
-        else:
-            # has_voted was not annotated (user not authenticated or not logged in)
-            has_voted_bool = False
-
-        result.append(
-            TopicDTO(
-                id=topic.id,
-                slug=topic.slug,
-                title=topic.title,
-                description=topic.description,
-                vote_count=getattr(topic, "vote_count", 0),
-                has_voted=has_voted_bool,
-                creator_username=topic.creator.username,
-                creator_display_name=get_user_display_name(topic.creator),
-                creator_avatar_url=get_user_avatar_url(topic.creator),
-                event_slug=topic.event.slug,
-                event_name=topic.event.name,
-                created_at=topic.created_at,
-            )
+def _listing_sort(event: Event, sort: TopicSort) -> TopicSort:
+    """
+    The mode an event is actually listed in: closed events only have their
+    final ranking, and open events don't have one yet.
+    """
+    if event.is_closed:
+        return TopicSort.RANKING
+    if sort == TopicSort.RANKING:
+        raise ValueError("Only closed events have a final ranking")
+    return sort
+
+
+def _topics_queryset(
+    event: Event, sort: TopicSort, user: "User | None", since: datetime | None
+) -> QuerySet[Topic]:
+    """An event's live topics for a listing mode, with everything the DTOs need."""
+    # No select_related("event"): the join made SQLite scan events_event as the
+    # outer loop and re-read this event's topics once per event row
+    topics = (
+        Topic.objects.filter(event=event)
+        .select_related("creator")
+        .prefetch_related("creator__socialaccount_set", presenter_suggestions_prefetch())
+    )
+    authenticated = user is not None and user.is_authenticated
+    # Closed events take no votes, so nobody's vote status is shown
+    if authenticated and sort != TopicSort.RANKING:
+        # Exists is answered from the unique (topic, user) vote index
+        topics = topics.annotate(
+            has_voted=Exists(Vote.objects.filter(topic=OuterRef("pk"), user=user))
         )
-    return result
+    elif sort in PERSONAL_SORTS:
+        raise ValueError(f"Sort {sort.value!r} needs a signed-in user")
+
+    if sort == TopicSort.MINE:
+        topics = topics.filter(creator=user)
+    elif sort == TopicSort.UNVOTED:
+        topics = topics.filter(has_voted=False)
+    elif sort == TopicSort.TRENDING:
+        topics = topics.annotate(recent_vote_count=recent_vote_count_subquery(since))
+
+    return topics.order_by(
+        *(f"-{name}" if descending else name for name, descending in SORT_KEYS[sort])
+    )
+
+
+def _to_topic_dto(topic: Topic, event: Event) -> TopicDTO:
+    presenter_count, presenters = presenter_preview(topic)
+    return TopicDTO(
+        id=topic.id,
+        slug=topic.slug,
+        title=topic.title,
+        description=topic.description,
+        vote_count=topic.vote_count,
+        # Exists returns a boolean; not annotated for anonymous users
+        has_voted=bool(getattr(topic, "has_voted", False)),
+        creator_username=topic.creator.username,
+        creator_display_name=get_user_display_name(topic.creator),
+        creator_avatar_url=get_user_avatar_url(topic.creator),
+        event_slug=event.slug,
+        event_name=event.name,
+        created_at=topic.created_at,
+        comment_count=topic.comment_count,
+        presenter_suggestion_count=presenter_count,
+        presenter_suggestions=presenters,
+    )
+
+
+def get_topics_page(
+    event_slug: str,
+    sort: TopicSort | str = TopicSort.TOP,
+    cursor: str | None = None,
+    limit: int = TOPICS_PAGE_SIZE,
+    user: "User | None" = None,
+) -> TopicPageDTO:
+    """
+    Get one page of an event's topics in a listing mode, using keyset pagination.
+
+    Each page reads `limit + 1` rows from the mode's index, starting at the
+    cursor, so deep pages cost the same as the first one and topics don't shift
+    between pages when others are added. Trending cursors pin the trending
+    window of the first page. Closed events are always listed by their final
+    ranking, whatever `sort` is asked for.
+
+    Args:
+        event_slug: The slug of the event
+        sort: Listing mode (a TopicSort value)
+        cursor: Token from a previous page's next_cursor, or None for the first page
+        limit: Page size
+        user: The current user (required by the "mine" and "unvoted" modes)
+
+    Returns:
+        TopicPageDTO with the topics and the next page cursor
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+        ValueError: If the sort is unknown or needs a user, or the cursor is malformed
+    """
+    event = Event.objects.get(slug=event_slug)
+    sort = _listing_sort(event, TopicSort(sort))
+    after, since = decode_topic_cursor(cursor, sort) if cursor else (None, None)
+    if sort == TopicSort.TRENDING and since is None:
+        since = trending_since()
+
+    topics = _topics_queryset(event, sort, user, since)
+    if after:
+        topics = topics.filter(_after(SORT_KEYS[sort], after))
+
+    rows = list(topics[: limit + 1])
+    page = rows[:limit]
+    return TopicPageDTO(
+        topics=[_to_topic_dto(topic, event) for topic in page],
+        next_cursor=encode_topic_cursor(page[-1], sort, since) if len(rows) > limit else None,
+        sort=sort.value,
+    )
+
+
+def get_topics_for_event(
+    event_slug: str,
+    offset: int = 0,
+    limit: int = TOPICS_PAGE_SIZE,
+    user: "User | None" = None,
+    sort: TopicSort | str = TopicSort.TOP,
+) -> list[TopicDTO]:
+    """
+    Get an event's topics in a listing mode, by offset.
+
+    Same ordering as get_topics_page; prefer that for paging, since an offset
+    makes SQLite step over every skipped row.
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+        ValueError: If the sort is unknown or needs a user
+    """
+    event = Event.objects.get(slug=event_slug)
+    sort = _listing_sort(event, TopicSort(sort))
+    since = trending_since() if sort == TopicSort.TRENDING else None
+    topics = _topics_queryset(event, sort, user, since)[offset : offset + limit]
+    return [_to_topic_dto(topic, event) for topic in topics]
+
+
+def get_topics_by_slug(
+    event_slug: str, topic_slugs: list[str], user: "User | None" = None
+) -> list[TopicDTO]:
+    """
+    Get some of an event's live topics, e.g. the ones a client was told changed.
+
+    Slugs of deleted topics or of other events' topics are left out.
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+    """
+    event = Event.objects.get(slug=event_slug)
+    sort = _listing_sort(event, TopicSort.TOP)
+    # Read by the unique slug index; unordered, since the cards are swapped in place
+    topics = _topics_queryset(event, sort, user, None).filter(slug__in=topic_slugs).order_by()
+    return [_to_topic_dto(topic, event) for topic in topics]
 
 
 def create_topic(
@@ -151,13 +424,17 @@ def create_topic(
         slug = f"{base_slug}-{counter}"
         counter += 1
 
-    topic = Topic.objects.create(
-        event=event,
-        creator=user,
-        title=title,
-        description=description or None,
-        slug=slug,
-    )
+    with transaction.atomic():
+        topic = Topic.objects.create(
+            event=event,
+            creator=user,
+            title=title,
+            description=description or None,
+            slug=slug,
+        )
+        index_topic_titles([topic])
+        bump_event_version(event.id, topic.id)
+    metrics.inc("floripatalks_topics_created_total")
 
     # Convert to DTO
     return TopicDTO(
@@ -173,6 +450,7 @@ def create_topic(
         event_slug=topic.event.slug,
         event_name=topic.event.name,
         created_at=topic.created_at,
+        comment_count=topic.comment_count,
     )
 
 
@@ -198,11 +476,15 @@ def update_topic(
     topic = Topic.objects.get(slug=topic_slug)
     topic.title = title
     topic.description = description or None
-    topic.save()
+    with transaction.atomic():
+        topic.save()
+        index_topic_titles([topic])
+        bump_event_version(topic.event_id, topic.id)
 
-    # Refresh to get updated vote count
+    # Refresh to get the current vote count
     topic.refresh_from_db()
-    vote_count = Vote.objects.filter(topic=topic).count()
+    prefetch_related_objects([topic], presenter_suggestions_prefetch())
+    presenter_count, presenters = presenter_preview(topic)
 
     # Convert to DTO
     return TopicDTO(
@@ -210,7 +492,7 @@ def update_topic(
         slug=topic.slug,
         title=topic.title,
         description=topic.description,
-        vote_count=vote_count,
+        vote_count=topic.vote_count,
         has_voted=False,  # Will be set by caller if user context available
         creator_username=topic.creator.username,
         creator_display_name=get_user_display_name(topic.creator),
@@ -218,12 +500,15 @@ def update_topic(
         event_slug=topic.event.slug,
         event_name=topic.event.name,
         created_at=topic.created_at,
+        comment_count=topic.comment_count,
+        presenter_suggestion_count=presenter_count,
+        presenter_suggestions=presenters,
     )
 
 
 def soft_delete_topic(topic_slug: str) -> None:
     """
-    Soft delete a topic (sets is_deleted=True).
+    Soft delete a topic (sets is_deleted and deleted_at, which archive_service ages it by).
 
     Args:
         topic_slug: Slug of the topic to delete
@@ -232,5 +517,7 @@ def soft_delete_topic(topic_slug: str) -> None:
         Topic.DoesNotExist: If topic with given slug doesn't exist
     """
     topic = Topic.objects.get(slug=topic_slug)
-    topic.is_deleted = True
-    topic.save()
+    with transaction.atomic():
+        topic.soft_delete()
+        unindex_topic(topic.id)
+        bump_event_version(topic.event_id, topic.id)
@@ -0,0 +1,123 @@
+"""
+Similar topic titles, to catch a talk suggested twice under different words.
+
+Titles are normalized (case, accents and punctuation dropped) and split into
+trigrams the way PostgreSQL's pg_trgm does: each word padded with two spaces
+in front and one behind, so "Django" gives "  d", " dj", "dja", ..., "go ".
+index_topic_titles() keeps each live topic's trigrams in TopicTitleTrigram,
+per event. find_similar_topics() looks a title's trigrams up in the
+(event, trigram, topic) index and counts the shared ones per topic in SQL;
+only the best candidates are read back and ranked by the Jaccard similarity
+(shared / all distinct trigrams) of the two titles.
+"""
+
+import math
+import unicodedata
+from collections.abc import Iterable
+from uuid import UUID
+
+from django.db.models import Count, Subquery
+
+from events.dto.topic_dto import SimilarTopicDTO
+from events.models import Event, Topic, TopicTitleTrigram
+
+# pg_trgm's default similarity threshold
+SIMILARITY_THRESHOLD = 0.3
+# Topics sharing the most trigrams that are ranked by similarity
+CANDIDATES = 20
+
+
+def title_trigrams(title: str) -> set[str]:
+    """The distinct trigrams of a title's normalized words."""
+    decomposed = unicodedata.normalize("NFKD", title.lower())
+    text = "".join(
+        char if char.isalnum() else " " for char in decomposed if not unicodedata.combining(char)
+    )
+    trigrams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+def index_topic_titles(topics: Iterable[Topic], batch_size: int = 1_000) -> None:
+    """
+    Replace the title trigrams of `topics` (live ones; deleted ones are only removed).
+
+    Call inside the transaction that saves the topics.
+    """
+    topics = list(topics)
+    for start in range(0, len(topics), batch_size):
+        batch = topics[start : start + batch_size]
+        TopicTitleTrigram.objects.filter(topic__in=[topic.pk for topic in batch]).delete()
+        TopicTitleTrigram.objects.bulk_create(
+            (
+                TopicTitleTrigram(event_id=topic.event_id, topic_id=topic.pk, trigram=trigram)
+                for topic in batch
+                if not topic.is_deleted
+                for trigram in title_trigrams(topic.title)
+            ),
+            batch_size=batch_size,
+        )
+
+
+def unindex_topic(topic_id: UUID) -> None:
+    """Remove a (deleted) topic's title trigrams."""
+    TopicTitleTrigram.objects.filter(topic_id=topic_id).delete()
+
+
+def find_similar_topics(
+    event_slug: str,
+    title: str,
+    limit: int = 5,
+    exclude_slug: str | None = None,
+) -> list[SimilarTopicDTO]:
+    """
+    Find the event's live topics whose titles resemble `title`, most similar first.
+
+    A topic at least SIMILARITY_THRESHOLD similar shares at least that share
+    of the title's trigrams, so topics sharing fewer are dropped in SQL.
+
+    Args:
+        event_slug: Event slug
+        title: Title being typed
+        limit: Maximum number of topics returned
+        exclude_slug: Topic left out (the one being edited)
+
+    Returns:
+        List of SimilarTopicDTO with similarity >= SIMILARITY_THRESHOLD
+    """
+    trigrams = title_trigrams(title)
+    if not trigrams:
+        return []
+
+    event_id = Subquery(Event.objects.filter(slug=event_slug).values("id")[:1])
+    candidates = dict(
+        TopicTitleTrigram.objects.filter(event=event_id, trigram__in=trigrams)
+        .values("topic_id")
+        .annotate(shared=Count("*"))
+        .filter(shared__gte=math.ceil(SIMILARITY_THRESHOLD * len(trigrams)))
+        .order_by("-shared")
+        .values_list("topic_id", "shared")[:CANDIDATES]
+    )
+    if not candidates:
+        return []
+
+    topics = Topic.objects.filter(pk__in=candidates).only("slug", "title", "vote_count")
+    if exclude_slug:
+        topics = topics.exclude(slug=exclude_slug)
+    similar = []
+    for topic in topics.order_by():
+        shared = candidates[topic.pk]
+        similarity = shared / len(trigrams | title_trigrams(topic.title))
+        if similarity >= SIMILARITY_THRESHOLD:
+            similar.append(
+                SimilarTopicDTO(
+                    slug=topic.slug,
+                    title=topic.title,
+                    vote_count=topic.vote_count,
+                    similarity=similarity,
+                )
+            )
+    similar.sort(key=lambda topic: (-topic.similarity, -topic.vote_count))
+    return similar[:limit]
@@ -0,0 +1,301 @@
+"""
+Vote analytics: the append-only vote log and its hourly rollups.
+
+vote_service records every vote cast or removed with record_vote(), inside the
+vote's transaction: one VoteLogEntry row, and the roll_up_vote_log task
+(events.tasks) enqueued to count it. The task runs roll_up_vote_log(), which
+adds every pending entry to its topic's VoteHourlyRollup row for the hour, off
+the vote's request and one increment per topic and hour rather than per vote.
+Trend queries (get_event_vote_trend) only read the rollups, never the hot
+events_vote table, and compact_vote_log() trims log entries whose counts the
+rollups already hold.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+import uuid6
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F, Field, Sum
+from django.utils import timezone
+
+from events.dto.vote_trend_dto import EventVoteTrendDTO, TopicVoteTrendDTO, VoteTrendPointDTO
+from events.models import ArchivedTopic, Event, Topic, VoteHourlyRollup, VoteLogEntry
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+
+@dataclass
+class CompactionResult:
+    """Summary of a vote log compaction run."""
+
+    entries: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+def hour_start(moment: datetime) -> datetime:
+    """The start of the (UTC) hour `moment` falls in: the rollup bucket it counts in."""
+    return moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def _add_to_rollup(event_id: UUID, topic_id: UUID, hour: datetime, cast: int, removed: int) -> None:
+    """Add to a topic's rollup row for `hour`, creating it on the hour's first vote."""
+    bucket = VoteHourlyRollup.objects.filter(topic_id=topic_id, hour=hour)
+    increments = {
+        "votes_cast": F("votes_cast") + cast,
+        "votes_removed": F("votes_removed") + removed,
+    }
+    if bucket.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            VoteHourlyRollup.objects.create(
+                event_id=event_id,
+                topic_id=topic_id,
+                hour=hour,
+                votes_cast=cast,
+                votes_removed=removed,
+            )
+    except IntegrityError:
+        # A concurrent vote created the row between the update and the insert
+        bucket.update(**increments)
+
+
+def record_vote(topic: Topic, user: "User", delta: int) -> None:
+    """
+    Log a vote cast (delta=VoteLogEntry.CAST) or removed (REMOVED).
+
+    Call inside the transaction that creates or deletes the Vote, so the log
+    never disagrees with events_vote, and enqueue the roll_up_vote_log task.
+    """
+    VoteLogEntry.objects.create(event_id=topic.event_id, topic_id=topic.pk, user=user, delta=delta)
+
+
+def roll_up_vote_log(batch_size: int = 1_000) -> int:
+    """
+    Count the log entries not rolled up yet into the hourly rollups.
+
+    Each batch is counted and marked in one transaction. Entries are marked
+    first, and a batch another worker marked meanwhile is rolled back and
+    read again, so no entry is ever counted twice.
+
+    Args:
+        batch_size: Maximum number of entries counted per transaction
+
+    Returns:
+        Number of entries counted
+    """
+    pending = VoteLogEntry.objects.filter(rolled_up=False).order_by("created_at")
+    counted = 0
+    while True:
+        with transaction.atomic():
+            entries = list(
+                pending.values_list("pk", "event_id", "topic_id", "created_at", "delta")[
+                    :batch_size
+                ]
+            )
+            if not entries:
+                return counted
+            ids = [entry[0] for entry in entries]
+            if VoteLogEntry.objects.filter(pk__in=ids, rolled_up=False).update(
+                rolled_up=True
+            ) != len(ids):
+                transaction.set_rollback(True)
+                continue
+
+            # {(topic id, hour): [event id, cast, removed]}
+            buckets: dict[tuple[UUID, datetime], list] = {}
+            for _pk, event_id, topic_id, created_at, delta in entries:
+                bucket = buckets.setdefault((topic_id, hour_start(created_at)), [event_id, 0, 0])
+                bucket[1 if delta == VoteLogEntry.CAST else 2] += 1
+            for (topic_id, hour), (event_id, cast, removed) in buckets.items():
+                _add_to_rollup(event_id, topic_id, hour, cast=cast, removed=removed)
+        counted += len(entries)
+
+
+def add_to_rollups(
+    counts: dict[tuple[UUID, datetime], tuple[UUID, int]], batch_size: int = 10_000
+) -> None:
+    """
+    Count votes that skipped vote_service (e.g. bulk-loaded ones) into the rollups.
+
+    Counts are merged into existing rows in memory, so don't run it while the
+    same topics are being voted on.
+
+    Args:
+        counts: {(topic id, hour from hour_start()): (event id, votes cast)}
+        batch_size: Rows written per statement
+    """
+    counts = dict(counts)
+    topic_ids = list({topic_id for topic_id, _hour in counts})
+    existing = []
+    for i in range(0, len(topic_ids), 500):
+        for rollup in VoteHourlyRollup.objects.filter(topic_id__in=topic_ids[i : i + 500]):
+            if (key := (rollup.topic_id, rollup.hour)) in counts:
+                rollup.votes_cast += counts.pop(key)[1]
+                existing.append(rollup)
+    VoteHourlyRollup.objects.bulk_update(existing, ["votes_cast"], batch_size=batch_size)
+    _insert_rollups(counts, batch_size)
+
+
+def _insert_rollups(counts: dict[tuple[UUID, datetime], tuple[UUID, int]], batch_size: int) -> None:
+    """
+    Insert new rollup rows from {(topic id, hour): (event id, votes cast)} with executemany.
+
+    Votes spread over a long period create a row for most of them, and
+    bulk_create's per-object preparation would dominate the run (as for seeded
+    votes, see seed_service). Values are still converted by the model fields,
+    once per distinct topic, event and hour.
+    """
+    meta = VoteHourlyRollup._meta
+    names = ("id", "created_at", "updated_at", "event", "topic", "hour", "votes_cast")
+    fields = [meta.get_field(name) for name in names]
+    quote = connection.ops.quote_name
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} "
+        f"({', '.join(quote(f.column) for f in fields)}, {quote('votes_removed')}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}, 0)"
+    )
+    pk, created_at, _updated_at, event, topic, hour_field, _votes_cast = fields
+    now = created_at.get_db_prep_save(timezone.now(), connection)
+    prepared: dict[tuple[str, object], object] = {}
+
+    def prep(field: Field, value: object) -> object:
+        if (field.name, value) not in prepared:
+            prepared[field.name, value] = field.get_db_prep_save(value, connection)
+        return prepared[field.name, value]
+
+    rows = [
+        (
+            pk.get_db_prep_save(uuid6.uuid6(), connection),
+            now,
+            now,
+            prep(event, event_id),
+            prep(topic, topic_id),
+            prep(hour_field, hour),
+            count,
+        )
+        for (topic_id, hour), (event_id, count) in counts.items()
+    ]
+    with connection.cursor() as cursor:
+        for i in range(0, len(rows), batch_size):
+            cursor.executemany(sql, rows[i : i + batch_size])
+
+
+def compact_vote_log(
+    retention: timedelta, batch_size: int = 5_000, dry_run: bool = False
+) -> CompactionResult:
+    """
+    Delete vote log entries older than `retention`; their counts stay in the rollups.
+
+    The cutoff is rounded down to the hour, and each batch is deleted in its own
+    transaction, so writers are only blocked for the duration of one batch.
+
+    Args:
+        retention: How long log entries are kept
+        batch_size: Maximum number of entries deleted per transaction
+        dry_run: Only count the entries, don't delete anything
+
+    Returns:
+        CompactionResult with entries removed and time spent
+    """
+    started = time.monotonic()
+    result = CompactionResult()
+    # Entries not rolled up yet are kept until they are, however old
+    expired = VoteLogEntry.objects.filter(
+        created_at__lt=hour_start(timezone.now() - retention), rolled_up=True
+    )
+
+    if dry_run:
+        result.entries = expired.count()
+        result.seconds = time.monotonic() - started
+        return result
+
+    while True:
+        with transaction.atomic():
+            ids = list(expired.order_by("created_at").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            VoteLogEntry.objects.filter(pk__in=ids).delete()
+        result.entries += len(ids)
+        result.batches += 1
+
+    result.seconds = time.monotonic() - started
+    return result
+
+
+def _topic_titles(topic_ids: list[UUID]) -> dict[UUID, str]:
+    """Titles of live, soft-deleted and archived topics (archived ones keep their id)."""
+    titles = dict(ArchivedTopic.objects.filter(pk__in=topic_ids).values_list("pk", "title"))
+    titles.update(Topic.all_objects.filter(pk__in=topic_ids).values_list("pk", "title"))
+    return titles
+
+
+def get_event_vote_trend(
+    event_slug: str, since: datetime, until: datetime | None = None, top: int = 10
+) -> EventVoteTrendDTO:
+    """
+    Get an event's hourly vote series and its most voted topics over a period,
+    from the rollups only.
+
+    Args:
+        event_slug: The slug of the event
+        since: Start of the period (rounded down to the hour)
+        until: End of the period, exclusive (default: now)
+        top: How many topics to list, by net votes in the period
+
+    Returns:
+        EventVoteTrendDTO with one point per hour of the period
+
+    Raises:
+        Event.DoesNotExist: If event with given slug doesn't exist
+    """
+    event = Event.objects.get(slug=event_slug)
+    since = hour_start(since)
+    until = until or timezone.now()
+    rollups = VoteHourlyRollup.objects.filter(event=event, hour__gte=since, hour__lt=until)
+
+    by_hour = {
+        row["hour"]: row
+        for row in rollups.order_by("hour")
+        .values("hour")
+        .annotate(cast=Sum("votes_cast"), removed=Sum("votes_removed"))
+    }
+    points = []
+    hour = since
+    while hour < until:
+        row = by_hour.get(hour, {"cast": 0, "removed": 0})
+        points.append(VoteTrendPointDTO(hour, row["cast"], row["removed"]))
+        hour += timedelta(hours=1)
+
+    totals = list(
+        rollups.order_by()
+        .values("topic_id")
+        .annotate(cast=Sum("votes_cast"), removed=Sum("votes_removed"))
+        .annotate(net=F("cast") - F("removed"))
+        .order_by("-net", "-cast", "topic_id")[:top]
+    )
+    titles = _topic_titles([row["topic_id"] for row in totals])
+    top_topics = [
+        TopicVoteTrendDTO(
+            topic_id=row["topic_id"],
+            title=titles.get(row["topic_id"], str(row["topic_id"])),
+            votes_cast=row["cast"],
+            votes_removed=row["removed"],
+        )
+        for row in totals
+    ]
+
+    return EventVoteTrendDTO(
+        event_slug=event.slug,
+        event_name=event.name,
+        since=since,
+        until=until,
+        points=points,
+        top_topics=top_topics,
+    )
@@ -4,9 +4,14 @@ Vote service functions for handling vote operations.
 
 from typing import TYPE_CHECKING
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import F
 
-from events.models import Topic, Vote
+from core import metrics
+from events.models import Topic, Vote, VoteLogEntry
+from events.services.event_version_service import bump_event_version
+from events.services.vote_analytics_service import record_vote
+from events.tasks import roll_up_vote_log
 
 if TYPE_CHECKING:
     from accounts.models import User
@@ -14,7 +19,8 @@ if TYPE_CHECKING:
 
 def vote_topic(topic_slug: str, user: "User") -> bool:
     """
-    Create a vote for a topic by a user.
+    Create a vote for a topic by a user, increment the topic's vote_count and
+    log it (see vote_analytics_service).
 
     Args:
         topic_slug: The slug of the topic to vote on
@@ -32,7 +38,13 @@ def vote_topic(topic_slug: str, user: "User") -> bool:
         return False  # Already voted, no action needed
 
     try:
-        Vote.objects.create(topic=topic, user=user)
+        with transaction.atomic():
+            Vote.objects.create(topic=topic, user=user)
+            Topic.all_objects.filter(pk=topic.pk).update(vote_count=F("vote_count") + 1)
+            record_vote(topic, user, VoteLogEntry.CAST)
+            roll_up_vote_log.enqueue()
+            bump_event_version(topic.event_id, topic.id)
+        metrics.inc("floripatalks_votes_created_total")
         return True
     except IntegrityError:
         # Handle race condition where vote was created between check and create
@@ -41,7 +53,8 @@ def vote_topic(topic_slug: str, user: "User") -> bool:
 
 def unvote_topic(topic_slug: str, user: "User") -> bool:
     """
-    Remove a vote for a topic by a user (hard delete).
+    Remove a vote for a topic by a user (hard delete), decrement the topic's
+    vote_count and log the removal (see vote_analytics_service).
 
     Args:
         topic_slug: The slug of the topic to unvote
@@ -56,7 +69,15 @@ def unvote_topic(topic_slug: str, user: "User") -> bool:
     topic = Topic.objects.get(slug=topic_slug)
     try:
         vote = Vote.objects.get(topic=topic, user=user)
-        vote.delete()
+        with transaction.atomic():
+            # A concurrent unvote may have deleted it already: decrement only once
+            deleted, _ = Vote.objects.filter(pk=vote.pk).delete()
+            if not deleted:
+                return False
+            Topic.all_objects.filter(pk=topic.pk).update(vote_count=F("vote_count") - 1)
+            record_vote(topic, user, VoteLogEntry.REMOVED)
+            roll_up_vote_log.enqueue()
+            bump_event_version(topic.event_id, topic.id)
         return True
     except Vote.DoesNotExist:
         return False  # Not voted, no action needed
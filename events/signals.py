@@ -0,0 +1,41 @@
+"""
+Signal receivers of the events app (connected in EventsConfig.ready).
+"""
+
+from uuid import UUID
+
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from accounts.signals import avatar_changed
+from core.backup import database_restored
+from events.services.event_version_service import bump_user_event_versions, retire_event_versions
+
+# User fields get_user_display_name() reads
+DISPLAY_NAME_FIELDS = frozenset({"first_name", "last_name", "username"})
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def refresh_cards_on_rename(
+    instance: object, created: bool, update_fields: frozenset[str] | None, **_kwargs: object
+) -> None:
+    """Refresh the cards showing a user whose display name may have changed."""
+    if created or (update_fields is not None and not update_fields & DISPLAY_NAME_FIELDS):
+        return  # e.g. the last_login update of every login
+    bump_user_event_versions(instance.pk)
+
+
+@receiver(avatar_changed)
+def refresh_cards_on_new_avatar(user_id: UUID, **_kwargs: object) -> None:
+    """
+    Refresh the cards showing a user whose avatar changed: its thumbnail
+    address changes, and the old thumbnail is removed (see avatar_service).
+    """
+    bump_user_event_versions(user_id)
+
+
+@receiver(database_restored)
+def retire_versions_on_restore(**_kwargs: object) -> None:
+    """Keep validators from before a restore from matching the restored pages."""
+    retire_event_versions()
@@ -0,0 +1,13 @@
+"""
+Background tasks of the events app (run by `manage.py run_worker`, see core.task_queue).
+"""
+
+from django.tasks import task
+
+from events.services import vote_analytics_service
+
+
+@task
+def roll_up_vote_log() -> int:
+    """Count pending vote log entries into the hourly rollups."""
+    return vote_analytics_service.roll_up_vote_log()
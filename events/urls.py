@@ -2,15 +2,48 @@
 
 from django.urls import path
 
-from events import views
+from events import api_views, views
 
 app_name = "events"
 
 urlpatterns = [
+    # Read-only JSON API, before "<slug:slug>/..." claims its paths
+    path("api/v1/", api_views.event_list, name="api_event_list"),
+    path("api/v1/<slug:slug>/topics/", api_views.topic_list, name="api_topic_list"),
+    path(
+        "api/v1/<slug:slug>/topics/<slug:topic_slug>/",
+        api_views.topic_detail,
+        name="api_topic_detail",
+    ),
     path("<slug:slug>/", views.event_detail, name="event_detail"),
     path("<slug:slug>/topics/load-more/", views.load_more_topics, name="load_more_topics"),
+    path("<slug:slug>/changes/", views.event_changes, name="event_changes"),
+    path("<slug:slug>/topics/cards/", views.topic_cards, name="topic_cards"),
+    path("<slug:slug>/topics/similar/", views.similar_topics, name="similar_topics"),
     path("topics/create/", views.create_topic_view, name="create_topic"),
     path("topics/<slug:slug>/edit/", views.edit_topic_view, name="edit_topic"),
     path("topics/<slug:slug>/delete/", views.delete_topic_view, name="delete_topic"),
     path("topics/<slug:slug>/vote/", views.vote_topic_view, name="vote_topic"),
+    path("topics/<slug:slug>/comments/", views.topic_comments, name="topic_comments"),
+    path(
+        "topics/<slug:slug>/comments/create/",
+        views.create_comment_view,
+        name="create_comment",
+    ),
+    path(
+        "comments/<uuid:comment_id>/delete/",
+        views.delete_comment_view,
+        name="delete_comment",
+    ),
+    path("topics/<slug:slug>/presenters/", views.topic_presenters, name="topic_presenters"),
+    path(
+        "topics/<slug:slug>/presenters/suggest/",
+        views.suggest_presenter_view,
+        name="suggest_presenter",
+    ),
+    path(
+        "topics/<slug:slug>/presenters/<uuid:suggestion_id>/delete/",
+        views.delete_presenter_suggestion_view,
+        name="delete_presenter_suggestion",
+    ),
 ]
@@ -0,0 +1,36 @@
+"""
+Use case for adding a comment to a topic.
+"""
+
+from typing import TYPE_CHECKING
+
+from events.dto.comment_dto import CommentDTO
+from events.services.comment_service import create_comment as create_comment_service
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+
+def add_comment(user: "User", topic_slug: str, content: str) -> CommentDTO:
+    """
+    Add a comment to a topic.
+
+    Args:
+        user: The user commenting (must be authenticated - validated by view)
+        topic_slug: Slug of the topic to comment on
+        content: Comment text (max 1000 characters, required)
+
+    Returns:
+        CommentDTO with created comment data
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+        ValueError: If content is empty or exceeds max length
+    """
+    if not content or not content.strip():
+        raise ValueError("Comment is required")
+
+    if len(content) > 1000:
+        raise ValueError("Comment must be 1000 characters or less")
+
+    return create_comment_service(topic_slug=topic_slug, user=user, content=content.strip())
@@ -5,6 +5,7 @@ Use case for creating a topic.
 from typing import TYPE_CHECKING
 
 from events.dto.topic_dto import TopicDTO
+from events.services.event_service import EVENT_CLOSED_MESSAGE, is_voting_closed
 from events.services.topic_service import create_topic as create_topic_service
 
 if TYPE_CHECKING:
@@ -32,7 +33,11 @@ def create_topic(
     Raises:
         Event.DoesNotExist: If event with given slug doesn't exist
         ValidationError: If title is empty or exceeds max length
+        PermissionError: If the event has closed its voting
     """
+    if is_voting_closed(event_slug):
+        raise PermissionError(EVENT_CLOSED_MESSAGE)
+
     # Validation
     if not title or not title.strip():
         raise ValueError("Title is required")
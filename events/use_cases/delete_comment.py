@@ -0,0 +1,32 @@
+"""
+Use case for deleting a comment.
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from events.models import Comment
+from events.services.comment_service import soft_delete_comment as soft_delete_comment_service
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+
+def delete_comment(user: "User", comment_id: UUID) -> None:
+    """
+    Delete a comment (soft delete).
+
+    Args:
+        user: The user deleting the comment (must be the author)
+        comment_id: Id of the comment to delete
+
+    Raises:
+        Comment.DoesNotExist: If comment doesn't exist (or is already deleted)
+        PermissionError: If user is not the author of the comment
+    """
+    comment = Comment.objects.get(pk=comment_id)
+
+    if comment.author_id != user.pk:
+        raise PermissionError("User is not the author of this comment")
+
+    soft_delete_comment_service(comment_id=comment_id)
@@ -0,0 +1,32 @@
+"""
+Use case for deleting a presenter suggestion.
+"""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from events.models import PresenterSuggestion
+from events.services.presenter_service import soft_delete_suggestion
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+
+def delete_presenter_suggestion(user: "User", suggestion_id: UUID) -> None:
+    """
+    Delete a presenter suggestion (soft delete).
+
+    Args:
+        user: The user deleting the suggestion (must be who suggested it)
+        suggestion_id: Id of the suggestion to delete
+
+    Raises:
+        PresenterSuggestion.DoesNotExist: If suggestion doesn't exist (or is already deleted)
+        PermissionError: If user did not make the suggestion
+    """
+    suggestion = PresenterSuggestion.objects.get(pk=suggestion_id)
+
+    if suggestion.suggested_by_id != user.pk:
+        raise PermissionError("User did not make this presenter suggestion")
+
+    soft_delete_suggestion(suggestion_id=suggestion_id)
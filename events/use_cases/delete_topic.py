@@ -5,6 +5,7 @@ Use case for deleting a topic.
 from typing import TYPE_CHECKING
 
 from events.models import Topic
+from events.services.event_service import EVENT_CLOSED_MESSAGE
 from events.services.topic_service import soft_delete_topic as soft_delete_topic_service
 
 if TYPE_CHECKING:
@@ -24,12 +25,16 @@ def delete_topic(
 
     Raises:
         Topic.DoesNotExist: If topic with given slug doesn't exist
-        PermissionError: If user is not the creator of the topic
+        PermissionError: If user is not the creator of the topic, or the event
+            has closed its voting
     """
     # Get topic and verify ownership - CRITICAL: Only creator can delete
-    topic = Topic.objects.get(slug=topic_slug)
+    topic = Topic.objects.select_related("event").get(slug=topic_slug)
 
     if topic.creator != user:
         raise PermissionError("User is not the creator of this topic")
 
+    if topic.event.is_closed:
+        raise PermissionError(EVENT_CLOSED_MESSAGE)
+
     soft_delete_topic_service(topic_slug=topic_slug)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from events.dto.topic_dto import TopicDTO
 from events.models import Topic
+from events.services.event_service import EVENT_CLOSED_MESSAGE
 from events.services.topic_service import update_topic as update_topic_service
 
 if TYPE_CHECKING:
@@ -32,16 +33,20 @@ def edit_topic(
 
     Raises:
         Topic.DoesNotExist: If topic with given slug doesn't exist
-        PermissionError: If user is not the creator of the topic
+        PermissionError: If user is not the creator of the topic, or the event
+            has closed its voting
         ValidationError: If title is empty or exceeds max length
     """
     # Get topic and verify ownership
-    topic = Topic.objects.get(slug=topic_slug)
+    topic = Topic.objects.select_related("event").get(slug=topic_slug)
 
     # CRITICAL: Only creator can edit
     if topic.creator != user:
         raise PermissionError("User is not the creator of this topic")
 
+    if topic.event.is_closed:
+        raise PermissionError(EVENT_CLOSED_MESSAGE)
+
     # Validation
     if not title or not title.strip():
         raise ValueError("Title is required")
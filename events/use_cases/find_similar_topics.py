@@ -0,0 +1,10 @@
+"""
+Use case for finding topics similar to a title being typed.
+"""
+
+from events.dto.topic_dto import SimilarTopicDTO
+from events.services.topic_similarity_service import find_similar_topics as find_similar
+
+
+def find_similar_topics(event_slug: str, title: str) -> list[SimilarTopicDTO]:
+    return find_similar(event_slug, title)
@@ -2,9 +2,11 @@
 Use case for retrieving event topics.
 """
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
-from events.dto.topic_dto import TopicDTO
+from events.dto.topic_dto import TopicDTO, TopicPageDTO
+from events.services.topic_service import TopicSort, get_topics_by_slug, get_topics_page
 from events.services.topic_service import get_topics_for_event as get_topics_for_event_service
 
 if TYPE_CHECKING:
@@ -12,6 +14,50 @@ if TYPE_CHECKING:
 
 
 def get_event_topics(
-    event_slug: str, offset: int = 0, limit: int = 20, user: "User | None" = None
+    event_slug: str,
+    offset: int = 0,
+    limit: int = 20,
+    user: "User | None" = None,
+    sort: TopicSort | str = TopicSort.TOP,
 ) -> list[TopicDTO]:
-    return get_topics_for_event_service(event_slug, offset, limit, user=user)
+    return get_topics_for_event_service(event_slug, offset, limit, user=user, sort=sort)
+
+
+def get_event_topics_page(
+    event_slug: str,
+    sort: TopicSort | str = TopicSort.TOP,
+    cursor: str | None = None,
+    user: "User | None" = None,
+) -> TopicPageDTO:
+    return get_topics_page(event_slug, sort=sort, cursor=cursor, user=user)
+
+
+def iter_event_topics_pages(
+    event_slug: str,
+    sort: TopicSort | str = TopicSort.TOP,
+    cursor: str | None = None,
+    limit: int = 20,
+    batch_size: int = 100,
+) -> Iterator[TopicPageDTO]:
+    """
+    Walk `limit` topics from `cursor` on as keyset pages of at most `batch_size`.
+
+    Only one batch of topics is held at a time; the last page yielded carries
+    the cursor to continue after the `limit` topics.
+    """
+    remaining = limit
+    while True:
+        page = get_topics_page(
+            event_slug, sort=sort, cursor=cursor, limit=min(batch_size, remaining)
+        )
+        yield page
+        remaining -= len(page.topics)
+        cursor = page.next_cursor
+        if cursor is None or remaining <= 0:
+            return
+
+
+def get_event_topics_by_slug(
+    event_slug: str, topic_slugs: list[str], user: "User | None" = None
+) -> list[TopicDTO]:
+    return get_topics_by_slug(event_slug, topic_slugs, user=user)
@@ -0,0 +1,11 @@
+"""
+Use case for listing events.
+"""
+
+from events.dto.event_dto import EventPageDTO
+from events.services.event_service import EVENTS_PAGE_SIZE
+from events.services.event_service import get_events_page as get_events_page_service
+
+
+def get_events_page(cursor: str | None = None, limit: int = EVENTS_PAGE_SIZE) -> EventPageDTO:
+    return get_events_page_service(cursor=cursor, limit=limit)
@@ -0,0 +1,10 @@
+"""
+Use case for retrieving all presenter suggestions of a topic.
+"""
+
+from events.dto.presenter_dto import PresenterDTO
+from events.services.presenter_service import get_suggestions_for_topic
+
+
+def get_presenter_suggestions(topic_slug: str) -> list[PresenterDTO]:
+    return get_suggestions_for_topic(topic_slug)
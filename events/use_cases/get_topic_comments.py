@@ -0,0 +1,10 @@
+"""
+Use case for retrieving a page of a topic's comments.
+"""
+
+from events.dto.comment_dto import CommentPageDTO
+from events.services.comment_service import get_comments_page
+
+
+def get_topic_comments(topic_slug: str, cursor: str | None = None) -> CommentPageDTO:
+    return get_comments_page(topic_slug, cursor=cursor)
@@ -0,0 +1,12 @@
+"""
+Use case for retrieving an event's hourly vote trend (admin analytics).
+"""
+
+from datetime import datetime
+
+from events.dto.vote_trend_dto import EventVoteTrendDTO
+from events.services.vote_analytics_service import get_event_vote_trend
+
+
+def get_vote_trend(event_slug: str, since: datetime) -> EventVoteTrendDTO:
+    return get_event_vote_trend(event_slug, since)
@@ -0,0 +1,41 @@
+"""
+Use case for suggesting a presenter for a topic.
+"""
+
+from typing import TYPE_CHECKING
+
+from events.dto.presenter_dto import PresenterDTO
+from events.services.presenter_service import suggest_presenter as suggest_presenter_service
+
+if TYPE_CHECKING:
+    from accounts.models import User
+
+
+def suggest_presenter(
+    suggested_by: "User", topic_slug: str, presenter_contact: str
+) -> PresenterDTO:
+    """
+    Suggest a presenter for a topic.
+
+    Args:
+        suggested_by: The user suggesting (must be authenticated - validated by view)
+        topic_slug: Slug of the topic
+        presenter_contact: Email, name, LinkedIn URL, WhatsApp contact, etc.
+            (max 500 characters, required)
+
+    Returns:
+        PresenterDTO with created suggestion data
+
+    Raises:
+        Topic.DoesNotExist: If topic with given slug doesn't exist
+        ValueError: If contact is empty or too long, or a suggestion limit was reached
+    """
+    if not presenter_contact or not presenter_contact.strip():
+        raise ValueError("Presenter contact is required")
+
+    if len(presenter_contact) > 500:
+        raise ValueError("Presenter contact must be 500 characters or less")
+
+    return suggest_presenter_service(
+        topic_slug=topic_slug, user=suggested_by, presenter_contact=presenter_contact.strip()
+    )
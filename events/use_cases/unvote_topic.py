@@ -4,6 +4,7 @@ Use case for unvoting on a topic.
 
 from typing import TYPE_CHECKING
 
+from events.services.event_service import EVENT_CLOSED_MESSAGE, is_topic_voting_closed
 from events.services.vote_service import unvote_topic as unvote_topic_service
 
 if TYPE_CHECKING:
@@ -24,5 +25,8 @@ def unvote_topic(topic_slug: str, user: "User") -> bool:
     Raises:
         Topic.DoesNotExist: If topic with given slug doesn't exist
         Vote.DoesNotExist: If user hasn't voted on this topic
+        PermissionError: If the topic's event has closed its voting
     """
+    if is_topic_voting_closed(topic_slug):
+        raise PermissionError(EVENT_CLOSED_MESSAGE)
     return unvote_topic_service(topic_slug=topic_slug, user=user)
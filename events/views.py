@@ -2,25 +2,210 @@
 Views for events app.
 """
 
-from django.http import HttpRequest, HttpResponse, HttpResponseNotFound
+import hashlib
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta
+from functools import wraps
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib import admin
+from django.http import (
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+    HttpResponseNotFound,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
-from django.views.decorators.http import require_http_methods
+from django.template import RequestContext
+from django.template.loader import get_template, render_to_string
+from django.utils import timezone
+from django.utils.cache import add_never_cache_headers, patch_cache_control
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition, require_GET, require_http_methods
+from whitenoise.middleware import WhiteNoiseMiddleware
 
 from core.decorators import require_authentication
+from core.release import get_release
+from core.routers import read_only_queries
+from events.dto.topic_dto import TopicPageDTO
 from events.forms import TopicForm
-from events.models import Event, Topic, Vote
+from events.models import Comment, Event, PresenterSuggestion, Topic, Vote
+from events.services.event_version_service import (
+    EventVersion,
+    get_event_version,
+    wait_for_event_change,
+)
+from events.services.snapshot_service import get_event_snapshot
+from events.services.topic_service import PERSONAL_SORTS, TopicSort, trending_since
+from events.use_cases.add_comment import add_comment
 from events.use_cases.create_topic import create_topic
+from events.use_cases.delete_comment import delete_comment
+from events.use_cases.delete_presenter_suggestion import delete_presenter_suggestion
 from events.use_cases.delete_topic import delete_topic
 from events.use_cases.edit_topic import edit_topic
-from events.use_cases.get_event_topics import get_event_topics
+from events.use_cases.find_similar_topics import find_similar_topics
+from events.use_cases.get_event_topics import get_event_topics_by_slug, get_event_topics_page
+from events.use_cases.get_presenter_suggestions import get_presenter_suggestions
+from events.use_cases.get_topic_comments import get_topic_comments
+from events.use_cases.get_vote_trend import get_vote_trend
+from events.use_cases.suggest_presenter import suggest_presenter
 from events.use_cases.unvote_topic import unvote_topic
 from events.use_cases.vote_topic import vote_topic
 
 
+def _event_version(request: HttpRequest, slug: str) -> EventVersion | None:
+    """Look up the event's validators once per request (ETag and Last-Modified share it)."""
+    if not hasattr(request, "_event_version"):
+        request._event_version = get_event_version(slug)
+    return request._event_version
+
+
+def _event_etag(request: HttpRequest, slug: str) -> str | None:
+    """
+    ETag for an event page or topic fragment.
+
+    Anonymous and authenticated users get separate validators: the authenticated
+    variant renders has_voted and the user's own edit/delete buttons, so it is
+    keyed by user. Every page embeds a CSRF token, so the CSRF cookie is part of
+    the validator too (a rotated cookie must not revalidate a stale token), and
+    the release, so a deploy doesn't revalidate HTML pointing at removed assets.
+    """
+    event = _event_version(request, slug)
+    if event is None:
+        return None
+
+    variant = f"user:{request.user.pk}" if request.user.is_authenticated else "anon"
+    if request.GET.get("sort") == TopicSort.TRENDING:
+        # Trending also changes when its window moves on, without any write
+        variant += f":since:{trending_since().isoformat()}"
+    csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME, "")
+    raw = (
+        f"{event.id}:{event.version}:{event.updated_at.isoformat()}:{variant}:{csrf_cookie}"
+        f":{get_release().id}"
+    )
+    prefix = "u" if request.user.is_authenticated else "a"
+    return f"{prefix}{event.version}-{hashlib.sha256(raw.encode()).hexdigest()[:24]}"
+
+
+def _event_last_modified(request: HttpRequest, slug: str) -> datetime | None:
+    """
+    Last-Modified for an event page or topic fragment.
+
+    Only used by clients that don't send If-None-Match. For authenticated users it
+    also moves forward on login, so a page cached while anonymous isn't revalidated,
+    and for everyone on deploys (see core.release).
+    """
+    event = _event_version(request, slug)
+    if event is None:
+        return None
+
+    candidates = [event.updated_at, get_release().built_at]
+    if request.user.is_authenticated and request.user.last_login:
+        candidates.append(request.user.last_login)
+    return max(candidates)
+
+
+# Sort selector labels, in display order
+TOPIC_SORT_LABELS = {
+    TopicSort.TOP: "Mais votados",
+    TopicSort.TRENDING: "Em alta",
+    TopicSort.NEWEST: "Mais recentes",
+    TopicSort.OLDEST: "Mais antigos",
+    TopicSort.MINE: "Meus tópicos",
+    TopicSort.UNVOTED: "Ainda não votei",
+}
+
+
+# Returned by the topic write endpoints of closed events
+EVENT_CLOSED_ERROR = "A votação deste evento foi encerrada."
+
+
+def _topic_sort(request: HttpRequest) -> TopicSort:
+    """
+    The listing mode from `?sort=`; unknown values, and personal modes for
+    anonymous users, fall back to most voted. (Closed events are listed by
+    their final ranking whatever the mode.)
+    """
+    try:
+        sort = TopicSort(request.GET.get("sort", TopicSort.TOP))
+    except ValueError:
+        return TopicSort.TOP
+    if sort not in TOPIC_SORT_LABELS:
+        return TopicSort.TOP
+    if sort in PERSONAL_SORTS and not request.user.is_authenticated:
+        return TopicSort.TOP
+    return sort
+
+
+def _sort_options(request: HttpRequest) -> list[tuple[str, str]]:
+    return [
+        (sort.value, label)
+        for sort, label in TOPIC_SORT_LABELS.items()
+        if request.user.is_authenticated or sort not in PERSONAL_SORTS
+    ]
+
+
+def _serve_snapshot(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """
+    Serve archived events from their static snapshot (see snapshot_service),
+    before the user, the session or the event is looked up.
+
+    WhiteNoise sets the snapshot's own ETag and Cache-Control, so this goes
+    outside _event_cache_control() and condition().
+    """
+
+    @wraps(view_func)
+    def wrapper(request: HttpRequest, slug: str) -> HttpResponse:
+        if request.method in ("GET", "HEAD") and (snapshot := get_event_snapshot(slug)):
+            try:
+                return WhiteNoiseMiddleware.serve(snapshot, request)
+            except FileNotFoundError:
+                pass  # Re-archived or unarchived since this worker read the manifest
+        return view_func(request, slug)
+
+    return wrapper
+
+
+def _event_cache_control(view_func: Callable[..., HttpResponse]) -> Callable[..., HttpResponse]:
+    """
+    Cache policy of event pages and topic fragments (including their 304s).
+
+    Open events are no-cache: clients must revalidate every time (no heuristic
+    freshness from Last-Modified), and condition() answers unchanged pages with
+    304 before the view runs any topic query. Closed events can't change
+    through votes or topics, so clients keep them for EVENT_CLOSED_MAX_AGE
+    without asking. Private either way: pages show the signed-in user.
+    """
+
+    @wraps(view_func)
+    def wrapper(request: HttpRequest, slug: str) -> HttpResponse:
+        response = view_func(request, slug)
+        event = _event_version(request, slug)
+        if event is not None and event.is_closed:
+            patch_cache_control(response, private=True, max_age=settings.EVENT_CLOSED_MAX_AGE)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return wrapper
+
+
+@_serve_snapshot
+@_event_cache_control
+@condition(etag_func=_event_etag, last_modified_func=_event_last_modified)
 def event_detail(request: HttpRequest, slug: str) -> HttpResponse:
     """
     Display event detail page with topics list.
 
+    The listing mode comes from `?sort=` (see TOPIC_SORT_LABELS). Archived
+    events are served from their snapshot instead, in most voted order. With
+    EVENT_PAGE_STREAMING the page is streamed (see _stream_event_page).
+
     Args:
         request: HTTP request object
         slug: Event slug
@@ -29,22 +214,78 @@ def event_detail(request: HttpRequest, slug: str) -> HttpResponse:
         HTTP response with event detail page
     """
     event = get_object_or_404(Event, slug=slug)
-    topics = get_event_topics(slug, offset=0, limit=20, user=request.user)
+    sort = _topic_sort(request)
+    if settings.EVENT_PAGE_STREAMING:
+        return _stream_event_page(request, event, sort)
+
+    page = get_event_topics_page(slug, sort=sort, user=request.user)
 
     context = {
         "event": event,
-        "topics": topics,
+        "topics": page.topics,
+        "page": page,
+        "sort_options": _sort_options(request),
+        "live_updates": settings.EVENT_LIVE_UPDATES,
     }
 
     return render(request, "events/event_detail.html", context)
 
 
+# Stands in for the topic list while the rest of a streamed event page is rendered
+STREAMED_TOPICS_MARKER = "<!-- streamed-topics -->"
+
+
+def _stream_event_page(request: HttpRequest, event: Event, sort: TopicSort) -> HttpResponse:
+    """
+    Stream the event page: the page around the topic list (head with the CSS
+    and JS links, header, topic form) is rendered before the topics are
+    queried and sent first; the cards follow one at a time as they're rendered.
+
+    The page around the list is rendered in the view, so the CSRF cookie,
+    messages and session are settled before the response starts. The topic
+    query runs while the response streams, after the middleware returned, so
+    it is routed to the read-only database again here.
+    """
+    context = {
+        "event": event,
+        # The list's mode is only settled by the query; the selector shows the one asked for
+        "page": TopicPageDTO(sort=sort.value),
+        "sort_options": _sort_options(request),
+        "live_updates": settings.EVENT_LIVE_UPDATES,
+        "streamed_topics": mark_safe(STREAMED_TOPICS_MARKER),
+    }
+    head, tail = render_to_string("events/event_detail.html", context, request).split(
+        STREAMED_TOPICS_MARKER, 1
+    )
+
+    def chunks() -> Iterator[str]:
+        yield head
+        with read_only_queries():
+            page = get_event_topics_page(event.slug, sort=sort, user=request.user)
+
+        # Context processors run once for all the cards, as in a rendered page
+        card = get_template("events/partials/topic_item.html").template
+        card_context = RequestContext(request, {"event": event, "page": page})
+        with card_context.bind_template(card):
+            for topic in page.topics:
+                with card_context.push(topic=topic):
+                    yield card.render(card_context)
+            closing = "load_more_trigger.html" if page.topics else "topic_list_empty.html"
+            yield get_template(f"events/partials/{closing}").template.render(card_context)
+        yield tail
+
+    return StreamingHttpResponse(chunks())
+
+
+@_event_cache_control
+@condition(etag_func=_event_etag, last_modified_func=_event_last_modified)
 def load_more_topics(request: HttpRequest, slug: str) -> HttpResponse:
     """
-    HTMX endpoint to load more topics for infinite scroll.
+    HTMX endpoint to load the next keyset page of topics for infinite scroll.
 
     Args:
-        request: HTTP request object (should have HX-Request header)
+        request: HTTP request object (should have HX-Request header), with the
+            `sort` and `cursor` of the page being continued
         slug: Event slug
 
     Returns:
@@ -54,18 +295,131 @@ def load_more_topics(request: HttpRequest, slug: str) -> HttpResponse:
         return HttpResponseNotFound()
 
     event = get_object_or_404(Event, slug=slug)
-    offset = int(request.GET.get("offset", 0))
-    limit = 20
+    try:
+        page = get_event_topics_page(
+            slug, sort=_topic_sort(request), cursor=request.GET.get("cursor"), user=request.user
+        )
+    except ValueError:
+        return HttpResponseBadRequest("Cursor inválido.")
+
+    context = {
+        "event": event,
+        "topics": page.topics,
+        "page": page,
+    }
+
+    return render(request, "events/partials/topic_list_fragment.html", context)
+
+
+# Most topic cards refreshed by one topic_cards request
+TOPIC_CARDS_MAX = 50
 
-    topics = get_event_topics(slug, offset=offset, limit=limit, user=request.user)
+
+@require_GET
+async def event_changes(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    Long-poll endpoint: wait until the event changes after `?version=`.
+
+    Answers `{"version": ..., "topics": [...]}` with the slugs of the topics
+    whose cards changed (an empty list means the whole page should be
+    reloaded, e.g. the voting was closed), or 204 when nothing changed within
+    EVENT_CHANGES_TIMEOUT seconds. While waiting only the event's version is
+    read, never its topics. Under ASGI (the middleware stack is async
+    capable) a waiting request holds no thread; under WSGI it holds a worker,
+    so event pages only poll with EVENT_LIVE_UPDATES.
+
+    Args:
+        request: HTTP request object, with the `version` the client has
+        slug: Event slug
+
+    Returns:
+        JSON response with the changes, or 204 No Content
+    """
+    try:
+        since = int(request.GET["version"])
+    except (KeyError, ValueError):
+        return HttpResponseBadRequest("Versão inválida.")
+
+    try:
+        changes = await wait_for_event_change(
+            slug,
+            since,
+            timeout=settings.EVENT_CHANGES_TIMEOUT,
+            interval=settings.EVENT_CHANGES_POLL_INTERVAL,
+        )
+    except Event.DoesNotExist as e:
+        raise Http404("Evento não encontrado.") from e
+
+    if changes is None:
+        response = HttpResponse(status=204)
+    else:
+        response = JsonResponse({"version": changes.version, "topics": changes.topic_slugs})
+    add_never_cache_headers(response)
+    return response
+
+
+@require_GET
+def topic_cards(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint to refresh the cards of `?topics=` in place (out-of-band swaps).
+
+    Cards of topics that are gone (deleted) are removed from the page.
+
+    Args:
+        request: HTTP request object (should have HX-Request header)
+        slug: Event slug
+
+    Returns:
+        HTTP response with the cards as out-of-band swaps
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    event = get_object_or_404(Event, slug=slug)
+    slugs = request.GET.getlist("topics")[:TOPIC_CARDS_MAX]
+    topics = get_event_topics_by_slug(slug, slugs, user=request.user)
+    found = {topic.slug for topic in topics}
 
     context = {
         "event": event,
         "topics": topics,
-        "offset": offset,
+        "removed_slugs": [topic_slug for topic_slug in slugs if topic_slug not in found],
     }
 
-    return render(request, "events/partials/topic_list_fragment.html", context)
+    response = render(request, "events/partials/topic_cards_oob.html", context)
+    add_never_cache_headers(response)
+    return response
+
+
+# Titles shorter than this aren't looked up while typing
+SIMILAR_TOPICS_MIN_LENGTH = 4
+
+
+@require_GET
+def similar_topics(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint listing the event's topics similar to `?title=`, while it is typed.
+
+    Args:
+        request: HTTP request object (should have HX-Request header)
+        slug: Event slug
+
+    Returns:
+        HTTP response with the similar topics (empty when there are none)
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    title = request.GET.get("title", "").strip()
+    topics = []
+    if len(title) >= SIMILAR_TOPICS_MIN_LENGTH:
+        topics = find_similar_topics(slug, title[: Topic._meta.get_field("title").max_length])
+
+    response = render(
+        request, "events/partials/similar_topics.html", {"event_slug": slug, "topics": topics}
+    )
+    add_never_cache_headers(response)
+    return response
 
 
 @require_authentication
@@ -82,12 +436,15 @@ def vote_topic_view(request: HttpRequest, slug: str) -> HttpResponse:
         slug: Topic slug
 
     Returns:
-        HTTP response with vote button partial HTML fragment
+        HTTP response with vote button partial HTML fragment (404 for topics of
+        closed events, which take no votes)
     """
     if not request.htmx:
         return HttpResponseNotFound()
 
-    topic = get_object_or_404(Topic, slug=slug)
+    topic = get_object_or_404(Topic.objects.select_related("event"), slug=slug)
+    if topic.event.is_closed:
+        return HttpResponseNotFound()
 
     # Check if user has already voted
     has_voted = Vote.objects.filter(topic=topic, user=request.user).exists()
@@ -129,8 +486,6 @@ def create_topic_view(request: HttpRequest) -> HttpResponse:
     """
     # CRITICAL: Explicit authentication check (defense in depth)
     if not request.user.is_authenticated:
-        from django.http import HttpResponseForbidden
-
         return HttpResponseForbidden("Você precisa estar autenticado para criar tópicos.")
 
     event_slug = request.GET.get("event") or request.POST.get("event")
@@ -138,6 +493,8 @@ def create_topic_view(request: HttpRequest) -> HttpResponse:
         return HttpResponseNotFound()
 
     event = get_object_or_404(Event, slug=event_slug)
+    if event.is_closed:
+        return HttpResponseForbidden(EVENT_CLOSED_ERROR)
 
     if request.method == "POST":
         form = TopicForm(request.POST)
@@ -216,14 +573,15 @@ def edit_topic_view(request: HttpRequest, slug: str) -> HttpResponse:
     Returns:
         HTTP response with form (GET) or redirect (POST)
     """
-    topic = get_object_or_404(Topic, slug=slug)
+    topic = get_object_or_404(Topic.objects.select_related("event"), slug=slug)
 
     # Check ownership - CRITICAL: Only creator can edit
     if topic.creator != request.user:
-        from django.http import HttpResponseForbidden
-
         return HttpResponseForbidden("Você não é o criador deste tópico.")
 
+    if topic.event.is_closed:
+        return HttpResponseForbidden(EVENT_CLOSED_ERROR)
+
     if request.method == "POST":
         # Support both form-based and direct POST (for inline editing)
         if "title" in request.POST:
@@ -303,14 +661,15 @@ def delete_topic_view(request: HttpRequest, slug: str) -> HttpResponse:
     if not request.htmx:
         return HttpResponseNotFound()
 
-    topic = get_object_or_404(Topic, slug=slug)
+    topic = get_object_or_404(Topic.objects.select_related("event"), slug=slug)
 
     # Check ownership - CRITICAL: Only creator can edit
     if topic.creator != request.user:
-        from django.http import HttpResponseForbidden
-
         return HttpResponseForbidden("Você não é o criador deste tópico.")
 
+    if topic.event.is_closed:
+        return HttpResponseForbidden(EVENT_CLOSED_ERROR)
+
     try:
         delete_topic(user=request.user, topic_slug=slug)
         # Return empty string - HTMX outerHTML swap with empty string removes the target element
@@ -319,6 +678,267 @@ def delete_topic_view(request: HttpRequest, slug: str) -> HttpResponse:
         response["HX-Trigger"] = "topicDeleted"
         return response
     except PermissionError:
-        from django.http import HttpResponseForbidden
-
         return HttpResponseForbidden("Você não é o criador deste tópico.")
+
+
+def _comment_count_oob(request: HttpRequest, topic_slug: str) -> str:
+    """Render the topic's comment count as an out-of-band swap for its card."""
+    comment_count = Topic.objects.values_list("comment_count", flat=True).get(slug=topic_slug)
+    return render_to_string(
+        "events/partials/comment_count.html",
+        {"topic_slug": topic_slug, "comment_count": comment_count, "oob": True},
+        request=request,
+    )
+
+
+def topic_comments(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint to lazily load a topic's comments, one keyset page at a time.
+
+    Without a cursor, returns the comments section (form + first page); with
+    `?cursor=`, returns only the next page of comments for infinite scroll.
+
+    Args:
+        request: HTTP request object (should have HX-Request header)
+        slug: Topic slug
+
+    Returns:
+        HTTP response with partial HTML fragment of comments
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    cursor = request.GET.get("cursor")
+    try:
+        page = get_topic_comments(slug, cursor=cursor)
+    except Topic.DoesNotExist as e:
+        raise Http404 from e
+    except ValueError:
+        return HttpResponseBadRequest("Cursor inválido.")
+
+    context = {
+        "topic_slug": slug,
+        "page": page,
+    }
+    template = (
+        "events/partials/comment_list_fragment.html"
+        if cursor
+        else "events/partials/topic_comments.html"
+    )
+    return render(request, template, context)
+
+
+@require_authentication
+@require_http_methods(["POST"])
+def create_comment_view(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint to add a comment to a topic.
+
+    Args:
+        request: HTTP request object (must be authenticated and HTMX)
+        slug: Topic slug
+
+    Returns:
+        HTTP response with the new comment and an OOB update of the card's count
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    try:
+        dto = add_comment(
+            user=request.user, topic_slug=slug, content=request.POST.get("content", "")
+        )
+    except Topic.DoesNotExist as e:
+        raise Http404 from e
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
+
+    response = render(request, "events/partials/comment_item.html", {"comment": dto})
+    response.content += _comment_count_oob(request, slug).encode()
+    return response
+
+
+@require_authentication
+@require_http_methods(["POST"])
+def delete_comment_view(request: HttpRequest, comment_id: UUID) -> HttpResponse:
+    """
+    Delete a comment (soft delete).
+
+    Args:
+        request: HTTP request object (must be authenticated and HTMX)
+        comment_id: Comment id
+
+    Returns:
+        HTTP response removing the comment and updating the card's count (OOB)
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    comment = get_object_or_404(Comment.objects.select_related("topic"), pk=comment_id)
+
+    try:
+        delete_comment(user=request.user, comment_id=comment_id)
+    except PermissionError:
+        return HttpResponseForbidden("Você não é o autor deste comentário.")
+
+    # Empty main content removes the comment (hx-swap="outerHTML" on .comment-item)
+    return HttpResponse(_comment_count_oob(request, comment.topic.slug))
+
+
+def _render_presenters(request: HttpRequest, slug: str, error: str | None = None) -> HttpResponse:
+    """Render a topic's full presenter suggestions section."""
+    try:
+        suggestions = get_presenter_suggestions(slug)
+    except Topic.DoesNotExist as e:
+        raise Http404 from e
+
+    context = {
+        "topic_slug": slug,
+        "suggestions": suggestions,
+        "error": error,
+    }
+    return render(request, "events/partials/presenter_suggestions.html", context)
+
+
+def topic_presenters(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint to load all presenter suggestions of a topic.
+
+    The topic listing only renders a preview (see
+    topic_service.presenter_suggestions_prefetch); this replaces it with the
+    full list and the suggestion form.
+
+    Args:
+        request: HTTP request object (should have HX-Request header)
+        slug: Topic slug
+
+    Returns:
+        HTTP response with partial HTML fragment of suggestions
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    return _render_presenters(request, slug)
+
+
+@require_authentication
+@require_http_methods(["POST"])
+def suggest_presenter_view(request: HttpRequest, slug: str) -> HttpResponse:
+    """
+    HTMX endpoint to suggest a presenter for a topic.
+
+    Args:
+        request: HTTP request object (must be authenticated and HTMX)
+        slug: Topic slug
+
+    Returns:
+        HTTP response with the updated suggestions section (with an error if a
+        limit was reached)
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    try:
+        suggest_presenter(
+            suggested_by=request.user,
+            topic_slug=slug,
+            presenter_contact=request.POST.get("presenter_contact", ""),
+        )
+    except Topic.DoesNotExist as e:
+        raise Http404 from e
+    except ValueError as e:
+        return _render_presenters(request, slug, error=str(e))
+
+    return _render_presenters(request, slug)
+
+
+@require_authentication
+@require_http_methods(["POST"])
+def delete_presenter_suggestion_view(
+    request: HttpRequest, slug: str, suggestion_id: UUID
+) -> HttpResponse:
+    """
+    Delete a presenter suggestion (soft delete).
+
+    Args:
+        request: HTTP request object (must be authenticated and HTMX)
+        slug: Topic slug
+        suggestion_id: Suggestion id
+
+    Returns:
+        HTTP response with the updated suggestions section
+    """
+    if not request.htmx:
+        return HttpResponseNotFound()
+
+    get_object_or_404(PresenterSuggestion, pk=suggestion_id, topic__slug=slug)
+
+    try:
+        delete_presenter_suggestion(user=request.user, suggestion_id=suggestion_id)
+    except PermissionError:
+        return HttpResponseForbidden("Você não fez esta sugestão.")
+
+    return _render_presenters(request, slug)
+
+
+# Periods offered by the vote trend chart, in days
+VOTE_TREND_PERIODS = (1, 7, 30, 90)
+
+# Drawing area of the vote trend chart (SVG user units)
+VOTE_TREND_CHART_HEIGHT = 200
+
+
+def vote_trends(request: HttpRequest) -> HttpResponse:
+    """
+    Admin page charting an event's votes per hour, read from the hourly rollups.
+
+    `?event=<slug>` picks the event (default: the newest) and `?days=` the
+    period (one of VOTE_TREND_PERIODS). Wrapped with admin.site.admin_view in
+    the URLconf (staff only).
+    """
+    events = list(Event.objects.order_by("-created_at").values_list("slug", "name"))
+    slug = request.GET.get("event") or (events[0][0] if events else None)
+    try:
+        days = int(request.GET.get("days", 7))
+    except ValueError:
+        days = 7
+    if days not in VOTE_TREND_PERIODS:
+        days = 7
+
+    trend = None
+    bars = []
+    if slug is not None:
+        try:
+            trend = get_vote_trend(slug, since=timezone.now() - timedelta(days=days))
+        except Event.DoesNotExist as e:
+            raise Http404("Evento não encontrado.") from e
+        peak = max((max(p.votes_cast, p.votes_removed) for p in trend.points), default=0) or 1
+        # Cast votes grow up from the middle line, removed votes down from it
+        half = VOTE_TREND_CHART_HEIGHT / 2
+        bars = [
+            {
+                "x": i,
+                "hour": point.hour,
+                "cast": point.votes_cast,
+                "removed": point.votes_removed,
+                "cast_height": half * point.votes_cast / peak,
+                "cast_y": half - half * point.votes_cast / peak,
+                "removed_height": half * point.votes_removed / peak,
+            }
+            for i, point in enumerate(trend.points)
+        ]
+
+    context = {
+        **admin.site.each_context(request),
+        "title": "Votos por hora",
+        "events": events,
+        "selected_event": slug,
+        "periods": VOTE_TREND_PERIODS,
+        "days": days,
+        "trend": trend,
+        "bars": bars,
+        "chart_width": len(bars),
+        "chart_height": VOTE_TREND_CHART_HEIGHT,
+        "chart_middle": VOTE_TREND_CHART_HEIGHT / 2,
+    }
+    return render(request, "admin/events/vote_trends.html", context)
@@ -41,12 +41,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",  # First: latency covers the whole stack
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files in production
+    "core.middleware.StaticFilesMiddleware",  # WhiteNoise: serve static files in production
+    "core.middleware.ReadOnlyDatabaseMiddleware",  # GET/HEAD reads use the "readonly" alias
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.ProfilingMiddleware",  # Staff-only, ?_profile=1 / X-Profile: 1
     "allauth.account.middleware.AccountMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -55,6 +58,61 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "floripatalks.urls"
 
+# Reads of safe-method requests go to the "readonly" database alias when an
+# environment defines it (see core.routers); writes always go to "default"
+DATABASE_ROUTERS = ["core.routers.ReadOnlyRouter"]
+
+# SQLite connection setup. Django runs init_command once per new connection, so
+# with persistent connections (CONN_MAX_AGE) the pragmas, Django's function
+# registration and the prepared statement cache are paid once per worker rather
+# than once per request.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL; "  # Durable in WAL mode, fsyncs only at checkpoints
+    "PRAGMA temp_store = MEMORY; "
+    "PRAGMA cache_size = -16000; "  # 16 MB page cache per connection
+    "PRAGMA mmap_size = 134217728"  # 128 MB memory-mapped reads
+)
+SQLITE_CACHED_STATEMENTS = 256
+
+
+def sqlite_databases(path: str | Path, conn_max_age: int = 0) -> dict[str, dict]:
+    """
+    DATABASES for one SQLite file: the `default` writer and the `readonly` alias.
+
+    The writer puts the file in WAL mode so readers never wait for it (and vice
+    versa), and begins its transactions IMMEDIATE: they take the write lock up
+    front, so concurrent ones queue (up to the busy timeout) instead of failing
+    with "database is locked" when one that already read tries to write. The
+    read-only alias opens the same file with `mode=ro` and `query_only` for the
+    reads of GET requests (see core.routers).
+    """
+    common = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "CONN_MAX_AGE": conn_max_age,
+        # Check a reused connection before the first query of each request
+        "CONN_HEALTH_CHECKS": conn_max_age != 0,
+    }
+    return {
+        "default": {
+            **common,
+            "NAME": path,
+            "OPTIONS": {
+                "init_command": f"PRAGMA journal_mode = WAL; {SQLITE_PRAGMAS}",
+                "transaction_mode": "IMMEDIATE",
+                "cached_statements": SQLITE_CACHED_STATEMENTS,
+            },
+        },
+        "readonly": {
+            **common,
+            "NAME": f"file:{path}?mode=ro",
+            "OPTIONS": {
+                "init_command": f"PRAGMA query_only = ON; {SQLITE_PRAGMAS}",
+                "cached_statements": SQLITE_CACHED_STATEMENTS,
+            },
+        },
+    }
+
+
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -109,6 +167,93 @@ STORAGES = {
     },
 }
 
+# Topics soft-deleted longer than this are moved to the archive tables by
+# `manage.py archive_deleted_topics`
+TOPIC_ARCHIVE_RETENTION_DAYS = 90
+
+# Vote log entries (events.VoteLogEntry) older than this are removed by
+# `manage.py compact_vote_log`; their counts stay in the hourly rollups
+VOTE_LOG_RETENTION_DAYS = 30
+
+# Identifier of the deployed code (e.g. the commit SHA), part of the ETag of
+# rendered pages with a hash of the templates and static manifest (core.release)
+RELEASE = ""
+
+# Browsers keep pages of events whose voting is closed (events.services.event_service)
+# this many seconds without revalidating
+EVENT_CLOSED_MAX_AGE = 60 * 60
+
+# Stream the event page (events.views.event_detail): everything around the topic
+# list is sent before the topics are queried, then the cards as they're rendered
+EVENT_PAGE_STREAMING = True
+
+# Long polls of the event page (events.views.event_changes) wait this many
+# seconds for a change, checking the event's version every POLL_INTERVAL seconds
+EVENT_CHANGES_TIMEOUT = 25
+EVENT_CHANGES_POLL_INTERVAL = 1.0
+# Whether event pages long-poll event_changes to refresh their cards. Each
+# waiting poll holds a worker under WSGI (sync gunicorn workers), so every open
+# page would take one: only turn it on when the site is served under ASGI
+# (uvicorn, or gunicorn with uvicorn workers)
+EVENT_LIVE_UPDATES = False
+
+# Static HTML snapshots of archived events (events.services.snapshot_service),
+# served in place of the event page; browsers revalidate them after this many seconds
+EVENT_SNAPSHOT_DIR = BASE_DIR / ".snapshots"
+EVENT_SNAPSHOT_MAX_AGE = 300
+
+# Avatars (accounts.services.avatar_service) are served from AVATAR_SIZE px
+# thumbnails stored in AVATAR_DIR; AVATAR_FETCHER (dotted path to a callable
+# taking the provider's URL and returning the image bytes) downloads each once
+AVATAR_DIR = BASE_DIR / ".avatars"
+AVATAR_SIZE = 96
+AVATAR_FETCHER = "accounts.services.avatar_service.fetch_avatar"
+AVATAR_FETCH_TIMEOUT = 5
+AVATAR_MAX_BYTES = 5 * 1024 * 1024
+
+# In-process caches are invalidated across workers through version counters in a
+# memory-mapped file (core.invalidation); it must be on a local filesystem
+# shared by every worker of the host
+INVALIDATION_BUS_PATH = BASE_DIR / ".invalidation"
+INVALIDATION_BUS_SLOTS = 4096
+
+# Background tasks (django.tasks) are stored in the database by
+# core.task_queue.DatabaseBackend and run by `manage.py run_worker`; failed
+# attempts are retried (MAX_ATTEMPTS in all, RETRY_DELAY seconds apart, doubling),
+# and tasks of a worker that died are retried once their LEASE (seconds) expires.
+# Finished tasks are kept TASK_RESULT_RETENTION_DAYS for inspection in the admin
+TASKS = {
+    "default": {
+        "BACKEND": "core.task_queue.DatabaseBackend",
+        "QUEUES": ["default"],
+        "OPTIONS": {"MAX_ATTEMPTS": 3, "RETRY_DELAY": 10, "LEASE": 600},
+    },
+}
+TASK_RESULT_RETENTION_DAYS = 7
+
+# Metrics (core.metrics): each worker flushes its values to a file in METRICS_DIR
+# at most every METRICS_FLUSH_INTERVAL seconds; /metrics merges them. Scrapers
+# authenticate with "Authorization: Bearer <METRICS_TOKEN>" (staff users always can).
+METRICS_DIR = BASE_DIR / ".metrics"
+METRICS_FLUSH_INTERVAL = 1.0
+METRICS_TOKEN = None
+
+# On-demand profiling (core.profiling): reports are kept as a ring buffer of the
+# newest PROFILING_MAX_REPORTS files in PROFILING_DIR, browsed at /admin/profiling/
+PROFILING_DIR = BASE_DIR / ".profiles"
+PROFILING_MAX_REPORTS = 50
+
+# Online SQLite snapshots (`manage.py backup_database` / `restore_database`):
+# the newest BACKUP_KEEP snapshots are kept in BACKUP_DIR
+BACKUP_DIR = BASE_DIR / ".backups"
+BACKUP_KEEP = 7
+
+# N+1 detection (core.nplusone): when the same relation is lazily loaded for
+# NPLUSONE_THRESHOLD instances in one request (or test), "warn" logs it and
+# "raise" raises NPlusOneError. None disables it (the descriptors aren't wrapped).
+NPLUSONE_DETECTION = None
+NPLUSONE_THRESHOLD = 2
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
@@ -129,7 +274,7 @@ ACCOUNT_SIGNUP_FIELDS = [
 ]  # Email required, username not required
 ACCOUNT_EMAIL_VERIFICATION = "none"  # For MVP, skip email verification
 ACCOUNT_UNIQUE_EMAIL = True
-# ACCOUNT_ADAPTER = "accounts.adapters.CustomAccountAdapter"  # Optional: uncomment if custom adapter needed
+ACCOUNT_ADAPTER = "accounts.adapters.AccountAdapter"  # Sends emails from the task worker
 
 # Django-allauth social account configuration
 SOCIALACCOUNT_AUTO_SIGNUP = True
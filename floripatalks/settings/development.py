@@ -22,8 +22,12 @@ INSTALLED_APPS += [
 # Development-only middleware (must be after StaticFilesMiddleware)
 MIDDLEWARE += [
     "django_browser_reload.middleware.BrowserReloadMiddleware",
+    "core.middleware.NPlusOneMiddleware",
 ]
 
+# Log repeated lazy loads of a relation in a request (core.nplusone)
+NPLUSONE_DETECTION = "warn"
+
 # Load environment variables from .env file
 # This allows using .env file for local development
 env_path = BASE_DIR / ".env"
@@ -38,12 +42,9 @@ DEBUG = True
 ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
 
 # Database - SQLite for development
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
-}
+# The runserver starts a thread per request, which would strand persistent
+# connections, so they are only enabled in production
+DATABASES = sqlite_databases(BASE_DIR / "db.sqlite3")
 
 # Email backend for development
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
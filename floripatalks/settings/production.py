@@ -45,12 +45,37 @@ X_FRAME_OPTIONS = "DENY"
 # SQLite database stored in persistent storage
 # Using /home/site/data/ - a subdirectory that persists (wwwroot gets overwritten, but data/ doesn't)
 # Alternative: /home/data/ (but may need to be created)
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": "/home/site/data/db.sqlite3",
-    }
-}
+# Persistent connections: each gunicorn (sync) worker keeps its connections
+# open for CONN_MAX_AGE seconds instead of reconnecting on every request
+DATABASES = sqlite_databases(
+    "/home/site/data/db.sqlite3", conn_max_age=int(os.environ.get("CONN_MAX_AGE", "600"))
+)
+
+# Metrics - per-worker files must be on a filesystem shared by all gunicorn
+# workers of the instance; startup.sh empties the directory on boot
+METRICS_DIR = os.environ.get("METRICS_DIR", "/tmp/floripatalks-metrics")
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+# The invalidation bus is memory-mapped, so it stays on local disk (not the
+# network share of /home); workers only need it while they run
+INVALIDATION_BUS_PATH = os.environ.get("INVALIDATION_BUS_PATH", "/tmp/floripatalks-invalidation")
+
+# Event pages long-poll for changes. Only turn it on where the deployment serves
+# floripatalks.asgi with its own ASGI server: startup.sh runs Gunicorn's sync
+# WSGI workers, where each waiting poll would hold a worker
+EVENT_LIVE_UPDATES = os.environ.get("EVENT_LIVE_UPDATES", "") == "1"
+
+# Set by the deployment so code-only releases also change page validators
+RELEASE = os.environ.get("RELEASE", "")
+
+# Profiling reports persist across deployments next to the database
+PROFILING_DIR = os.environ.get("PROFILING_DIR", "/home/site/data/profiles")
+
+# Snapshots live next to the database, in persistent storage
+BACKUP_DIR = os.environ.get("BACKUP_DIR", "/home/site/data/backups")
+
+# Avatar thumbnails too, so deployments don't fetch every avatar again
+AVATAR_DIR = os.environ.get("AVATAR_DIR", "/home/site/data/avatars")
 
 # Static files - WhiteNoise handles serving in production
 # STATICFILES_STORAGE is set in base.py
@@ -4,6 +4,8 @@ Django test settings for floripatalks project.
 Uses in-memory SQLite for faster test execution.
 """
 
+import tempfile
+
 from .base import *
 
 # Override STORAGES FIRST before any other imports that might use it
@@ -22,7 +24,13 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
-    }
+    },
+    # Mirrors default: routed reads see the test's data (core.routers)
+    "readonly": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"MIRROR": "default"},
+    },
 }
 
 
@@ -38,6 +46,26 @@ class DisableMigrations:
 
 MIGRATION_MODULES = DisableMigrations()
 
+# Keep metric, profile and backup files out of the project directory
+METRICS_DIR = tempfile.mkdtemp(prefix="floripatalks-test-metrics-")
+# Flush on every update: no background flush timers in the test process
+METRICS_FLUSH_INTERVAL = 0
+PROFILING_DIR = tempfile.mkdtemp(prefix="floripatalks-test-profiles-")
+BACKUP_DIR = tempfile.mkdtemp(prefix="floripatalks-test-backups-")
+EVENT_SNAPSHOT_DIR = tempfile.mkdtemp(prefix="floripatalks-test-snapshots-")
+INVALIDATION_BUS_PATH = f"{tempfile.mkdtemp(prefix='floripatalks-test-invalidation-')}/bus"
+AVATAR_DIR = tempfile.mkdtemp(prefix="floripatalks-test-avatars-")
+# Avatars are "fetched" from a generated image, never from the network
+AVATAR_FETCHER = "tests.stubs.fetch_avatar"
+
+# Render the event page in one piece, so tests can read its content and context;
+# the streamed page has tests of its own (tests/integration/events/test_event_page_streaming.py)
+EVENT_PAGE_STREAMING = False
+
+# Run tasks as they are enqueued; tests of the database backend and its worker
+# override TASKS
+TASKS = {"default": {"BACKEND": "django.tasks.backends.immediate.ImmediateBackend"}}
+
 # Speed up password hashing for tests
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
@@ -64,4 +92,9 @@ LOGGING = {
 
 # Remove WhiteNoise middleware in tests - it requires a manifest file
 # Use Django's default static file serving instead
-MIDDLEWARE = [mw for mw in MIDDLEWARE if mw != "whitenoise.middleware.WhiteNoiseMiddleware"]
+MIDDLEWARE = [mw for mw in MIDDLEWARE if mw != "core.middleware.StaticFilesMiddleware"]
+
+# Fail tests that lazily load the same relation for several rows (core.nplusone);
+# each request and each test (tests/conftest.py) is tracked on its own
+MIDDLEWARE += ["core.middleware.NPlusOneMiddleware"]
+NPLUSONE_DETECTION = "raise"
@@ -9,7 +9,9 @@ from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import include, path
 
+from core.views import metrics_view, profile_report_detail, profile_report_list
 from events.models import Event
+from events.views import vote_trends
 
 
 def home(request: HttpRequest) -> HttpResponse:
@@ -25,7 +27,20 @@ def home(request: HttpRequest) -> HttpResponse:
 
 urlpatterns = [
     path("", home, name="home"),
+    # Before admin.site.urls, whose catch-all would otherwise claim these paths
+    path(
+        "admin/profiling/",
+        admin.site.admin_view(profile_report_list),
+        name="profile_report_list",
+    ),
+    path(
+        "admin/profiling/<slug:report_id>/",
+        admin.site.admin_view(profile_report_detail),
+        name="profile_report_detail",
+    ),
+    path("admin/vote-trends/", admin.site.admin_view(vote_trends), name="vote_trends"),
     path("admin/", admin.site.urls),
+    path("metrics", metrics_view, name="metrics"),
     path("events/", include("events.urls")),
     path("accounts/", include("accounts.urls")),
     # django-allauth URLs
@@ -43,13 +43,43 @@ python manage.py migrate --noinput --verbosity=0
 # Note: Oryx build system may do this automatically, but explicit is cleaner
 python manage.py collectstatic --noinput
 
+# Reset worker metric files (core.metrics): counters restart with the server,
+# like any other Prometheus target
+export METRICS_DIR="${METRICS_DIR:-/tmp/floripatalks-metrics}"
+rm -rf "$METRICS_DIR"
+mkdir -p "$METRICS_DIR"
+
+# Start the task worker (core.task_queue) in the background: it runs the tasks
+# requests enqueue (emails, vote rollups) and finishes its current task on SIGTERM
+python manage.py run_worker &
+worker_pid=$!
+
 # Start Gunicorn (official WSGI server for Django)
+# Sync workers: each request holds one, so event pages don't long-poll for
+# changes here (leave EVENT_LIVE_UPDATES off; it needs an ASGI server for
+# floripatalks.asgi, which this script doesn't start)
 # Azure sets $PORT environment variable automatically
 # Using '-' for log files ensures logs are captured by Azure
-exec gunicorn floripatalks.wsgi:application \
+# Not exec'd: this shell stays to forward SIGTERM/SIGINT to both processes
+gunicorn floripatalks.wsgi:application \
     --bind 0.0.0.0:${PORT:-8000} \
     --workers 2 \
     --timeout 600 \
     --access-logfile '-' \
     --error-logfile '-' \
-    --log-level info
+    --log-level info &
+gunicorn_pid=$!
+
+stop() {
+    kill -TERM "$gunicorn_pid" "$worker_pid" 2>/dev/null
+}
+trap stop TERM INT
+
+# Returns when gunicorn exits, or as soon as a signal is forwarded; either way
+# both are stopped, and waited for while they finish their current work
+set +e
+wait "$gunicorn_pid"
+status=$?
+stop
+wait
+exit "$status"
@@ -2,14 +2,43 @@
 Pytest configuration and shared fixtures.
 """
 
+from collections.abc import Iterator
+
 import pytest
 from faker import Faker
 
 from accounts.models import User
+from core.invalidation import clear_caches
+from core.nplusone import allow_lazy_loads, track_lazy_loads
 
 fake = Faker()
 
 
+@pytest.fixture(autouse=True)
+def detect_n_plus_one(request: pytest.FixtureRequest) -> Iterator[None]:
+    """
+    Fail a test that lazily loads the same relation for several rows (core.nplusone).
+
+    Requests made by the test are tracked separately by NPlusOneMiddleware. Tests
+    that load relations row by row on purpose use @pytest.mark.allow_lazy_loads.
+    """
+    with track_lazy_loads():
+        if request.node.get_closest_marker("allow_lazy_loads"):
+            with allow_lazy_loads():
+                yield
+        else:
+            yield
+
+
+@pytest.fixture(autouse=True)
+def empty_invalidated_caches() -> None:
+    """
+    Start each test with empty in-process caches (core.invalidation): rolling
+    back a test's rows doesn't publish their keys.
+    """
+    clear_caches()
+
+
 # User fixtures
 @pytest.fixture
 def user_factory() -> type[User]:
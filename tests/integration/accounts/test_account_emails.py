@@ -0,0 +1,33 @@
+"""
+Integration tests for allauth emails sent through the task worker.
+"""
+
+import pytest
+from django.core import mail
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from core.models import QueuedTask
+from core.task_queue import run_tasks
+
+
+@pytest.mark.django_db
+class TestAccountEmails:
+    """Integration tests for AccountAdapter.send_mail."""
+
+    def test_password_reset_email_is_sent_by_the_worker(self, settings) -> None:
+        """Verify the reset email is enqueued by the request and sent when the worker runs."""
+        settings.TASKS = {"default": {"BACKEND": "core.task_queue.DatabaseBackend"}}
+        baker.make("accounts.User", email="ana@example.com")
+
+        Client().post(reverse("account_reset_password"), {"email": "ana@example.com"})
+
+        assert mail.outbox == []
+        assert QueuedTask.objects.get().task_path == "core.tasks.send_email"
+
+        run_tasks("default", 10, "worker")
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["ana@example.com"]
+        assert "/accounts/password/reset/key/" in mail.outbox[0].body
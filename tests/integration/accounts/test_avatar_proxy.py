@@ -0,0 +1,143 @@
+"""
+Integration tests for the avatar proxy (accounts.views.avatar).
+"""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from accounts.services.avatar_service import (
+    THUMBNAIL_CONTENT_TYPE,
+    avatar_url,
+    avatar_version,
+    thumbnail_path,
+)
+from tests.stubs import fetched_avatars
+
+PICTURE = "https://lh3.googleusercontent.com/a/picture"
+
+
+@pytest.fixture(autouse=True)
+def avatar_dir(settings, tmp_path: Path) -> Path:
+    """Store thumbnails in a directory of the test's own."""
+    settings.AVATAR_DIR = tmp_path / "avatars"
+    fetched_avatars.clear()
+    return settings.AVATAR_DIR
+
+
+def _user_with_avatar(picture: str) -> User:
+    """A user whose social account has `picture`, not fetched yet."""
+    user = baker.make("accounts.User")
+    account = baker.make(SocialAccount, user=user, provider="google")
+    # update() skips post_save, so nothing is fetched in the background
+    SocialAccount.objects.filter(pk=account.pk).update(extra_data={"picture": picture})
+    fetched_avatars.clear()
+    return user
+
+
+@pytest.mark.django_db
+class TestAvatarProxy:
+    """Integration tests for serving avatar thumbnails."""
+
+    def test_fetches_once_and_serves_an_immutable_thumbnail(self) -> None:
+        """Verify the first request stores the thumbnail and later ones reuse it."""
+        user = _user_with_avatar(PICTURE)
+        client = Client()
+
+        first = client.get(avatar_url(user.pk, PICTURE))
+        second = client.get(avatar_url(user.pk, PICTURE))
+
+        assert first.status_code == second.status_code == HTTPStatus.OK
+        assert first["Content-Type"] == THUMBNAIL_CONTENT_TYPE
+        assert "immutable" in first["Cache-Control"]
+        assert "public" in first["Cache-Control"]
+        assert (
+            b"".join(second.streaming_content)
+            == thumbnail_path(user.pk, avatar_version(PICTURE)).read_bytes()
+        )
+        assert fetched_avatars == [PICTURE]
+
+    def test_stored_thumbnail_is_served_without_queries(self, django_assert_num_queries) -> None:
+        """Verify a stored thumbnail costs no database query."""
+        user = _user_with_avatar(PICTURE)
+        client = Client()
+        client.get(avatar_url(user.pk, PICTURE))
+
+        with django_assert_num_queries(0):
+            response = client.get(avatar_url(user.pk, PICTURE))
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_thumbnail_removed_after_a_check_is_fetched_again(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a thumbnail removed by a concurrent store_avatar is fetched again, not a 500."""
+        user = _user_with_avatar(PICTURE)
+        path = thumbnail_path(user.pk, avatar_version(PICTURE))
+        Client().get(avatar_url(user.pk, PICTURE))
+        path.unlink()
+        # As if it was removed right after an existence check
+        monkeypatch.setattr(Path, "exists", lambda *_args, **_kwargs: True)
+
+        response = Client().get(avatar_url(user.pk, PICTURE))
+
+        assert response.status_code == HTTPStatus.OK
+        assert b"".join(response.streaming_content) == path.read_bytes()
+        assert fetched_avatars == [PICTURE, PICTURE]
+
+    def test_unknown_version_is_not_found(self) -> None:
+        """Verify only the user's current avatar is fetched."""
+        user = _user_with_avatar(PICTURE)
+
+        response = Client().get(
+            reverse("accounts:avatar", kwargs={"user_id": user.pk, "version": "0" * 16})
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert fetched_avatars == []
+
+    def test_provider_failure_redirects_to_the_provider(self) -> None:
+        """Verify browsers are sent to the provider's image when it can't be fetched."""
+        picture = "https://unreachable.example.com/picture"
+        user = _user_with_avatar(picture)
+
+        response = Client().get(avatar_url(user.pk, picture))
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"] == picture
+        assert "no-cache" in response["Cache-Control"]
+
+
+@pytest.mark.django_db
+class TestAvatarRefresh:
+    """Integration tests for refreshing thumbnails when social accounts change."""
+
+    def test_new_picture_is_stored_in_the_background(self) -> None:
+        """Verify saving an account with a new picture stores it and drops the old one."""
+        user = baker.make("accounts.User")
+        account = baker.make(
+            SocialAccount, user=user, provider="google", extra_data={"picture": PICTURE}
+        )
+        old = thumbnail_path(user.pk, avatar_version(PICTURE))
+        assert old.exists()
+
+        account.extra_data = {"picture": f"{PICTURE}-new"}
+        account.save()
+
+        assert not old.exists()
+        assert thumbnail_path(user.pk, avatar_version(f"{PICTURE}-new")).exists()
+        assert fetched_avatars == [PICTURE, f"{PICTURE}-new"]
+
+    def test_unchanged_picture_is_not_fetched_again(self) -> None:
+        """Verify saving an account (as each login does) doesn't refetch a stored avatar."""
+        account = baker.make(SocialAccount, provider="google", extra_data={"picture": PICTURE})
+
+        account.save()
+
+        assert fetched_avatars == [PICTURE]
@@ -0,0 +1,174 @@
+"""
+Integration tests for online database backups and restores.
+"""
+
+import gzip
+import sqlite3
+from contextlib import closing
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from model_bakery import baker
+
+from core.backup import (
+    BackupError,
+    backup_database,
+    list_snapshots,
+    restore_database,
+    verify_snapshot,
+)
+from events.models import Event
+from events.services.event_version_service import (
+    RETIRED_VERSIONS_OFFSET,
+    bump_event_version,
+    get_event_version,
+)
+
+
+def _event_names(snapshot: Path) -> list[str]:
+    with closing(sqlite3.connect(snapshot)) as conn:
+        return [row[0] for row in conn.execute("SELECT name FROM events_event ORDER BY name")]
+
+
+# Backups read through the live connection and restores write to it, so the data
+# must be committed: transactional tests
+@pytest.mark.django_db(transaction=True)
+class TestBackupDatabase:
+    """Tests for backup_database."""
+
+    def test_snapshot_contains_committed_data(self, tmp_path: Path) -> None:
+        """Verify the snapshot is a standalone, healthy copy of the database."""
+        baker.make("events.Event", name="FloripaConf")
+
+        result = backup_database(tmp_path, pages=1, sleep=0)
+
+        assert result.path.parent == tmp_path
+        assert result.steps > 1  # Copied incrementally
+        assert _event_names(result.path) == ["FloripaConf"]
+        with closing(sqlite3.connect(result.path)) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+        verify_snapshot(result.path)
+
+    def test_compressed_snapshot(self, tmp_path: Path) -> None:
+        """Verify --compress produces a gzipped, verifiable snapshot."""
+        baker.make("events.Event")
+
+        result = backup_database(tmp_path, compress=True)
+
+        assert result.path.name.endswith(".sqlite3.gz")
+        with gzip.open(result.path) as f:
+            assert f.read(16) == b"SQLite format 3\x00"
+        verify_snapshot(result.path)
+
+    def test_rotation_keeps_newest(self, tmp_path: Path) -> None:
+        """Verify only the newest `keep` snapshots are kept."""
+        paths = [backup_database(tmp_path, keep=2).path for _ in range(4)]
+
+        assert list_snapshots(tmp_path) == [paths[3], paths[2]]
+        assert list(tmp_path.glob(".*")) == []  # No partial files left behind
+
+    def test_writes_between_steps_are_not_blocked(self, tmp_path: Path) -> None:
+        """Verify the app can write between steps and the snapshot includes those writes."""
+        baker.make("events.Event", _quantity=50)
+        written = []
+
+        def write(_remaining: int, _total: int) -> None:
+            if len(written) < 3:
+                written.append(baker.make("events.Event").name)
+
+        result = backup_database(tmp_path, pages=1, sleep=0, progress=write)
+
+        assert len(written) == 3
+        assert set(written) <= set(_event_names(result.path))
+        assert len(_event_names(result.path)) == 53
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRestoreDatabase:
+    """Tests for restore_database and verification failures."""
+
+    def test_restore_replaces_contents(self, tmp_path: Path) -> None:
+        """Verify a restore brings back the snapshot's rows and drops newer ones."""
+        baker.make("events.Event", name="Before")
+        snapshot = backup_database(tmp_path, compress=True).path
+        Event.objects.all().delete()
+        baker.make("events.Event", name="After")
+
+        restore_database(snapshot)
+
+        assert list(Event.objects.values_list("name", flat=True)) == ["Before"]
+
+    def test_restore_retires_versions_and_cached_validators(self, tmp_path: Path) -> None:
+        """Verify restored events move past every version they had, in every worker's cache."""
+        event = baker.make("events.Event", name="Before")
+        snapshot = backup_database(tmp_path).path
+        for _ in range(3):
+            bump_event_version(event.id)
+        assert get_event_version(event.slug).version == 3
+
+        restore_database(snapshot)
+
+        version = get_event_version(event.slug).version
+        assert version == RETIRED_VERSIONS_OFFSET
+        assert Event.objects.get(pk=event.pk).version == version
+
+    def test_corrupt_snapshot_is_rejected(self, tmp_path: Path) -> None:
+        """Verify a corrupt snapshot is never restored."""
+        baker.make("events.Event", name="Live")
+        snapshot = tmp_path / "floripatalks-20260101T000000000000Z.sqlite3"
+        snapshot.write_bytes(b"SQLite format 3\x00" + b"\x00" * 4096)
+
+        with pytest.raises(BackupError):
+            restore_database(snapshot)
+
+        assert list(Event.objects.values_list("name", flat=True)) == ["Live"]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestBackupCommands:
+    """Tests for the backup_database and restore_database commands."""
+
+    def test_backup_and_verify(self, tmp_path: Path) -> None:
+        """Verify the backup command reports the snapshot and --verify checks it."""
+        out = StringIO()
+
+        call_command("backup_database", "--dir", str(tmp_path), "--compress", stdout=out)
+        call_command("backup_database", "--dir", str(tmp_path), "--verify", stdout=out)
+
+        [snapshot] = list_snapshots(tmp_path)
+        assert f"Backed up to {snapshot}" in out.getvalue()
+        assert f"{snapshot.name}: ok" in out.getvalue()
+
+    def test_verify_fails_on_corrupt_snapshot(self, tmp_path: Path) -> None:
+        """Verify --verify exits with an error when a snapshot is corrupt."""
+        (tmp_path / "floripatalks-20260101T000000000000Z.sqlite3.gz").write_bytes(b"garbage")
+
+        with pytest.raises(CommandError, match="1 of 1 snapshots failed"):
+            call_command("backup_database", "--dir", str(tmp_path), "--verify", stderr=StringIO())
+
+    def test_restore_latest_with_safety_backup(self, tmp_path: Path) -> None:
+        """Verify restore picks the newest snapshot and saves the current database first."""
+        baker.make("events.Event", name="Before")
+        call_command("backup_database", "--dir", str(tmp_path), stdout=StringIO())
+        baker.make("events.Event", name="After")
+        out = StringIO()
+
+        call_command("restore_database", "--dir", str(tmp_path), "--noinput", stdout=out)
+
+        assert list(Event.objects.values_list("name", flat=True)) == ["Before"]
+        newest = list_snapshots(tmp_path)[0]
+        assert _event_names(newest) == ["After", "Before"]
+        assert "Restored" in out.getvalue()
+
+    def test_restore_can_be_cancelled(self, tmp_path: Path, monkeypatch) -> None:
+        """Verify anything but 'yes' cancels the restore."""
+        baker.make("events.Event", name="Before")
+        snapshot = backup_database(tmp_path).path
+        baker.make("events.Event", name="After")
+        monkeypatch.setattr("builtins.input", lambda _prompt: "no")
+
+        call_command("restore_database", str(snapshot), stdout=StringIO())
+
+        assert Event.objects.count() == 2
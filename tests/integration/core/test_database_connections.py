@@ -0,0 +1,126 @@
+"""
+Integration tests for SQLite connection setup and persistence (sqlite_databases).
+"""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from django.db import OperationalError, transaction
+from django.db.backends.signals import connection_created
+from django.db.utils import ConnectionHandler
+
+from core.routers import READ_ONLY_DATABASE
+from floripatalks.settings.base import sqlite_databases
+
+HandlerFactory = Callable[[int], ConnectionHandler]
+
+
+@pytest.fixture
+def make_handler(tmp_path: Path, django_db_blocker) -> Iterator[HandlerFactory]:
+    """Build connections to a SQLite file configured like development/production."""
+    handlers = []
+
+    def make(conn_max_age: int) -> ConnectionHandler:
+        handler = ConnectionHandler(sqlite_databases(tmp_path / "db.sqlite3", conn_max_age))
+        handlers.append(handler)
+        return handler
+
+    with django_db_blocker.unblock():
+        yield make
+        for handler in handlers:
+            handler.close_all()
+
+
+def _pragma(handler: ConnectionHandler, alias: str, name: str) -> object:
+    with handler[alias].cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+def _request_cycle(handler: ConnectionHandler) -> None:
+    """What Django does on request_started/request_finished, plus one query."""
+    connection = handler["default"]
+    connection.close_if_unusable_or_obsolete()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    connection.close_if_unusable_or_obsolete()
+
+
+class TestConnectionSetup:
+    """Tests for the per-connection pragmas."""
+
+    def test_writer_pragmas(self, make_handler: HandlerFactory) -> None:
+        """Verify the writer runs in WAL mode with the tuned pragmas."""
+        handler = make_handler(0)
+
+        assert _pragma(handler, "default", "journal_mode") == "wal"
+        assert _pragma(handler, "default", "synchronous") == 1  # NORMAL
+        assert _pragma(handler, "default", "temp_store") == 2  # MEMORY
+        assert _pragma(handler, "default", "cache_size") == -16000
+
+    def test_reader_pragmas(self, make_handler: HandlerFactory) -> None:
+        """Verify the read-only alias gets the same tuning plus query_only."""
+        handler = make_handler(0)
+        _pragma(handler, "default", "journal_mode")  # Create the file
+
+        assert _pragma(handler, READ_ONLY_DATABASE, "query_only") == 1
+        assert _pragma(handler, READ_ONLY_DATABASE, "cache_size") == -16000
+
+    def test_writer_transactions_lock_up_front(
+        self, make_handler: HandlerFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify a write transaction holds the write lock before its first write."""
+        first, second = make_handler(0), make_handler(0)
+        # Fail fast instead of waiting 5s for the lock
+        second["default"].settings_dict["OPTIONS"]["timeout"] = 0.1
+        with first["default"].cursor() as cursor:
+            cursor.execute("CREATE TABLE suggestion (id INTEGER)")
+        monkeypatch.setattr(transaction, "connections", first)
+
+        with transaction.atomic():
+            _pragma(first, "default", "user_version")  # Only a read so far
+            with (
+                pytest.raises(OperationalError, match="locked"),
+                second["default"].cursor() as cursor,
+            ):
+                cursor.execute("INSERT INTO suggestion VALUES (1)")
+
+
+class TestPersistentConnections:
+    """Tests for reusing connections across requests."""
+
+    @pytest.fixture
+    def opened(self) -> Iterator[list[str]]:
+        """Aliases of the connections opened while the test runs."""
+        opened = []
+
+        def record(connection: object, **_kwargs: object) -> None:
+            opened.append(connection.alias)
+
+        connection_created.connect(record)
+        yield opened
+        connection_created.disconnect(record)
+
+    def test_persistent_connection_is_set_up_once(
+        self, make_handler: HandlerFactory, opened: list[str]
+    ) -> None:
+        """Verify CONN_MAX_AGE reuses one connection (and its setup) across requests."""
+        handler = make_handler(600)
+
+        for _ in range(5):
+            _request_cycle(handler)
+
+        assert opened == ["default"]
+        assert handler["default"].health_check_enabled
+
+    def test_without_persistence_each_request_connects(
+        self, make_handler: HandlerFactory, opened: list[str]
+    ) -> None:
+        """Verify CONN_MAX_AGE=0 connects (and re-runs the setup) on every request."""
+        handler = make_handler(0)
+
+        for _ in range(5):
+            _request_cycle(handler)
+
+        assert opened == ["default"] * 5
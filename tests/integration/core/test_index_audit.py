@@ -0,0 +1,114 @@
+"""
+Integration tests for the redundant index audit.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from core.index_audit import find_redundant_indexes, table_indexes
+
+
+def _findings(app_label: str) -> dict[str, tuple[str, str]]:
+    return {
+        finding.index.name: (finding.reason, finding.covered_by.name)
+        for finding in find_redundant_indexes([app_label])
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestFindRedundantIndexes:
+    """Tests for find_redundant_indexes."""
+
+    def test_events_schema_is_clean(self) -> None:
+        """Verify the events app declares no redundant indexes."""
+        assert _findings("events") == {}
+
+    def test_prefix_of_unique_index(self) -> None:
+        """Verify a non-unique index on the leading column of a unique one is reported."""
+        unique = next(
+            index.name
+            for index in table_indexes("events_vote")
+            if index.columns == ("topic_id", "user_id") and index.unique
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE INDEX "zz_vote_topic" ON "events_vote" ("topic_id")')
+
+        assert _findings("events") == {"zz_vote_topic": ("is a prefix of", unique)}
+
+    def test_sources_name_model_declarations(self) -> None:
+        """Verify each finding says which declaration created the index."""
+        findings = {
+            finding.index.table: (finding.index.source, finding.covered_by.source)
+            for finding in find_redundant_indexes(["auth"])
+        }
+
+        assert findings["auth_permission"] == (
+            "Permission.content_type (ForeignKey)",
+            "Permission.Meta.unique_together",
+        )
+
+    def test_partial_indexes_only_compare_with_same_condition(self) -> None:
+        """Verify a partial index isn't made redundant by a full one, nor vice versa."""
+        reported = {finding.index.name for finding in find_redundant_indexes(["events"])}
+
+        assert "events_topic_live_event_idx" not in reported
+        assert not any(name.startswith("events_topic_event_id") for name in reported)
+
+    def test_exact_duplicate_keeps_one(self) -> None:
+        """Verify only one of two identical non-unique indexes is reported."""
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE INDEX "zz_event_name_a" ON "events_event" ("name")')
+            cursor.execute('CREATE INDEX "zz_event_name_b" ON "events_event" ("name")')
+
+        findings = [
+            f for f in find_redundant_indexes(["events"]) if f.index.table == "events_event"
+        ]
+
+        assert [(f.index.name, f.reason, f.covered_by.name) for f in findings] == [
+            ("zz_event_name_b", "duplicates", "zz_event_name_a")
+        ]
+        assert findings[0].index.source == "not declared by a model"
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestAuditIndexesCommand:
+    """Tests for the audit_indexes management command."""
+
+    def test_project_apps_are_clean(self) -> None:
+        """Verify the default run covers project apps only, and they pass --check."""
+        out = StringIO()
+
+        call_command("audit_indexes", "--check", stdout=out)
+
+        assert "No redundant indexes" in out.getvalue()
+
+    def test_all_includes_third_party_apps(self) -> None:
+        """Verify --all also audits contrib and third-party tables."""
+        out = StringIO()
+
+        call_command("audit_indexes", "--all", stdout=out)
+
+        assert "auth_permission" in out.getvalue()
+
+    def test_check_fails_on_findings(self) -> None:
+        """Verify --check turns findings into a command error."""
+        with pytest.raises(CommandError, match="3 redundant index"):
+            call_command("audit_indexes", "--all", "--check", stdout=StringIO())
+
+    def test_clean_app(self) -> None:
+        """Verify an app without redundant indexes reports none."""
+        out = StringIO()
+
+        call_command("audit_indexes", "accounts", "--check", stdout=out)
+
+        assert "No redundant indexes" in out.getvalue()
+
+    def test_unknown_app(self) -> None:
+        """Verify an unknown app label is a command error."""
+        with pytest.raises(CommandError):
+            call_command("audit_indexes", "nope", stdout=StringIO())
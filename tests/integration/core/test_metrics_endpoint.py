@@ -0,0 +1,126 @@
+"""
+Integration tests for the metrics middleware and the /metrics endpoint.
+"""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from core import metrics
+from core.metrics import MetricsStore
+from events.services.vote_service import vote_topic
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> MetricsStore:
+    """Install a fresh process store writing to a temporary directory."""
+    store = MetricsStore(tmp_path, flush_interval=0)
+    monkeypatch.setattr(metrics, "_store", store)
+    return store
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    """Tests for /metrics access and content."""
+
+    def test_anonymous_is_forbidden(self, client: Client) -> None:
+        """Verify /metrics is not public."""
+        assert client.get(reverse("metrics")).status_code == HTTPStatus.FORBIDDEN
+
+    def test_staff_can_read(self, client: Client, sample_superuser) -> None:
+        """Verify staff users can read the metrics."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("metrics"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+    def test_bearer_token(self, client: Client, settings) -> None:
+        """Verify scrapers can authenticate with METRICS_TOKEN, and only with the right one."""
+        settings.METRICS_TOKEN = "s3cret"
+        url = reverse("metrics")
+
+        assert client.get(url, HTTP_AUTHORIZATION="Bearer s3cret").status_code == HTTPStatus.OK
+        assert client.get(url, HTTP_AUTHORIZATION="Bearer nope").status_code == (
+            HTTPStatus.FORBIDDEN
+        )
+
+    def test_token_auth_disabled_without_token(self, client: Client, settings) -> None:
+        """Verify an empty Bearer token doesn't match an unset METRICS_TOKEN."""
+        settings.METRICS_TOKEN = None
+
+        response = client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer ")
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestMetricsMiddleware:
+    """Tests for per-URL-name request metrics."""
+
+    def test_records_requests_by_url_name(self, client: Client, store: MetricsStore) -> None:
+        """Verify status, latency, SQL and size are recorded under the resolved URL name."""
+        event = baker.make("events.Event", slug="test-event")
+        baker.make("events.Topic", event=event, _quantity=2)
+
+        client.get(reverse("events:event_detail", kwargs={"slug": "test-event"}))
+
+        counters, histograms = store.collect()
+        view = (("view", "events:event_detail"),)
+        requests = (
+            "floripatalks_http_requests_total",
+            (("method", "GET"), ("status", "200"), *view),
+        )
+        assert counters[requests] == 1
+        assert histograms[("floripatalks_http_request_duration_seconds", view)][-1] == 1
+        assert histograms[("floripatalks_db_queries_per_request", view)][-2] >= 2
+        assert histograms[("floripatalks_http_response_size_bytes", view)][-2] > 0
+        assert counters[("floripatalks_db_query_duration_seconds_total", view)] > 0
+
+    def test_streamed_response_is_recorded_once_sent(
+        self, client: Client, settings, store: MetricsStore
+    ) -> None:
+        """Verify a streamed page is recorded with its full size and the queries made streaming."""
+        settings.EVENT_PAGE_STREAMING = True
+        event = baker.make("events.Event", slug="test-event")
+        baker.make("events.Topic", event=event, _quantity=2)
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": "test-event"}))
+        view = (("view", "events:event_detail"),)
+        _, histograms = store.collect()
+        assert ("floripatalks_http_request_duration_seconds", view) not in histograms
+
+        size = len(b"".join(response.streaming_content))
+
+        _, histograms = store.collect()
+        assert histograms[("floripatalks_http_request_duration_seconds", view)][-1] == 1
+        assert histograms[("floripatalks_http_response_size_bytes", view)][-2] == size
+        # The event, the topics and their prefetches
+        assert histograms[("floripatalks_db_queries_per_request", view)][-2] >= 3
+
+    def test_unresolved_urls_share_one_label(self, client: Client, store: MetricsStore) -> None:
+        """Verify 404s for unknown paths don't create a label per path."""
+        client.get("/no/such/page/")
+        client.get("/another/missing/")
+
+        counters, _ = store.collect()
+        key = (
+            "floripatalks_http_requests_total",
+            (("method", "GET"), ("status", "404"), ("view", "unresolved")),
+        )
+        assert counters[key] == 2
+
+    def test_vote_counter(self, store: MetricsStore) -> None:
+        """Verify created votes are counted by vote_service."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+
+        vote_topic(topic_slug=topic.slug, user=user)
+        vote_topic(topic_slug=topic.slug, user=user)
+
+        assert store.collect()[0][("floripatalks_votes_created_total", ())] == 1
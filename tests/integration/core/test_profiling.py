@@ -0,0 +1,151 @@
+"""
+Integration tests for on-demand request profiling and its admin pages.
+"""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from model_bakery import baker
+
+from core.profiling import list_reports
+
+
+@pytest.fixture(autouse=True)
+def profiling_dir(tmp_path: Path, settings) -> Path:
+    """Store reports in a temporary directory."""
+    settings.PROFILING_DIR = tmp_path
+    return tmp_path
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """Tests for activating profiling on a request."""
+
+    @pytest.fixture
+    def url(self) -> str:
+        """Event page with a few topics."""
+        event = baker.make("events.Event", slug="test-event")
+        baker.make("events.Topic", event=event, _quantity=3)
+        return reverse("events:event_detail", kwargs={"slug": "test-event"})
+
+    def test_staff_request_is_profiled(self, client: Client, sample_superuser, url: str) -> None:
+        """Verify ?_profile=1 stores a report split by layer and links it in a header."""
+        client.force_login(sample_superuser)
+
+        response = client.get(url, {"_profile": "1"})
+
+        assert response.status_code == HTTPStatus.OK
+        [report] = list_reports()
+        assert response["X-Profile-Report"] == reverse(
+            "profile_report_detail", kwargs={"report_id": report.id}
+        )
+        assert report.view_name == "events:event_detail"
+        assert report.sql_count >= 3
+        for layer in ("events.views", "events.use_cases", "events.services", "templates"):
+            assert report.layers[layer] > 0, layer
+
+    def test_streamed_page_is_profiled_to_the_end(
+        self, client: Client, sample_superuser, url: str, settings
+    ) -> None:
+        """Verify the queries and rendering done while a page streams are in its report."""
+        settings.EVENT_PAGE_STREAMING = True
+        client.force_login(sample_superuser)
+
+        response = client.get(url, {"_profile": "1"})
+
+        assert b"".join(response.streaming_content).count(b'class="topic-item"') == 3
+        [report] = list_reports()
+        assert report.sql_count >= 3
+        for layer in ("events.use_cases", "events.services", "templates"):
+            assert report.layers[layer] > 0, layer
+
+    def test_async_request_is_profiled_in_one_thread(
+        self, async_client: AsyncClient, sample_superuser, url: str
+    ) -> None:
+        """Verify under ASGI the sync views are brought back to the profiled thread."""
+        async_client.force_login(sample_superuser)
+
+        response = async_to_sync(async_client.get)(url, {"_profile": "1"})
+
+        assert response.status_code == HTTPStatus.OK
+        [report] = list_reports()
+        assert response["X-Profile-Report"].endswith(f"{report.id}/")
+        assert report.sql_count >= 3
+        for layer in ("events.views", "events.services", "templates"):
+            assert report.layers[layer] > 0, layer
+
+    def test_header_activates_profiling(self, client: Client, sample_superuser, url: str) -> None:
+        """Verify the X-Profile header works like the query parameter."""
+        client.force_login(sample_superuser)
+
+        client.get(url, HTTP_X_PROFILE="1")
+
+        assert len(list_reports()) == 1
+
+    def test_profile_report_redirects_to_report(
+        self, client: Client, sample_superuser, url: str
+    ) -> None:
+        """Verify ?_profile=report redirects to the stored report."""
+        client.force_login(sample_superuser)
+
+        response = client.get(url, {"_profile": "report"})
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert response["Location"].startswith("/admin/profiling/")
+
+    def test_non_staff_is_never_profiled(self, client: Client, sample_user, url: str) -> None:
+        """Verify regular and anonymous users can't trigger profiling."""
+        client.get(url, {"_profile": "1"})
+        client.force_login(sample_user)
+        response = client.get(url, {"_profile": "1"})
+
+        assert "X-Profile-Report" not in response
+        assert list_reports() == []
+
+
+@pytest.mark.django_db
+class TestProfilingAdmin:
+    """Tests for browsing reports in the admin."""
+
+    def test_list_and_detail(self, client: Client, sample_superuser) -> None:
+        """Verify staff can browse stored reports."""
+        client.force_login(sample_superuser)
+        client.get(reverse("home"), {"_profile": "1"})
+        [report] = list_reports()
+
+        listing = client.get(reverse("profile_report_list"))
+        detail = client.get(reverse("profile_report_detail", kwargs={"report_id": report.id}))
+
+        assert listing.status_code == HTTPStatus.OK
+        assert report.id in listing.content.decode()
+        assert detail.status_code == HTTPStatus.OK
+        assert "events.views" in detail.content.decode()
+
+    def test_admin_pages_require_staff(self, client: Client, sample_user) -> None:
+        """Verify non-staff users are sent to the admin login."""
+        client.force_login(sample_user)
+
+        response = client.get(reverse("profile_report_list"))
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert "/admin/login/" in response["Location"]
+
+    def test_unknown_report_404(self, client: Client, sample_superuser) -> None:
+        """Verify rotated-out reports return 404."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("profile_report_detail", kwargs={"report_id": "gone"}))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_admin_index_links_to_reports(self, client: Client, sample_superuser) -> None:
+        """Verify the admin index links to the reports."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("admin:index"))
+
+        assert reverse("profile_report_list") in response.content.decode()
@@ -0,0 +1,123 @@
+"""
+Integration tests for routing GET traffic to the read-only SQLite connection.
+"""
+
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.db import OperationalError, connections
+from django.db.utils import ConnectionHandler
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from core.routers import READ_ONLY_DATABASE
+from floripatalks.settings.base import sqlite_databases
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", READ_ONLY_DATABASE])
+class TestReadOnlyDatabaseMiddleware:
+    """Tests for which connection a request's queries use."""
+
+    @pytest.fixture
+    def event(self) -> object:
+        """Event with a few topics."""
+        event = baker.make("events.Event", slug="test-event")
+        baker.make("events.Topic", event=event, _quantity=3)
+        return event
+
+    @pytest.mark.usefixtures("event")
+    @pytest.mark.parametrize(
+        "url",
+        [
+            reverse("home"),
+            reverse("events:event_detail", kwargs={"slug": "test-event"}),
+            reverse("events:load_more_topics", kwargs={"slug": "test-event"}),
+        ],
+    )
+    def test_get_reads_use_read_only_alias(self, client: Client, sample_user, url: str) -> None:
+        """Verify listing pages read from the read-only connection."""
+        client.force_login(sample_user)
+
+        with (
+            CaptureQueriesContext(connections["default"]) as writer,
+            CaptureQueriesContext(connections[READ_ONLY_DATABASE]) as reader,
+        ):
+            response = client.get(url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(reader) > 0
+        assert [q["sql"] for q in writer] == []
+
+    def test_post_uses_writer(self, client: Client, sample_user, event) -> None:
+        """Verify a vote (reads and writes) runs on the writer only."""
+        topic = event.topics.first()
+        client.force_login(sample_user)
+
+        with CaptureQueriesContext(connections[READ_ONLY_DATABASE]) as reader:
+            response = client.post(
+                reverse("events:vote_topic", kwargs={"slug": topic.slug}), HTTP_HX_REQUEST="true"
+            )
+
+        assert response.status_code == HTTPStatus.OK
+        assert len(reader) == 0
+        assert topic.votes.count() == 1
+
+
+@pytest.fixture
+def file_connections(tmp_path: Path, django_db_blocker) -> Iterator[ConnectionHandler]:
+    """Writer and read-only connections on one SQLite file, configured like production."""
+    databases = sqlite_databases(tmp_path / "db.sqlite3")
+    # Fail fast instead of waiting 5s if a read ever blocks
+    databases[READ_ONLY_DATABASE]["OPTIONS"]["timeout"] = 0.1
+    handler = ConnectionHandler(databases)
+    with django_db_blocker.unblock():
+        with handler["default"].cursor() as cursor:
+            cursor.execute("CREATE TABLE topic (title TEXT)")
+            cursor.execute("INSERT INTO topic VALUES ('committed')")
+        yield handler
+        handler.close_all()
+
+
+class TestReadOnlyConnection:
+    """Tests for the read-only SQLite connection settings."""
+
+    def test_reads_continue_during_long_write_transaction(
+        self, file_connections: ConnectionHandler
+    ) -> None:
+        """Verify reads neither block nor see uncommitted rows while a write is open."""
+        writer = file_connections["default"]
+        reader = file_connections[READ_ONLY_DATABASE]
+
+        writer.set_autocommit(False)
+        with writer.cursor() as cursor:
+            cursor.execute("INSERT INTO topic VALUES ('pending')")
+        try:
+            for _ in range(10):
+                with reader.cursor() as cursor:
+                    cursor.execute("SELECT title FROM topic")
+                    assert cursor.fetchall() == [("committed",)]
+            writer.commit()
+        finally:
+            writer.set_autocommit(True)
+
+        with reader.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM topic")
+            assert cursor.fetchone() == (2,)
+
+    def test_rejects_writes(self, file_connections: ConnectionHandler) -> None:
+        """Verify the read-only connection can't write."""
+        with (
+            pytest.raises(OperationalError, match="readonly"),
+            file_connections[READ_ONLY_DATABASE].cursor() as cursor,
+        ):
+            cursor.execute("INSERT INTO topic VALUES ('nope')")
+
+    def test_query_only_is_set(self, file_connections: ConnectionHandler) -> None:
+        """Verify query_only is on, guarding even if the URI mode is lost."""
+        with file_connections[READ_ONLY_DATABASE].cursor() as cursor:
+            cursor.execute("PRAGMA query_only")
+            assert cursor.fetchone() == (1,)
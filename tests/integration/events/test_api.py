@@ -0,0 +1,282 @@
+"""
+Integration tests for the read-only JSON API.
+
+These tests verify:
+- Events and topics are listed page by page with cursors
+- Field selection trims the objects
+- Unchanged lists are answered with 304, and changes invalidate the ETag
+- Topic lists are streamed, and an event's topics can be exported in one request
+- Invalid parameters and unknown events or topics are reported as JSON errors
+"""
+
+import json
+from collections.abc import Iterator
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from asgiref.local import Local
+from django.apps import apps
+from django.db import connection, connections
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events import api_views
+from events.models import Event, Topic
+from events.services.event_service import close_voting
+from events.services.vote_service import vote_topic
+from floripatalks.settings.base import sqlite_databases
+
+
+def _json(response: HttpResponse) -> dict:
+    """Decode a (possibly streamed) JSON response."""
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db
+class TestEventListApi:
+    """Integration tests for the event list endpoint."""
+
+    @pytest.fixture
+    def url(self) -> str:
+        return reverse("events:api_event_list")
+
+    def test_pages_through_events(self, client: Client, url: str) -> None:
+        """Verify events are listed by slug, page by page."""
+        for slug in ("python-floripa", "django-floripa", "js-floripa"):
+            baker.make("events.Event", slug=slug)
+
+        first = _json(client.get(url, {"limit": 2}))
+        second = _json(client.get(url, {"limit": 2, "cursor": first["next_cursor"]}))
+
+        assert [event["slug"] for event in first["data"]] == ["django-floripa", "js-floripa"]
+        assert [event["slug"] for event in second["data"]] == ["python-floripa"]
+        assert second["next_cursor"] is None
+
+    def test_selects_fields(self, client: Client, url: str) -> None:
+        """Verify `fields` trims the events to the fields asked for."""
+        baker.make("events.Event", slug="python-floripa", name="Python Floripa")
+
+        data = _json(client.get(url, {"fields": "name,slug"}))["data"]
+
+        assert data == [{"name": "Python Floripa", "slug": "python-floripa"}]
+
+    def test_new_event_changes_etag(self, client: Client, url: str) -> None:
+        """Verify an unchanged list is a 304, and adding an event changes its ETag."""
+        baker.make("events.Event")
+        etag = client.get(url)["ETag"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == HTTPStatus.NOT_MODIFIED
+
+        baker.make("events.Event")
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == HTTPStatus.OK
+
+
+@pytest.mark.django_db
+class TestTopicListApi:
+    """Integration tests for the topic list endpoint."""
+
+    @pytest.fixture
+    def event(self, sample_user: User) -> Event:
+        """Create test event with five topics, 0 to 4 votes."""
+        event = baker.make("events.Event", slug="python-floripa")
+        for votes in range(5):
+            baker.make(
+                "events.Topic",
+                event=event,
+                creator=sample_user,
+                title=f"T{votes}",
+                vote_count=votes,
+            )
+        return event
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        return reverse("events:api_topic_list", kwargs={"slug": event.slug})
+
+    def test_lists_topics_with_vote_counts(self, client: Client, url: str) -> None:
+        """Verify topics are streamed, most voted first, with their vote counts."""
+        response = client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming
+        assert response["Content-Type"] == "application/json"
+        body = _json(response)
+        assert body["sort"] == "top"
+        assert [topic["vote_count"] for topic in body["data"]] == [4, 3, 2, 1, 0]
+        assert body["next_cursor"] is None
+        assert "has_voted" not in body["data"][0]
+
+    def test_pages_through_topics(self, client: Client, url: str) -> None:
+        """Verify the cursor continues where the previous page stopped, in the same mode."""
+        first = _json(client.get(url, {"sort": "oldest", "limit": 3, "fields": "title"}))
+        second = _json(
+            client.get(
+                url,
+                {"sort": "oldest", "limit": 3, "fields": "title", "cursor": first["next_cursor"]},
+            )
+        )
+
+        assert first["data"] == [{"title": "T0"}, {"title": "T1"}, {"title": "T2"}]
+        assert second["data"] == [{"title": "T3"}, {"title": "T4"}]
+        assert second["next_cursor"] is None
+
+    def test_exports_event_in_batches(self, client: Client, url: str) -> None:
+        """Verify a large limit is read in batches while the response streams."""
+        response = client.get(url, {"limit": 1000, "fields": "slug"})
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(response.streaming_content)
+
+        assert len(json.loads(b"".join(chunks))["data"]) == 5
+        # The first batch is read before the response starts (then only its transaction ends)
+        assert not [q for q in queries.captured_queries if "SAVEPOINT" not in q["sql"]]
+
+    def test_closed_event_is_listed_by_final_ranking(
+        self, client: Client, event: Event, url: str
+    ) -> None:
+        """Verify a closed event is listed by its ranking and kept by clients."""
+        close_voting(event.slug)
+
+        response = client.get(url, {"sort": "newest"})
+
+        assert _json(response)["sort"] == "ranking"
+        assert "max-age" in response["Cache-Control"]
+
+    def test_vote_changes_etag(
+        self, client: Client, sample_user: User, event: Event, url: str
+    ) -> None:
+        """Verify an unchanged list is a 304 without topic queries, and a vote changes its ETag."""
+        response = client.get(url)
+        response.close()
+        etag = response["ETag"]
+        assert "no-cache" in response["Cache-Control"]
+        assert "public" in response["Cache-Control"]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert not any("events_topic" in query["sql"] for query in queries.captured_queries)
+
+        vote_topic(Topic.objects.filter(event=event).first().slug, sample_user)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        response.close()
+        assert response.status_code == HTTPStatus.OK
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"cursor": "not-a-cursor"},
+            {"sort": "mine"},
+            {"limit": "0"},
+            {"limit": "1001"},
+            {"fields": "title,secret"},
+        ],
+    )
+    def test_rejects_invalid_parameters(
+        self, client: Client, url: str, params: dict[str, str]
+    ) -> None:
+        """Verify invalid parameters are a 400 with a JSON error."""
+        response = client.get(url, params)
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert _json(response)["error"]
+
+    def test_unknown_event(self, client: Client) -> None:
+        """Verify an unknown event is a 404 with a JSON error."""
+        response = client.get(reverse("events:api_topic_list", kwargs={"slug": "unknown"}))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert _json(response)["error"]
+
+
+@pytest.mark.django_db
+class TestTopicDetailApi:
+    """Integration tests for the topic detail endpoint."""
+
+    @pytest.fixture
+    def topic(self) -> Topic:
+        event = baker.make("events.Event", slug="python-floripa")
+        return baker.make("events.Topic", event=event, title="Django", vote_count=3)
+
+    def test_shows_topic(self, client: Client, topic: Topic) -> None:
+        """Verify the topic is shown with the fields asked for."""
+        url = reverse(
+            "events:api_topic_detail", kwargs={"slug": "python-floripa", "topic_slug": topic.slug}
+        )
+
+        response = client.get(url, {"fields": "title,vote_count"})
+
+        assert response.status_code == HTTPStatus.OK
+        assert _json(response) == {"data": {"title": "Django", "vote_count": 3}}
+        assert response["ETag"]
+
+    @pytest.mark.parametrize("event_slug", ["python-floripa", "other-event", "unknown"])
+    def test_topic_of_another_or_unknown_event(
+        self, client: Client, topic: Topic, event_slug: str
+    ) -> None:
+        """Verify a topic is only found under its own event."""
+        baker.make("events.Event", slug="other-event")
+        baker.make("events.Topic", event=topic.event, slug="deleted", is_deleted=True)
+        topic_slug = "deleted" if event_slug == "python-floripa" else topic.slug
+        url = reverse(
+            "events:api_topic_detail", kwargs={"slug": event_slug, "topic_slug": topic_slug}
+        )
+
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.fixture
+def file_databases(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, django_db_blocker
+) -> Iterator[None]:
+    """
+    Swap the test databases for a SQLite file in WAL mode with its read-only
+    alias, configured like production: the in-memory test databases share
+    their cache, whose table locks would block a write during a read.
+    """
+    databases = sqlite_databases(tmp_path / "db.sqlite3")
+    monkeypatch.setattr(connections, "settings", connections.configure_settings(databases))
+    monkeypatch.setattr(connections, "_connections", Local(connections.thread_critical))
+    with django_db_blocker.unblock():
+        with connections["default"].schema_editor() as editor:
+            for model in apps.get_models():
+                if model._meta.managed and not model._meta.proxy:
+                    editor.create_model(model)
+        try:
+            yield
+        finally:
+            connections.close_all()
+
+
+@pytest.mark.usefixtures("file_databases")
+class TestTopicExportConsistency:
+    """Integration tests for exports streamed while votes are cast."""
+
+    def test_votes_between_batches_neither_skip_nor_repeat_topics(
+        self, client: Client, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verify every batch reads the same snapshot, whatever is voted meanwhile."""
+        monkeypatch.setattr(api_views, "TOPICS_BATCH_SIZE", 2)
+        event = baker.make("events.Event", slug="python-floripa")
+        topics = [
+            baker.make("events.Topic", event=event, title=f"T{votes}", vote_count=votes)
+            for votes in range(6)
+        ]
+        url = reverse("events:api_topic_list", kwargs={"slug": event.slug})
+
+        # The first batch (T5, T4) is read before the response starts
+        response = client.get(url, {"limit": 1000, "fields": "title"})
+        # The next batch starts after T4: voting T3 past T4 would skip it
+        for voter in baker.make("accounts.User", _quantity=3):
+            vote_topic(topics[3].slug, voter)
+
+        titles = [topic["title"] for topic in _json(response)["data"]]
+
+        assert titles == ["T5", "T4", "T3", "T2", "T1", "T0"]
+        assert Topic.objects.get(pk=topics[3].pk).vote_count == 6
@@ -0,0 +1,156 @@
+"""
+Integration tests for events whose voting is closed.
+
+These tests verify:
+- The event page shows the final ranking, without vote, topic or sort controls
+- Closed event pages and fragments are cacheable for EVENT_CLOSED_MAX_AGE
+- The vote endpoint is gone and topic changes are forbidden
+- Voting can be closed from the admin
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event, Topic, Vote
+from events.services.event_service import close_voting, reopen_voting
+
+
+@pytest.mark.django_db
+class TestClosedEvent:
+    """Integration tests for the pages and endpoints of closed events."""
+
+    @pytest.fixture
+    def user(self) -> User:
+        """Create a user who created and voted on a topic."""
+        return baker.make("accounts.User", username="voter")
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create an event to close."""
+        return baker.make("events.Event", slug="encerrado", name="Evento Encerrado")
+
+    @pytest.fixture
+    def topic(self, event: Event, user: User) -> Topic:
+        """Create a voted topic and close the event's voting."""
+        topic = baker.make("events.Topic", event=event, creator=user, title="Vencedor")
+        baker.make("events.Vote", topic=topic, user=user)
+        Topic.objects.filter(pk=topic.pk).update(vote_count=1)
+        close_voting(event.slug)
+        return topic
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        """Event page URL."""
+        return reverse("events:event_detail", kwargs={"slug": event.slug})
+
+    @pytest.mark.usefixtures("topic")
+    def test_page_shows_final_ranking_without_controls(
+        self, client: Client, user: User, url: str
+    ) -> None:
+        """Verify the topics are shown read-only, without forms or sort modes."""
+        client.force_login(user)
+
+        content = client.get(url).content.decode()
+
+        assert "A votação deste evento foi encerrada" in content
+        assert "Vencedor" in content
+        assert 'class="vote-plus-button' not in content
+        assert "topic-action-edit" not in content
+        assert 'id="inline-topic-form-container"' not in content
+        assert 'class="topic-sort"' not in content
+
+    @pytest.mark.usefixtures("topic")
+    def test_page_is_cacheable(self, client: Client, url: str, settings) -> None:
+        """Verify closed pages and their 304s get a private max-age instead of no-cache."""
+        settings.EVENT_CLOSED_MAX_AGE = 600
+        client.get(reverse("home"))  # Hold a CSRF cookie, like a returning browser
+
+        response = client.get(url)
+        revalidated = client.get(url, HTTP_IF_NONE_MATCH=response.headers["ETag"])
+
+        for cached in (response, revalidated):
+            cache_control = cached.headers["Cache-Control"]
+            assert "max-age=600" in cache_control
+            assert "private" in cache_control
+            assert "no-cache" not in cache_control
+        assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_reopened_page_is_no_cache_again(self, client: Client, url: str, topic: Topic) -> None:
+        """Verify reopening voting restores the revalidate-every-time policy."""
+        reopen_voting(topic.event.slug)
+
+        response = client.get(url)
+
+        assert "no-cache" in response.headers["Cache-Control"]
+        assert b"vote-plus-button" in response.content
+
+    def test_vote_endpoint_is_gone(self, client: Client, user: User, topic: Topic) -> None:
+        """Verify the vote endpoint is a 404 and the vote is kept."""
+        client.force_login(user)
+
+        response = client.post(
+            reverse("events:vote_topic", kwargs={"slug": topic.slug}), HTTP_HX_REQUEST="true"
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert Vote.objects.filter(topic=topic, user=user).exists()
+
+    def test_topic_changes_are_forbidden(self, client: Client, user: User, topic: Topic) -> None:
+        """Verify creating, editing and deleting topics of a closed event is refused."""
+        client.force_login(user)
+
+        create = client.post(
+            reverse("events:create_topic"),
+            {"event": topic.event.slug, "title": "Novo"},
+            HTTP_HX_REQUEST="true",
+        )
+        edit = client.post(
+            reverse("events:edit_topic", kwargs={"slug": topic.slug}),
+            {"title": "Editado"},
+            HTTP_HX_REQUEST="true",
+        )
+        delete = client.post(
+            reverse("events:delete_topic", kwargs={"slug": topic.slug}), HTTP_HX_REQUEST="true"
+        )
+
+        assert [r.status_code for r in (create, edit, delete)] == [HTTPStatus.FORBIDDEN] * 3
+        topic.refresh_from_db()
+        assert (topic.title, topic.is_deleted) == ("Vencedor", False)
+        assert Topic.objects.filter(event=topic.event).count() == 1
+
+    def test_load_more_continues_the_ranking(self, client: Client, event: Event) -> None:
+        """Verify the infinite scroll fragment pages through the final ranking."""
+        baker.make("events.Topic", event=event, _quantity=25)
+        close_voting(event.slug)
+        first = client.get(reverse("events:event_detail", kwargs={"slug": event.slug}))
+        assert b"sort=ranking" in first.content
+
+        page = first.context["page"]
+        response = client.get(
+            reverse("events:load_more_topics", kwargs={"slug": event.slug}),
+            {"sort": page.sort, "cursor": page.next_cursor},
+            HTTP_HX_REQUEST="true",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        ranking = Topic.objects.filter(event=event).order_by("final_rank")
+        expected = list(ranking.values_list("slug", flat=True)[20:])
+        assert [dto.slug for dto in response.context["topics"]] == expected
+
+    def test_close_from_admin(self, client: Client, event: Event, sample_superuser: User) -> None:
+        """Verify the admin action closes the selected events."""
+        client.force_login(sample_superuser)
+
+        response = client.post(
+            reverse("admin:events_event_changelist"),
+            {"action": "close_events", "_selected_action": [str(event.pk)]},
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
+        event.refresh_from_db()
+        assert event.is_closed
@@ -0,0 +1,184 @@
+"""
+Integration tests for topic comments.
+
+These tests verify the full request/response cycle including:
+- Lazy HTMX loading of comments with cursor pagination
+- Comment creation and deletion with the denormalized count
+- Topic listing cost independent of comment volume
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Comment, Event, Topic
+from events.services.comment_service import create_comment
+
+
+@pytest.mark.django_db
+class TestCommentsFlow:
+    """Integration tests for comments on topics."""
+
+    @pytest.fixture
+    def client(self) -> Client:
+        """Create Django test client."""
+        return Client()
+
+    @pytest.fixture
+    def user(self) -> User:
+        """Create test user."""
+        return baker.make("accounts.User", username="testuser")
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="test-event", name="Test Event")
+
+    @pytest.fixture
+    def topic(self, event: Event, user: User) -> Topic:
+        """Create test topic."""
+        return baker.make("events.Topic", event=event, creator=user, title="Test Topic")
+
+    def test_topic_card_shows_count_without_comments(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify the listing shows the count and a lazy loader, not the comments."""
+        create_comment(topic_slug=topic.slug, user=user, content="Comentário escondido")
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": "test-event"}))
+
+        content = response.content.decode()
+        assert "1 comentário" in content
+        assert reverse("events:topic_comments", kwargs={"slug": topic.slug}) in content
+        assert "Comentário escondido" not in content
+
+    def test_comments_endpoint_requires_htmx(self, client: Client, topic: Topic) -> None:
+        """Verify the comments endpoint returns 404 for non-HTMX requests."""
+        url = reverse("events:topic_comments", kwargs={"slug": topic.slug})
+
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+    def test_comments_endpoint_paginates_with_cursor(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify the first load returns one page and a cursor trigger for the next."""
+        for i in range(12):
+            create_comment(topic_slug=topic.slug, user=user, content=f"comentario-{i:02d}")
+        url = reverse("events:topic_comments", kwargs={"slug": topic.slug})
+
+        first = client.get(url, HTTP_HX_REQUEST="true")
+
+        content = first.content.decode()
+        assert "comentario-09" in content
+        assert "comentario-10" not in content
+        assert "?cursor=" in content
+        next_page = first.context["page"].next_cursor
+        second = client.get(url, {"cursor": next_page}, HTTP_HX_REQUEST="true")
+        assert "comentario-10" in second.content.decode()
+        assert "comentario-11" in second.content.decode()
+        assert "comentario-00" not in second.content.decode()
+
+    def test_invalid_cursor_returns_400(self, client: Client, topic: Topic) -> None:
+        """Verify a malformed cursor returns 400."""
+        url = reverse("events:topic_comments", kwargs={"slug": topic.slug})
+
+        response = client.get(url, {"cursor": "garbage"}, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_create_comment_returns_item_and_count(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify posting a comment returns it plus an OOB count update."""
+        client.force_login(user)
+        url = reverse("events:create_comment", kwargs={"slug": topic.slug})
+
+        response = client.post(url, {"content": "Quero ver!"}, HTTP_HX_REQUEST="true")
+
+        content = response.content.decode()
+        assert response.status_code == HTTPStatus.OK
+        assert "Quero ver!" in content
+        assert 'hx-swap-oob="true"' in content
+        assert "1 comentário" in content
+        topic.refresh_from_db()
+        assert topic.comment_count == 1
+
+    def test_create_comment_requires_authentication(self, client: Client, topic: Topic) -> None:
+        """Verify anonymous users are redirected to login."""
+        url = reverse("events:create_comment", kwargs={"slug": topic.slug})
+
+        response = client.post(url, {"content": "x"}, HTTP_HX_REQUEST="true")
+
+        assert "HX-Redirect" in response.headers
+        assert not Comment.objects.exists()
+
+    def test_delete_comment_by_author(self, client: Client, user: User, topic: Topic) -> None:
+        """Verify the author can delete a comment and the count is updated."""
+        dto = create_comment(topic_slug=topic.slug, user=user, content="x")
+        client.force_login(user)
+        url = reverse("events:delete_comment", kwargs={"comment_id": dto.id})
+
+        response = client.post(url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "0 comentários" in response.content.decode()
+        assert not Comment.objects.filter(pk=dto.id).exists()
+
+    def test_delete_comment_forbidden_for_other_users(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify other users can't delete a comment."""
+        dto = create_comment(topic_slug=topic.slug, user=user, content="x")
+        client.force_login(baker.make("accounts.User"))
+        url = reverse("events:delete_comment", kwargs={"comment_id": dto.id})
+
+        response = client.post(url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert Comment.objects.filter(pk=dto.id).exists()
+
+
+@pytest.mark.django_db
+class TestTopicListingCostWithComments:
+    """The topic listing must not get more expensive as comments grow."""
+
+    def _listing_queries(self, client: Client) -> int:
+        url = reverse("events:event_detail", kwargs={"slug": "test-event"})
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        return len(ctx.captured_queries)
+
+    def test_listing_query_count_independent_of_comment_volume(self) -> None:
+        """Verify event_detail runs the same queries with 0 or 100 comments per topic."""
+        client = Client()
+        event = baker.make("events.Event", slug="test-event")
+        users = baker.make("accounts.User", _quantity=5)
+        topics = [baker.make("events.Topic", event=event, creator=user) for user in users]
+
+        without_comments = self._listing_queries(client)
+        for topic in topics:
+            for i in range(100):
+                create_comment(topic_slug=topic.slug, user=users[i % 5], content=f"c{i}")
+        with_comments = self._listing_queries(client)
+
+        assert with_comments == without_comments
+
+    def test_listing_never_queries_comment_table(self) -> None:
+        """Verify event_detail reads counts from Topic, never from events_comment."""
+        client = Client()
+        event = baker.make("events.Event", slug="test-event")
+        topic = baker.make("events.Topic", event=event)
+        create_comment(topic_slug=topic.slug, user=topic.creator, content="x")
+
+        url = reverse("events:event_detail", kwargs={"slug": "test-event"})
+        with CaptureQueriesContext(connection) as ctx:
+            client.get(url)
+
+        assert not any("events_comment" in q["sql"] for q in ctx.captured_queries)
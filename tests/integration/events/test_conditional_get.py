@@ -0,0 +1,141 @@
+"""
+Integration tests for conditional GET of event pages and load-more fragments.
+
+These tests verify:
+- ETag/Last-Modified are sent and 304 is returned before the topic query runs
+- Writes through the services invalidate the validators
+- Anonymous and authenticated users get separate validators
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from core.release import get_release
+from events.models import Event, Topic
+from events.services.vote_service import vote_topic
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("topic")
+class TestConditionalEventPage:
+    """Integration tests for ETag/Last-Modified on the event page."""
+
+    @pytest.fixture
+    def client(self) -> Client:
+        """Create Django test client that already holds a CSRF cookie, like a returning browser."""
+        client = Client()
+        client.get(reverse("home"))
+        return client
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="test-event", name="Test Event")
+
+    @pytest.fixture
+    def topic(self, event: Event) -> Topic:
+        """Create test topic."""
+        return baker.make("events.Topic", event=event, title="Test Topic")
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        """Event page URL."""
+        return reverse("events:event_detail", kwargs={"slug": event.slug})
+
+    def test_response_has_validators(self, client: Client, url: str) -> None:
+        """Verify the page is sent with ETag, Last-Modified and a revalidate policy."""
+        response = client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+        assert "no-cache" in response.headers["Cache-Control"]
+        assert "private" in response.headers["Cache-Control"]
+
+    def test_if_none_match_returns_304_without_topic_query(self, client: Client, url: str) -> None:
+        """Verify a matching ETag short-circuits before the topic query."""
+        etag = client.get(url).headers["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert not any('FROM "events_topic"' in q["sql"] for q in ctx.captured_queries)
+
+    def test_if_modified_since_returns_304(self, client: Client, url: str) -> None:
+        """Verify If-Modified-Since is honored when no ETag is sent."""
+        last_modified = client.get(url).headers["Last-Modified"]
+
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_vote_invalidates_etag(self, client: Client, url: str, topic: Topic) -> None:
+        """Verify a vote (through vote_service) changes the ETag."""
+        etag = client.get(url).headers["ETag"]
+
+        vote_topic(topic_slug=topic.slug, user=baker.make("accounts.User"))
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+
+    def test_anonymous_and_user_validators_differ(self, client: Client, url: str) -> None:
+        """Verify an anonymous ETag doesn't revalidate a logged-in user's page."""
+        anonymous_etag = client.get(url).headers["ETag"]
+        user: User = baker.make("accounts.User")
+        client.force_login(user)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=anonymous_etag)
+
+        assert response.status_code == HTTPStatus.OK
+        user_etag = response.headers["ETag"]
+        assert user_etag != anonymous_etag
+        assert client.get(url, HTTP_IF_NONE_MATCH=user_etag).status_code == (
+            HTTPStatus.NOT_MODIFIED
+        )
+
+    def test_users_get_separate_validators(self, url: str) -> None:
+        """Verify two users never share a validator (has_voted differs per user)."""
+        first, second = Client(), Client()
+        first.force_login(baker.make("accounts.User"))
+        second.force_login(baker.make("accounts.User"))
+
+        assert first.get(url).headers["ETag"] != second.get(url).headers["ETag"]
+
+    def test_load_more_fragment_is_conditional(self, client: Client, event: Event) -> None:
+        """Verify the load-more fragment answers 304 for an unchanged event."""
+        url = reverse("events:load_more_topics", kwargs={"slug": event.slug})
+        etag = client.get(url, {"offset": 0}, HTTP_HX_REQUEST="true").headers["ETag"]
+
+        response = client.get(url, {"offset": 0}, HTTP_HX_REQUEST="true", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_release_changes_validators(self, client: Client, url: str, settings) -> None:
+        """Verify a deploy (a new release) doesn't revalidate the HTML of the previous one."""
+        response = client.get(url)
+        etag = response.headers["ETag"]
+
+        settings.RELEASE = "next"
+        get_release.cache_clear()
+        try:
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        finally:
+            get_release.cache_clear()
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+
+    def test_unknown_event_still_404(self, client: Client) -> None:
+        """Verify unknown events are not affected by the conditional layer."""
+        url = reverse("events:event_detail", kwargs={"slug": "missing"})
+
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,176 @@
+"""
+Integration tests for the event page's change long-poll.
+
+These tests verify:
+- The changes endpoint answers with the new version and the changed topics
+- Under ASGI, the changes endpoint waits without being adapted to a thread
+- Unchanged events are answered with 204 after the timeout
+- The cards endpoint refreshes changed cards and removes deleted ones
+- Only live event pages poll for changes
+"""
+
+import logging
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event, Topic
+from events.services.event_service import close_voting
+from events.services.topic_service import soft_delete_topic
+from events.services.vote_service import vote_topic
+
+
+@pytest.mark.django_db
+class TestEventChanges:
+    """Integration tests for the event_changes endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def short_polls(self, settings) -> None:
+        """Don't keep tests waiting for changes that won't come."""
+        settings.EVENT_CHANGES_TIMEOUT = 0.05
+        settings.EVENT_CHANGES_POLL_INTERVAL = 0.01
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="ao-vivo")
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        """Changes endpoint URL."""
+        return reverse("events:event_changes", kwargs={"slug": event.slug})
+
+    def test_returns_changed_topics(self, client: Client, event: Event, url: str) -> None:
+        """Verify the new version and the slugs of the changed topics are returned."""
+        topic = baker.make("events.Topic", event=event)
+        vote_topic(topic_slug=topic.slug, user=baker.make("accounts.User"))
+
+        response = client.get(url, {"version": 0})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"version": 1, "topics": [topic.slug]}
+        assert "no-store" in response.headers["Cache-Control"]
+
+    def test_runs_without_sync_adapter_under_asgi(
+        self, async_client: AsyncClient, url: str, settings, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify no middleware makes Django run the async view through a thread."""
+        settings.DEBUG = True  # Adapted handlers are only logged in debug
+        caplog.set_level(logging.DEBUG, logger="django.request")
+
+        response = async_to_sync(async_client.get)(url, {"version": 0})
+
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert not [r.message for r in caplog.records if "adapted" in r.message]
+
+    def test_unchanged_event_times_out(self, client: Client, url: str) -> None:
+        """Verify a 204 is returned when nothing changed before the timeout."""
+        response = client.get(url, {"version": 0})
+
+        assert response.status_code == HTTPStatus.NO_CONTENT
+
+    @pytest.mark.parametrize("params", [{}, {"version": "x"}])
+    def test_invalid_version(self, client: Client, url: str, params: dict[str, str]) -> None:
+        """Verify a missing or non-numeric version is a bad request."""
+        assert client.get(url, params).status_code == HTTPStatus.BAD_REQUEST
+
+    def test_unknown_event(self, client: Client) -> None:
+        """Verify unknown events are a 404."""
+        url = reverse("events:event_changes", kwargs={"slug": "nao-existe"})
+
+        assert client.get(url, {"version": 0}).status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestTopicCards:
+    """Integration tests for the topic_cards endpoint."""
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="ao-vivo")
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        """Cards endpoint URL."""
+        return reverse("events:topic_cards", kwargs={"slug": event.slug})
+
+    def test_refreshes_and_removes_cards(
+        self, client: Client, event: Event, url: str, sample_user: User
+    ) -> None:
+        """Verify live topics are swapped in out-of-band and deleted ones removed."""
+        voted = baker.make("events.Topic", event=event, title="Votado")
+        deleted = baker.make("events.Topic", event=event)
+        vote_topic(topic_slug=voted.slug, user=sample_user)
+        soft_delete_topic(topic_slug=deleted.slug)
+        client.force_login(sample_user)
+
+        response = client.get(url, {"topics": [voted.slug, deleted.slug]}, HTTP_HX_REQUEST="true")
+
+        content = response.content.decode()
+        assert response.status_code == HTTPStatus.OK
+        assert f'id="topic-{voted.slug}"' in content
+        assert 'hx-swap-oob="outerHTML"' in content
+        assert "Votado" in content
+        assert f'<div id="topic-{deleted.slug}" hx-swap-oob="delete"></div>' in content
+
+    def test_ignores_other_events_topics(self, client: Client, url: str) -> None:
+        """Verify a topic of another event isn't rendered."""
+        other = baker.make("events.Topic", title="De outro evento")
+
+        response = client.get(url, {"topics": [other.slug]}, HTTP_HX_REQUEST="true")
+
+        assert "De outro evento" not in response.content.decode()
+
+    def test_requires_htmx(self, client: Client, url: str) -> None:
+        """Verify plain requests are a 404."""
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestEventPagePolling:
+    """The event page polls for changes only while it can change, and only under ASGI."""
+
+    @pytest.fixture(autouse=True)
+    def live_updates(self, settings) -> None:
+        """Serve pages as under ASGI, where polls don't hold a worker."""
+        settings.EVENT_LIVE_UPDATES = True
+
+    def test_live_page_polls_from_its_version(self, client: Client) -> None:
+        """Verify the page starts polling from the version it was rendered at."""
+        event = baker.make("events.Event", slug="ao-vivo")
+        Event.objects.filter(pk=event.pk).update(version=7)
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": event.slug}))
+
+        content = response.content.decode()
+        assert reverse("events:event_changes", kwargs={"slug": event.slug}) in content
+        assert "let version = 7;" in content
+
+    def test_closed_page_does_not_poll(self, client: Client) -> None:
+        """Verify closed events, which can't change, don't poll."""
+        event = baker.make("events.Event", slug="encerrado")
+        baker.make(Topic, event=event)
+        close_voting(event.slug)
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": event.slug}))
+
+        assert reverse("events:event_changes", kwargs={"slug": event.slug}) not in (
+            response.content.decode()
+        )
+
+    def test_no_polling_without_live_updates(self, client: Client, settings) -> None:
+        """Verify pages served under WSGI (the default) don't poll: each poll holds a worker."""
+        settings.EVENT_LIVE_UPDATES = False
+        event = baker.make("events.Event", slug="wsgi")
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": event.slug}))
+
+        assert reverse("events:event_changes", kwargs={"slug": event.slug}) not in (
+            response.content.decode()
+        )
@@ -171,3 +171,70 @@ class TestEventDetailView:
         assert isinstance(topics, list), f"Topics should be a list, got {type(topics)}"
         # Verify we can iterate over it without errors
         list(topics)  # This would fail if topics is None
+
+
+@pytest.mark.django_db
+class TestTopicSortModes:
+    """Integration tests for the ?sort= listing modes and cursor pagination."""
+
+    @pytest.fixture
+    def client(self) -> Client:
+        """Create Django test client."""
+        return Client()
+
+    @pytest.fixture
+    def event(self) -> object:
+        event = baker.make("events.Event", slug="sorted")
+        user = baker.make("accounts.User")
+        for i in range(25):
+            baker.make("events.Topic", event=event, creator=user, title=f"T{i}", vote_count=i)
+        return event
+
+    def test_sort_param_selects_mode(self, client: Client, event: object) -> None:
+        """Verify ?sort=oldest lists topics oldest first and marks the mode as current."""
+        url = reverse("events:event_detail", kwargs={"slug": event.slug})
+
+        response = client.get(url, {"sort": "oldest"})
+
+        assert response.context["page"].sort == "oldest"
+        assert [topic.title for topic in response.context["topics"]][:2] == ["T0", "T1"]
+        assert 'href="?sort=oldest" aria-current="page"' in response.content.decode()
+
+    def test_unknown_and_personal_sorts_fall_back_for_anonymous(
+        self, client: Client, event: object
+    ) -> None:
+        """Verify unknown modes, and personal modes when signed out, list most voted."""
+        url = reverse("events:event_detail", kwargs={"slug": event.slug})
+
+        for sort in ("bogus", "mine", "unvoted"):
+            response = client.get(url, {"sort": sort})
+            assert response.context["page"].sort == "top"
+        assert "?sort=mine" not in response.content.decode()
+
+    def test_load_more_continues_from_cursor(self, client: Client, event: object) -> None:
+        """Verify the load-more fragment returns the page after the cursor."""
+        page = client.get(
+            reverse("events:event_detail", kwargs={"slug": event.slug}), {"sort": "top"}
+        ).context["page"]
+
+        response = client.get(
+            reverse("events:load_more_topics", kwargs={"slug": event.slug}),
+            {"sort": "top", "cursor": page.next_cursor},
+            HTTP_HX_REQUEST="true",
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert [topic.title for topic in response.context["topics"]] == [
+            f"T{i}" for i in range(4, -1, -1)
+        ]
+        assert response.context["page"].next_cursor is None
+
+    def test_load_more_rejects_invalid_cursor(self, client: Client, event: object) -> None:
+        """Verify a malformed cursor is a 400, not a server error."""
+        response = client.get(
+            reverse("events:load_more_topics", kwargs={"slug": event.slug}),
+            {"sort": "top", "cursor": "garbage"},
+            HTTP_HX_REQUEST="true",
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
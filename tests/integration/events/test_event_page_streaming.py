@@ -0,0 +1,120 @@
+"""
+Integration tests for the streamed event page.
+
+These tests verify:
+- The streamed page has the same content as the page rendered in one piece
+- The page around the topic list is sent before the topics are queried
+- Empty lists, the load-more trigger and the CSRF cookie work when streamed
+"""
+
+import re
+from http import HTTPStatus
+
+import pytest
+from django.conf import settings as django_settings
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event
+from events.services.topic_service import TOPICS_PAGE_SIZE
+
+
+def _normalized(html: str) -> str:
+    """Page HTML without its (per render) CSRF tokens and the whitespace between tags."""
+    html = re.sub(r'name="csrfmiddlewaretoken" value="[^"]*"', "", html)
+    return re.sub(r">\s+", ">", re.sub(r"\s+<", "<", html))
+
+
+def _read(response: HttpResponse) -> str:
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+class TestStreamedEventPage:
+    """Integration tests for event_detail with EVENT_PAGE_STREAMING."""
+
+    @pytest.fixture(autouse=True)
+    def streaming(self, settings) -> None:
+        settings.EVENT_PAGE_STREAMING = True
+
+    @pytest.fixture
+    def event(self, sample_user: User) -> Event:
+        """Create test event with a topic."""
+        event = baker.make("events.Event", slug="test-event", name="Test Event")
+        baker.make("events.Topic", event=event, creator=sample_user, title="Streamed Topic")
+        return event
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        return reverse("events:event_detail", kwargs={"slug": event.slug})
+
+    @pytest.mark.parametrize("authenticated", [False, True])
+    def test_same_page_as_rendered(
+        self, client: Client, settings, sample_user: User, url: str, authenticated: bool
+    ) -> None:
+        """Verify the streamed page matches the page rendered in one piece."""
+        if authenticated:
+            client.force_login(sample_user)
+
+        streamed = client.get(url)
+        settings.EVENT_PAGE_STREAMING = False
+        rendered = client.get(url)
+
+        assert streamed.streaming
+        assert streamed.status_code == HTTPStatus.OK
+        assert streamed["ETag"]
+        assert "no-cache" in streamed["Cache-Control"]
+        assert _normalized(_read(streamed)) == _normalized(rendered.content.decode())
+
+    def test_head_is_sent_before_the_topic_query(self, client: Client, url: str) -> None:
+        """Verify the page head and header come first, and the topics are read while streaming."""
+        response = client.get(url)
+        chunks = iter(response.streaming_content)
+
+        with CaptureQueriesContext(connection) as queries:
+            head = next(chunks).decode()
+        assert "</head>" in head
+        assert "Test Event" in head
+        assert "Streamed Topic" not in head
+        assert not queries.captured_queries
+
+        with CaptureQueriesContext(connection) as queries:
+            rest = b"".join(chunks).decode()
+        assert "Streamed Topic" in rest
+        assert rest.rstrip().endswith("</html>")
+        assert any("events_topic" in query["sql"] for query in queries.captured_queries)
+
+    def test_empty_event(self, client: Client) -> None:
+        """Verify an event without topics streams the empty state."""
+        baker.make("events.Event", slug="empty-event")
+
+        content = _read(client.get(reverse("events:event_detail", kwargs={"slug": "empty-event"})))
+
+        assert "Nenhum tópico ainda" in content
+
+    def test_load_more_trigger(self, client: Client, event: Event, url: str) -> None:
+        """Verify a full first page ends with the trigger that loads the next one."""
+        baker.make("events.Topic", event=event, _quantity=TOPICS_PAGE_SIZE)
+
+        content = _read(client.get(url, {"sort": "newest"}))
+
+        assert content.count('class="topic-item"') == TOPICS_PAGE_SIZE
+        assert "load-more-trigger" in content
+        assert "?sort=newest&cursor=" in content
+
+    def test_csrf_cookie_is_set(self, client: Client, url: str) -> None:
+        """Verify the CSRF cookie is set even though the cards render after the headers."""
+        response = client.get(url)
+
+        assert django_settings.CSRF_COOKIE_NAME in response.cookies
+
+    def test_unknown_event(self, client: Client) -> None:
+        """Verify an unknown event is still a 404 page, not a stream."""
+        response = client.get(reverse("events:event_detail", kwargs={"slug": "unknown"}))
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
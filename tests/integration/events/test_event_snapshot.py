@@ -0,0 +1,132 @@
+"""
+Integration tests for serving archived events from their static snapshot.
+
+These tests verify:
+- Archived event pages are served from the snapshot without any query
+- Snapshots are served precompressed, with validators and a public max-age
+- Unarchived events are rendered live again
+- Events can be archived from the admin
+"""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event
+from events.services.snapshot_service import archive_event, unarchive_event
+
+
+def _content(response: object) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+class TestArchivedEventPage:
+    """Integration tests for the event page of archived events."""
+
+    @pytest.fixture(autouse=True)
+    def snapshot_dir(self, settings, tmp_path: Path) -> Path:
+        """Keep each test's snapshots in its own directory."""
+        settings.EVENT_SNAPSHOT_DIR = tmp_path
+        return tmp_path
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create an archived event with one topic."""
+        event = baker.make(
+            "events.Event", status=Event.CLOSED, slug="arquivado", name="Evento Arquivado"
+        )
+        baker.make("events.Topic", event=event, title="Tópico histórico")
+        archive_event(event.slug)
+        return event
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        """Event page URL."""
+        return reverse("events:event_detail", kwargs={"slug": event.slug})
+
+    def test_served_without_queries(self, client: Client, url: str, django_assert_num_queries):
+        """Verify the snapshot is served without touching the database."""
+        with django_assert_num_queries(0):
+            response = client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["Content-Type"].startswith("text/html")
+        assert "Tópico histórico" in _content(response).decode()
+
+    def test_authenticated_users_get_the_snapshot(
+        self, client: Client, url: str, sample_user: User, django_assert_num_queries
+    ) -> None:
+        """Verify logged-in users get the same snapshot, without a session lookup."""
+        client.force_login(sample_user)
+
+        with django_assert_num_queries(0):
+            response = client.get(url)
+
+        assert 'class="vote-plus-button' not in _content(response).decode()
+
+    def test_precompressed_with_validators(self, client: Client, url: str) -> None:
+        """Verify gzip is negotiated and the snapshot revalidates with its ETag."""
+        response = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["Cache-Control"] == "max-age=300, public"
+        etag = response.headers["ETag"]
+
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_unarchived_event_is_rendered_live(self, client: Client, url: str) -> None:
+        """Verify the page goes back to the live, user-aware rendering."""
+        unarchive_event("arquivado")
+
+        response = client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert "private" in response.headers["Cache-Control"]
+        assert b"Este evento foi arquivado" not in response.content
+
+    def test_other_events_are_rendered_live(self, client: Client) -> None:
+        """Verify events without a snapshot aren't affected."""
+        other = baker.make("events.Event", slug="ao-vivo")
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": other.slug}))
+
+        assert response.status_code == HTTPStatus.OK
+        assert "private" in response.headers["Cache-Control"]
+
+    def test_archive_from_admin(self, client: Client, sample_superuser: User) -> None:
+        """Verify the admin action archives the selected events."""
+        other = baker.make("events.Event", status=Event.CLOSED, slug="pelo-admin")
+        client.force_login(sample_superuser)
+
+        response = client.post(
+            reverse("admin:events_event_changelist"),
+            {"action": "archive_events", "_selected_action": [str(other.pk)]},
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
+        other.refresh_from_db()
+        assert other.archived_at is not None
+        page = client.get(reverse("events:event_detail", kwargs={"slug": other.slug}))
+        assert b"Este evento foi arquivado" in _content(page)
+
+    def test_admin_skips_open_events(self, client: Client, sample_superuser: User) -> None:
+        """Verify the admin action leaves events with open voting unarchived, with a warning."""
+        other = baker.make("events.Event", status=Event.OPEN, slug="aberto")
+        client.force_login(sample_superuser)
+
+        response = client.post(
+            reverse("admin:events_event_changelist"),
+            {"action": "archive_events", "_selected_action": [str(other.pk)]},
+            follow=True,
+        )
+
+        assert "encerre a votação antes" in response.content.decode()
+        other.refresh_from_db()
+        assert other.archived_at is None
@@ -0,0 +1,147 @@
+"""
+Integration tests for presenter suggestions.
+
+These tests verify the full request/response cycle including:
+- The bounded preview rendered with the topic listing
+- Loading the full list on demand via HTMX
+- Suggesting and deleting presenters
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event, PresenterSuggestion, Topic
+from events.services.presenter_service import MAX_SUGGESTIONS_PER_USER
+
+
+@pytest.mark.django_db
+class TestPresenterSuggestionFlow:
+    """Integration tests for presenter suggestions on topics."""
+
+    @pytest.fixture
+    def client(self) -> Client:
+        """Create Django test client."""
+        return Client()
+
+    @pytest.fixture
+    def user(self) -> User:
+        """Create test user."""
+        return baker.make("accounts.User", username="testuser")
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="test-event", name="Test Event")
+
+    @pytest.fixture
+    def topic(self, event: Event, user: User) -> Topic:
+        """Create test topic."""
+        return baker.make("events.Topic", event=event, creator=user, title="Test Topic")
+
+    def test_listing_renders_preview_and_see_all(self, client: Client, topic: Topic) -> None:
+        """Verify the event page shows only the preview and a link to the full list."""
+        for i in range(5):
+            baker.make("events.PresenterSuggestion", topic=topic, presenter_contact=f"speaker-{i}")
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": "test-event"}))
+
+        content = response.content.decode()
+        assert "speaker-0" in content
+        assert "speaker-2" in content
+        assert "speaker-3" not in content
+        assert "Ver todas as 5 sugestões" in content
+        assert reverse("events:topic_presenters", kwargs={"slug": topic.slug}) in content
+
+    def test_full_list_requires_htmx(self, client: Client, topic: Topic) -> None:
+        """Verify the full list endpoint returns 404 for non-HTMX requests."""
+        url = reverse("events:topic_presenters", kwargs={"slug": topic.slug})
+
+        assert client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+    def test_full_list_returns_every_suggestion(self, client: Client, topic: Topic) -> None:
+        """Verify the HTMX endpoint renders every live suggestion."""
+        for i in range(5):
+            baker.make("events.PresenterSuggestion", topic=topic, presenter_contact=f"speaker-{i}")
+        url = reverse("events:topic_presenters", kwargs={"slug": topic.slug})
+
+        response = client.get(url, HTTP_HX_REQUEST="true")
+
+        content = response.content.decode()
+        assert all(f"speaker-{i}" in content for i in range(5))
+        assert "Faça login" in content
+
+    def test_suggest_presenter(self, client: Client, user: User, topic: Topic) -> None:
+        """Verify posting a suggestion re-renders the section with it."""
+        client.force_login(user)
+        url = reverse("events:suggest_presenter", kwargs={"slug": topic.slug})
+
+        response = client.post(
+            url, {"presenter_contact": "ada@example.com"}, HTTP_HX_REQUEST="true"
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert "ada@example.com" in response.content.decode()
+        assert PresenterSuggestion.objects.filter(topic=topic).count() == 1
+
+    def test_suggest_presenter_shows_limit_error(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify reaching the per-user limit renders an error instead of saving."""
+        baker.make(
+            "events.PresenterSuggestion",
+            topic=topic,
+            suggested_by=user,
+            _quantity=MAX_SUGGESTIONS_PER_USER,
+        )
+        client.force_login(user)
+        url = reverse("events:suggest_presenter", kwargs={"slug": topic.slug})
+
+        response = client.post(url, {"presenter_contact": "extra"}, HTTP_HX_REQUEST="true")
+
+        assert 'role="alert"' in response.content.decode()
+        assert PresenterSuggestion.objects.filter(topic=topic).count() == MAX_SUGGESTIONS_PER_USER
+
+    def test_suggest_presenter_requires_authentication(self, client: Client, topic: Topic) -> None:
+        """Verify anonymous users are redirected to login."""
+        url = reverse("events:suggest_presenter", kwargs={"slug": topic.slug})
+
+        response = client.post(url, {"presenter_contact": "x"}, HTTP_HX_REQUEST="true")
+
+        assert "HX-Redirect" in response.headers
+        assert not PresenterSuggestion.objects.exists()
+
+    def test_delete_own_suggestion(self, client: Client, user: User, topic: Topic) -> None:
+        """Verify the suggester can delete their suggestion."""
+        suggestion = baker.make("events.PresenterSuggestion", topic=topic, suggested_by=user)
+        client.force_login(user)
+        url = reverse(
+            "events:delete_presenter_suggestion",
+            kwargs={"slug": topic.slug, "suggestion_id": suggestion.id},
+        )
+
+        response = client.post(url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "Nenhuma sugestão" in response.content.decode()
+        assert not PresenterSuggestion.objects.filter(pk=suggestion.id).exists()
+
+    def test_delete_other_users_suggestion_forbidden(
+        self, client: Client, user: User, topic: Topic
+    ) -> None:
+        """Verify other users can't delete a suggestion."""
+        suggestion = baker.make("events.PresenterSuggestion", topic=topic)
+        client.force_login(user)
+        url = reverse(
+            "events:delete_presenter_suggestion",
+            kwargs={"slug": topic.slug, "suggestion_id": suggestion.id},
+        )
+
+        response = client.post(url, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        assert PresenterSuggestion.objects.filter(pk=suggestion.id).exists()
@@ -0,0 +1,275 @@
+"""
+Query plan regression tests for the topic and vote services.
+
+Every function in events.services.topic_service, vote_service, event_service and
+topic_similarity_service that touches
+the database is run against a seeded, ANALYZEd database; each statement it
+issues is explained and must not full-scan a table or sort in a temporary
+B-tree, except for the steps allowlisted (with the reason) below. An index
+change that turns a lookup into a scan fails here instead of in production.
+"""
+
+import inspect
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from accounts.models import User
+from core.index_audit import table_indexes
+from core.query_plans import QueryPlan, capture_plans
+from events.dto.event_dto import EventPageDTO
+from events.dto.topic_dto import TopicPageDTO
+from events.models import Event, Topic, Vote
+from events.services import (
+    event_service,
+    topic_service,
+    topic_similarity_service,
+    vote_service,
+)
+from events.services.seed_service import SeedConfig, seed_load
+from events.services.topic_service import TopicSort
+
+# Big enough that scans cost more than index searches for the planner
+SEED = SeedConfig(
+    users=400,
+    events=3,
+    topics=300,
+    votes=15_000,
+    until=timezone.make_aware(datetime(2026, 1, 1)),
+)
+
+# (table the statement reads, plan step) pairs that are expected
+# Trending: the recent vote count is computed per query, so the event's live
+# topics (read through the partial index) are sorted in memory
+TRENDING_SORT = ("events_topic", "USE TEMP B-TREE FOR ORDER BY")
+# The preview prefetch re-sorts its at-most-3-per-topic window rows
+PRESENTER_PREVIEW_SORT = ("events_presentersuggestion", "USE TEMP B-TREE FOR ORDER BY")
+# Rolling up the vote log (run inline by the test task backend) reads the
+# partial index of pending entries in full: it holds only those entries
+VOTE_LOG_PENDING_SCAN = (
+    "events_votelogentry",
+    "SCAN events_votelogentry USING INDEX events_votelog_pending_idx",
+)
+
+# The first page of events reads the slug index from its start, up to the limit
+EVENTS_FIRST_PAGE = (
+    "events_event",
+    "SCAN events_event USING INDEX sqlite_autoindex_events_event_2",
+)
+
+# Similar titles: the topics sharing the typed title's trigrams (only those
+# index entries) are counted and ranked in memory
+SIMILAR_TITLES_COUNT = (
+    ("events_topictitletrigram", "USE TEMP B-TREE FOR GROUP BY"),
+    ("events_topictitletrigram", "USE TEMP B-TREE FOR ORDER BY"),
+)
+
+# Pure helpers: they build expressions or read prefetched data
+NO_QUERIES = {
+    "get_user_avatar_url",
+    "get_user_display_name",
+    "recent_vote_count_subquery",
+    "trending_since",
+    "encode_topic_cursor",
+    "decode_topic_cursor",
+    "presenter_suggestions_prefetch",
+    "to_presenter_dto",
+    "presenter_preview",
+    "title_trigrams",
+    "encode_event_cursor",
+    "decode_event_cursor",
+}
+
+
+@dataclass
+class Scenario:
+    event: Event
+    topic: Topic
+    voter: User
+    outsider: User
+
+
+@dataclass
+class PlanCase:
+    function: str
+    call: Callable[[Scenario], object]
+    allowed: tuple[tuple[str, str], ...] = ()
+    # Runs before the plans are captured
+    setup: Callable[[Scenario], object] | None = None
+
+
+def _close(scenario: Scenario) -> None:
+    event_service.close_voting(scenario.event.slug)
+
+
+def _second_page(scenario: Scenario, sort: TopicSort) -> TopicPageDTO:
+    """Fetch the first and then the second page of a mode (both pages are checked)."""
+    first = topic_service.get_topics_page(scenario.event.slug, sort=sort, user=scenario.voter)
+    return topic_service.get_topics_page(
+        scenario.event.slug, sort=sort, cursor=first.next_cursor, user=scenario.voter
+    )
+
+
+def _second_events_page(_scenario: Scenario) -> EventPageDTO:
+    first = event_service.get_events_page(limit=1)
+    return event_service.get_events_page(cursor=first.next_cursor, limit=1)
+
+
+def _listing_allowed(sort: TopicSort) -> tuple[tuple[str, str], ...]:
+    if sort == TopicSort.TRENDING:
+        return (TRENDING_SORT, PRESENTER_PREVIEW_SORT)
+    return (PRESENTER_PREVIEW_SORT,)
+
+
+CASES = [
+    *(
+        PlanCase(
+            "get_topics_page",
+            lambda s, sort=sort: _second_page(s, sort),
+            allowed=_listing_allowed(sort),
+        )
+        for sort in TopicSort
+        if sort != TopicSort.RANKING
+    ),
+    PlanCase(
+        "get_topics_page",
+        lambda s: _second_page(s, TopicSort.RANKING),
+        allowed=(PRESENTER_PREVIEW_SORT,),
+        setup=_close,
+    ),
+    PlanCase(
+        "get_topics_page",
+        lambda s: topic_service.get_topics_page(s.event.slug),
+        allowed=(PRESENTER_PREVIEW_SORT,),
+    ),
+    PlanCase(
+        "get_topics_for_event",
+        lambda s: topic_service.get_topics_for_event(s.event.slug, offset=20, user=s.voter),
+        allowed=(PRESENTER_PREVIEW_SORT,),
+    ),
+    PlanCase(
+        "get_topics_by_slug",
+        lambda s: topic_service.get_topics_by_slug(
+            s.event.slug, [s.topic.slug, "nao-existe"], user=s.voter
+        ),
+        allowed=(PRESENTER_PREVIEW_SORT,),
+    ),
+    PlanCase(
+        "create_topic",
+        lambda s: topic_service.create_topic(s.voter, s.topic.title, "", s.event.slug),
+    ),
+    PlanCase(
+        "update_topic",
+        lambda s: topic_service.update_topic(s.topic.slug, "Novo título", ""),
+        allowed=(PRESENTER_PREVIEW_SORT,),
+    ),
+    PlanCase("soft_delete_topic", lambda s: topic_service.soft_delete_topic(s.topic.slug)),
+    PlanCase(
+        "vote_topic",
+        lambda s: vote_service.vote_topic(s.topic.slug, s.outsider),
+        allowed=(VOTE_LOG_PENDING_SCAN,),
+    ),
+    PlanCase("vote_topic", lambda s: vote_service.vote_topic(s.topic.slug, s.voter)),
+    PlanCase(
+        "unvote_topic",
+        lambda s: vote_service.unvote_topic(s.topic.slug, s.voter),
+        allowed=(VOTE_LOG_PENDING_SCAN,),
+    ),
+    PlanCase("unvote_topic", lambda s: vote_service.unvote_topic(s.topic.slug, s.outsider)),
+    PlanCase(
+        "get_user_vote_status",
+        lambda s: vote_service.get_user_vote_status(s.topic.slug, s.voter),
+    ),
+    PlanCase(
+        "find_similar_topics",
+        lambda s: topic_similarity_service.find_similar_topics(s.event.slug, s.topic.title),
+        allowed=SIMILAR_TITLES_COUNT,
+    ),
+    PlanCase(
+        "index_topic_titles",
+        lambda s: topic_similarity_service.index_topic_titles([s.topic]),
+    ),
+    PlanCase("unindex_topic", lambda s: topic_similarity_service.unindex_topic(s.topic.id)),
+    PlanCase("close_voting", lambda s: event_service.close_voting(s.event.slug)),
+    PlanCase("reopen_voting", lambda s: event_service.reopen_voting(s.event.slug), setup=_close),
+    PlanCase("get_events_page", _second_events_page, allowed=(EVENTS_FIRST_PAGE,)),
+    PlanCase("is_voting_closed", lambda s: event_service.is_voting_closed(s.event.slug)),
+    PlanCase(
+        "is_topic_voting_closed",
+        lambda s: event_service.is_topic_voting_closed(s.topic.slug),
+    ),
+]
+
+
+def _table(plan: QueryPlan) -> str:
+    """The statement's main table: UPDATE/DELETE target, or the first selected column's table."""
+    match = re.match(r'\s*(?:UPDATE|DELETE FROM)\s+"(\w+)"', plan.sql) or re.search(
+        r'"(\w+)"\."', plan.sql
+    )
+    return match.group(1) if match else ""
+
+
+@pytest.fixture
+def scenario() -> Scenario:
+    seed_load(SEED)
+    event = Event.objects.annotate(topic_count=Count("topics")).order_by("-topic_count").first()
+    topic = Topic.objects.filter(event=event).order_by("-vote_count").first()
+    voter = Vote.objects.filter(topic=topic).first().user
+    outsider = User.objects.exclude(votes__topic=topic).first()
+    return Scenario(event=event, topic=topic, voter=voter, outsider=outsider)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestServiceQueryPlans:
+    """EXPLAIN QUERY PLAN checks for the topic, vote and event services."""
+
+    @pytest.mark.parametrize(
+        "case", CASES, ids=[f"{case.function}-{i}" for i, case in enumerate(CASES)]
+    )
+    def test_no_unexpected_scans_or_sorts(self, scenario: Scenario, case: PlanCase) -> None:
+        """Verify the function's queries use indexes instead of scans and temp sorts."""
+        if case.setup:
+            case.setup(scenario)
+        plans = capture_plans(lambda: case.call(scenario))
+
+        assert plans
+        unexpected = [
+            f"{step}\n    in: {plan.sql[:300]}"
+            for plan in plans
+            for step in plan.problems
+            if (_table(plan), step) not in case.allowed
+        ]
+        assert not unexpected, "\n".join(unexpected)
+
+    def test_dropped_index_is_caught(self, scenario: Scenario) -> None:
+        """Verify losing the indexes on Topic.event shows up as a table scan."""
+        # DDL is transactional in SQLite: rolled back after the test
+        with connection.cursor() as cursor:
+            for index in table_indexes("events_topic"):
+                if index.columns[0] == "event_id":
+                    cursor.execute(f'DROP INDEX "{index.name}"')
+
+        plans = capture_plans(lambda: topic_service.get_topics_for_event(scenario.event.slug))
+
+        problems = [step for plan in plans for step in plan.problems]
+        assert any(step.startswith("SCAN events_topic") for step in problems)
+
+    def test_every_querying_function_has_a_case(self) -> None:
+        """Verify new service functions get a plan case (or are declared query-free)."""
+        functions = {
+            name
+            for module in (topic_service, vote_service, event_service, topic_similarity_service)
+            for name, member in inspect.getmembers(module, inspect.isfunction)
+            if member.__module__ == module.__name__ and not name.startswith("_")
+        }
+        covered = {case.function for case in CASES}
+
+        assert functions - NO_QUERIES - covered == set()
+        assert covered <= functions
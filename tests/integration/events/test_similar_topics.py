@@ -0,0 +1,71 @@
+"""
+Integration tests for the similar topics lookup of the topic form.
+
+These tests verify:
+- Typing a title lists the event's topics with similar titles
+- Short titles and unrelated titles list nothing
+- The topic form asks for similar topics while the title is typed
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event
+from events.services.topic_service import create_topic
+
+
+@pytest.mark.django_db
+class TestSimilarTopics:
+    """Integration tests for the similar_topics endpoint."""
+
+    @pytest.fixture
+    def event(self, sample_user: User) -> Event:
+        """Create test event with a topic."""
+        event = baker.make("events.Event", slug="python-floripa")
+        create_topic(sample_user, "Introdução ao Django REST Framework", "", event.slug)
+        return event
+
+    @pytest.fixture
+    def url(self, event: Event) -> str:
+        return reverse("events:similar_topics", kwargs={"slug": event.slug})
+
+    def test_lists_similar_topics(self, client: Client, url: str) -> None:
+        """Verify a reworded title lists the existing topic, linked on the event page."""
+        response = client.get(url, {"title": "introducao ao django rest"}, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        content = response.content.decode()
+        assert "Introdução ao Django REST Framework" in content
+        assert "#topic-introducao-ao-django-rest-framework" in content
+        assert "no-cache" in response["Cache-Control"]
+
+    @pytest.mark.parametrize("title", ["Dja", "Machine learning na prática"])
+    def test_short_or_unrelated_titles_list_nothing(
+        self, client: Client, url: str, title: str
+    ) -> None:
+        """Verify nothing is listed for titles too short or not similar."""
+        response = client.get(url, {"title": title}, HTTP_HX_REQUEST="true")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.content.decode().strip() == ""
+
+    def test_requires_htmx(self, client: Client, url: str) -> None:
+        """Verify non-HTMX requests are not found."""
+        assert client.get(url, {"title": "Django"}).status_code == HTTPStatus.NOT_FOUND
+
+    def test_topic_form_looks_up_while_typing(
+        self, client: Client, sample_user: User, event: Event, url: str
+    ) -> None:
+        """Verify the inline topic form's title input asks for similar topics."""
+        client.force_login(sample_user)
+
+        response = client.get(reverse("events:event_detail", kwargs={"slug": event.slug}))
+
+        content = response.content.decode()
+        assert f'hx-get="{url}"' in content
+        assert 'id="similar-topics"' in content
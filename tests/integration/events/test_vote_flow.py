@@ -73,12 +73,15 @@ class TestVoteFlow:
         """Verify vote endpoint toggles to unvote when user has already voted."""
         client.force_login(user)
         baker.make("events.Vote", topic=topic, user=user)
+        Topic.objects.filter(pk=topic.pk).update(vote_count=1)
 
         url = reverse("events:vote_topic", kwargs={"slug": topic.slug})
         response = client.post(url, HTTP_HX_REQUEST="true")
 
         assert response.status_code == HTTPStatus.OK
         assert not Vote.objects.filter(topic=topic, user=user).exists()
+        topic.refresh_from_db()
+        assert topic.vote_count == 0
 
     def test_vote_endpoint_requires_authentication(self, client: Client, topic: Topic) -> None:
         """Verify vote endpoint requires authentication."""
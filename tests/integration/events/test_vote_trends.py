@@ -0,0 +1,64 @@
+"""
+Integration tests for the vote trend admin chart.
+"""
+
+from http import HTTPStatus
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from model_bakery import baker
+
+from events.services.vote_service import vote_topic
+
+
+@pytest.mark.django_db
+class TestVoteTrendsView:
+    """Tests for the /admin/vote-trends/ page."""
+
+    @pytest.fixture
+    def topic(self) -> object:
+        event = baker.make("events.Event", slug="test-event", name="Test Event")
+        topic = baker.make("events.Topic", event=event, title="Tópico popular")
+        for user in baker.make("accounts.User", _quantity=3):
+            vote_topic(topic.slug, user)
+        return topic
+
+    @pytest.mark.usefixtures("topic")
+    def test_requires_staff(self, client: Client) -> None:
+        """Verify anonymous users are sent to the admin login."""
+        response = client.get(reverse("vote_trends"))
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert "/admin/login/" in response["Location"]
+
+    @pytest.mark.usefixtures("topic")
+    def test_charts_event_votes(self, client: Client, sample_superuser) -> None:
+        """Verify the chart shows the event's hourly bars and top topics."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("vote_trends"), {"event": "test-event", "days": "1"})
+
+        assert response.status_code == HTTPStatus.OK
+        trend = response.context["trend"]
+        assert len(trend.points) == 25  # The current, partial hour included
+        assert trend.votes_cast == 3
+        content = response.content.decode()
+        assert "Tópico popular" in content
+        assert 'height="100.00"' in content  # The peak hour fills the upper half
+
+    def test_unknown_event_is_404(self, client: Client, sample_superuser) -> None:
+        """Verify an unknown event slug is a 404."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("vote_trends"), {"event": "nope"})
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_linked_from_admin_index(self, client: Client, sample_superuser) -> None:
+        """Verify the admin index links to the chart."""
+        client.force_login(sample_superuser)
+
+        response = client.get(reverse("admin:index"))
+
+        assert reverse("vote_trends") in response.content.decode()
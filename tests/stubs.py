@@ -0,0 +1,22 @@
+"""
+Local stand-ins for external services, referenced by the test settings.
+"""
+
+from io import BytesIO
+
+from PIL import Image
+
+from accounts.services.avatar_service import AvatarError
+
+# URLs fetched by fetch_avatar, in order
+fetched_avatars: list[str] = []
+
+
+def fetch_avatar(url: str) -> bytes:
+    """AVATAR_FETCHER stub: a 400x300 JPEG, or AvatarError for URLs containing "unreachable"."""
+    fetched_avatars.append(url)
+    if "unreachable" in url:
+        raise AvatarError(f"Couldn't fetch avatar {url}")
+    output = BytesIO()
+    Image.new("RGB", (400, 300), "#3572a5").save(output, "JPEG")
+    return output.getvalue()
@@ -0,0 +1,100 @@
+"""
+Unit tests for avatar_service module.
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from model_bakery import baker
+from PIL import Image
+
+from accounts.services.avatar_service import (
+    THUMBNAIL_FORMAT,
+    AvatarError,
+    avatar_url,
+    avatar_version,
+    make_thumbnail,
+    refresh_avatar,
+    store_avatar,
+    thumbnail_path,
+)
+from events.services.topic_service import get_user_avatar_url
+from tests.stubs import fetch_avatar, fetched_avatars
+
+PICTURE = "https://lh3.googleusercontent.com/a/picture"
+
+
+@pytest.fixture(autouse=True)
+def avatar_dir(settings, tmp_path: Path) -> Path:
+    """Store thumbnails in a directory of the test's own."""
+    settings.AVATAR_DIR = tmp_path / "avatars"
+    fetched_avatars.clear()
+    return settings.AVATAR_DIR
+
+
+class TestMakeThumbnail:
+    """Tests for make_thumbnail function."""
+
+    def test_crops_and_shrinks_to_a_square(self, settings) -> None:
+        """Verify the image is cropped to a square of AVATAR_SIZE px."""
+        settings.AVATAR_SIZE = 48
+
+        with Image.open(BytesIO(make_thumbnail(fetch_avatar(PICTURE)))) as thumbnail:
+            assert (thumbnail.format, thumbnail.size) == (THUMBNAIL_FORMAT, (48, 48))
+
+    def test_rejects_data_that_is_not_an_image(self) -> None:
+        """Verify unreadable data raises AvatarError."""
+        with pytest.raises(AvatarError):
+            make_thumbnail(b"<html>Not found</html>")
+
+
+@pytest.mark.django_db
+class TestStoreAvatar:
+    """Tests for store_avatar and refresh_avatar functions."""
+
+    def test_replaces_the_users_older_thumbnails_only(self) -> None:
+        """Verify storing a new avatar removes the user's previous one, not other users'."""
+        user, other = baker.make("accounts.User", _quantity=2)
+        old = store_avatar(user.pk, f"{PICTURE}-old")
+        others = store_avatar(other.pk, PICTURE)
+
+        new = store_avatar(user.pk, PICTURE)
+
+        assert new == thumbnail_path(user.pk, avatar_version(PICTURE))
+        assert (old.exists(), new.exists(), others.exists()) == (False, True, True)
+
+    def test_refresh_fetches_the_current_avatar_once(self) -> None:
+        """Verify refresh_avatar fetches only avatars not stored yet."""
+        user = baker.make("accounts.User")
+        account = baker.make(SocialAccount, user=user, provider="google")
+        SocialAccount.objects.filter(pk=account.pk).update(extra_data={"picture": PICTURE})
+        fetched_avatars.clear()
+
+        assert refresh_avatar(user.pk) is True
+        assert refresh_avatar(user.pk) is False
+        assert fetched_avatars == [PICTURE]
+
+    def test_refresh_without_social_account(self) -> None:
+        """Verify users without a social avatar are skipped."""
+        assert refresh_avatar(baker.make("accounts.User").pk) is False
+        assert fetched_avatars == []
+
+
+@pytest.mark.django_db
+class TestGetUserAvatarUrl:
+    """Tests for the avatar URLs of topic and comment DTOs."""
+
+    def test_points_at_the_local_thumbnail(self) -> None:
+        """Verify the URL is the local proxy's, versioned by the provider URL."""
+        user = baker.make("accounts.User")
+        baker.make(SocialAccount, user=user, provider="google", extra_data={"picture": PICTURE})
+        # The services prefetch social accounts
+        user = type(user).objects.prefetch_related("socialaccount_set").get(pk=user.pk)
+
+        url = get_user_avatar_url(user)
+
+        assert url == avatar_url(user.pk, PICTURE)
+        assert url.endswith(f"/{avatar_version(PICTURE)}/")
+        assert "googleusercontent" not in url
@@ -0,0 +1,76 @@
+"""
+Unit tests for core custom model fields.
+"""
+
+import uuid
+
+import pytest
+from django.db import connection
+from model_bakery import baker
+
+from accounts.models import User
+from core.fields import BinaryUUIDField
+from events.models import Event, Topic, Vote
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestBinaryUUIDField:
+    """Test BinaryUUIDField storage through BaseModel/User primary keys."""
+
+    def _raw(self, sql: str, params: list) -> tuple:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def test_base_model_and_user_use_binary_uuid_field(self) -> None:
+        """BaseModel subclasses and User should declare BinaryUUIDField primary keys."""
+        assert isinstance(Event._meta.pk, BinaryUUIDField)
+        assert isinstance(User._meta.pk, BinaryUUIDField)
+
+    def test_primary_key_is_stored_as_16_byte_blob(self) -> None:
+        """Primary keys should be stored as 16-byte blobs on SQLite."""
+        event = baker.make("events.Event")
+
+        stored = self._raw("SELECT typeof(id), length(id) FROM events_event", [])
+
+        assert stored == ("blob", 16)
+        assert event.id.version == 6
+
+    def test_foreign_keys_are_stored_as_16_byte_blobs(self) -> None:
+        """Foreign key columns inherit the blob storage of the referenced key."""
+        vote = baker.make("events.Vote")
+
+        stored = self._raw(
+            "SELECT typeof(topic_id), length(topic_id), typeof(user_id) FROM events_vote", []
+        )
+
+        assert stored == ("blob", 16, "blob")
+        assert Vote.objects.get().topic_id == vote.topic_id
+
+    def test_values_round_trip_as_uuid(self) -> None:
+        """Loaded primary and foreign keys should be uuid.UUID instances."""
+        topic = baker.make("events.Topic")
+
+        loaded = Topic.objects.get(pk=topic.pk)
+
+        assert isinstance(loaded.id, uuid.UUID)
+        assert isinstance(loaded.event_id, uuid.UUID)
+        assert loaded.event_id == topic.event.id
+        assert list(Topic.objects.values_list("creator_id", flat=True)) == [topic.creator_id]
+
+    def test_lookup_accepts_string_uuid(self) -> None:
+        """Lookups should accept string UUIDs, as used by admin URLs and sessions."""
+        event = baker.make("events.Event")
+
+        assert Event.objects.get(pk=str(event.id)) == event
+        assert Event.objects.filter(pk__in=[str(event.id)]).count() == 1
+
+    def test_legacy_hex_text_values_are_still_readable(self) -> None:
+        """Rows still holding char(32) hex text (pre-migration) should load as UUID."""
+        field = Event._meta.pk
+        value = uuid.uuid4()
+
+        assert field.from_db_value(value.hex, None, connection) == value
+        assert field.from_db_value(value.bytes, None, connection) == value
+        assert field.from_db_value(None, None, connection) is None
@@ -0,0 +1,134 @@
+"""
+Unit tests for the cross-worker invalidation bus and invalidated caches.
+"""
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+import pytest
+from django.db import transaction
+
+from core.invalidation import InvalidatedCache, InvalidationBus, get_bus, publish
+
+
+@pytest.fixture
+def bus_path(settings, tmp_path: Path) -> Path:
+    """Point the process bus at a file of its own."""
+    settings.INVALIDATION_BUS_PATH = tmp_path / "bus"
+    settings.INVALIDATION_BUS_SLOTS = 64
+    return settings.INVALIDATION_BUS_PATH
+
+
+@pytest.mark.unit
+class TestInvalidationBus:
+    """Test version counters shared through the bus file."""
+
+    def test_publish_is_seen_by_other_handles(self, tmp_path: Path) -> None:
+        """A key published through one handle moves its counter for every handle."""
+        writer = InvalidationBus(tmp_path / "bus", slots=64)
+        reader = InvalidationBus(tmp_path / "bus", slots=64)
+
+        writer.publish("events", "events")
+        writer.publish("events")
+
+        assert reader.version("events") == 2
+        assert reader.version("other") in (0, 2)  # 0 unless the keys share a slot
+
+    def test_reopening_keeps_counters(self, tmp_path: Path) -> None:
+        """A new handle (e.g. a restarted worker) sees the counters already published."""
+        InvalidationBus(tmp_path / "bus", slots=64).publish("events")
+
+        assert InvalidationBus(tmp_path / "bus", slots=64).version("events") == 1
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("bus_path")
+class TestInvalidatedCache:
+    """Test per-process caches dropping entries when their key is published."""
+
+    def test_recomputes_only_after_publish(self) -> None:
+        """Values are reused until their bus key is published."""
+        cache = InvalidatedCache()
+        computed = []
+
+        def compute() -> int:
+            computed.append(1)
+            return len(computed)
+
+        assert cache.get_or_set("a", "events", compute) == 1
+        assert cache.get_or_set("a", "events", compute) == 1
+        get_bus().publish("events")
+        assert cache.get_or_set("a", "events", compute) == 2
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The cache keeps at most maxsize entries."""
+        cache = InvalidatedCache(maxsize=2)
+        for key in ("a", "b", "a", "c"):
+            cache.get_or_set(key, "events", lambda key=key: key)
+
+        assert list(cache._entries) == ["a", "c"]
+
+    @pytest.mark.django_db
+    def test_publish_inside_a_transaction_repeats_on_commit(
+        self, django_capture_on_commit_callbacks
+    ) -> None:
+        """Keys are published at once and again when the transaction commits."""
+        bus = get_bus()
+
+        with django_capture_on_commit_callbacks(execute=True), transaction.atomic():
+            publish("events")
+            assert bus.version("events") == 1
+
+        assert bus.version("events") == 2
+
+
+def _worker(conn: Connection, value_path: Path) -> None:
+    """A stand-in gunicorn worker: caches a value read from a file (the "database")."""
+    cache = InvalidatedCache()
+    while (command := conn.recv()) is not None:
+        if command == "write":
+            value_path.write_text(str(int(value_path.read_text()) + 1))
+            publish("events")
+            conn.send(None)
+        else:
+            conn.send(cache.get_or_set("value", "events", value_path.read_text))
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("bus_path")
+class TestAcrossProcesses:
+    """A write in one worker process invalidates the caches of the others."""
+
+    def test_write_invalidates_other_workers_by_their_next_request(self, tmp_path: Path) -> None:
+        """Verify the other worker serves its cached value until the write, then the new one."""
+        value_path = tmp_path / "value"
+        value_path.write_text("1")
+        context = multiprocessing.get_context("fork")
+        workers = []
+        for _ in range(2):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker, args=(child, value_path))
+            process.start()
+            workers.append((process, parent))
+        (_, reader), (_, writer) = workers
+
+        def request(conn: Connection, command: str) -> object:
+            conn.send(command)
+            return conn.recv()
+
+        try:
+            assert request(reader, "read") == "1"
+            value_path.write_text("changed without publishing")
+            assert request(reader, "read") == "1"  # Served from the reader's cache
+            value_path.write_text("1")
+
+            request(writer, "write")
+
+            assert request(reader, "read") == "2"
+        finally:
+            for process, conn in workers:
+                conn.send(None)
+                process.join(timeout=5)
+
+        assert [process.exitcode for process, _ in workers] == [0, 0]
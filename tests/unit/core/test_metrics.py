@@ -0,0 +1,126 @@
+"""
+Unit tests for core metrics store and exposition format.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core import metrics
+from core.metrics import MetricsStore, render_exposition
+
+
+@pytest.fixture
+def store(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> MetricsStore:
+    """Install a fresh process store writing to a temporary directory."""
+    store = MetricsStore(tmp_path, flush_interval=0)
+    monkeypatch.setattr(metrics, "_store", store)
+    return store
+
+
+@pytest.mark.unit
+class TestMetricsStore:
+    """Test per-worker values and their merge across workers."""
+
+    def test_counters_merge_across_worker_files(self, tmp_path: Path, store: MetricsStore) -> None:
+        """Values flushed by another worker's store are added to this worker's."""
+        other_worker = MetricsStore(tmp_path, flush_interval=0)
+        store.inc("floripatalks_votes_created_total")
+        other_worker.inc("floripatalks_votes_created_total", amount=2)
+
+        counters, _ = store.collect()
+
+        assert counters[("floripatalks_votes_created_total", ())] == 3
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_histogram_buckets_are_cumulative(self, store: MetricsStore) -> None:
+        """An observation counts in every bucket whose bound is >= the value."""
+        store.observe("floripatalks_http_request_duration_seconds", 0.03, {"view": "home"})
+        store.observe("floripatalks_http_request_duration_seconds", 0.3, {"view": "home"})
+
+        _, histograms = store.collect()
+
+        values = histograms[("floripatalks_http_request_duration_seconds", (("view", "home"),))]
+        buckets = dict(zip(metrics.LATENCY_BUCKETS, values, strict=False))
+        assert buckets[0.025] == 0
+        assert buckets[0.05] == 1
+        assert buckets[0.5] == 2
+        assert values[-2] == pytest.approx(0.33)
+        assert values[-1] == 2
+
+    def test_flush_is_throttled(self, tmp_path: Path) -> None:
+        """Within the flush interval, values stay in memory until forced."""
+        store = MetricsStore(tmp_path, flush_interval=3600)
+        store.inc("floripatalks_topics_created_total")
+        store.inc("floripatalks_topics_created_total")
+
+        reader = MetricsStore(tmp_path, flush_interval=0)
+        assert reader.collect()[0] == {("floripatalks_topics_created_total", ()): 1}
+
+        store.flush(force=True)
+        assert reader.collect()[0] == {("floripatalks_topics_created_total", ()): 2}
+
+    def test_throttled_updates_are_flushed_after_the_interval(self, tmp_path: Path) -> None:
+        """Values held back by the throttle reach the file once the interval passes, unprompted."""
+        store = MetricsStore(tmp_path, flush_interval=0.05)
+        store.inc("floripatalks_topics_created_total")
+        store.inc("floripatalks_topics_created_total")
+
+        store._timer.join(timeout=5)
+
+        reader = MetricsStore(tmp_path, flush_interval=0)
+        assert reader.collect()[0] == {("floripatalks_topics_created_total", ()): 2}
+
+    def test_process_store_is_flushed_at_exit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, settings
+    ) -> None:
+        """The process store registers a forced flush to run at interpreter exit."""
+        settings.METRICS_DIR = tmp_path
+        registered = []
+        monkeypatch.setattr(metrics, "_store", None)
+        monkeypatch.setattr(
+            metrics.atexit, "register", lambda func, **kwargs: registered.append((func, kwargs))
+        )
+
+        store = metrics.get_store()
+
+        assert registered == [(store.flush, {"force": True})]
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("store")
+class TestRenderExposition:
+    """Test the Prometheus text exposition output."""
+
+    def test_renders_counters_and_histograms(self) -> None:
+        """Counters, buckets (with +Inf), _sum and _count are rendered with labels."""
+        metrics.inc(
+            "floripatalks_http_requests_total",
+            {"view": "events:event_detail", "method": "GET", "status": "200"},
+        )
+        metrics.observe("floripatalks_db_queries_per_request", 3, {"view": "events:event_detail"})
+
+        text = render_exposition()
+
+        assert "# TYPE floripatalks_http_requests_total counter" in text
+        assert (
+            'floripatalks_http_requests_total{method="GET",status="200",'
+            'view="events:event_detail"} 1'
+        ) in text
+        assert (
+            'floripatalks_db_queries_per_request_bucket{view="events:event_detail",le="2"} 0'
+        ) in text
+        assert (
+            'floripatalks_db_queries_per_request_bucket{view="events:event_detail",le="3"} 1'
+        ) in text
+        assert (
+            'floripatalks_db_queries_per_request_bucket{view="events:event_detail",le="+Inf"} 1'
+        ) in text
+        assert 'floripatalks_db_queries_per_request_sum{view="events:event_detail"} 3' in text
+        assert 'floripatalks_db_queries_per_request_count{view="events:event_detail"} 1' in text
+
+    def test_escapes_label_values(self) -> None:
+        """Quotes and backslashes in label values are escaped."""
+        metrics.inc("floripatalks_http_requests_total", {"view": 'a"b\\c'})
+
+        assert 'view="a\\"b\\\\c"' in render_exposition()
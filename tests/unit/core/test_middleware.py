@@ -0,0 +1,20 @@
+"""
+Unit tests for the middleware stack (core.middleware).
+"""
+
+import pytest
+from django.utils.module_loading import import_string
+
+from floripatalks.settings import base
+
+
+class TestMiddlewareStack:
+    """Tests for the middleware listed in the settings."""
+
+    @pytest.mark.parametrize("path", base.MIDDLEWARE)
+    def test_middleware_is_async_capable(self, path: str) -> None:
+        """Verify no middleware makes Django adapt the chain to a thread under ASGI."""
+        middleware = import_string(path)
+
+        assert getattr(middleware, "async_capable", False), path
+        assert getattr(middleware, "sync_capable", True), path
@@ -0,0 +1,89 @@
+"""
+Unit tests for N+1 lazy load detection.
+"""
+
+import logging
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+from model_bakery import baker
+
+from core.middleware import NPlusOneMiddleware
+from core.nplusone import NPlusOneError, allow_lazy_loads, track_lazy_loads
+from events.models import Vote
+
+
+@pytest.fixture
+def votes() -> None:
+    topic = baker.make("events.Topic")
+    baker.make("events.Vote", topic=topic, _quantity=3)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.usefixtures("votes")
+class TestLazyLoadDetection:
+    """Test repeated lazy loads are reported."""
+
+    def test_lazy_load_per_row_raises(self) -> None:
+        """Verify Vote.__str__ over a plain queryset is reported as an N+1."""
+        with track_lazy_loads(), pytest.raises(NPlusOneError, match=r"events\.Vote\.user"):
+            [str(vote) for vote in Vote.objects.all()]
+
+    def test_select_related_is_fine(self) -> None:
+        """Verify fetching the relations up front isn't reported."""
+        with track_lazy_loads():
+            [str(vote) for vote in Vote.objects.select_related("user", "topic")]
+
+    def test_single_lazy_load_is_fine(self) -> None:
+        """Verify one lazy load, and reloading the same row, aren't reported."""
+        vote = Vote.objects.first()
+
+        with track_lazy_loads():
+            vote.user  # noqa: B018
+            Vote.objects.get(pk=vote.pk).user  # noqa: B018
+
+    def test_allow_lazy_loads(self) -> None:
+        """Verify deliberate per-row loads can be allowed."""
+        with track_lazy_loads(), allow_lazy_loads():
+            [str(vote) for vote in Vote.objects.all()]
+
+    @override_settings(NPLUSONE_DETECTION="warn")
+    def test_warn_mode_logs(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Verify "warn" logs the N+1 and its location instead of raising."""
+        with caplog.at_level(logging.WARNING, logger="core.nplusone"), track_lazy_loads():
+            [str(vote) for vote in Vote.objects.all()]
+
+        assert "events.Vote.user was lazily loaded for 2 rows" in caplog.text
+        assert "(events/models.py:" in caplog.text  # Vote.__str__ made the load
+
+    @pytest.mark.allow_lazy_loads
+    def test_marker_allows_lazy_loads_in_test(self) -> None:
+        """Verify the allow_lazy_loads marker disables the per-test check."""
+        [str(vote) for vote in Vote.objects.all()]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.usefixtures("votes")
+class TestNPlusOneMiddleware:
+    """Test lazy loads are tracked per request."""
+
+    def _middleware(self, rows: int) -> NPlusOneMiddleware:
+        def view(_request: HttpRequest) -> HttpResponse:
+            return HttpResponse([str(vote) for vote in Vote.objects.all()[:rows]])
+
+        return NPlusOneMiddleware(view)
+
+    def test_each_request_is_tracked_separately(self) -> None:
+        """Verify one lazy load per request never adds up across requests."""
+        middleware = self._middleware(rows=1)
+
+        for _ in range(3):
+            middleware(RequestFactory().get("/"))
+
+    def test_n_plus_one_in_request_raises(self) -> None:
+        """Verify a request loading a relation row by row fails."""
+        with pytest.raises(NPlusOneError):
+            self._middleware(rows=3)(RequestFactory().get("/"))
@@ -0,0 +1,68 @@
+"""
+Unit tests for core profiling reports and their on-disk ring buffer.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.profiling import (
+    ProfileReport,
+    RequestProfiler,
+    list_reports,
+    load_report,
+    new_report,
+    save_report,
+)
+
+
+@pytest.fixture(autouse=True)
+def profiling_dir(tmp_path: Path, settings) -> Path:
+    """Store reports in a temporary directory."""
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_MAX_REPORTS = 3
+    return tmp_path
+
+
+def _report(path: str = "/") -> ProfileReport:
+    return new_report("GET", path, "admin")
+
+
+@pytest.mark.unit
+class TestReportRingBuffer:
+    """Test report storage is bounded and newest-first."""
+
+    def test_keeps_only_newest_reports(self, profiling_dir: Path) -> None:
+        """Saving beyond PROFILING_MAX_REPORTS drops the oldest reports."""
+        reports = [_report(f"/page/{i}") for i in range(5)]
+        for report in reports:
+            save_report(report)
+
+        assert len(list(profiling_dir.glob("*.json"))) == 3
+        assert [r.path for r in list_reports()] == ["/page/4", "/page/3", "/page/2"]
+        assert load_report(reports[0].id) is None
+        assert load_report(reports[4].id).path == "/page/4"
+
+    def test_load_report_rejects_paths(self) -> None:
+        """Report ids can't escape the profiling directory."""
+        assert load_report("../../etc/passwd") is None
+
+
+@pytest.mark.unit
+class TestRequestProfiler:
+    """Test layer attribution."""
+
+    def test_attributes_time_to_layers(self) -> None:
+        """Calls into a layer's modules are attributed to that layer."""
+        from django.template import Context, Template
+
+        report = _report()
+        with RequestProfiler(report):
+            Template("{% for i in items %}{{ i }}{% endfor %}").render(
+                Context({"items": range(200)})
+            )
+
+        assert report.total_seconds > 0
+        assert report.layers["templates"] > 0
+        assert report.layers["events.services"] == 0
+        assert "cumulative" in report.top_functions
@@ -0,0 +1,46 @@
+"""
+Unit tests for query plan problem detection.
+"""
+
+import pytest
+
+from core.query_plans import plan_problems
+
+
+@pytest.mark.unit
+class TestPlanProblems:
+    """Test which EXPLAIN QUERY PLAN steps are reported."""
+
+    def test_index_searches_are_fine(self) -> None:
+        """Verify index searches and covering indexes aren't reported."""
+        steps = [
+            "SEARCH events_topic USING INDEX events_topic_live_event_idx (event_id=?)",
+            "CORRELATED SCALAR SUBQUERY 1",
+            "SEARCH U0 USING COVERING INDEX events_vote_topic_id_user_id_uniq (topic_id=?)",
+        ]
+
+        assert plan_problems(steps) == []
+
+    def test_table_scan_and_temp_sorts_are_reported(self) -> None:
+        """Verify full scans and temporary B-trees are reported."""
+        steps = [
+            "SCAN events_topic",
+            "USE TEMP B-TREE FOR ORDER BY",
+            "USE TEMP B-TREE FOR LAST TERM OF ORDER BY",
+            "USE TEMP B-TREE FOR GROUP BY",
+        ]
+
+        assert plan_problems(steps) == steps
+
+    def test_coroutine_and_constant_scans_are_fine(self) -> None:
+        """Verify scans of subquery co-routines and constant rows aren't reported."""
+        steps = [
+            "CO-ROUTINE qualify",
+            "CO-ROUTINE (subquery-4)",
+            "SEARCH events_presentersuggestion USING INDEX events_presenter_live_idx (topic_id=?)",
+            "SCAN (subquery-4)",
+            "SCAN qualify",
+            "SCAN CONSTANT ROW",
+        ]
+
+        assert plan_problems(steps) == []
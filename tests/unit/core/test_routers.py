@@ -0,0 +1,50 @@
+"""
+Unit tests for the read-only database router.
+"""
+
+import pytest
+from django.conf import settings
+from django.db import transaction
+
+from core.routers import READ_ONLY_DATABASE, ReadOnlyRouter, read_only_queries
+from events.models import Topic
+
+router = ReadOnlyRouter()
+
+
+@pytest.mark.unit
+class TestReadOnlyRouter:
+    """Test where reads and writes are routed."""
+
+    def test_reads_use_default_outside_read_only_context(self) -> None:
+        """Reads aren't routed unless requested."""
+        assert router.db_for_read(Topic) is None
+
+    def test_reads_use_read_only_alias_in_context(self) -> None:
+        """read_only_queries() sends reads to the read-only alias."""
+        with read_only_queries():
+            assert router.db_for_read(Topic) == READ_ONLY_DATABASE
+        assert router.db_for_read(Topic) is None
+
+    def test_reads_stay_on_default_without_alias(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Environments without the alias keep reading from default."""
+        monkeypatch.delitem(settings.DATABASES, READ_ONLY_DATABASE)
+
+        with read_only_queries():
+            assert router.db_for_read(Topic) is None
+
+    @pytest.mark.django_db
+    def test_reads_stay_on_default_inside_transaction(self) -> None:
+        """Reads inside an atomic block see the block's own uncommitted writes."""
+        with transaction.atomic(), read_only_queries():
+            assert router.db_for_read(Topic) is None
+
+    def test_writes_always_use_default(self) -> None:
+        """Writes (including of instances read from the alias) go to default."""
+        with read_only_queries():
+            assert router.db_for_write(Topic, instance=Topic()) == "default"
+
+    def test_no_migrations_on_read_only_alias(self) -> None:
+        """migrate never targets the read-only alias."""
+        assert router.allow_migrate(READ_ONLY_DATABASE, "events") is False
+        assert router.allow_migrate("default", "events") is None
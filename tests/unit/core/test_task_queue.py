@@ -0,0 +1,234 @@
+"""
+Unit tests for the database task backend, its worker and the run_worker command.
+"""
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.tasks import TaskResultStatus, default_task_backend, task
+from django.tasks.exceptions import TaskResultDoesNotExist
+from django.utils import timezone
+
+from core.models import QueuedTask
+from core.task_queue import TaskLeaseExpired, claim_tasks, prune_task_results, run_tasks
+
+calls: list[int] = []
+
+
+@task
+def record_call(n: int) -> int:
+    calls.append(n)
+    return n * 2
+
+
+@task
+def fail_always() -> None:
+    raise ValueError("boom")
+
+
+@task
+def fail_after_reenqueueing() -> None:
+    fail_after_reenqueueing.enqueue()
+    raise ValueError("boom")
+
+
+@pytest.fixture(autouse=True)
+def database_backend(settings) -> None:
+    """Run the tests against DatabaseBackend instead of the test settings' ImmediateBackend."""
+    settings.TASKS = {
+        "default": {
+            "BACKEND": "core.task_queue.DatabaseBackend",
+            "OPTIONS": {"MAX_ATTEMPTS": 2, "RETRY_DELAY": 0, "LEASE": 60},
+        }
+    }
+    calls.clear()
+
+
+def _expire_leases() -> None:
+    QueuedTask.objects.filter(status=TaskResultStatus.RUNNING).update(
+        last_attempted_at=timezone.now() - timedelta(minutes=5)
+    )
+
+
+@pytest.mark.django_db
+class TestDatabaseBackend:
+    """Tests for enqueueing tasks and reading their results."""
+
+    def test_enqueue_stores_the_task_without_running_it(self) -> None:
+        """Verify an enqueued task waits in the table until a worker runs it."""
+        result = record_call.enqueue(1)
+
+        assert result.status == TaskResultStatus.READY
+        assert calls == []
+        record = QueuedTask.objects.get()
+        assert (record.task_path, record.args) == (f"{__name__}.record_call", [1])
+
+    def test_identical_waiting_tasks_are_batched(self) -> None:
+        """Verify enqueueing a task identical to a waiting one returns that one."""
+        first = record_call.enqueue(1)
+        second = record_call.enqueue(1)
+        other = record_call.enqueue(2)
+
+        assert first.id == second.id != other.id
+        assert QueuedTask.objects.count() == 2
+
+    def test_finished_tasks_are_not_batched(self) -> None:
+        """Verify a task identical to one that already ran is enqueued again."""
+        first = record_call.enqueue(1)
+        run_tasks("default", 10, "worker")
+
+        assert record_call.enqueue(1).id != first.id
+
+    def test_get_result(self) -> None:
+        """Verify results are read back from the table, and unknown ids raise."""
+        result = record_call.enqueue(3)
+        run_tasks("default", 10, "worker")
+
+        fetched = default_task_backend.get_result(result.id)
+        assert fetched.status == TaskResultStatus.SUCCESSFUL
+        assert fetched.return_value == 6
+        assert fetched.worker_ids == ["worker"]
+        with pytest.raises(TaskResultDoesNotExist):
+            default_task_backend.get_result("not-a-uuid")
+
+
+@pytest.mark.django_db
+class TestRunTasks:
+    """Tests for the worker claiming and running due tasks."""
+
+    def test_runs_due_tasks_by_priority(self) -> None:
+        """Verify higher priority tasks run first, and at most `limit` per call."""
+        record_call.enqueue(1)
+        record_call.using(priority=10).enqueue(2)
+        record_call.enqueue(3)
+
+        batch = run_tasks("default", 2, "worker")
+
+        assert (batch.succeeded, batch.tasks) == (2, 2)
+        assert calls == [2, 1]
+        assert run_tasks("default", 2, "worker").tasks == 1
+        assert run_tasks("default", 2, "worker").tasks == 0
+
+    def test_deferred_tasks_wait(self) -> None:
+        """Verify a task with run_after in the future isn't run yet."""
+        record_call.using(run_after=timezone.now() + timedelta(hours=1)).enqueue(1)
+
+        assert run_tasks("default", 10, "worker").tasks == 0
+        assert calls == []
+
+    def test_failures_are_retried_then_failed(self) -> None:
+        """Verify a failing task is retried until MAX_ATTEMPTS, keeping each error."""
+        result = fail_always.enqueue()
+
+        assert run_tasks("default", 10, "worker").retried == 1
+        assert run_tasks("default", 10, "worker").failed == 1
+
+        result.refresh()
+        assert result.status == TaskResultStatus.FAILED
+        assert len(result.errors) == 2
+        assert result.errors[0].exception_class is ValueError
+
+    def test_retry_superseded_by_an_identical_task(self) -> None:
+        """Verify a retry isn't kept when an identical task was enqueued meanwhile."""
+        result = fail_after_reenqueueing.enqueue()
+
+        batch = run_tasks("default", 1, "worker")
+
+        assert batch.failed == 1
+        result.refresh()
+        assert result.status == TaskResultStatus.FAILED
+        assert QueuedTask.objects.filter(status=TaskResultStatus.READY).count() == 1
+
+    def test_prune_deletes_old_finished_tasks(self) -> None:
+        """Verify only tasks finished before the retention period are deleted."""
+        record_call.enqueue(1)
+        run_tasks("default", 10, "worker")
+        record_call.enqueue(2)
+        QueuedTask.objects.filter(status=TaskResultStatus.SUCCESSFUL).update(
+            finished_at=timezone.now() - timedelta(days=8)
+        )
+
+        assert prune_task_results(timedelta(days=7)) == 1
+        assert QueuedTask.objects.get().status == TaskResultStatus.READY
+
+
+@pytest.mark.django_db
+class TestStaleTasks:
+    """Tests for the lease of claimed tasks and the recovery of a dead worker's tasks."""
+
+    def test_started_attempt_of_a_dead_worker_is_retried(self) -> None:
+        """Verify a task whose worker died mid-run is run again, the lost attempt counted."""
+        result = record_call.enqueue(1)
+        (record,) = claim_tasks(default_task_backend, 10)
+        QueuedTask.objects.filter(pk=record.pk).update(worker_ids=["dead"])
+        _expire_leases()
+
+        assert run_tasks("default", 10, "worker").succeeded == 1
+
+        result.refresh()
+        assert result.status == TaskResultStatus.SUCCESSFUL
+        assert result.worker_ids == ["dead", "worker"]
+        assert result.errors[0].exception_class is TaskLeaseExpired
+        assert calls == [1]
+
+    def test_lost_last_attempt_fails_the_task(self) -> None:
+        """Verify a lost attempt that was the task's last one fails it."""
+        result = record_call.enqueue(1)
+        (record,) = claim_tasks(default_task_backend, 10)
+        QueuedTask.objects.filter(pk=record.pk).update(worker_ids=["dead", "dead"])
+        _expire_leases()
+
+        assert run_tasks("default", 10, "worker").tasks == 0
+
+        result.refresh()
+        assert result.status == TaskResultStatus.FAILED
+        assert calls == []
+
+    def test_unstarted_claims_are_ready_again_without_an_attempt(self) -> None:
+        """Verify tasks claimed by a dead worker but never started run with no error."""
+        result = record_call.enqueue(1)
+        claim_tasks(default_task_backend, 10)
+        _expire_leases()
+
+        assert run_tasks("default", 10, "worker").succeeded == 1
+
+        result.refresh()
+        assert result.worker_ids == ["worker"]
+        assert result.errors == []
+
+    def test_running_tasks_within_their_lease_are_left_alone(self) -> None:
+        """Verify a live worker's claimed tasks aren't recovered."""
+        record_call.enqueue(1)
+        claim_tasks(default_task_backend, 10)
+
+        assert run_tasks("default", 10, "worker").tasks == 0
+        assert QueuedTask.objects.get().status == TaskResultStatus.RUNNING
+
+    def test_stopping_releases_the_rest_of_the_batch(self) -> None:
+        """Verify a stopping worker finishes its current task and releases the others."""
+        for n in range(3):
+            record_call.enqueue(n)
+
+        batch = run_tasks("default", 10, "worker", stopping=lambda: bool(calls))
+
+        assert batch.succeeded == 1
+        assert QueuedTask.objects.filter(status=TaskResultStatus.READY).count() == 2
+        assert run_tasks("default", 10, "worker").succeeded == 2
+
+
+@pytest.mark.django_db
+class TestRunWorkerCommand:
+    """Tests for the run_worker management command."""
+
+    def test_burst_runs_due_tasks_and_exits(self) -> None:
+        """Verify --burst drains the queue and reports the number of tasks run."""
+        for n in range(3):
+            record_call.enqueue(n)
+        out = StringIO()
+
+        call_command("run_worker", burst=True, batch_size=2, stdout=out)
+
+        assert sorted(calls) == [0, 1, 2]
+        assert "Ran 3 tasks" in out.getvalue()
@@ -87,8 +87,8 @@ class TestGetTopicsForEventNPlusOnePrevention:
         baker.make("events.Topic", event=event, creator=user)
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event")
 
         assert len(dtos) == 1
@@ -108,8 +108,8 @@ class TestGetTopicsForEventNPlusOnePrevention:
         baker.make("events.Topic", event=event, creator=user3, _quantity=1)
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event")
 
         assert len(dtos) == 6
@@ -124,8 +124,8 @@ class TestGetTopicsForEventNPlusOnePrevention:
         baker.make("events.Topic", event=event, creator=user, _quantity=2)
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event")
 
         assert len(dtos) >= 2
@@ -153,15 +153,15 @@ class TestGetTopicsForEventNPlusOnePrevention:
         baker.make("events.Topic", event=event, creator=user, _quantity=25)
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with limit, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with limit, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event", offset=0, limit=20)
 
         assert len(dtos) == 20
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with offset/limit, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with offset/limit, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event", offset=20, limit=20)
 
         assert len(dtos) == 5
@@ -172,7 +172,9 @@ class TestGetTopicsForEventNPlusOnePrevention:
         user = baker.make("accounts.User", username="creator")
         baker.make("events.Topic", event=event, creator=user, title="Test Topic")
 
-        with assertNumQueries(3):  # 1 for event, 1 for topics, 1 for social accounts prefetch
+        with assertNumQueries(
+            4
+        ):  # 1 for event, 1 for topics, 1 for social accounts, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event")
             dto = dtos[0]
 
@@ -0,0 +1,208 @@
+"""
+Unit tests for archive_service module and the archive_deleted_topics command.
+"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+
+from events.models import (
+    ArchivedComment,
+    ArchivedPresenterSuggestion,
+    ArchivedTopic,
+    ArchivedVote,
+    Comment,
+    PresenterSuggestion,
+    Topic,
+    Vote,
+)
+from events.services.archive_service import archive_deleted_topics, restore_archived_topic
+from events.services.comment_service import create_comment, soft_delete_comment
+from events.services.presenter_service import soft_delete_suggestion, suggest_presenter
+from events.services.topic_service import soft_delete_topic
+
+
+def _delete(topic: Topic, days_ago: int) -> Topic:
+    """Delete a topic through the service, as if `days_ago` days ago."""
+    with patch("django.utils.timezone.now", return_value=timezone.now() - timedelta(days=days_ago)):
+        soft_delete_topic(topic.slug)
+    return Topic.all_objects.get(pk=topic.pk)
+
+
+def _deleted_topic(days_ago: int, **kwargs: object) -> Topic:
+    return _delete(baker.make("events.Topic", **kwargs), days_ago)
+
+
+@pytest.mark.django_db
+class TestArchiveDeletedTopics:
+    """Tests for archive_deleted_topics function."""
+
+    def test_moves_old_deleted_topics_and_votes(self) -> None:
+        """Verify topics deleted before the cutoff move to the archive with their votes."""
+        topic = _deleted_topic(days_ago=100)
+        baker.make("events.Vote", topic=topic, _quantity=3)
+
+        result = archive_deleted_topics(retention=timedelta(days=90))
+
+        assert result.topics == 1
+        assert result.votes == 3
+        assert not Topic.all_objects.filter(pk=topic.pk).exists()
+        assert not Vote.objects.filter(topic_id=topic.pk).exists()
+        archived = ArchivedTopic.objects.get(pk=topic.pk)
+        assert archived.slug == topic.slug
+        assert archived.created_at == topic.created_at
+        assert archived.deleted_at == topic.deleted_at
+        assert ArchivedVote.objects.filter(topic=archived).count() == 3
+
+    def test_archives_topic_deleted_just_now_without_retention(self) -> None:
+        """Verify a topic deleted through the service is aged from its deletion."""
+        topic = baker.make("events.Topic")
+        soft_delete_topic(topic.slug)
+
+        result = archive_deleted_topics(retention=timedelta(0))
+
+        assert result.topics == 1
+        assert ArchivedTopic.objects.get(pk=topic.pk).deleted_at is not None
+
+    def test_keeps_live_and_recently_deleted_topics(self) -> None:
+        """Verify live topics and topics inside the retention period are untouched."""
+        live = baker.make("events.Topic")
+        recent = _deleted_topic(days_ago=10)
+
+        result = archive_deleted_topics(retention=timedelta(days=90))
+
+        assert result.topics == 0
+        assert Topic.objects.filter(pk=live.pk).exists()
+        assert Topic.all_objects.filter(pk=recent.pk).exists()
+
+    def test_moves_rows_in_batches(self) -> None:
+        """Verify candidates are moved in batches of batch_size."""
+        for _ in range(5):
+            _deleted_topic(days_ago=100)
+
+        result = archive_deleted_topics(retention=timedelta(days=90), batch_size=2)
+
+        assert result.topics == 5
+        assert result.batches == 3
+        assert ArchivedTopic.objects.count() == 5
+
+    def test_dry_run_moves_nothing(self) -> None:
+        """Verify dry_run only counts candidates."""
+        topic = _deleted_topic(days_ago=100)
+        baker.make("events.Vote", topic=topic, _quantity=2)
+
+        result = archive_deleted_topics(retention=timedelta(days=90), dry_run=True)
+
+        assert (result.topics, result.votes) == (1, 2)
+        assert Topic.all_objects.filter(pk=topic.pk).exists()
+        assert not ArchivedTopic.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRestoreArchivedTopic:
+    """Tests for restore_archived_topic function."""
+
+    def test_restores_topic_and_votes_undeleted(self) -> None:
+        """Verify a restored topic is live again, with original timestamps and votes."""
+        topic = _deleted_topic(days_ago=100)
+        votes = baker.make("events.Vote", topic=topic, _quantity=2)
+        archive_deleted_topics(retention=timedelta(days=90))
+
+        restored = restore_archived_topic(ArchivedTopic.objects.get(pk=topic.pk))
+
+        assert restored.pk == topic.pk
+        assert restored.is_deleted is False
+        assert restored.deleted_at is None
+        assert restored.created_at == topic.created_at
+        assert Topic.objects.filter(pk=topic.pk).exists()
+        restored_votes = Vote.objects.filter(topic=restored)
+        assert {vote.pk for vote in restored_votes} == {vote.pk for vote in votes}
+        assert {vote.created_at for vote in restored_votes} == {vote.created_at for vote in votes}
+        assert not ArchivedTopic.objects.exists()
+        assert not ArchivedVote.objects.exists()
+
+    def test_archives_and_restores_comments(self) -> None:
+        """Verify comments (live and deleted) follow their topic and the count is rebuilt."""
+        topic = baker.make("events.Topic")
+        create_comment(topic_slug=topic.slug, user=topic.creator, content="keep")
+        deleted = create_comment(topic_slug=topic.slug, user=topic.creator, content="gone")
+        soft_delete_comment(deleted.id)
+        _delete(topic, days_ago=100)
+
+        result = archive_deleted_topics(retention=timedelta(days=90))
+
+        assert result.comments == 2
+        assert not Comment.all_objects.filter(topic_id=topic.pk).exists()
+        assert ArchivedComment.objects.filter(topic_id=topic.pk).count() == 2
+
+        restored = restore_archived_topic(ArchivedTopic.objects.get(pk=topic.pk))
+
+        assert restored.comment_count == 1
+        assert [c.content for c in Comment.objects.filter(topic=restored)] == ["keep"]
+        assert Comment.all_objects.filter(topic=restored).count() == 2
+
+    def test_archives_and_restores_presenter_suggestions(self) -> None:
+        """Verify presenter suggestions (live and deleted) follow their topic, timestamps kept."""
+        topic = baker.make("events.Topic")
+        kept = suggest_presenter(topic.slug, topic.creator, "ana@example.com")
+        deleted = suggest_presenter(topic.slug, topic.creator, "bia@example.com")
+        soft_delete_suggestion(deleted.id)
+        created_at = PresenterSuggestion.objects.get(pk=kept.id).created_at
+        _delete(topic, days_ago=100)
+
+        result = archive_deleted_topics(retention=timedelta(days=90))
+
+        assert result.presenter_suggestions == 2
+        assert not PresenterSuggestion.all_objects.filter(topic_id=topic.pk).exists()
+        assert ArchivedPresenterSuggestion.objects.filter(topic_id=topic.pk).count() == 2
+
+        restored = restore_archived_topic(ArchivedTopic.objects.get(pk=topic.pk))
+
+        live = PresenterSuggestion.objects.get(topic=restored)
+        assert (live.pk, live.presenter_contact) == (kept.id, "ana@example.com")
+        assert live.created_at == created_at
+        assert PresenterSuggestion.all_objects.filter(topic=restored).count() == 2
+        assert not ArchivedPresenterSuggestion.objects.exists()
+
+    def test_restore_suffixes_reused_slug(self) -> None:
+        """Verify a slug taken while the topic was archived gets a suffix."""
+        topic = _deleted_topic(days_ago=100, slug="my-topic")
+        archive_deleted_topics(retention=timedelta(days=90))
+        baker.make("events.Topic", slug="my-topic")
+
+        restored = restore_archived_topic(ArchivedTopic.objects.get(pk=topic.pk))
+
+        assert restored.slug == "my-topic-1"
+
+
+@pytest.mark.django_db
+class TestArchiveDeletedTopicsCommand:
+    """Tests for the archive_deleted_topics management command."""
+
+    def test_command_reports_rows_moved(self) -> None:
+        """Verify the command archives and reports topics, votes and time spent."""
+        topic = _deleted_topic(days_ago=40)
+        baker.make("events.Vote", topic=topic)
+        out = StringIO()
+
+        call_command("archive_deleted_topics", "--days", "30", stdout=out)
+
+        assert (
+            "Archived 1 topics, 1 votes, 0 comments and 0 presenter suggestions" in out.getvalue()
+        )
+        assert ArchivedTopic.objects.filter(pk=topic.pk).exists()
+
+    def test_command_uses_retention_setting_by_default(self, settings) -> None:
+        """Verify the default retention comes from TOPIC_ARCHIVE_RETENTION_DAYS."""
+        settings.TOPIC_ARCHIVE_RETENTION_DAYS = 90
+        _deleted_topic(days_ago=40)
+        out = StringIO()
+
+        call_command("archive_deleted_topics", stdout=out)
+
+        assert "Archived 0 topics" in out.getvalue()
@@ -0,0 +1,109 @@
+"""
+Unit tests for comment_service module.
+"""
+
+import pytest
+from model_bakery import baker
+from pytest_django.asserts import assertNumQueries
+
+from events.models import Comment, Topic
+from events.services.comment_service import (
+    create_comment,
+    get_comments_page,
+    restore_comment,
+    soft_delete_comment,
+)
+
+
+def _comment_count(topic: Topic) -> int:
+    return Topic.all_objects.values_list("comment_count", flat=True).get(pk=topic.pk)
+
+
+@pytest.mark.django_db
+class TestCommentCount:
+    """Tests for the denormalized Topic.comment_count."""
+
+    def test_create_comment_increments_count(self) -> None:
+        """Verify create_comment creates the comment and increments comment_count."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+
+        create_comment(topic_slug=topic.slug, user=user, content="Ótimo tema!")
+        create_comment(topic_slug=topic.slug, user=user, content="Concordo")
+
+        assert Comment.objects.filter(topic=topic).count() == 2
+        assert _comment_count(topic) == 2
+
+    def test_soft_delete_decrements_count_once(self) -> None:
+        """Verify deleting twice only decrements comment_count once."""
+        topic = baker.make("events.Topic")
+        dto = create_comment(topic_slug=topic.slug, user=baker.make("accounts.User"), content="x")
+
+        assert soft_delete_comment(dto.id) is True
+        assert soft_delete_comment(dto.id) is False
+
+        assert _comment_count(topic) == 0
+        assert Comment.all_objects.get(pk=dto.id).is_deleted is True
+
+    def test_restore_increments_count(self) -> None:
+        """Verify restoring a deleted comment increments comment_count again."""
+        topic = baker.make("events.Topic")
+        dto = create_comment(topic_slug=topic.slug, user=baker.make("accounts.User"), content="x")
+        soft_delete_comment(dto.id)
+
+        assert restore_comment(dto.id) is True
+        assert restore_comment(dto.id) is False
+
+        assert _comment_count(topic) == 1
+
+
+@pytest.mark.django_db
+class TestGetCommentsPage:
+    """Tests for get_comments_page keyset pagination."""
+
+    @pytest.fixture
+    def topic(self) -> Topic:
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+        for i in range(25):
+            create_comment(topic_slug=topic.slug, user=user, content=f"comment {i}")
+        return topic
+
+    def test_pages_cover_all_comments_oldest_first_without_overlap(self, topic: Topic) -> None:
+        """Verify following next_cursor walks every comment exactly once, in order."""
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = get_comments_page(topic.slug, cursor=cursor)
+            seen.extend(comment.content for comment in page.comments)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert seen == [f"comment {i}" for i in range(25)]
+
+    def test_page_excludes_deleted_comments(self, topic: Topic) -> None:
+        """Verify soft-deleted comments are not listed."""
+        first = Comment.objects.filter(topic=topic).order_by("created_at").first()
+        soft_delete_comment(first.pk)
+
+        page = get_comments_page(topic.slug, limit=100)
+
+        assert len(page.comments) == 24
+        assert first.pk not in {comment.id for comment in page.comments}
+
+    def test_page_query_count_is_constant(self, topic: Topic) -> None:
+        """Verify a page costs the same queries whatever the cursor position."""
+        first = get_comments_page(topic.slug)
+
+        # topic, comments + authors, authors' social accounts
+        with assertNumQueries(3):
+            get_comments_page(topic.slug, cursor=first.next_cursor)
+
+    def test_invalid_cursor_raises_value_error(self, topic: Topic) -> None:
+        """Verify a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            get_comments_page(topic.slug, cursor="not-a-cursor")
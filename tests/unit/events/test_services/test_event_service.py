@@ -0,0 +1,112 @@
+"""
+Unit tests for event_service module.
+"""
+
+import pytest
+from model_bakery import baker
+
+from events.models import Event, Topic
+from events.services.event_service import (
+    close_voting,
+    get_events_page,
+    is_topic_voting_closed,
+    is_voting_closed,
+    reopen_voting,
+)
+
+
+@pytest.mark.django_db
+class TestCloseVoting:
+    """Tests for close_voting function."""
+
+    def test_ranks_topics_by_votes_then_age(self) -> None:
+        """Verify final ranks follow the most voted order, ties going to older topics."""
+        event = baker.make("events.Event")
+        older = baker.make("events.Topic", event=event, vote_count=2)
+        newer = baker.make("events.Topic", event=event, vote_count=2)
+        top = baker.make("events.Topic", event=event, vote_count=7)
+        deleted = baker.make("events.Topic", event=event, vote_count=9, is_deleted=True)
+
+        assert close_voting(event.slug) == 3
+
+        ranks = dict(Topic.all_objects.values_list("pk", "final_rank"))
+        assert ranks == {top.pk: 1, older.pk: 2, newer.pk: 3, deleted.pk: None}
+
+    def test_closes_the_event(self) -> None:
+        """Verify the event is closed with a timestamp and its version bumped."""
+        event = baker.make("events.Event")
+
+        close_voting(event.slug)
+
+        closed = Event.objects.get(pk=event.pk)
+        assert closed.is_closed
+        assert closed.voting_closed_at is not None
+        assert closed.version == event.version + 1
+
+    def test_unknown_event(self) -> None:
+        """Verify closing a missing event raises Event.DoesNotExist."""
+        with pytest.raises(Event.DoesNotExist):
+            close_voting("nao-existe")
+
+
+@pytest.mark.django_db
+class TestReopenVoting:
+    """Tests for reopen_voting function."""
+
+    def test_reopens_and_discards_the_ranking(self) -> None:
+        """Verify the event is open again and its topics lose their final rank."""
+        event = baker.make("events.Event")
+        baker.make("events.Topic", event=event, _quantity=2)
+        close_voting(event.slug)
+
+        reopen_voting(event.slug)
+
+        event.refresh_from_db()
+        assert (event.status, event.voting_closed_at) == (Event.OPEN, None)
+        assert not Topic.objects.filter(final_rank__isnull=False).exists()
+
+
+@pytest.mark.django_db
+class TestIsVotingClosed:
+    """Tests for is_voting_closed and is_topic_voting_closed functions."""
+
+    def test_reflects_the_event_status(self) -> None:
+        """Verify both checks follow the event's status."""
+        topic = baker.make("events.Topic")
+
+        assert not is_voting_closed(topic.event.slug)
+        assert not is_topic_voting_closed(topic.slug)
+
+        close_voting(topic.event.slug)
+
+        assert is_voting_closed(topic.event.slug)
+        assert is_topic_voting_closed(topic.slug)
+        assert not is_voting_closed("nao-existe")
+
+
+@pytest.mark.django_db
+class TestGetEventsPage:
+    """Tests for get_events_page function."""
+
+    def test_pages_through_events_by_slug(self) -> None:
+        """Verify the pages follow slug order and the last one has no cursor."""
+        for slug in ("gamma", "alpha", "delta", "beta"):
+            baker.make("events.Event", slug=slug)
+
+        first = get_events_page(limit=3)
+        second = get_events_page(cursor=first.next_cursor, limit=3)
+
+        assert [event.slug for event in first.events] == ["alpha", "beta", "delta"]
+        assert [event.slug for event in second.events] == ["gamma"]
+        assert second.next_cursor is None
+
+    def test_exact_last_page_has_no_cursor(self) -> None:
+        """Verify a page ending on the last event has no next cursor."""
+        baker.make("events.Event", _quantity=2)
+
+        assert get_events_page(limit=2).next_cursor is None
+
+    def test_rejects_malformed_cursor(self) -> None:
+        """Verify a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            get_events_page(cursor="not base64!")
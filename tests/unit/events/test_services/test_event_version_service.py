@@ -0,0 +1,229 @@
+"""
+Unit tests for event_version_service and the services that bump event versions.
+"""
+
+import pytest
+from allauth.socialaccount.models import SocialAccount
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from accounts.models import User
+from events.models import Event, Topic
+from events.services.comment_service import create_comment, soft_delete_comment
+from events.services.event_version_service import (
+    bump_event_version,
+    bump_user_event_versions,
+    get_event_version,
+    wait_for_event_change,
+)
+from events.services.presenter_service import soft_delete_suggestion, suggest_presenter
+from events.services.topic_service import create_topic, soft_delete_topic, update_topic
+from events.services.vote_service import unvote_topic, vote_topic
+
+
+def _version(event: Event) -> int:
+    return Event.objects.values_list("version", flat=True).get(pk=event.pk)
+
+
+@pytest.mark.django_db
+class TestEventVersion:
+    """Tests for bump_event_version and get_event_version."""
+
+    def test_bump_increments_version_and_updated_at(self) -> None:
+        """Verify a bump increments version and moves updated_at forward."""
+        event = baker.make("events.Event", slug="test-event")
+        before = get_event_version("test-event")
+
+        bump_event_version(event.id)
+
+        after = get_event_version("test-event")
+        assert after.version == before.version + 1
+        assert after.updated_at > before.updated_at
+
+    def test_bump_stamps_the_changed_topic(self) -> None:
+        """Verify a topic bump stamps the topic, and only it, with the new version."""
+        event = baker.make("events.Event")
+        topic, other = baker.make("events.Topic", event=event, _quantity=2)
+
+        bump_event_version(event.id)
+        bump_event_version(event.id, topic.id)
+
+        stamps = dict(Topic.objects.values_list("pk", "changed_in_version"))
+        assert stamps == {topic.pk: 2, other.pk: 0}
+
+    def test_get_event_version_is_cached_until_a_bump(self, django_assert_num_queries) -> None:
+        """Verify validators are read once, and again after a bump publishes the change."""
+        event = baker.make("events.Event", slug="test-event")
+        with django_assert_num_queries(1):
+            get_event_version("test-event")
+            get_event_version("test-event")
+
+        bump_event_version(event.id)
+
+        with django_assert_num_queries(1):
+            assert get_event_version("test-event").version == 1
+
+    def test_get_event_version_unknown_slug(self) -> None:
+        """Verify get_event_version returns None for unknown events."""
+        assert get_event_version("missing") is None
+
+
+@pytest.mark.django_db
+class TestServicesBumpEventVersion:
+    """Every write rendered on the event page must bump the event version."""
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="test-event")
+
+    def test_topic_writes_bump(self, event: Event) -> None:
+        """Verify topic create, update and delete each bump the version."""
+        user = baker.make("accounts.User")
+
+        dto = create_topic(user=user, title="Tema", description="", event_slug=event.slug)
+        assert _version(event) == 1
+        update_topic(topic_slug=dto.slug, title="Outro tema", description="")
+        assert _version(event) == 2
+        soft_delete_topic(topic_slug=dto.slug)
+        assert _version(event) == 3
+
+    def test_vote_writes_bump_only_on_change(self, event: Event) -> None:
+        """Verify vote/unvote bump the version, no-op calls don't."""
+        topic = baker.make("events.Topic", event=event)
+        user = baker.make("accounts.User")
+
+        vote_topic(topic_slug=topic.slug, user=user)
+        vote_topic(topic_slug=topic.slug, user=user)
+        assert _version(event) == 1
+        unvote_topic(topic_slug=topic.slug, user=user)
+        unvote_topic(topic_slug=topic.slug, user=user)
+        assert _version(event) == 2
+
+    def test_comment_and_presenter_writes_bump(self, event: Event) -> None:
+        """Verify comment and presenter suggestion writes bump the version."""
+        topic = baker.make("events.Topic", event=event)
+        user = baker.make("accounts.User")
+
+        comment = create_comment(topic_slug=topic.slug, user=user, content="x")
+        soft_delete_comment(comment.id)
+        suggestion = suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact="x")
+        soft_delete_suggestion(suggestion.id)
+
+        assert _version(event) == 4
+
+    def test_writes_leave_other_events_alone(self, event: Event) -> None:
+        """Verify only the affected event is bumped."""
+        other = baker.make("events.Event")
+        topic = baker.make("events.Topic", event=event)
+
+        vote_topic(topic_slug=topic.slug, user=baker.make("accounts.User"))
+
+        assert _version(other) == 0
+
+
+@pytest.mark.django_db
+class TestBumpUserEventVersions:
+    """Tests for bump_user_event_versions and the profile changes that call it."""
+
+    @pytest.fixture
+    def user(self) -> User:
+        return baker.make("accounts.User", username="ana")
+
+    def test_stamps_topics_showing_the_user(self, user: User) -> None:
+        """Verify the user's topics and the topics they suggested presenters for are stamped."""
+        event, suggested_event, other_event = baker.make("events.Event", _quantity=3)
+        created = baker.make("events.Topic", event=event, creator=user)
+        suggested = baker.make("events.Topic", event=suggested_event)
+        suggest_presenter(suggested.slug, user, "Ana")
+        untouched = baker.make("events.Topic", event=other_event)
+        versions = {e.pk: _version(e) for e in (event, suggested_event, other_event)}
+
+        assert bump_user_event_versions(user.pk) == 2
+
+        assert _version(event) == versions[event.pk] + 1
+        assert _version(suggested_event) == versions[suggested_event.pk] + 1
+        assert _version(other_event) == versions[other_event.pk]
+        stamps = dict(Topic.objects.values_list("pk", "changed_in_version"))
+        assert stamps[created.pk] == _version(event)
+        assert stamps[suggested.pk] == _version(suggested_event)
+        assert stamps[untouched.pk] == 0
+
+    def test_rename_bumps_but_login_does_not(self, user: User) -> None:
+        """Verify saving a user's name bumps their events, and the last_login update doesn't."""
+        event = baker.make("events.Event")
+        baker.make("events.Topic", event=event, creator=user)
+        version = _version(event)
+
+        user.save(update_fields=["last_login"])
+        assert _version(event) == version
+
+        user.first_name = "Ana"
+        user.save()
+        assert _version(event) == version + 1
+
+    def test_new_avatar_bumps(self, user: User) -> None:
+        """Verify a social account with an avatar not stored yet bumps the user's events."""
+        event = baker.make("events.Event")
+        baker.make("events.Topic", event=event, creator=user)
+        version = _version(event)
+
+        baker.make(
+            SocialAccount,
+            user=user,
+            provider="google",
+            extra_data={"picture": "https://lh3.googleusercontent.com/a/new"},
+        )
+
+        assert _version(event) == version + 1
+
+
+@pytest.mark.django_db
+class TestWaitForEventChange:
+    """Tests for wait_for_event_change function."""
+
+    @pytest.fixture
+    def event(self) -> Event:
+        """Create test event."""
+        return baker.make("events.Event", slug="test-event")
+
+    def test_returns_topics_changed_since_version(self, event: Event) -> None:
+        """Verify changed topics since the client's version are returned, deleted ones too."""
+        seen, voted, deleted = baker.make("events.Topic", event=event, _quantity=3)
+        bump_event_version(event.id, seen.id)
+        vote_topic(topic_slug=voted.slug, user=baker.make("accounts.User"))
+        soft_delete_topic(topic_slug=deleted.slug)
+
+        changes = async_to_sync(wait_for_event_change)(event.slug, 1, timeout=1, interval=0.01)
+
+        assert changes.version == 3
+        assert sorted(changes.topic_slugs) == sorted([voted.slug, deleted.slug])
+
+    def test_event_wide_change_has_no_topics(self, event: Event) -> None:
+        """Verify a change to no topic in particular returns an empty topic list."""
+        baker.make("events.Topic", event=event)
+        bump_event_version(event.id)
+
+        changes = async_to_sync(wait_for_event_change)(event.slug, 0, timeout=1, interval=0.01)
+
+        assert (changes.version, changes.topic_slugs) == (1, [])
+
+    def test_times_out_without_reading_topics(self, event: Event) -> None:
+        """Verify an unchanged event returns None, having only polled the event's version."""
+        baker.make("events.Topic", event=event)
+
+        with CaptureQueriesContext(connection) as queries:
+            changes = async_to_sync(wait_for_event_change)(
+                event.slug, 0, timeout=0.05, interval=0.01
+            )
+
+        assert changes is None
+        assert len(queries) > 1
+        assert not [q["sql"] for q in queries if "events_topic" in q["sql"]]
+
+    def test_unknown_event(self) -> None:
+        """Verify waiting on a missing event raises Event.DoesNotExist."""
+        with pytest.raises(Event.DoesNotExist):
+            async_to_sync(wait_for_event_change)("missing", 0, timeout=1, interval=0.01)
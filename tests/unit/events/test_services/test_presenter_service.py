@@ -0,0 +1,120 @@
+"""
+Unit tests for presenter_service module and the presenter suggestions preview.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from events.models import PresenterSuggestion
+from events.services.presenter_service import (
+    MAX_SUGGESTIONS_PER_TOPIC,
+    MAX_SUGGESTIONS_PER_USER,
+    get_suggestions_for_topic,
+    soft_delete_suggestion,
+    suggest_presenter,
+)
+from events.services.topic_service import PRESENTER_PREVIEW_SIZE, get_topics_for_event
+
+
+@pytest.mark.django_db
+class TestSuggestPresenter:
+    """Tests for suggest_presenter and its limits."""
+
+    def test_suggest_presenter_creates_suggestion(self) -> None:
+        """Verify suggest_presenter creates a suggestion and returns its DTO."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User", username="alice")
+
+        dto = suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact="bob@x.com")
+
+        assert dto.presenter_contact == "bob@x.com"
+        assert dto.suggested_by_username == "alice"
+        assert dto.topic_slug == topic.slug
+        assert PresenterSuggestion.objects.filter(topic=topic).count() == 1
+
+    def test_per_user_limit(self) -> None:
+        """Verify a user can't suggest more than MAX_SUGGESTIONS_PER_USER presenters."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+        for i in range(MAX_SUGGESTIONS_PER_USER):
+            suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact=f"p{i}")
+
+        with pytest.raises(ValueError, match="at most"):
+            suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact="one more")
+
+    def test_per_topic_limit(self) -> None:
+        """Verify a topic can't have more than MAX_SUGGESTIONS_PER_TOPIC suggestions."""
+        topic = baker.make("events.Topic")
+        baker.make("events.PresenterSuggestion", topic=topic, _quantity=MAX_SUGGESTIONS_PER_TOPIC)
+
+        with pytest.raises(ValueError, match="maximum"):
+            suggest_presenter(
+                topic_slug=topic.slug, user=baker.make("accounts.User"), presenter_contact="x"
+            )
+
+    def test_deleted_suggestions_free_the_limit(self) -> None:
+        """Verify soft-deleted suggestions don't count towards the limits."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+        dtos = [
+            suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact=f"p{i}")
+            for i in range(MAX_SUGGESTIONS_PER_USER)
+        ]
+
+        assert soft_delete_suggestion(dtos[0].id) is True
+        assert soft_delete_suggestion(dtos[0].id) is False
+        suggest_presenter(topic_slug=topic.slug, user=user, presenter_contact="again")
+
+    def test_get_suggestions_for_topic_returns_all_live_oldest_first(self) -> None:
+        """Verify the full list has every live suggestion in creation order."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+        for i in range(5):
+            suggest_presenter(
+                topic_slug=topic.slug, user=baker.make("accounts.User"), presenter_contact=f"p{i}"
+            )
+        baker.make("events.PresenterSuggestion", topic=topic, suggested_by=user, is_deleted=True)
+
+        dtos = get_suggestions_for_topic(topic.slug)
+
+        assert [dto.presenter_contact for dto in dtos] == [f"p{i}" for i in range(5)]
+
+
+@pytest.mark.django_db
+class TestPresenterSuggestionsPreview:
+    """The topic listing carries only a count and a bounded preview of suggestions."""
+
+    def test_listing_carries_count_and_first_suggestions(self) -> None:
+        """Verify each TopicDTO has the total count but only PRESENTER_PREVIEW_SIZE DTOs."""
+        event = baker.make("events.Event", slug="test-event")
+        busy = baker.make("events.Topic", event=event)
+        quiet = baker.make("events.Topic", event=event)
+        for i in range(7):
+            baker.make("events.PresenterSuggestion", topic=busy, presenter_contact=f"p{i}")
+        baker.make("events.PresenterSuggestion", topic=busy, is_deleted=True)
+
+        dtos = {dto.slug: dto for dto in get_topics_for_event("test-event")}
+
+        assert dtos[busy.slug].presenter_suggestion_count == 7
+        assert [p.presenter_contact for p in dtos[busy.slug].presenter_suggestions] == [
+            f"p{i}" for i in range(PRESENTER_PREVIEW_SIZE)
+        ]
+        assert dtos[quiet.slug].presenter_suggestion_count == 0
+        assert dtos[quiet.slug].presenter_suggestions == []
+
+    def test_preview_query_is_row_bounded(self) -> None:
+        """Verify the preview prefetch is limited per topic by a window function."""
+        event = baker.make("events.Event", slug="test-event")
+        topic = baker.make("events.Topic", event=event)
+        baker.make("events.PresenterSuggestion", topic=topic, _quantity=10)
+
+        with CaptureQueriesContext(connection) as ctx:
+            get_topics_for_event("test-event")
+
+        preview_sql = next(
+            q["sql"] for q in ctx.captured_queries if "events_presentersuggestion" in q["sql"]
+        )
+        assert "ROW_NUMBER() OVER (PARTITION BY" in preview_sql
+        assert f"<= {PRESENTER_PREVIEW_SIZE}" in preview_sql
@@ -0,0 +1,172 @@
+"""
+Unit tests for seed_service module and the seed_load command.
+"""
+
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils.text import slugify
+
+from accounts.models import User
+from events.models import Event, Topic, Vote, VoteHourlyRollup
+from events.services.seed_service import SeedConfig, seed_load, zipf_allocation
+from events.services.vote_analytics_service import hour_start
+
+UNTIL = datetime(2026, 6, 1, tzinfo=UTC)
+
+
+def _config(**kwargs: object) -> SeedConfig:
+    defaults = {"users": 200, "events": 3, "topics": 100, "votes": 3_000, "until": UNTIL}
+    return SeedConfig(**{**defaults, **kwargs})
+
+
+class TestZipfAllocation:
+    """Tests for zipf_allocation function."""
+
+    def test_allocates_total_with_decreasing_shares(self) -> None:
+        """Verify the total is allocated and higher ranks get more."""
+        counts = zipf_allocation(1_000, [1_000] * 10, exponent=1.0)
+
+        assert sum(counts) == 1_000
+        assert counts == sorted(counts, reverse=True)
+        assert counts[0] > 3 * counts[9]
+
+    def test_respects_capacity(self) -> None:
+        """Verify full buckets overflow into the next ranks."""
+        counts = zipf_allocation(100, [30, 30, 30, 30], exponent=2.0)
+
+        assert counts == [30, 30, 30, 10]
+
+    def test_total_capped_by_capacity(self) -> None:
+        """Verify no more than the combined capacity is allocated."""
+        assert zipf_allocation(100, [5, 5], exponent=1.0) == [5, 5]
+
+
+@pytest.mark.django_db
+class TestSeedLoad:
+    """Tests for seed_load function."""
+
+    def test_creates_requested_rows(self) -> None:
+        """Verify row counts and the soft-deleted share."""
+        result = seed_load(_config(deleted_ratio=0.2))
+
+        assert (result.users, result.events, result.topics, result.votes) == (200, 3, 100, 3_000)
+        assert User.objects.count() == 200
+        assert Event.objects.count() == 3
+        assert Topic.all_objects.count() == 100
+        assert Vote.objects.count() == 3_000
+        deleted = Topic.all_objects.filter(is_deleted=True)
+        assert deleted.count() == result.deleted_topics > 0
+        assert all(topic.deleted_at >= topic.created_at for topic in deleted)
+
+    def test_votes_are_skewed(self) -> None:
+        """Verify a few topics get most votes (Zipf), with one vote per user and topic."""
+        seed_load(_config())
+
+        counts = list(
+            Topic.all_objects.annotate(n=Count("votes")).order_by("-n").values_list("n", flat=True)
+        )
+        assert sum(counts[:10]) > sum(counts[10:])
+        assert not Vote.objects.values("topic", "user").annotate(n=Count("id")).filter(n__gt=1)
+
+    def test_votes_are_counted_into_hourly_rollups(self) -> None:
+        """Verify each topic's rollups add up to its seeded votes, by vote hour."""
+        seed_load(_config())
+
+        rollups = dict(
+            VoteHourlyRollup.objects.values("topic_id")
+            .annotate(n=Sum("votes_cast"))
+            .values_list("topic_id", "n")
+        )
+        votes = dict(
+            Vote.objects.values("topic_id").annotate(n=Count("id")).values_list("topic_id", "n")
+        )
+        assert rollups == votes
+        vote = Vote.objects.first()
+        assert VoteHourlyRollup.objects.filter(
+            topic_id=vote.topic_id, hour=hour_start(vote.created_at)
+        ).exists()
+
+    def test_duplicate_titles_get_suffixed_slugs(self) -> None:
+        """Verify reused titles exercise the slug suffixes Topic.save would generate."""
+        seed_load(_config(duplicate_ratio=0.5))
+
+        title = (
+            Topic.all_objects.values("title")
+            .annotate(n=Count("id"))
+            .filter(n__gt=1)
+            .order_by("-n")
+            .values_list("title", flat=True)
+            .first()
+        )
+        slugs = set(Topic.all_objects.filter(title=title).values_list("slug", flat=True))
+        base = slugify(title)
+        assert {base, f"{base}-1"} <= slugs
+
+    def test_timestamps_are_spread_and_consistent(self) -> None:
+        """Verify generated timestamps are kept (not insert time) and votes follow topics."""
+        seed_load(_config(days=30))
+
+        topic_dates = set(Topic.all_objects.values_list("created_at__date", flat=True))
+        assert len(topic_dates) > 10
+        assert max(topic_dates) <= UNTIL.date()
+        for vote in Vote.objects.select_related("topic")[:200]:
+            assert UNTIL >= vote.created_at >= vote.topic.created_at
+
+    def test_same_seed_same_rows(self) -> None:
+        """Verify a seed always produces identical rows, ids included."""
+
+        def rows(config: SeedConfig) -> tuple:
+            with transaction.atomic():
+                seed_load(config)
+                snapshot = (
+                    list(User.objects.order_by("id").values_list("id", "username")),
+                    list(Topic.all_objects.order_by("id").values_list("id", "slug", "created_at")),
+                    list(Vote.objects.order_by("id").values_list("id", "topic_id", "user_id")),
+                )
+                transaction.set_rollback(True)
+            return snapshot
+
+        assert rows(_config(seed=7)) == rows(_config(seed=7))
+        assert rows(_config(seed=7))[1] != rows(_config(seed=8))[1]
+
+    def test_seed_loads_once(self) -> None:
+        """Verify loading the same seed twice is rejected."""
+        seed_load(_config(votes=0))
+
+        with pytest.raises(ValueError, match="already loaded"):
+            seed_load(_config(votes=0))
+
+
+@pytest.mark.django_db
+class TestSeedLoadCommand:
+    """Tests for the seed_load management command."""
+
+    def test_command_reports_rows(self) -> None:
+        """Verify the command seeds and reports what it created."""
+        out = StringIO()
+
+        call_command(
+            "seed_load",
+            "--users=50",
+            "--events=2",
+            "--topics=20",
+            "--votes=300",
+            "--until=2026-06-01",
+            "--force",
+            stdout=out,
+        )
+
+        assert "Created 50 users, 2 events, 20 topics" in out.getvalue()
+        assert Vote.objects.count() == 300
+
+    def test_command_refuses_without_debug(self, settings) -> None:
+        """Verify the command won't seed a non-DEBUG environment without --force."""
+        settings.DEBUG = False
+
+        with pytest.raises(CommandError, match="--force"):
+            call_command("seed_load", "--users=1", stdout=StringIO())
@@ -0,0 +1,184 @@
+"""
+Unit tests for snapshot_service module and the archive_event command.
+"""
+
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from model_bakery import baker
+
+from events.models import Event
+from events.services.event_service import reopen_voting
+from events.services.snapshot_service import (
+    MANIFEST_NAME,
+    archive_event,
+    get_event_snapshot,
+    unarchive_event,
+)
+from events.services.topic_service import TOPICS_PAGE_SIZE
+
+
+@pytest.fixture
+def snapshot_dir(settings, tmp_path: Path) -> Path:
+    """Keep each test's snapshots in its own directory."""
+    settings.EVENT_SNAPSHOT_DIR = tmp_path
+    return tmp_path
+
+
+def _manifest(snapshot_dir: Path) -> dict[str, str]:
+    return json.loads((snapshot_dir / MANIFEST_NAME).read_text())
+
+
+@pytest.mark.django_db
+class TestArchiveEvent:
+    """Tests for archive_event function."""
+
+    def test_writes_hashed_precompressed_snapshot(self, snapshot_dir: Path) -> None:
+        """Verify the snapshot is content-hashed, gzipped and listed in the manifest."""
+        event = baker.make("events.Event", status=Event.CLOSED, slug="python-floripa")
+        baker.make("events.Topic", event=event, title="Tópico arquivado")
+
+        result = archive_event(event.slug)
+
+        assert result.path.name.startswith("python-floripa.")
+        assert result.path.with_name(f"{result.path.name}.gz").exists()
+        assert _manifest(snapshot_dir) == {"python-floripa": result.path.name}
+        html = result.path.read_text()
+        assert "Tópico arquivado" in html
+        assert "Este evento foi arquivado" in html
+        event.refresh_from_db()
+        assert event.archived_at is not None
+
+    @pytest.mark.usefixtures("snapshot_dir")
+    def test_renders_every_page_without_user_controls(self) -> None:
+        """Verify all topics are in the snapshot, with no CSRF token, vote or sort controls."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        for i in range(TOPICS_PAGE_SIZE + 5):
+            baker.make("events.Topic", event=event, title=f"Tópico {i:02d}")
+
+        result = archive_event(event.slug)
+
+        html = result.path.read_text()
+        assert result.topics == TOPICS_PAGE_SIZE + 5
+        assert html.count('class="topic-item"') == TOPICS_PAGE_SIZE + 5
+        assert '<input type="hidden" name="csrfmiddlewaretoken"' not in html
+        assert 'class="vote-plus-button' not in html
+        assert "load-more-trigger" not in html
+        assert 'class="topic-sort"' not in html
+
+    def test_rearchiving_replaces_the_snapshot(self, snapshot_dir: Path) -> None:
+        """Verify a new snapshot replaces the old one and its files are deleted."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        first = archive_event(event.slug)
+        baker.make("events.Topic", event=event, title="Chegou depois")
+
+        second = archive_event(event.slug)
+
+        assert second.path != first.path
+        assert not first.path.exists()
+        assert not first.path.with_name(f"{first.path.name}.gz").exists()
+        assert _manifest(snapshot_dir) == {event.slug: second.path.name}
+
+    @pytest.mark.usefixtures("snapshot_dir")
+    def test_unknown_event(self) -> None:
+        """Verify archiving a missing event raises Event.DoesNotExist."""
+        with pytest.raises(Event.DoesNotExist):
+            archive_event("nao-existe")
+
+    def test_open_event_is_not_archived(self, snapshot_dir: Path) -> None:
+        """Verify an event still taking votes can't be archived."""
+        event = baker.make("events.Event", status=Event.OPEN)
+
+        with pytest.raises(ValueError, match="closed"):
+            archive_event(event.slug)
+
+        assert not (snapshot_dir / MANIFEST_NAME).exists()
+        event.refresh_from_db()
+        assert event.archived_at is None
+
+    def test_reopening_voting_unarchives(self, snapshot_dir: Path) -> None:
+        """Verify reopening an archived event's voting deletes its snapshot."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        result = archive_event(event.slug)
+
+        reopen_voting(event.slug)
+
+        assert not result.path.exists()
+        assert _manifest(snapshot_dir) == {}
+        assert get_event_snapshot(event.slug) is None
+        event.refresh_from_db()
+        assert event.archived_at is None
+
+
+@pytest.mark.django_db
+class TestUnarchiveEvent:
+    """Tests for unarchive_event function."""
+
+    def test_deletes_the_snapshot(self, snapshot_dir: Path) -> None:
+        """Verify the files and manifest entry are removed and archived_at is cleared."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        result = archive_event(event.slug)
+
+        assert unarchive_event(event.slug) is True
+
+        assert not result.path.exists()
+        assert _manifest(snapshot_dir) == {}
+        event.refresh_from_db()
+        assert event.archived_at is None
+        assert unarchive_event(event.slug) is False
+
+
+@pytest.mark.django_db
+class TestGetEventSnapshot:
+    """Tests for get_event_snapshot function."""
+
+    @pytest.mark.usefixtures("snapshot_dir")
+    def test_follows_the_manifest_without_queries(self, django_assert_num_queries) -> None:
+        """Verify lookups read only the manifest, and see (un)archiving right away."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        with django_assert_num_queries(0):
+            assert get_event_snapshot(event.slug) is None
+
+        result = archive_event(event.slug)
+        with django_assert_num_queries(0):
+            snapshot = get_event_snapshot(event.slug)
+        assert snapshot is not None
+        assert snapshot.etag == f'"{result.path.name.split(".")[1]}"'
+
+        unarchive_event(event.slug)
+        assert get_event_snapshot(event.slug) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("snapshot_dir")
+class TestArchiveEventCommand:
+    """Tests for the archive_event management command."""
+
+    def test_archives_and_unarchives(self) -> None:
+        """Verify the command archives events and --unarchive reverts it."""
+        event = baker.make("events.Event", status=Event.CLOSED, slug="evento")
+        out = StringIO()
+
+        call_command("archive_event", "evento", stdout=out)
+        assert "Archived evento: 0 topics" in out.getvalue()
+        assert get_event_snapshot(event.slug) is not None
+
+        call_command("archive_event", "evento", "--unarchive", stdout=out)
+        assert "Unarchived evento" in out.getvalue()
+        assert get_event_snapshot(event.slug) is None
+
+    def test_unknown_event(self) -> None:
+        """Verify an unknown slug is a command error."""
+        with pytest.raises(CommandError, match="does not exist"):
+            call_command("archive_event", "nao-existe", stdout=StringIO())
+
+    def test_open_event(self) -> None:
+        """Verify archiving an event with open voting is a command error."""
+        baker.make("events.Event", status=Event.OPEN, slug="aberto")
+
+        with pytest.raises(CommandError, match="Only closed events"):
+            call_command("archive_event", "aberto", stdout=StringIO())
@@ -2,14 +2,25 @@
 Unit tests for topic_service module.
 """
 
+from datetime import timedelta
+
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from model_bakery import baker
 from pytest_django.asserts import assertNumQueries
 
 from events.dto.topic_dto import TopicDTO
 from events.models import Event, Topic
+from events.services.event_service import close_voting
+from events.services.topic_service import (
+    TopicSort,
+    decode_topic_cursor,
+    get_topics_for_event,
+    get_topics_page,
+)
 from events.services.topic_service import create_topic as create_topic_service
-from events.services.topic_service import get_topics_for_event
 
 
 @pytest.mark.django_db
@@ -101,8 +112,8 @@ class TestGetTopicsForEvent:
             baker.make("events.Topic", event=event, creator=user)
 
         with assertNumQueries(
-            3
-        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch
+            4
+        ):  # 1 for event, 1 for topics with select_related, 1 for social accounts prefetch, 1 for presenter suggestions preview
             dtos = get_topics_for_event("test-event")
 
         assert len(dtos) == 10
@@ -115,6 +126,75 @@ class TestGetTopicsForEvent:
             _ = dto.has_voted
 
 
+def _query_plan(sql: str) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN output for a captured query as one string."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        return "\n".join(row[-1] for row in cursor.fetchall())
+
+
+@pytest.mark.django_db
+class TestTopicQueryPlans:
+    """Verify topic queries use the partial (is_deleted=False) indexes."""
+
+    @pytest.fixture(autouse=True)
+    def seeded_topics(self) -> None:
+        event = baker.make("events.Event", slug="test-event")
+        other_event = baker.make("events.Event", slug="other-event")
+        user = baker.make("accounts.User")
+        baker.make("events.Topic", event=event, creator=user, _quantity=30)
+        baker.make("events.Topic", event=other_event, creator=user, _quantity=30)
+        baker.make("events.Topic", event=event, creator=user, is_deleted=True, _quantity=10)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def _topic_list_plan(self, user: object = None) -> str:
+        with CaptureQueriesContext(connection) as ctx:
+            get_topics_for_event("test-event", user=user)
+        topic_sql = next(
+            q["sql"] for q in ctx.captured_queries if 'FROM "events_topic"' in q["sql"]
+        )
+        return _query_plan(topic_sql)
+
+    def test_ranking_query_reads_partial_ranking_index(self) -> None:
+        """Verify the ranked listing reads the partial ranking index in order."""
+        plan = self._topic_list_plan()
+
+        assert "SEARCH events_topic USING INDEX events_topic_live_top_idx" in plan
+        assert "SCAN events_topic" not in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_ranking_query_with_user_reads_partial_ranking_index(self) -> None:
+        """Verify the has_voted subquery doesn't change the topic access path."""
+        user = baker.make("accounts.User")
+
+        plan = self._topic_list_plan(user=user)
+
+        assert "SEARCH events_topic USING INDEX events_topic_live_top_idx" in plan
+        assert "SCAN events_topic" not in plan
+
+    def test_recency_query_uses_partial_index_without_sorting(self) -> None:
+        """Verify newest-first listing walks the partial index with no temp B-tree."""
+        event = Event.objects.get(slug="test-event")
+        with CaptureQueriesContext(connection) as ctx:
+            list(Topic.objects.filter(event=event).order_by("-created_at")[:20])
+
+        plan = _query_plan(ctx.captured_queries[0]["sql"])
+
+        assert "events_topic_live_event_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_slug_lookup_uses_unique_slug_index(self) -> None:
+        """Verify slug lookups search the unique slug index."""
+        with CaptureQueriesContext(connection) as ctx:
+            Topic.objects.filter(slug="some-slug").exists()
+
+        plan = _query_plan(ctx.captured_queries[0]["sql"])
+
+        assert "SEARCH events_topic USING" in plan
+        assert "(slug=?)" in plan
+
+
 @pytest.mark.django_db
 class TestCreateTopicService:
     """Tests for create_topic service function."""
@@ -268,3 +348,151 @@ class TestSlugGenerationUniqueness:
         assert "&" not in dto.slug
         assert "!" not in dto.slug
         assert " " not in dto.slug
+
+
+@pytest.mark.django_db
+class TestGetTopicsPage:
+    """Tests for get_topics_page listing modes and keyset cursors."""
+
+    @pytest.fixture
+    def event(self) -> Event:
+        return baker.make("events.Event", slug="test-event")
+
+    def _titles(self, sort: TopicSort, user: object = None, limit: int = 20) -> list[str]:
+        return [
+            dto.title for dto in get_topics_page("test-event", sort, limit=limit, user=user).topics
+        ]
+
+    def test_modes_order_topics(self, event: Event) -> None:
+        """Verify top, newest and oldest order by vote count and creation time."""
+        user = baker.make("accounts.User")
+        now = timezone.now()
+        # Created in another order than their (backdated) creation times
+        for title, votes, age in (("c", 1, 1), ("a", 1, 3), ("b", 5, 2)):
+            topic = baker.make(
+                "events.Topic", event=event, creator=user, title=title, vote_count=votes
+            )
+            Topic.objects.filter(pk=topic.pk).update(created_at=now - timedelta(days=age))
+
+        assert self._titles(TopicSort.TOP) == ["b", "a", "c"]
+        assert self._titles(TopicSort.NEWEST) == ["c", "b", "a"]
+        assert self._titles(TopicSort.OLDEST) == ["a", "b", "c"]
+
+    def test_mine_and_unvoted_filter_by_user(self, event: Event) -> None:
+        """Verify "mine" lists the user's topics and "unvoted" the ones they haven't voted."""
+        user = baker.make("accounts.User")
+        other = baker.make("accounts.User")
+        own = baker.make("events.Topic", event=event, creator=user, title="own")
+        voted = baker.make("events.Topic", event=event, creator=other, title="voted")
+        baker.make("events.Topic", event=event, creator=other, title="open")
+        baker.make("events.Vote", topic=voted, user=user)
+        baker.make("events.Vote", topic=own, user=other)
+
+        assert self._titles(TopicSort.MINE, user=user) == ["own"]
+        assert sorted(self._titles(TopicSort.UNVOTED, user=user)) == ["open", "own"]
+
+    def test_personal_modes_need_a_user(self, event: Event) -> None:
+        """Verify "mine" and "unvoted" raise ValueError without a signed-in user."""
+        with pytest.raises(ValueError):
+            get_topics_page(event.slug, TopicSort.MINE)
+
+    def test_trending_counts_recent_votes_only(self, event: Event) -> None:
+        """Verify trending ranks by votes cast within the trending window."""
+        user = baker.make("accounts.User")
+        old = baker.make("events.Topic", event=event, creator=user, title="old", vote_count=3)
+        new = baker.make("events.Topic", event=event, creator=user, title="new", vote_count=1)
+        for voter in baker.make("accounts.User", _quantity=3):
+            vote = baker.make("events.Vote", topic=old, user=voter)
+            vote.created_at = timezone.now() - timedelta(days=30)
+            vote.save()
+        baker.make("events.Vote", topic=new, user=user)
+
+        assert self._titles(TopicSort.TRENDING) == ["new", "old"]
+
+    @pytest.mark.parametrize("sort", [TopicSort.TOP, TopicSort.NEWEST, TopicSort.TRENDING])
+    def test_cursor_pages_cover_every_topic_once(self, event: Event, sort: TopicSort) -> None:
+        """Verify following next_cursor returns each topic exactly once, in order."""
+        user = baker.make("accounts.User")
+        for i in range(7):
+            baker.make("events.Topic", event=event, creator=user, title=f"t{i}", vote_count=i % 3)
+        expected = self._titles(sort)
+
+        titles, cursor = [], None
+        while True:
+            page = get_topics_page(event.slug, sort, cursor=cursor, limit=3)
+            titles += [dto.title for dto in page.topics]
+            cursor = page.next_cursor
+            if not cursor:
+                break
+
+        assert titles == expected
+        assert len(titles) == 7
+
+    def test_last_page_has_no_cursor(self, event: Event) -> None:
+        """Verify a page that reaches the end has no next_cursor."""
+        baker.make("events.Topic", event=event, _quantity=3)
+
+        page = get_topics_page(event.slug, limit=3)
+
+        assert len(page.topics) == 3
+        assert page.next_cursor is None
+
+    def test_cursor_of_another_sort_is_rejected(self, event: Event) -> None:
+        """Verify a cursor can't be replayed against another mode or tampered with."""
+        baker.make("events.Topic", event=event, _quantity=3)
+        cursor = get_topics_page(event.slug, TopicSort.TOP, limit=1).next_cursor
+
+        assert decode_topic_cursor(cursor, TopicSort.TOP)
+        with pytest.raises(ValueError):
+            get_topics_page(event.slug, TopicSort.NEWEST, cursor=cursor)
+        with pytest.raises(ValueError):
+            get_topics_page(event.slug, TopicSort.TOP, cursor="not-a-cursor")
+
+
+@pytest.mark.django_db
+class TestClosedEventListing:
+    """Tests for listing the topics of events whose voting is closed."""
+
+    @pytest.fixture
+    def event(self) -> Event:
+        event = baker.make("events.Event", slug="closed-event")
+        for title, votes in (("b", 1), ("a", 3), ("c", 0)):
+            baker.make("events.Topic", event=event, title=title, vote_count=votes)
+        close_voting(event.slug)
+        return event
+
+    def test_every_mode_reads_the_final_ranking(self, event: Event) -> None:
+        """Verify closed events are listed by final_rank whatever sort is asked for."""
+        # Votes can't change any more; a stray update must not reorder the ranking
+        Topic.objects.filter(title="c").update(vote_count=10)
+
+        for sort in (TopicSort.TOP, TopicSort.NEWEST, TopicSort.TRENDING):
+            page = get_topics_page(event.slug, sort)
+            assert [dto.title for dto in page.topics] == ["a", "b", "c"]
+            assert page.sort == TopicSort.RANKING
+
+    def test_cursor_pages_follow_the_ranking(self, event: Event) -> None:
+        """Verify ranking pages continue from their cursor."""
+        first = get_topics_page(event.slug, limit=2)
+        second = get_topics_page(event.slug, cursor=first.next_cursor, limit=2)
+
+        assert [dto.title for dto in first.topics + second.topics] == ["a", "b", "c"]
+        assert second.next_cursor is None
+
+    def test_vote_status_is_not_computed(self, event: Event) -> None:
+        """Verify has_voted isn't queried for closed events, even for voters."""
+        user = baker.make("accounts.User")
+        baker.make("events.Vote", topic=Topic.objects.get(title="a"), user=user)
+
+        with CaptureQueriesContext(connection) as captured:
+            page = get_topics_page(event.slug, user=user)
+
+        assert not any(dto.has_voted for dto in page.topics)
+        assert not any('"events_vote"' in query["sql"] for query in captured.captured_queries)
+
+    def test_open_events_have_no_ranking(self) -> None:
+        """Verify asking an open event for its final ranking raises ValueError."""
+        event = baker.make("events.Event")
+
+        with pytest.raises(ValueError):
+            get_topics_page(event.slug, TopicSort.RANKING)
@@ -0,0 +1,122 @@
+"""
+Unit tests for topic_similarity_service module.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from model_bakery import baker
+
+from events.models import Topic, TopicTitleTrigram
+from events.services.archive_service import archive_deleted_topics, restore_archived_topic
+from events.services.topic_service import create_topic, soft_delete_topic, update_topic
+from events.services.topic_similarity_service import (
+    find_similar_topics,
+    index_topic_titles,
+    title_trigrams,
+)
+
+
+class TestTitleTrigrams:
+    """Tests for title_trigrams function."""
+
+    def test_pads_each_word_like_pg_trgm(self) -> None:
+        """Verify words are padded with two spaces in front and one behind."""
+        assert title_trigrams("Go") == {"  g", " go", "go "}
+
+    def test_ignores_case_accents_and_punctuation(self) -> None:
+        """Verify titles differing only in case, accents and punctuation match."""
+        assert title_trigrams("Introdução ao Django!") == title_trigrams("introducao ao django")
+
+    def test_title_without_words(self) -> None:
+        """Verify punctuation alone gives no trigrams."""
+        assert title_trigrams("?!") == set()
+
+
+@pytest.mark.django_db
+class TestTitleIndex:
+    """Tests for the trigram index kept by the topic services."""
+
+    def _indexed(self, topic: Topic) -> set[str]:
+        return set(
+            TopicTitleTrigram.objects.filter(topic_id=topic.pk).values_list("trigram", flat=True)
+        )
+
+    def test_create_edit_and_delete_maintain_the_index(self, sample_user) -> None:
+        """Verify created topics are indexed, edits reindexed and deletions removed."""
+        event = baker.make("events.Event")
+        dto = create_topic(sample_user, "Async Python", "", event.slug)
+        topic = Topic.objects.get(pk=dto.id)
+        assert self._indexed(topic) == title_trigrams("Async Python")
+
+        update_topic(topic.slug, "Tipagem estática", "")
+        assert self._indexed(topic) == title_trigrams("Tipagem estática")
+
+        soft_delete_topic(topic.slug)
+        assert self._indexed(topic) == set()
+
+    def test_restored_topics_are_indexed(self) -> None:
+        """Verify a topic restored from the archive is found again."""
+        topic = baker.make("events.Topic", title="Pandas na prática")
+        index_topic_titles([topic])
+        Topic.all_objects.filter(pk=topic.pk).update(
+            is_deleted=True, deleted_at=timezone.now() - timedelta(days=100)
+        )
+        TopicTitleTrigram.objects.filter(topic_id=topic.pk).delete()
+        archive_deleted_topics(retention=timedelta(days=90))
+
+        restored = restore_archived_topic(topic.event.archived_topics.get())
+
+        assert self._indexed(restored) == title_trigrams("Pandas na prática")
+
+
+@pytest.mark.django_db
+class TestFindSimilarTopics:
+    """Tests for find_similar_topics function."""
+
+    @pytest.fixture
+    def event(self, sample_user) -> object:
+        event = baker.make("events.Event", slug="python-floripa")
+        for title in (
+            "Introdução ao Django REST Framework",
+            "Testes com pytest",
+            "Django ORM avançado",
+            "Machine learning com scikit-learn",
+        ):
+            create_topic(sample_user, title, "", event.slug)
+        return event
+
+    def test_finds_reworded_titles_most_similar_first(self, event: object) -> None:
+        """Verify near-duplicates are found and unrelated titles are not."""
+        similar = find_similar_topics(event.slug, "introducao ao django rest")
+
+        assert [topic.title for topic in similar] == ["Introdução ao Django REST Framework"]
+        assert 0.3 <= similar[0].similarity < 1
+
+    def test_identical_title_has_similarity_one(self, event: object) -> None:
+        """Verify an exact re-suggestion scores 1."""
+        similar = find_similar_topics(event.slug, "Testes com Pytest")
+
+        assert (similar[0].title, similar[0].similarity) == ("Testes com pytest", 1)
+
+    def test_other_events_and_deleted_topics_are_ignored(self, event: object, sample_user) -> None:
+        """Verify only the event's live topics are suggested."""
+        other = baker.make("events.Event")
+        create_topic(sample_user, "Testes com pytest", "", other.slug)
+        soft_delete_topic(Topic.objects.get(event=event, title="Testes com pytest").slug)
+
+        assert find_similar_topics(event.slug, "Testes com pytest") == []
+
+    def test_excludes_the_topic_being_edited(self, event: object) -> None:
+        """Verify a topic isn't reported as similar to itself."""
+        topic = Topic.objects.get(event=event, title="Testes com pytest")
+
+        assert find_similar_topics(event.slug, topic.title, exclude_slug=topic.slug) == []
+
+    def test_reads_candidates_from_the_index(
+        self, event: object, django_assert_num_queries
+    ) -> None:
+        """Verify one query counts shared trigrams and one reads the candidates."""
+        with django_assert_num_queries(2):
+            find_similar_topics(event.slug, "Django ORM")
@@ -0,0 +1,251 @@
+"""
+Unit tests for vote_analytics_service module and the compact_vote_log command.
+"""
+
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from model_bakery import baker
+
+from events.models import Topic, VoteHourlyRollup, VoteLogEntry
+from events.services.archive_service import archive_deleted_topics
+from events.services.vote_analytics_service import (
+    add_to_rollups,
+    compact_vote_log,
+    get_event_vote_trend,
+    hour_start,
+    roll_up_vote_log,
+)
+from events.services.vote_service import unvote_topic, vote_topic
+
+
+def _backdate_log(days_ago: int) -> None:
+    VoteLogEntry.objects.update(created_at=timezone.now() - timedelta(days=days_ago))
+
+
+@pytest.mark.django_db
+class TestRecordVote:
+    """Tests for the vote log and rollups written by vote_service."""
+
+    def test_vote_and_unvote_are_logged(self) -> None:
+        """Verify casting and removing a vote each append a log entry."""
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic")
+
+        vote_topic(topic.slug, user)
+        unvote_topic(topic.slug, user)
+
+        entries = list(VoteLogEntry.objects.order_by("created_at").values_list("delta", "user"))
+        assert entries == [(VoteLogEntry.CAST, user.pk), (VoteLogEntry.REMOVED, user.pk)]
+        assert VoteLogEntry.objects.filter(topic_id=topic.pk, event_id=topic.event_id).count() == 2
+
+    def test_rollup_counts_cast_and_removed_in_the_hour(self) -> None:
+        """Verify the hour's rollup row counts both directions on one row."""
+        users = baker.make("accounts.User", _quantity=3)
+        topic = baker.make("events.Topic")
+
+        for user in users:
+            vote_topic(topic.slug, user)
+        unvote_topic(topic.slug, users[0])
+
+        rollup = VoteHourlyRollup.objects.get(topic_id=topic.pk)
+        assert (rollup.votes_cast, rollup.votes_removed, rollup.net_votes) == (3, 1, 2)
+        assert rollup.event_id == topic.event_id
+        assert rollup.hour == hour_start(timezone.now())
+
+    def test_duplicate_vote_is_not_logged(self) -> None:
+        """Verify a no-op vote or unvote doesn't write to the log."""
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic")
+
+        vote_topic(topic.slug, user)
+        vote_topic(topic.slug, user)
+        unvote_topic(topic.slug, baker.make("accounts.User"))
+
+        assert VoteLogEntry.objects.count() == 1
+
+    def test_history_survives_archival(self) -> None:
+        """Verify rollups outlive their topic being moved to the archive."""
+        topic = baker.make("events.Topic", title="Arquivado")
+        vote_topic(topic.slug, baker.make("accounts.User"))
+        Topic.all_objects.filter(pk=topic.pk).update(
+            is_deleted=True, deleted_at=timezone.now() - timedelta(days=100)
+        )
+
+        archive_deleted_topics(retention=timedelta(days=90))
+
+        assert VoteHourlyRollup.objects.filter(topic_id=topic.pk).exists()
+        trend = get_event_vote_trend(topic.event.slug, since=timezone.now() - timedelta(days=1))
+        assert [t.title for t in trend.top_topics] == ["Arquivado"]
+
+
+@pytest.mark.django_db
+class TestHourStart:
+    """Tests for hour_start function."""
+
+    def test_truncates_to_the_utc_hour(self) -> None:
+        """Verify moments are bucketed by their UTC hour."""
+        moment = datetime(2026, 3, 1, 22, 45, 10, tzinfo=UTC)
+
+        assert hour_start(moment) == datetime(2026, 3, 1, 22, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+class TestAddToRollups:
+    """Tests for add_to_rollups function."""
+
+    def test_merges_into_existing_rows_and_creates_new_ones(self) -> None:
+        """Verify bulk-loaded counts are added to existing rollup rows or inserted."""
+        topic = baker.make("events.Topic")
+        hour = hour_start(timezone.now()) - timedelta(days=2)
+        baker.make(
+            "events.VoteHourlyRollup", event=topic.event, topic=topic, hour=hour, votes_cast=10
+        )
+
+        add_to_rollups(
+            {
+                (topic.pk, hour): (topic.event_id, 2),
+                (topic.pk, hour + timedelta(hours=1)): (topic.event_id, 1),
+            }
+        )
+
+        rows = VoteHourlyRollup.objects.values_list("hour", "votes_cast", "votes_removed")
+        assert sorted(rows) == [(hour, 12, 0), (hour + timedelta(hours=1), 1, 0)]
+
+
+@pytest.mark.django_db
+class TestRollUpVoteLog:
+    """Tests for roll_up_vote_log function."""
+
+    def test_counts_pending_entries_once(self) -> None:
+        """Verify pending entries are counted by hour and marked, and not counted again."""
+        topic = baker.make("events.Topic")
+        hour = hour_start(timezone.now()) - timedelta(days=1)
+        for minute, delta in enumerate(
+            (VoteLogEntry.CAST, VoteLogEntry.CAST, VoteLogEntry.REMOVED)
+        ):
+            entry = baker.make("events.VoteLogEntry", event=topic.event, topic=topic, delta=delta)
+            VoteLogEntry.objects.filter(pk=entry.pk).update(
+                created_at=hour + timedelta(minutes=minute)
+            )
+
+        assert roll_up_vote_log(batch_size=2) == 3
+        assert roll_up_vote_log() == 0
+
+        rollup = VoteHourlyRollup.objects.get(topic_id=topic.pk)
+        assert (rollup.hour, rollup.votes_cast, rollup.votes_removed) == (hour, 2, 1)
+        assert not VoteLogEntry.objects.filter(rolled_up=False).exists()
+
+
+@pytest.mark.django_db
+class TestCompactVoteLog:
+    """Tests for compact_vote_log function and command."""
+
+    def test_deletes_expired_entries_and_keeps_rollups(self) -> None:
+        """Verify entries older than the retention are deleted in batches, rollups stay."""
+        topic = baker.make("events.Topic")
+        for user in baker.make("accounts.User", _quantity=5):
+            vote_topic(topic.slug, user)
+        _backdate_log(days_ago=40)
+        vote_topic(topic.slug, baker.make("accounts.User"))
+
+        result = compact_vote_log(retention=timedelta(days=30), batch_size=2)
+
+        assert (result.entries, result.batches) == (5, 3)
+        assert VoteLogEntry.objects.count() == 1
+        assert VoteHourlyRollup.objects.get(topic_id=topic.pk).votes_cast == 6
+
+    def test_keeps_entries_not_rolled_up(self) -> None:
+        """Verify expired entries the rollups don't hold yet are kept."""
+        vote_topic(baker.make("events.Topic").slug, baker.make("accounts.User"))
+        VoteLogEntry.objects.update(rolled_up=False)
+        _backdate_log(days_ago=40)
+
+        assert compact_vote_log(retention=timedelta(days=30)).entries == 0
+        assert VoteLogEntry.objects.count() == 1
+
+    def test_dry_run_only_counts(self) -> None:
+        """Verify dry_run reports the expired entries without deleting them."""
+        vote_topic(baker.make("events.Topic").slug, baker.make("accounts.User"))
+        _backdate_log(days_ago=40)
+
+        result = compact_vote_log(retention=timedelta(days=30), dry_run=True)
+
+        assert result.entries == 1
+        assert VoteLogEntry.objects.count() == 1
+
+    def test_command_uses_retention_setting(self, settings) -> None:
+        """Verify the command's default retention comes from VOTE_LOG_RETENTION_DAYS."""
+        settings.VOTE_LOG_RETENTION_DAYS = 50
+        vote_topic(baker.make("events.Topic").slug, baker.make("accounts.User"))
+        _backdate_log(days_ago=40)
+        out = StringIO()
+
+        call_command("compact_vote_log", stdout=out)
+
+        assert "Deleted 0 vote log entries" in out.getvalue()
+        assert VoteLogEntry.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestGetEventVoteTrend:
+    """Tests for get_event_vote_trend function."""
+
+    def test_series_has_every_hour_of_the_period(self) -> None:
+        """Verify hours without votes are zero points and totals add up."""
+        topic = baker.make("events.Topic")
+        now = hour_start(timezone.now())
+        baker.make(
+            "events.VoteHourlyRollup",
+            event=topic.event,
+            topic=topic,
+            hour=now - timedelta(hours=2),
+            votes_cast=4,
+            votes_removed=1,
+        )
+
+        trend = get_event_vote_trend(
+            topic.event.slug, since=now - timedelta(hours=3), until=now + timedelta(hours=1)
+        )
+
+        assert [(p.votes_cast, p.votes_removed) for p in trend.points] == [
+            (0, 0),
+            (4, 1),
+            (0, 0),
+            (0, 0),
+        ]
+        assert (trend.votes_cast, trend.votes_removed) == (4, 1)
+
+    def test_top_topics_rank_by_net_votes(self) -> None:
+        """Verify topics are ranked by votes cast minus removed in the period."""
+        event = baker.make("events.Event")
+        hour = hour_start(timezone.now())
+        for title, cast, removed in (("a", 5, 4), ("b", 3, 0), ("c", 2, 0)):
+            topic = baker.make("events.Topic", event=event, title=title)
+            baker.make(
+                "events.VoteHourlyRollup",
+                event=event,
+                topic=topic,
+                hour=hour,
+                votes_cast=cast,
+                votes_removed=removed,
+            )
+
+        trend = get_event_vote_trend(event.slug, since=hour - timedelta(days=1), top=2)
+
+        assert [(t.title, t.net_votes) for t in trend.top_topics] == [("b", 3), ("c", 2)]
+
+    def test_reads_rollups_only(self) -> None:
+        """Verify trend queries never touch the events_vote table."""
+        topic = baker.make("events.Topic")
+        vote_topic(topic.slug, baker.make("accounts.User"))
+
+        with CaptureQueriesContext(connection) as captured:
+            get_event_vote_trend(topic.event.slug, since=timezone.now() - timedelta(days=7))
+
+        assert not any('"events_vote"' in query["sql"] for query in captured.captured_queries)
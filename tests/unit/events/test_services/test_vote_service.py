@@ -52,6 +52,29 @@ class TestVoteTopic:
         result2 = vote_topic(topic_slug=topic.slug, user=user)
         assert result2 is False  # Already voted, no action
 
+    def test_vote_topic_maintains_vote_count(self) -> None:
+        """Verify voting increments Topic.vote_count once, and a duplicate vote doesn't."""
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic")
+
+        vote_topic(topic_slug=topic.slug, user=user)
+        vote_topic(topic_slug=topic.slug, user=user)
+
+        topic.refresh_from_db()
+        assert topic.vote_count == 1
+
+    def test_unvote_topic_maintains_vote_count(self) -> None:
+        """Verify unvoting decrements Topic.vote_count, and unvoting again doesn't."""
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic")
+        vote_topic(topic_slug=topic.slug, user=user)
+
+        unvote_topic(topic_slug=topic.slug, user=user)
+        unvote_topic(topic_slug=topic.slug, user=user)
+
+        topic.refresh_from_db()
+        assert topic.vote_count == 0
+
 
 @pytest.mark.django_db
 class TestUnvoteTopic:
@@ -61,7 +84,7 @@ class TestUnvoteTopic:
         """Verify unvote_topic hard-deletes the Vote record."""
         event = baker.make("events.Event")
         user = baker.make("accounts.User")
-        topic = baker.make("events.Topic", event=event, creator=user)
+        topic = baker.make("events.Topic", event=event, creator=user, vote_count=1)
         vote = baker.make("events.Vote", topic=topic, user=user)
 
         unvote_topic(topic_slug=topic.slug, user=user)
@@ -72,7 +95,7 @@ class TestUnvoteTopic:
         """Verify unvote_topic returns True when vote is successfully deleted."""
         event = baker.make("events.Event")
         user = baker.make("accounts.User")
-        topic = baker.make("events.Topic", event=event, creator=user)
+        topic = baker.make("events.Topic", event=event, creator=user, vote_count=1)
         baker.make("events.Vote", topic=topic, user=user)
 
         result = unvote_topic(topic_slug=topic.slug, user=user)
@@ -0,0 +1,46 @@
+"""
+Unit tests for add_comment use case.
+"""
+
+import pytest
+from model_bakery import baker
+
+from events.dto.comment_dto import CommentDTO
+from events.models import Topic
+from events.use_cases.add_comment import add_comment
+
+
+@pytest.mark.django_db
+class TestAddComment:
+    """Tests for add_comment use case function."""
+
+    def test_add_comment_returns_dto(self) -> None:
+        """Verify add_comment creates a comment and returns a CommentDTO."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User", username="commenter")
+
+        dto = add_comment(user=user, topic_slug=topic.slug, content="  Muito bom!  ")
+
+        assert isinstance(dto, CommentDTO)
+        assert dto.content == "Muito bom!"
+        assert dto.author_username == "commenter"
+        assert dto.topic_slug == topic.slug
+
+    def test_add_comment_requires_content(self) -> None:
+        """Verify add_comment rejects empty content."""
+        topic = baker.make("events.Topic")
+
+        with pytest.raises(ValueError, match="required"):
+            add_comment(user=baker.make("accounts.User"), topic_slug=topic.slug, content="   ")
+
+    def test_add_comment_rejects_long_content(self) -> None:
+        """Verify add_comment rejects content over 1000 characters."""
+        topic = baker.make("events.Topic")
+
+        with pytest.raises(ValueError, match="1000"):
+            add_comment(user=baker.make("accounts.User"), topic_slug=topic.slug, content="x" * 1001)
+
+    def test_add_comment_raises_when_topic_not_found(self) -> None:
+        """Verify add_comment raises DoesNotExist for invalid topic slug."""
+        with pytest.raises(Topic.DoesNotExist):
+            add_comment(user=baker.make("accounts.User"), topic_slug="nope", content="x")
@@ -97,3 +97,13 @@ class TestCreateTopic:
         assert dto.event_slug == "test-event"
         assert dto.event_name == "Test Event"
         assert dto.created_at is not None
+
+    def test_create_topic_rejected_when_voting_closed(self) -> None:
+        """Verify create_topic raises PermissionError for closed events."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        user = baker.make("accounts.User")
+
+        with pytest.raises(PermissionError):
+            create_topic(user=user, title="Tarde demais", description="", event_slug=event.slug)
+
+        assert not Topic.objects.filter(event=event).exists()
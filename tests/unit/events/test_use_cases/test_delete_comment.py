@@ -0,0 +1,43 @@
+"""
+Unit tests for delete_comment use case.
+"""
+
+import pytest
+from model_bakery import baker
+
+from events.models import Comment
+from events.services.comment_service import create_comment
+from events.use_cases.delete_comment import delete_comment
+
+
+@pytest.mark.django_db
+class TestDeleteComment:
+    """Tests for delete_comment use case function."""
+
+    def test_delete_comment_soft_deletes_and_updates_count(self) -> None:
+        """Verify delete_comment soft deletes and decrements the topic count."""
+        topic = baker.make("events.Topic")
+        user = baker.make("accounts.User")
+        dto = create_comment(topic_slug=topic.slug, user=user, content="x")
+
+        delete_comment(user=user, comment_id=dto.id)
+
+        assert not Comment.objects.filter(pk=dto.id).exists()
+        assert Comment.all_objects.filter(pk=dto.id).exists()
+        topic.refresh_from_db()
+        assert topic.comment_count == 0
+
+    def test_delete_comment_raises_when_not_author(self) -> None:
+        """Verify delete_comment raises PermissionError for other users."""
+        topic = baker.make("events.Topic")
+        dto = create_comment(topic_slug=topic.slug, user=baker.make("accounts.User"), content="x")
+
+        with pytest.raises(PermissionError, match="not the author"):
+            delete_comment(user=baker.make("accounts.User"), comment_id=dto.id)
+
+    def test_delete_comment_raises_when_not_found(self) -> None:
+        """Verify delete_comment raises DoesNotExist for unknown comments."""
+        comment = baker.make("events.Comment", is_deleted=True)
+
+        with pytest.raises(Comment.DoesNotExist):
+            delete_comment(user=comment.author, comment_id=comment.pk)
@@ -0,0 +1,41 @@
+"""
+Unit tests for delete_presenter_suggestion use case.
+"""
+
+import pytest
+from model_bakery import baker
+
+from events.models import PresenterSuggestion
+from events.use_cases.delete_presenter_suggestion import delete_presenter_suggestion
+
+
+@pytest.mark.django_db
+class TestDeletePresenterSuggestion:
+    """Tests for delete_presenter_suggestion use case function."""
+
+    def test_delete_soft_deletes(self) -> None:
+        """Verify the suggester can soft delete their suggestion."""
+        suggestion = baker.make("events.PresenterSuggestion")
+
+        delete_presenter_suggestion(user=suggestion.suggested_by, suggestion_id=suggestion.id)
+
+        assert not PresenterSuggestion.objects.filter(pk=suggestion.id).exists()
+        assert PresenterSuggestion.all_objects.filter(pk=suggestion.id).exists()
+
+    def test_delete_raises_for_other_users(self) -> None:
+        """Verify other users get PermissionError."""
+        suggestion = baker.make("events.PresenterSuggestion")
+
+        with pytest.raises(PermissionError):
+            delete_presenter_suggestion(
+                user=baker.make("accounts.User"), suggestion_id=suggestion.id
+            )
+
+        assert PresenterSuggestion.objects.filter(pk=suggestion.id).exists()
+
+    def test_delete_raises_when_already_deleted(self) -> None:
+        """Verify deleted suggestions raise DoesNotExist."""
+        suggestion = baker.make("events.PresenterSuggestion", is_deleted=True)
+
+        with pytest.raises(PresenterSuggestion.DoesNotExist):
+            delete_presenter_suggestion(user=suggestion.suggested_by, suggestion_id=suggestion.id)
@@ -5,7 +5,7 @@ Unit tests for delete_topic use case.
 import pytest
 from model_bakery import baker
 
-from events.models import Topic
+from events.models import Event, Topic
 from events.use_cases.delete_topic import delete_topic
 
 
@@ -14,7 +14,7 @@ class TestDeleteTopic:
     """Tests for delete_topic use case function."""
 
     def test_delete_topic_soft_deletes_topic(self) -> None:
-        """Verify delete_topic sets is_deleted=True (soft delete)."""
+        """Verify delete_topic sets is_deleted=True and deleted_at (soft delete)."""
         event = baker.make("events.Event")
         user = baker.make("accounts.User")
         topic = baker.make("events.Topic", event=event, creator=user, is_deleted=False)
@@ -23,6 +23,7 @@ class TestDeleteTopic:
 
         topic.refresh_from_db()
         assert topic.is_deleted is True
+        assert topic.deleted_at is not None
         # Topic should not appear in regular queryset
         assert not Topic.objects.filter(id=topic.id).exists()
         # Topic should appear in all_objects queryset
@@ -58,3 +59,15 @@ class TestDeleteTopic:
         # But should be marked as deleted
         topic.refresh_from_db()
         assert topic.is_deleted is True
+
+    def test_delete_topic_rejected_when_voting_closed(self) -> None:
+        """Verify delete_topic raises PermissionError for topics of closed events."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic", event=event, creator=user)
+
+        with pytest.raises(PermissionError):
+            delete_topic(user=user, topic_slug=topic.slug)
+
+        topic.refresh_from_db()
+        assert topic.is_deleted is False
@@ -5,7 +5,7 @@ Unit tests for edit_topic use case.
 import pytest
 from model_bakery import baker
 
-from events.models import Topic
+from events.models import Event, Topic
 from events.use_cases.edit_topic import edit_topic
 
 
@@ -115,3 +115,15 @@ class TestEditTopic:
         assert dto.description == "Updated description"
         assert dto.event_slug == "test-event"
         assert dto.event_name == "Test Event"
+
+    def test_edit_topic_rejected_when_voting_closed(self) -> None:
+        """Verify edit_topic raises PermissionError for topics of closed events."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic", event=event, creator=user, title="Original")
+
+        with pytest.raises(PermissionError):
+            edit_topic(user=user, topic_slug=topic.slug, title="Editado", description="")
+
+        topic.refresh_from_db()
+        assert topic.title == "Original"
@@ -6,7 +6,7 @@ import pytest
 from model_bakery import baker
 
 from events.dto.topic_dto import TopicDTO
-from events.use_cases.get_event_topics import get_event_topics
+from events.use_cases.get_event_topics import get_event_topics, iter_event_topics_pages
 
 
 @pytest.mark.django_db
@@ -49,3 +49,32 @@ class TestGetEventTopics:
         assert len(dtos_page2) == 5
         # Verify different topics
         assert dtos_page1[0].id != dtos_page2[0].id
+
+
+@pytest.mark.django_db
+class TestIterEventTopicsPages:
+    """Tests for iter_event_topics_pages use case function."""
+
+    def test_walks_limit_topics_in_batches(self) -> None:
+        """Verify `limit` topics come in batches, the last one with the cursor to continue."""
+        event = baker.make("events.Event", slug="test-event")
+        for votes in range(7):
+            baker.make("events.Topic", event=event, vote_count=votes)
+
+        pages = list(iter_event_topics_pages("test-event", limit=5, batch_size=2))
+        rest = list(iter_event_topics_pages("test-event", cursor=pages[-1].next_cursor, limit=5))
+
+        assert [len(page.topics) for page in pages] == [2, 2, 1]
+        assert [topic.vote_count for page in pages for topic in page.topics] == [6, 5, 4, 3, 2]
+        assert [topic.vote_count for page in rest for topic in page.topics] == [1, 0]
+        assert rest[-1].next_cursor is None
+
+    def test_stops_at_the_last_topic(self) -> None:
+        """Verify walking stops when the event runs out of topics."""
+        event = baker.make("events.Event", slug="test-event")
+        baker.make("events.Topic", event=event, _quantity=3)
+
+        pages = list(iter_event_topics_pages("test-event", limit=10, batch_size=2))
+
+        assert [len(page.topics) for page in pages] == [2, 1]
+        assert pages[-1].next_cursor is None
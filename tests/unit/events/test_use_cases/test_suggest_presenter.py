@@ -0,0 +1,58 @@
+"""
+Unit tests for suggest_presenter use case.
+"""
+
+import pytest
+from model_bakery import baker
+
+from events.models import PresenterSuggestion, Topic
+from events.use_cases.suggest_presenter import suggest_presenter
+
+
+@pytest.mark.django_db
+class TestSuggestPresenter:
+    """Tests for suggest_presenter use case function."""
+
+    def test_suggest_presenter_strips_contact(self) -> None:
+        """Verify the contact is stored stripped."""
+        topic = baker.make("events.Topic")
+
+        dto = suggest_presenter(
+            suggested_by=baker.make("accounts.User"),
+            topic_slug=topic.slug,
+            presenter_contact="  https://linkedin.com/in/someone  ",
+        )
+
+        assert dto.presenter_contact == "https://linkedin.com/in/someone"
+        assert PresenterSuggestion.objects.get(pk=dto.id).presenter_contact == dto.presenter_contact
+
+    def test_suggest_presenter_requires_contact(self) -> None:
+        """Verify an empty contact raises ValueError."""
+        topic = baker.make("events.Topic")
+
+        with pytest.raises(ValueError, match="required"):
+            suggest_presenter(
+                suggested_by=baker.make("accounts.User"),
+                topic_slug=topic.slug,
+                presenter_contact="  ",
+            )
+
+    def test_suggest_presenter_rejects_long_contact(self) -> None:
+        """Verify a contact over 500 characters raises ValueError."""
+        topic = baker.make("events.Topic")
+
+        with pytest.raises(ValueError, match="500 characters"):
+            suggest_presenter(
+                suggested_by=baker.make("accounts.User"),
+                topic_slug=topic.slug,
+                presenter_contact="x" * 501,
+            )
+
+    def test_suggest_presenter_unknown_topic(self) -> None:
+        """Verify an unknown topic raises Topic.DoesNotExist."""
+        with pytest.raises(Topic.DoesNotExist):
+            suggest_presenter(
+                suggested_by=baker.make("accounts.User"),
+                topic_slug="missing",
+                presenter_contact="x",
+            )
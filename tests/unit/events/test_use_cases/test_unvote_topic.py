@@ -5,7 +5,7 @@ Unit tests for unvote_topic use case.
 import pytest
 from model_bakery import baker
 
-from events.models import Topic, Vote
+from events.models import Event, Topic, Vote
 from events.use_cases.unvote_topic import unvote_topic
 
 
@@ -17,7 +17,7 @@ class TestUnvoteTopic:
         """Verify unvote_topic hard-deletes the vote."""
         event = baker.make("events.Event")
         user = baker.make("accounts.User")
-        topic = baker.make("events.Topic", event=event, creator=user)
+        topic = baker.make("events.Topic", event=event, creator=user, vote_count=1)
         vote = baker.make("events.Vote", topic=topic, user=user)
 
         result = unvote_topic(topic_slug=topic.slug, user=user)
@@ -40,3 +40,15 @@ class TestUnvoteTopic:
 
         result = unvote_topic(topic_slug=topic.slug, user=user)
         assert result is False  # Not voted, no action
+
+    def test_unvote_topic_rejected_when_voting_closed(self) -> None:
+        """Verify unvote_topic raises PermissionError and keeps votes of closed events."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic", event=event, creator=user, vote_count=1)
+        baker.make("events.Vote", topic=topic, user=user)
+
+        with pytest.raises(PermissionError):
+            unvote_topic(topic_slug=topic.slug, user=user)
+
+        assert Vote.objects.filter(topic=topic, user=user).exists()
@@ -5,7 +5,7 @@ Unit tests for vote_topic use case.
 import pytest
 from model_bakery import baker
 
-from events.models import Topic, Vote
+from events.models import Event, Topic, Vote
 from events.use_cases.vote_topic import vote_topic
 
 
@@ -42,3 +42,14 @@ class TestVoteTopic:
 
         result2 = vote_topic(topic_slug=topic.slug, user=user)
         assert result2 is False  # Already voted, no action
+
+    def test_vote_topic_rejected_when_voting_closed(self) -> None:
+        """Verify vote_topic raises PermissionError for topics of closed events."""
+        event = baker.make("events.Event", status=Event.CLOSED)
+        user = baker.make("accounts.User")
+        topic = baker.make("events.Topic", event=event, creator=user)
+
+        with pytest.raises(PermissionError):
+            vote_topic(topic_slug=topic.slug, user=user)
+
+        assert not Vote.objects.filter(topic=topic).exists()